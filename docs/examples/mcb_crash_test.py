@@ -5,6 +5,7 @@ Runs a full-scale U2OS MCB crash test simulation and generates dashboard assets.
 This is a thin wrapper around the cell_os.mcb_crash library.
 """
 
+from multiprocessing import cpu_count
 from pathlib import Path
 from cell_os.mcb_crash import MCBTestConfig, run_mcb_crash_test
 
@@ -20,6 +21,7 @@ def main():
         output_dir="data/dashboard_assets/mcb",
         cell_line="U2OS",
         starting_vials=3,
+        workers=cpu_count(),
     )
     
     print(f"Starting MCB Crash Test: {config.num_simulations} simulations...")
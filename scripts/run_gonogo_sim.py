@@ -39,11 +39,9 @@ def parse_plate_id(plate_id: str) -> dict:
 def load_df_wells(db_path: str, design_id: str) -> pd.DataFrame:
     """Load well data and add passage/template columns."""
     db = CellThalamusDB(db_path=db_path)
-    rows = db.get_results(design_id)
+    df = db.get_results_frame(design_id)
     db.close()
 
-    df = pd.DataFrame(rows)
-
     # Parse passage/template from plate_id
     parsed = df["plate_id"].apply(parse_plate_id).apply(pd.Series)
     df["passage"] = parsed["passage"].astype("category")
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Beam search wall-time benchmark: snapshot/fork rollouts vs full prefix replay.
+
+With snapshots, each beam node extends its parent's VM snapshot by one step
+(O(depth) simulation per search path). With replay, every prefix rollout rebuilds
+the VM and replays from t=0 (O(depth²)). Both modes must pick the same schedule.
+
+Usage:
+    python scripts/testing/benchmark_beam_snapshots.py --widths 10 50 200
+    python scripts/testing/benchmark_beam_snapshots.py --widths 10 --compound test_C_clean
+"""
+
+import argparse
+import sys
+import time
+import warnings
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from cell_os.hardware.beam_search import BeamSearch, Phase5EpisodeRunner
+from cell_os.hardware.masked_compound_phase5 import PHASE5_LIBRARY
+
+
+def run_search(compound_id: str, beam_width: int, use_snapshots: bool, seed: int):
+    """Run one beam search, return (wall_seconds, result)."""
+    runner = Phase5EpisodeRunner(
+        phase5_compound=PHASE5_LIBRARY[compound_id],
+        cell_line="A549",
+        horizon_h=48.0,
+        step_h=6.0,
+        seed=seed,
+        use_snapshots=use_snapshots,
+    )
+    search = BeamSearch(runner=runner, beam_width=beam_width, max_interventions=2, death_tolerance=0.35)
+
+    t0 = time.perf_counter()
+    result = search.search(compound_id)
+    return time.perf_counter() - t0, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--widths", type=int, nargs="+", default=[10, 50, 200], help="Beam widths")
+    parser.add_argument("--compound", default=next(iter(PHASE5_LIBRARY)), choices=sorted(PHASE5_LIBRARY))
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--skip-replay", action="store_true", help="Only time the snapshot mode")
+    args = parser.parse_args()
+
+    warnings.filterwarnings("ignore")
+    modes = [True] if args.skip_replay else [True, False]
+
+    print(f"Compound: {args.compound}, seed={args.seed}")
+    print(f"{'width':>6} {'snapshot_s':>11} {'replay_s':>10} {'speedup':>8} {'expanded':>9} {'same_best':>10}")
+    print("-" * 60)
+    for width in args.widths:
+        timings = {}
+        results = {}
+        for use_snapshots in modes:
+            timings[use_snapshots], results[use_snapshots] = run_search(
+                args.compound, width, use_snapshots, args.seed
+            )
+
+        snap_s = timings[True]
+        expanded = results[True].nodes_expanded
+        if args.skip_replay:
+            print(f"{width:>6} {snap_s:>11.2f} {'-':>10} {'-':>8} {expanded:>9} {'-':>10}")
+            continue
+
+        replay_s = timings[False]
+        same = (
+            [str(a) for a in results[True].best_schedule] == [str(a) for a in results[False].best_schedule]
+            and results[True].best_reward == results[False].best_reward
+        )
+        print(
+            f"{width:>6} {snap_s:>11.2f} {replay_s:>10.2f} {replay_s / snap_s:>7.1f}x "
+            f"{expanded:>9} {str(same):>10}"
+        )
+
+
+if __name__ == "__main__":
+    main()
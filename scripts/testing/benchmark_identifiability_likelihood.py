@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Parity benchmark for the vectorized commitment hazard likelihood.
+
+Runs fit_commitment_params on identifiability suite outputs three ways:
+the legacy per-row/per-interval grid loop (reproduced here as the
+reference), the broadcast grid (refine=False), and the broadcast grid
+plus L-BFGS-B refinement. Reports wall time, whether the grid optimum
+matches the legacy one, and the likelihood gain from refinement.
+
+Every regime with commitment events is fitted against each stress metric
+it carries (er_stress, mito_dysfunction).
+
+Usage:
+    python scripts/testing/benchmark_identifiability_likelihood.py \\
+        --in artifacts/identifiability/2c1_run artifacts/identifiability/2c2_run
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from cell_os.calibration.identifiability_inference import fit_commitment_params
+
+STRESS_METRICS = ("er_stress", "mito_dysfunction")
+
+
+def _legacy_log_likelihood(events, trajectories, threshold, lambda0, p, cap):
+    """Original iterrows + interval loop likelihood."""
+    log_likelihood = 0.0
+    for _, row in events.iterrows():
+        if row['well_id'] not in trajectories:
+            continue
+        times, stresses = trajectories[row['well_id']]
+        if len(times) == 0:
+            continue
+        survival_prob = 1.0
+        for i in range(len(times) - 1):
+            s = stresses[i]
+            if s <= threshold:
+                hazard = 0.0
+            else:
+                hazard = min(cap, lambda0 * (((s - threshold) / (1.0 - threshold)) ** p))
+            p_survive_interval = np.exp(-hazard * (times[i + 1] - times[i]))
+            survival_prob *= p_survive_interval
+            if row['committed'] and row['commitment_time_h'] is not None:
+                if times[i] <= row['commitment_time_h'] < times[i + 1]:
+                    log_likelihood += np.log(max(1.0 - p_survive_interval, 1e-10))
+                    break
+        else:
+            if not row['committed']:
+                log_likelihood += np.log(max(survival_prob, 1e-10))
+    return log_likelihood
+
+
+def legacy_grid_fit(events_df, observations_df, regime, stress_metric):
+    """Original 10×7×8 nested grid search; returns (threshold, λ0, p, ll)."""
+    events = events_df[events_df['regime'] == regime]
+    obs = observations_df[
+        (observations_df['regime'] == regime) & (observations_df['metric_name'] == stress_metric)
+    ]
+    trajectories = {}
+    for well_id in events['well_id'].unique():
+        well_obs = obs[obs['well_id'] == well_id].sort_values('time_h')
+        trajectories[well_id] = (well_obs['time_h'].values, well_obs['value'].values)
+
+    best_ll, best = -np.inf, None
+    for threshold in np.linspace(0.3, 0.9, 10):
+        for p in np.linspace(1.0, 4.0, 7):
+            for lambda0 in np.logspace(-3, 0, 8):
+                ll = _legacy_log_likelihood(events, trajectories, threshold, lambda0, p, 10.0)
+                if ll > best_ll:
+                    best_ll, best = ll, (threshold, lambda0, p)
+    return (*best, best_ll)
+
+
+def _timed(fn, *args, **kwargs):
+    t0 = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - t0
+
+
+def benchmark_dataset(input_dir: Path) -> list:
+    """Fit every (regime, stress metric) pair in one suite output directory."""
+    events_df = pd.read_csv(input_dir / "events.csv")
+    observations_df = pd.read_csv(input_dir / "observations.csv")
+
+    rows = []
+    for regime in sorted(events_df['regime'].unique()):
+        if not events_df.loc[events_df['regime'] == regime, 'committed'].any():
+            continue
+        metrics = set(observations_df.loc[observations_df['regime'] == regime, 'metric_name'])
+        for stress_metric in STRESS_METRICS:
+            if stress_metric not in metrics:
+                continue
+            legacy, t_legacy = _timed(legacy_grid_fit, events_df, observations_df, regime, stress_metric)
+            grid, t_grid = _timed(
+                fit_commitment_params, events_df, observations_df,
+                regime=regime, stress_metric=stress_metric, refine=False,
+            )
+            refined, t_refined = _timed(
+                fit_commitment_params, events_df, observations_df,
+                regime=regime, stress_metric=stress_metric,
+            )
+            params_match = (
+                grid['threshold'] == legacy[0]
+                and grid['baseline_hazard_per_h'] == legacy[1]
+                and grid['sharpness_p'] == legacy[2]
+            )
+            rows.append({
+                'suite': input_dir.name,
+                'regime': regime,
+                'metric': stress_metric,
+                'n_events': len(events_df[events_df['regime'] == regime]),
+                'params_match': params_match,
+                'll_abs_diff': abs(grid['log_likelihood'] - legacy[3]),
+                'refine_gain': refined['log_likelihood'] - grid['log_likelihood'],
+                'legacy_s': t_legacy,
+                'grid_s': t_grid,
+                'refined_s': t_refined,
+            })
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--in", dest="input_dirs", nargs="+", required=True,
+        help="Suite output directories with events.csv and observations.csv",
+    )
+    args = parser.parse_args()
+
+    rows = []
+    for input_dir in args.input_dirs:
+        rows.extend(benchmark_dataset(Path(input_dir)))
+    if not rows:
+        print("No regimes with commitment events found.")
+        return 1
+
+    table = pd.DataFrame(rows)
+    with pd.option_context('display.width', 160, 'display.float_format', '{:.4g}'.format):
+        print(table.to_string(index=False))
+
+    speedup = table['legacy_s'].sum() / table['grid_s'].sum()
+    print(f"\nGrid parity: {int(table['params_match'].sum())}/{len(table)} fits identical, "
+          f"max |Δll| = {table['ll_abs_diff'].max():.2e}")
+    print(f"Grid speedup vs legacy loop: {speedup:.1f}x")
+    return 0 if table['params_match'].all() else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,60 +4,25 @@ Multi-seed benchmark for epistemic agent with gate KPI extraction.
 
 v0.4.2: Tracks gate attainment, rel_width tightness, and df efficiency.
 
+Seeds run in-process across a pool of warm workers
+(cell_os.epistemic_agent.batch_runner); KPIs come back directly and are
+written as one JSON file plus one consolidated CSV table.
+
 Usage:
-    python scripts/benchmark_multiseed.py --seeds 10 --budget 384 --cycles 20
+    python scripts/testing/benchmark_multiseed.py --seeds 10 --budget 384 --cycles 20 --workers 4
 """
 
 import argparse
 import json
-import subprocess
+import os
 import sys
+import time
 from pathlib import Path
 from typing import List, Dict, Any
 
-# Import reusable KPI extraction
-from benchmark_utils import extract_all_kpis
-
-
-def run_single_seed(seed: int, budget: int, cycles: int, log_dir: Path) -> Dict[str, Any]:
-    """Run epistemic agent for a single seed."""
-    print(f"\n{'='*60}")
-    print(f"Running seed {seed}")
-    print(f"{'='*60}")
-
-    cmd = [
-        sys.executable,
-        "scripts/run_epistemic_agent.py",
-        "--seed", str(seed),
-        "--budget", str(budget),
-        "--cycles", str(cycles),
-        "--log-dir", str(log_dir),
-    ]
-
-    result = subprocess.run(cmd, capture_output=True, text=True)
-
-    # Find the JSON file for this run (most recent in log_dir)
-    json_files = sorted(log_dir.glob("run_*.json"), key=lambda p: p.stat().st_mtime)
-    
-    if not json_files:
-        return {
-            "seed": seed,
-            "success": False,
-            "error": "No JSON output found",
-            "exit_code": result.returncode,
-        }
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
 
-    run_json_path = json_files[-1]
-
-    # Extract all KPIs using reusable utils
-    kpis = extract_all_kpis(run_json_path)
-
-    return {
-        "seed": seed,
-        "success": result.returncode == 0,
-        "exit_code": result.returncode,
-        **kpis,
-    }
+from cell_os.epistemic_agent.batch_runner import run_episodes, write_results_table
 
 
 def print_summary(results: List[Dict[str, Any]]):
@@ -134,6 +99,12 @@ def main():
         default="results/epistemic_agent",
         help="Directory for logs (default: results/epistemic_agent)",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="Worker processes (default: CPU count)",
+    )
     parser.add_argument(
         "--output",
         type=str,
@@ -146,10 +117,17 @@ def main():
     log_dir.mkdir(parents=True, exist_ok=True)
 
     # Run all seeds
-    results = []
-    for seed in range(args.seeds):
-        result = run_single_seed(seed, args.budget, args.cycles, log_dir)
-        results.append(result)
+    print(f"Running {args.seeds} seeds on {args.workers} workers...")
+    start = time.perf_counter()
+    results = run_episodes(
+        range(args.seeds),
+        budget=args.budget,
+        max_cycles=args.cycles,
+        log_dir=log_dir,
+        workers=args.workers,
+    )
+    wall_clock = time.perf_counter() - start
+    print(f"Completed in {wall_clock:.1f}s ({wall_clock / max(1, args.seeds):.2f}s/seed)")
 
     # Print summary
     print_summary(results)
@@ -162,11 +140,14 @@ def main():
                 "n_seeds": args.seeds,
                 "budget": args.budget,
                 "cycles": args.cycles,
+                "workers": args.workers,
+                "wall_clock_seconds": wall_clock,
             },
             "results": results,
         }, f, indent=2)
+    table_path = write_results_table(results, output_path.with_suffix(".csv"))
 
-    print(f"\n✓ Results saved to {output_path}")
+    print(f"\n✓ Results saved to {output_path} (table: {table_path})")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark for ValidatedRNG enforcement modes.
+
+Measures draws/second for scalar draws (the CellPaintingAssay per-well noise
+pattern) under each GUARD_MODES setting, against an unwrapped numpy Generator.
+
+Usage:
+    python scripts/testing/benchmark_rng_guard.py --draws 200000 --repeats 5
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from cell_os.hardware.rng_guard import GUARD_MODES, ValidatedRNG
+
+
+def _measure(rng, n_draws: int) -> float:
+    """Draw n_draws scalar normals from an authorized call-site, return seconds."""
+    normal = rng.normal
+    t0 = time.perf_counter()
+    for _ in range(n_draws):
+        normal(0.0, 1.0)
+    return time.perf_counter() - t0
+
+
+def benchmark(n_draws: int, repeats: int) -> dict:
+    """Return best-of-repeats draws/second per mode (plus raw numpy baseline)."""
+    results = {}
+    for mode in ("numpy",) + GUARD_MODES:
+        best = float("inf")
+        for _ in range(repeats):
+            if mode == "numpy":
+                rng = np.random.default_rng(0)
+            else:
+                rng = ValidatedRNG(
+                    np.random.default_rng(0),
+                    stream_name="assay",
+                    allowed_patterns={"_measure"},
+                    mode=mode,
+                )
+            best = min(best, _measure(rng, n_draws))
+        results[mode] = n_draws / best
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--draws", type=int, default=200_000, help="Draws per repeat")
+    parser.add_argument("--repeats", type=int, default=5, help="Repeats (best-of)")
+    args = parser.parse_args()
+
+    results = benchmark(args.draws, args.repeats)
+    strict = results["strict"]
+
+    print(f"{'mode':<8} {'draws/s':>14} {'vs strict':>10}")
+    print("-" * 34)
+    for mode, rate in results.items():
+        print(f"{mode:<8} {rate:>14,.0f} {rate / strict:>9.2f}x")
+
+
+if __name__ == "__main__":
+    main()
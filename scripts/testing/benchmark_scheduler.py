@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark for the CP-SAT workflow Scheduler on generated campaigns.
+
+Generates cell-culture campaigns of independent plate workflows
+(seed -> incubate -> treat -> incubate -> image) sharing liquid handlers,
+incubator slots and a single imager, then compares:
+
+- full:     one monolithic solve (bounded by --time-limit)
+- rolling:  rolling-horizon windows (--window tasks, --window-time-limit each)
+- replan:   rolling reschedule() at mid-campaign after five rush plates
+            arrive, warm-started from the rolling schedule
+
+plus the greedy list schedule every solve is warm-started with.
+
+Each schedule is checked with Scheduler.check_schedule and its makespan is
+compared with a simple lower bound (longest workflow vs. bottleneck load).
+
+Usage:
+    python scripts/testing/benchmark_scheduler.py --sizes 100 500 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from cell_os.scheduler import Resource, Scheduler, Task
+
+RESOURCES = [
+    Resource(id="liquid_handler", name="Liquid Handler", capacity=2),
+    Resource(id="incubator", name="Incubator slots", capacity=24),
+    Resource(id="imager", name="High-content imager", capacity=1),
+]
+
+# (step, resource, duration range in minutes)
+WORKFLOW_STEPS = [
+    ("seed", "liquid_handler", (15, 30)),
+    ("attach", "incubator", (240, 720)),
+    ("treat", "liquid_handler", (10, 20)),
+    ("expose", "incubator", (240, 720)),
+    ("image", "imager", (20, 40)),
+]
+
+
+def generate_campaign(n_tasks: int, seed: int = 0):
+    """Independent plate workflows totalling n_tasks tasks."""
+    rng = random.Random(seed)
+    tasks = []
+    for plate in range(n_tasks // len(WORKFLOW_STEPS)):
+        previous = None
+        for step, resource, (low, high) in WORKFLOW_STEPS:
+            task = Task(
+                id=f"plate{plate:04d}_{step}",
+                name=f"{step} plate {plate}",
+                duration_min=rng.randint(low, high),
+                resources_required=[resource],
+                predecessors=[previous] if previous else [],
+            )
+            tasks.append(task)
+            previous = task.id
+    return tasks
+
+
+def lower_bound(tasks):
+    """max(longest workflow, busiest resource load / capacity)."""
+    by_id = {t.id: t for t in tasks}
+    path = {}
+    for t in tasks:  # Generated tasks are in topological order
+        path[t.id] = t.duration_min + max((path[p] for p in t.predecessors if p in by_id), default=0)
+    capacities = {r.id: r.capacity for r in RESOURCES}
+    load = {}
+    for t in tasks:
+        for res_id in t.resources_required:
+            load[res_id] = load.get(res_id, 0) + t.duration_min
+    return max(max(path.values()), max(-(-load[r] // capacities[r]) for r in load))
+
+
+def run(name, scheduler, tasks, solve):
+    started = time.perf_counter()
+    results = solve()
+    elapsed = time.perf_counter() - started
+    info = scheduler.last_solve
+    violations = scheduler.check_schedule(tasks, results) if results else ["no schedule"]
+    makespan = max(r.end_time for r in results) if results else None
+    print(
+        f"  {name:8s} {elapsed:7.2f}s  makespan={makespan}  status={info.status}  "
+        f"windows={info.n_windows}  valid={not violations}"
+    )
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100, 500, 2000])
+    parser.add_argument("--time-limit", type=float, default=60.0, help="Monolithic solve limit (s)")
+    parser.add_argument("--window", type=int, default=100, help="Tasks per rolling window")
+    parser.add_argument("--window-time-limit", type=float, default=5.0, help="Per-window limit (s)")
+    parser.add_argument("--workers", type=int, default=8)
+    parser.add_argument("--horizon", type=int, default=6 * 7 * 24 * 60, help="Horizon (min)")
+    args = parser.parse_args()
+
+    for n_tasks in args.sizes:
+        tasks = generate_campaign(n_tasks)
+        scheduler = Scheduler(RESOURCES)
+        print(f"{len(tasks)} tasks (lower bound {lower_bound(tasks)} min)")
+
+        run("full", scheduler, tasks, lambda: scheduler.schedule(
+            tasks, horizon_min=args.horizon, time_limit_s=args.time_limit, num_workers=args.workers))
+
+        greedy = scheduler._greedy_schedule(tasks, {}, 0)
+        print(f"  {'greedy':8s} makespan={max(r.end_time for r in greedy.values())}")
+
+        rolling = run("rolling", scheduler, tasks, lambda: scheduler.schedule_rolling(
+            tasks, window_size=args.window, horizon_min=args.horizon,
+            time_limit_s=args.window_time_limit, num_workers=args.workers))
+        if not rolling:
+            continue
+
+        # Five rush plates arrive at mid-campaign
+        now = max(r.end_time for r in rolling) // 2
+        rush = generate_campaign(5 * len(WORKFLOW_STEPS), seed=1)
+        for task in rush:
+            task.id = task.id.replace("plate", "rush")
+            task.predecessors = [p.replace("plate", "rush") for p in task.predecessors]
+        replanned = tasks + rush
+        run("replan", scheduler, replanned, lambda: scheduler.reschedule(
+            replanned, rolling, now_min=now, horizon_min=args.horizon,
+            time_limit_s=args.window_time_limit, num_workers=args.workers, window_size=args.window))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark BiologicalVirtualMachine construction with the YAML parameter registry.
+
+Each VM reads simulation_parameters.yaml at construction and
+cell_thalamus_params.yaml on first assay. Modes (per-VM time, thalamus load
+included):
+
+    legacy  re-parse simulation_parameters.yaml with the pure-Python SafeLoader
+            on every construction (behaviour before the registry)
+    cold    fresh registry, no disk cache, LibYAML loader if available
+    disk    fresh registry, parsed data restored from the on-disk pickle cache
+    warm    registry already populated (steady state in episode/beam loops)
+
+Usage:
+    python scripts/testing/benchmark_vm_construction.py --vms 50
+"""
+
+import argparse
+import logging
+import sys
+import time
+from pathlib import Path
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2] / "src"))
+
+from cell_os.hardware import param_registry
+from cell_os.hardware.biological_virtual import BiologicalVirtualMachine
+
+SIM_PARAMS = Path(__file__).resolve().parents[2] / "data" / "simulation_parameters.yaml"
+
+
+def _build_vm(seed: int) -> None:
+    vm = BiologicalVirtualMachine(seed=seed)
+    vm._load_cell_thalamus_params()
+
+
+def _time_mode(mode: str, n_vms: int) -> float:
+    """Return mean seconds per VM for one mode."""
+    read_disk, write_disk, loader = (
+        param_registry._read_disk_cache,
+        param_registry._write_disk_cache,
+        param_registry.YAML_LOADER,
+    )
+    if mode in ("legacy", "cold"):
+        param_registry._read_disk_cache = lambda path, sha256: None
+        param_registry._write_disk_cache = lambda path, sha256, blob: None
+    if mode == "legacy":
+        param_registry.YAML_LOADER = yaml.SafeLoader
+
+    try:
+        _build_vm(0)  # DB parameters and imports warm in every mode
+        total = 0.0
+        for i in range(n_vms):
+            if mode == "legacy":
+                param_registry._PARAM_REGISTRY.pop(str(SIM_PARAMS.resolve()), None)
+            elif mode in ("cold", "disk"):
+                param_registry.clear_param_cache()
+            t0 = time.perf_counter()
+            _build_vm(i)
+            total += time.perf_counter() - t0
+        return total / n_vms
+    finally:
+        param_registry._read_disk_cache = read_disk
+        param_registry._write_disk_cache = write_disk
+        param_registry.YAML_LOADER = loader
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--vms", type=int, default=50, help="VMs constructed per mode")
+    args = parser.parse_args()
+
+    logging.disable(logging.WARNING)
+    print(f"LibYAML available: {param_registry.LIBYAML_AVAILABLE}")
+
+    results = {mode: _time_mode(mode, args.vms) for mode in ("legacy", "cold", "disk", "warm")}
+    legacy = results["legacy"]
+
+    print(f"{'mode':<8} {'ms/VM':>10} {'speedup':>9}")
+    print("-" * 29)
+    for mode, seconds in results.items():
+        print(f"{mode:<8} {seconds * 1e3:>10.2f} {legacy / seconds:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Convert plate executor JSON runs under results/ to the columnar store.
+
+Finds *_seed*.json files that contain raw_results (plate_executor_v2 and
+plate_executor_v2_parallel outputs), writes a Parquet/Arrow/npy copy next to
+each one, and verifies the copy round-trips before optionally deleting the JSON.
+
+Usage:
+    python scripts/tools/migrate_results_to_columnar.py
+    python scripts/tools/migrate_results_to_columnar.py results/calibration_plates --format npy
+    python scripts/tools/migrate_results_to_columnar.py --delete-json
+"""
+
+import argparse
+import json
+import shutil
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from src.cell_os.plate_results_store import (
+    PlateResultsReader,
+    default_format,
+    write_plate_results,
+    _SUFFIXES,
+)
+
+
+def _size(path: Path) -> int:
+    if path.is_dir():
+        return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+    return path.stat().st_size
+
+
+def find_runs(root: Path):
+    """JSON files under root that look like plate executor outputs."""
+    for path in sorted(root.rglob("*_seed*.json")):
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (json.JSONDecodeError, UnicodeDecodeError):
+            continue
+        if isinstance(data, dict) and isinstance(data.get("raw_results"), list):
+            yield path, data
+
+
+def migrate_run(json_path: Path, data: dict, fmt: str, overwrite: bool = False):
+    """Write the columnar copy of one run and check it. Returns the new path or None if skipped."""
+    target = json_path.with_suffix(_SUFFIXES[fmt])
+    if target.exists() and not overwrite:
+        return None
+    if target.is_dir():
+        shutil.rmtree(target)
+
+    write_plate_results(data, target, fmt=fmt)
+
+    reader = PlateResultsReader(target)
+    if len(reader) != len(data["raw_results"]):
+        raise RuntimeError(f"{target}: wrote {len(reader)} wells, expected {len(data['raw_results'])}")
+    if reader.to_raw_results()[0].get("well_id") != data["raw_results"][0].get("well_id"):
+        raise RuntimeError(f"{target}: round-trip mismatch on first well")
+    return target
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("root", nargs="?", default="results", help="Directory to scan (default: results)")
+    parser.add_argument("--format", choices=sorted(_SUFFIXES), default=default_format(),
+                        help=f"Columnar format (default: {default_format()})")
+    parser.add_argument("--overwrite", action="store_true", help="Rewrite existing columnar copies")
+    parser.add_argument("--delete-json", action="store_true", help="Delete JSON after a verified conversion")
+    parser.add_argument("--dry-run", action="store_true", help="List runs without converting")
+    args = parser.parse_args()
+
+    root = Path(args.root)
+    if not root.exists():
+        print(f"✗ Not found: {root}")
+        return 1
+
+    n_converted = 0
+    json_bytes = columnar_bytes = 0
+    for json_path, data in find_runs(root):
+        if args.dry_run:
+            print(f"  would convert: {json_path} ({len(data['raw_results'])} wells)")
+            continue
+
+        target = migrate_run(json_path, data, args.format, overwrite=args.overwrite)
+        if target is None:
+            print(f"  skip (exists): {json_path.with_suffix(_SUFFIXES[args.format])}")
+            continue
+
+        before, after = _size(json_path), _size(target)
+        json_bytes += before
+        columnar_bytes += after
+        n_converted += 1
+        print(f"✓ {json_path} → {target.name}  ({before / 1e6:.2f} MB → {after / 1e6:.2f} MB)")
+
+        if args.delete_json:
+            json_path.unlink()
+
+    if n_converted:
+        print(f"\nConverted {n_converted} runs: {json_bytes / 1e6:.2f} MB → {columnar_bytes / 1e6:.2f} MB")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -11,6 +11,7 @@ import numpy as np
 from sklearn.decomposition import PCA
 
 from cell_os.database.cell_thalamus_db import CellThalamusDB
+from cell_os.api.services.analysis_cache import ANALYSIS_CACHE, cached_response
 
 logger = logging.getLogger(__name__)
 
@@ -26,46 +27,130 @@ def init_globals(db_path):
     DB_PATH = db_path
 
 
-@router.get("/api/thalamus/designs/{design_id}/results")
-async def get_results(design_id: str):
-    """Get all results for a design"""
-    try:
-        db = CellThalamusDB(db_path=DB_PATH)
-        results = db.get_results(design_id)
-        db.close()
+def _results_response(db: CellThalamusDB, design_id: str, layout: str = "rows"):
+    """All result rows for a design, as row dicts or columns."""
+    results = db.get_results(design_id)
+
+    if not results:
+        raise HTTPException(status_code=404, detail="No results found")
+
+    if layout == "columns":
+        return {column: [row[column] for row in results] for column in results[0]}
+    return results
+
 
-        if not results:
-            raise HTTPException(status_code=404, detail="No results found")
+@router.get("/api/thalamus/designs/{design_id}/results")
+async def get_results(design_id: str, layout: str = "rows"):
+    """
+    Get all results for a design.
 
-        return results
+    Args:
+        design_id: Design ID
+        layout: "rows" (list of well dicts, default) or "columns" (dict of
+            column name -> list of values; much smaller for large designs)
+    """
+    try:
+        if layout not in ("rows", "columns"):
+            raise HTTPException(status_code=400, detail=f"Invalid layout: {layout}")
+        return await cached_response(DB_PATH, design_id, "results", _results_response, layout=layout)
 
     except Exception as e:
         logger.error(f"Error getting results: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _morphology_response(db: CellThalamusDB, design_id: str):
+    """N x 5 morphology matrix and well IDs."""
+    matrix, well_ids = db.get_morphology_matrix(design_id)
+
+    if not matrix:
+        raise HTTPException(status_code=404, detail="No morphology data found")
+
+    return {
+        "matrix": matrix,
+        "well_ids": well_ids,
+        "channels": ["ER", "Mito", "Nucleus", "Actin", "RNA"]
+    }
+
+
 @router.get("/api/thalamus/designs/{design_id}/morphology")
 async def get_morphology_matrix(design_id: str):
     """Get morphology matrix for PCA visualization"""
     try:
-        db = CellThalamusDB(db_path=DB_PATH)
-        matrix, well_ids = db.get_morphology_matrix(design_id)
-        db.close()
-
-        if not matrix:
-            raise HTTPException(status_code=404, detail="No morphology data found")
-
-        return {
-            "matrix": matrix,
-            "well_ids": well_ids,
-            "channels": ["ER", "Mito", "Nucleus", "Actin", "RNA"]
-        }
+        return await cached_response(DB_PATH, design_id, "morphology", _morphology_response)
 
     except Exception as e:
         logger.error(f"Error getting morphology: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _pca_response(db: CellThalamusDB, design_id: str, channels: Optional[str] = None):
+    """2-component PCA of the selected morphology channels."""
+    # All available channels in order
+    all_channels = ['er', 'mito', 'nucleus', 'actin', 'rna']
+    channel_map = {
+        'er': 'morph_er',
+        'mito': 'morph_mito',
+        'nucleus': 'morph_nucleus',
+        'actin': 'morph_actin',
+        'rna': 'morph_rna'
+    }
+    metadata_columns = ['well_id', 'cell_line', 'compound', 'dose_uM', 'timepoint_h', 'is_sentinel']
+
+    # Parse selected channels
+    if channels:
+        selected_channels = [c.strip().lower() for c in channels.split(',')]
+        # Validate channels
+        selected_channels = [c for c in selected_channels if c in all_channels]
+        if not selected_channels:
+            selected_channels = all_channels
+    else:
+        selected_channels = all_channels
+
+    columns = db.get_results_columns(
+        design_id, metadata_columns + [channel_map[ch] for ch in selected_channels]
+    )
+
+    if len(columns['well_id']) == 0:
+        raise HTTPException(status_code=404, detail="No results found")
+
+    # Morphology matrix for selected channels, skipping wells with missing values
+    X = np.column_stack([columns[channel_map[ch]] for ch in selected_channels])
+    complete = ~np.isnan(X).any(axis=1)
+    X = X[complete]
+
+    well_metadata = [
+        dict(zip(metadata_columns, values))
+        for values in zip(*(columns[c][complete].tolist() for c in metadata_columns))
+    ]
+
+    if len(X) < 2:
+        raise HTTPException(status_code=400, detail="Not enough data points for PCA")
+
+    # Compute PCA (2 components)
+    pca = PCA(n_components=2)
+    pc_scores = pca.fit_transform(X)
+
+    # Get loadings (eigenvectors)
+    loadings = pca.components_.T  # Shape: (n_channels, 2)
+
+    # Variance explained
+    variance_explained = pca.explained_variance_ratio_
+
+    return {
+        'pc_scores': pc_scores.tolist(),  # List of [PC1, PC2] for each well
+        'loadings': loadings.tolist(),    # List of [PC1_loading, PC2_loading] for each channel
+        'variance_explained': {
+            'pc1': float(variance_explained[0]),
+            'pc2': float(variance_explained[1]),
+            'total': float(variance_explained[0] + variance_explained[1])
+        },
+        'channels': selected_channels,
+        'well_metadata': well_metadata,
+        'n_wells': len(well_metadata)
+    }
+
+
 @router.get("/api/thalamus/designs/{design_id}/pca")
 async def get_pca_data(design_id: str, channels: Optional[str] = None):
     """
@@ -79,113 +164,65 @@ async def get_pca_data(design_id: str, channels: Optional[str] = None):
         PC scores, loadings, variance explained, and well metadata
     """
     try:
-        db = CellThalamusDB(db_path=DB_PATH)
-        results = db.get_results(design_id)
-
-        if not results:
-            db.close()
-            raise HTTPException(status_code=404, detail="No results found")
-
-        # All available channels in order
-        all_channels = ['er', 'mito', 'nucleus', 'actin', 'rna']
-        channel_map = {
-            'er': 'morph_er',
-            'mito': 'morph_mito',
-            'nucleus': 'morph_nucleus',
-            'actin': 'morph_actin',
-            'rna': 'morph_rna'
-        }
-
-        # Parse selected channels
-        if channels:
-            selected_channels = [c.strip().lower() for c in channels.split(',')]
-            # Validate channels
-            selected_channels = [c for c in selected_channels if c in all_channels]
-            if not selected_channels:
-                selected_channels = all_channels
-        else:
-            selected_channels = all_channels
-
-        # Extract morphology matrix for selected channels
-        matrix = []
-        well_metadata = []
-
-        for result in results:
-            # Get values for selected channels
-            values = [result[channel_map[ch]] for ch in selected_channels]
-
-            # Skip if any values are None
-            if None in values:
-                continue
-
-            matrix.append(values)
-            well_metadata.append({
-                'well_id': result['well_id'],
-                'cell_line': result['cell_line'],
-                'compound': result['compound'],
-                'dose_uM': result['dose_uM'],
-                'timepoint_h': result['timepoint_h'],
-                'is_sentinel': result['is_sentinel']
-            })
-
-        db.close()
-
-        if len(matrix) < 2:
-            raise HTTPException(status_code=400, detail="Not enough data points for PCA")
-
-        # Convert to numpy array
-        X = np.array(matrix, dtype=float)
-
-        # Compute PCA (2 components)
-        pca = PCA(n_components=2)
-        pc_scores = pca.fit_transform(X)
-
-        # Get loadings (eigenvectors)
-        loadings = pca.components_.T  # Shape: (n_channels, 2)
-
-        # Variance explained
-        variance_explained = pca.explained_variance_ratio_
-
-        return {
-            'pc_scores': pc_scores.tolist(),  # List of [PC1, PC2] for each well
-            'loadings': loadings.tolist(),    # List of [PC1_loading, PC2_loading] for each channel
-            'variance_explained': {
-                'pc1': float(variance_explained[0]),
-                'pc2': float(variance_explained[1]),
-                'total': float(variance_explained[0] + variance_explained[1])
-            },
-            'channels': selected_channels,
-            'well_metadata': well_metadata,
-            'n_wells': len(well_metadata)
-        }
+        return await cached_response(DB_PATH, design_id, "pca", _pca_response, channels=channels)
 
     except Exception as e:
         logger.error(f"Error computing PCA: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _dose_response(
+    db: CellThalamusDB,
+    design_id: str,
+    compound: str,
+    cell_line: str,
+    metric: str,
+    timepoint: Optional[float]
+):
+    """Mean/std/n per dose for one compound and cell line."""
+    data = db.get_dose_response_data(design_id, compound, cell_line, metric, timepoint)
+
+    if not data:
+        raise HTTPException(status_code=404, detail="No dose-response data found")
+
+    # Convert to dict format with mean, std, n
+    return {
+        "doses": [d[0] for d in data],
+        "values": [d[1] for d in data],  # mean
+        "std": [d[2] for d in data],     # standard deviation
+        "n": [d[3] for d in data],       # sample size
+        "compound": compound,
+        "cell_line": cell_line,
+        "metric": metric
+    }
+
+
 @router.get("/api/thalamus/designs/{design_id}/dose-response")
 async def get_dose_response(design_id: str, compound: str, cell_line: str, metric: str = "atp_signal", timepoint: Optional[float] = None):
     """Get dose-response data for a specific compound/cell line with error bars"""
     try:
-        db = CellThalamusDB(db_path=DB_PATH)
-        data = db.get_dose_response_data(design_id, compound, cell_line, metric, timepoint)
-        db.close()
-
-        if not data:
-            raise HTTPException(status_code=404, detail="No dose-response data found")
-
-        # Convert to dict format with mean, std, n
-        return {
-            "doses": [d[0] for d in data],
-            "values": [d[1] for d in data],  # mean
-            "std": [d[2] for d in data],     # standard deviation
-            "n": [d[3] for d in data],       # sample size
-            "compound": compound,
-            "cell_line": cell_line,
-            "metric": metric
-        }
+        return await cached_response(
+            DB_PATH, design_id, "dose-response", _dose_response,
+            compound=compound, cell_line=cell_line, metric=metric, timepoint=timepoint
+        )
 
     except Exception as e:
         logger.error(f"Error getting dose-response: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/api/thalamus/analysis-cache")
+async def get_analysis_cache_stats():
+    """
+    Statistics for the in-process results/analysis response cache.
+
+    Returns hit/miss/eviction/invalidation counters, hit rate, entry count and size.
+    """
+    return ANALYSIS_CACHE.stats()
+
+
+@router.delete("/api/thalamus/analysis-cache")
+async def clear_analysis_cache():
+    """Drop all cached results/analysis responses and reset counters."""
+    ANALYSIS_CACHE.clear()
+    return ANALYSIS_CACHE.stats()
@@ -9,6 +9,8 @@ import uuid
 from typing import Dict, Any
 from fastapi import APIRouter, HTTPException, BackgroundTasks
 
+from cell_os.biology.simulation_cache import DEFAULT_CACHE_PATH, SimulationResultCache
+
 from ..models import RunSimulationRequest, AutonomousLoopRequest, DesignResponse
 from ..services import run_simulation_task, run_autonomous_loop_task
 
@@ -22,16 +24,19 @@ DB_PATH: str = ""
 USE_LAMBDA: bool = False
 lambda_client = None
 LAMBDA_FUNCTION_NAME: str = ""
+SIM_CACHE_PATH: str = DEFAULT_CACHE_PATH
 
 
-def init_globals(sims, db_path, use_lambda, client, func_name):
+def init_globals(sims, db_path, use_lambda, client, func_name, sim_cache_path=None):
     """Initialize global state from main app"""
-    global running_simulations, DB_PATH, USE_LAMBDA, lambda_client, LAMBDA_FUNCTION_NAME
+    global running_simulations, DB_PATH, USE_LAMBDA, lambda_client, LAMBDA_FUNCTION_NAME, SIM_CACHE_PATH
     running_simulations = sims
     DB_PATH = db_path
     USE_LAMBDA = use_lambda
     lambda_client = client
     LAMBDA_FUNCTION_NAME = func_name
+    if sim_cache_path:
+        SIM_CACHE_PATH = sim_cache_path
 
 
 @router.post("/api/thalamus/run", response_model=DesignResponse)
@@ -151,3 +156,31 @@ async def run_autonomous_loop(request: AutonomousLoopRequest, background_tasks:
     except Exception as e:
         logger.error(f"Error starting autonomous loop: {e}")
         raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.get("/api/thalamus/simulation-cache")
+def get_simulation_cache_stats():
+    """
+    Result cache statistics for standalone simulation runs.
+
+    Returns hit/miss/eviction counters, hit rate, entry count and stored size.
+    Plain def: FastAPI runs it in its threadpool, off the event loop (sqlite I/O).
+    """
+    try:
+        with SimulationResultCache(SIM_CACHE_PATH) as cache:
+            return cache.stats()
+    except Exception as e:
+        logger.error(f"Error reading simulation cache stats: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+@router.delete("/api/thalamus/simulation-cache")
+def clear_simulation_cache():
+    """Drop all cached simulation results and reset counters (threadpool, like the stats route)."""
+    try:
+        with SimulationResultCache(SIM_CACHE_PATH) as cache:
+            cache.clear()
+            return cache.stats()
+    except Exception as e:
+        logger.error(f"Error clearing simulation cache: {e}")
+        raise HTTPException(status_code=500, detail=str(e))
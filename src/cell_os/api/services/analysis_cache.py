@@ -0,0 +1,169 @@
+"""
+Analysis Cache
+
+Design-level memoization for results/analysis endpoints.
+
+Dashboards poll the same design repeatedly; every poll used to reopen the
+database, pull every row as dicts and refit PCA/variance models. Responses
+are now cached as rendered JSON, keyed by
+(db_path, design_id, endpoint, params, results version), where the results
+version is the design's (row count, max result_id). Writes from any
+process change the version; in-process writes through CellThalamusDB also
+drop the design's entries immediately via a results listener.
+
+All blocking work (sqlite, numpy, sklearn) runs in the threadpool so the
+event loop stays responsive.
+"""
+
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+from fastapi import Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from cell_os.database.cell_thalamus_db import CellThalamusDB, add_results_listener
+
+logger = logging.getLogger(__name__)
+
+# Default LRU bounds (entries and total rendered JSON bytes)
+DEFAULT_MAX_ENTRIES = 256
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024
+
+
+class AnalysisCache:
+    """Thread-safe LRU of rendered JSON responses, grouped by (db_path, design_id)."""
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[Tuple, bytes]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    def get(self, key: Tuple) -> Optional[bytes]:
+        with self._lock:
+            body = self._entries.get(key)
+            if body is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return body
+
+    def put(self, key: Tuple, body: bytes):
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old)
+            if len(body) > self.max_bytes:
+                return
+            self._entries[key] = body
+            self._size += len(body)
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted)
+                self.evictions += 1
+
+    def invalidate(self, db_path: str, design_id: str):
+        """Drop every cached response for a design."""
+        db_path = os.path.abspath(db_path)
+        with self._lock:
+            stale = [k for k in self._entries if k[0] == db_path and k[1] == design_id]
+            for key in stale:
+                self._size -= len(self._entries.pop(key))
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+                'hit_rate': self.hits / lookups if lookups else None,
+                'entries': len(self._entries),
+                'size_bytes': self._size,
+                'max_entries': self.max_entries,
+                'max_bytes': self.max_bytes,
+            }
+
+
+ANALYSIS_CACHE = AnalysisCache()
+add_results_listener(ANALYSIS_CACHE.invalidate)
+
+
+def render_json(content: Any) -> bytes:
+    """Render a response body exactly as FastAPI would for a returned value."""
+    return JSONResponse(jsonable_encoder(content)).body
+
+
+def _params_key(params: Dict[str, Any]) -> Tuple[Tuple[str, Hashable], ...]:
+    return tuple(sorted(params.items()))
+
+
+def _cached_body(
+    db_path: str,
+    design_id: str,
+    endpoint: str,
+    params: Dict[str, Any],
+    compute: Callable[..., Any],
+    cache: AnalysisCache,
+) -> bytes:
+    db = CellThalamusDB(db_path=db_path)
+    try:
+        key = (
+            os.path.abspath(db_path), design_id, endpoint, _params_key(params),
+            db.get_results_version(design_id),
+        )
+        body = cache.get(key)
+        if body is None:
+            body = render_json(compute(db, design_id, **params))
+            cache.put(key, body)
+        return body
+    finally:
+        db.close()
+
+
+async def cached_response(
+    db_path: str,
+    design_id: str,
+    endpoint: str,
+    compute: Callable[..., Any],
+    cache: AnalysisCache = ANALYSIS_CACHE,
+    **params: Any,
+) -> Response:
+    """
+    Serve compute(db, design_id, **params) from the analysis cache.
+
+    compute runs in the threadpool with an open CellThalamusDB; HTTPExceptions
+    it raises propagate (and are not cached).
+
+    Args:
+        db_path: Database path
+        design_id: Design the response is derived from
+        endpoint: Endpoint name (part of the cache key)
+        compute: Function building the response content
+        cache: Cache instance (default: process-wide ANALYSIS_CACHE)
+        **params: Hashable query parameters (part of the cache key)
+
+    Returns:
+        JSON Response
+    """
+    body = await run_in_threadpool(_cached_body, db_path, design_id, endpoint, params, compute, cache)
+    return Response(content=body, media_type="application/json")
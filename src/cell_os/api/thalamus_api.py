@@ -43,6 +43,9 @@ running_simulations: Dict[str, Dict[str, Any]] = {}
 # Database path - use absolute path to work from any directory
 DB_PATH = str(Path(__file__).parent.parent.parent.parent / "data" / "cell_thalamus.db")
 
+# Content-addressed cache of finished standalone simulation runs
+SIM_CACHE_PATH = str(Path(__file__).parent.parent.parent.parent / "data" / "simulation_cache.db")
+
 # Lambda configuration
 USE_LAMBDA = os.getenv('USE_LAMBDA', 'false').lower() == 'true'
 LAMBDA_FUNCTION_NAME = os.getenv('LAMBDA_FUNCTION_NAME', 'cell-thalamus-simulator')
@@ -80,7 +83,7 @@ async def root():
 from .routes import simulations, designs, results, analysis, catalog, watcher, plates, epistemic
 
 # Initialize global state in route modules that need it
-simulations.init_globals(running_simulations, DB_PATH, USE_LAMBDA, lambda_client, LAMBDA_FUNCTION_NAME)
+simulations.init_globals(running_simulations, DB_PATH, USE_LAMBDA, lambda_client, LAMBDA_FUNCTION_NAME, SIM_CACHE_PATH)
 designs.init_globals(running_simulations, DB_PATH)
 results.init_globals(DB_PATH)
 analysis.init_globals(DB_PATH)
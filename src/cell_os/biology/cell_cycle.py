@@ -15,9 +15,12 @@ References:
 """
 
 import numpy as np
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+
+from scipy.linalg import expm
 
 
 class CellCyclePhase(str, Enum):
@@ -309,6 +312,99 @@ class PhaseDistribution:
         )
 
 
+# Transition rates in the order used to key cached propagators
+_RATE_KEYS = ('g1_to_s', 's_to_g2', 'g2_to_m', 'm_to_g1', 'g1_to_g0', 'g0_to_g1')
+
+
+def _rate_matrix(rates: Dict[str, float]) -> np.ndarray:
+    """
+    Rate matrix A of dX/dt = A X over (G0, G1, S, G2, M).
+
+    Mitosis feeds G1 with two daughters per exit (2 * m_to_g1).
+    """
+    A = np.zeros((5, 5))
+    A[0, 0] = -rates['g0_to_g1']
+    A[0, 1] = rates['g1_to_g0']
+    A[1, 0] = rates['g0_to_g1']
+    A[1, 1] = -(rates['g1_to_s'] + rates['g1_to_g0'])
+    A[1, 4] = 2 * rates['m_to_g1']
+    A[2, 1] = rates['g1_to_s']
+    A[2, 2] = -rates['s_to_g2']
+    A[3, 2] = rates['s_to_g2']
+    A[3, 3] = -rates['g2_to_m']
+    A[4, 3] = rates['g2_to_m']
+    A[4, 4] = -rates['m_to_g1']
+    return A
+
+
+@lru_cache(maxsize=1024)
+def _cached_propagator(rate_values: Tuple[float, ...], dt_h: float) -> np.ndarray:
+    P = expm(_rate_matrix(dict(zip(_RATE_KEYS, rate_values))) * dt_h)
+    P.setflags(write=False)
+    return P
+
+
+def phase_propagator(rates: Dict[str, float], dt_h: float) -> np.ndarray:
+    """
+    Exact propagator expm(A * dt) for piecewise-constant rates.
+
+    Rates only change with drugs, checkpoints or culture conditions, so the
+    matrix is cached per (rate set, dt). The result is read-only.
+    """
+    return _cached_propagator(tuple(float(rates[k]) for k in _RATE_KEYS), float(dt_h))
+
+
+# Steps per block of precomputed matrix powers (bounds memory for long runs)
+_PROPAGATE_BLOCK_STEPS = 4096
+
+
+def _matrix_powers(P: np.ndarray, n: int) -> np.ndarray:
+    """
+    P^1..P^n for each row of a (B, 5, 5) stack by repeated doubling.
+
+    Each power is rescaled by its largest entry: only the direction of the
+    propagated distribution matters, and this keeps long horizons finite.
+    """
+    powers = np.empty((P.shape[0], n, 5, 5))
+    powers[:, 0] = P
+    filled = 1
+    while filled < n:
+        m = min(filled, n - filled)
+        block = powers[:, :m] @ powers[:, filled - 1:filled]
+        block /= block.max(axis=(2, 3), keepdims=True)
+        powers[:, filled:filled + m] = block
+        filled += m
+    return powers
+
+
+def _propagate(P: np.ndarray, x0: np.ndarray, n_steps: int) -> np.ndarray:
+    """
+    Distributions after each of n_steps applications of per-row propagators.
+
+    Args:
+        P: (B, 5, 5) propagators
+        x0: (B, 5) starting distributions
+
+    Returns:
+        (B, n_steps, 5) normalized distributions after each step
+    """
+    out = np.empty((x0.shape[0], n_steps, 5))
+    if n_steps == 0:
+        return out
+
+    powers = _matrix_powers(P, min(n_steps, _PROPAGATE_BLOCK_STEPS))
+    x = x0
+    for start in range(0, n_steps, _PROPAGATE_BLOCK_STEPS):
+        stop = min(start + _PROPAGATE_BLOCK_STEPS, n_steps)
+        block = (powers[:, :stop - start] @ x[:, None, :, None])[..., 0]
+        np.maximum(block, 0.0, out=block)
+        total = block.sum(axis=2, keepdims=True)
+        np.divide(block, total, out=block, where=total > 0)
+        out[:, start:stop] = block
+        x = block[:, -1]
+    return out
+
+
 class CellCycleModel:
     """
     Comprehensive cell cycle dynamics model.
@@ -451,43 +547,22 @@ class CellCycleModel:
         """
         Advance cell cycle by dt hours.
 
+        Any dt is taken in one exact step; deaths from arrest are accrued
+        with the end-of-step distribution, so use a fine grid (simulate)
+        when death timing matters.
+
         Returns dict with phase distribution and events.
         """
         rates = self._compute_effective_rates(confluence, serum_fraction, nutrients)
 
-        # Current distribution
-        g0, g1, s, g2, m = (
-            self.distribution.g0,
-            self.distribution.g1,
-            self.distribution.s,
-            self.distribution.g2,
-            self.distribution.m
-        )
-
-        # ODE: dX/dt = inflow - outflow
-        # Using forward Euler (simple but stable for small dt)
-        dg0 = rates['g1_to_g0'] * g1 - rates['g0_to_g1'] * g0
-        dg1 = rates['g0_to_g1'] * g0 + 2 * rates['m_to_g1'] * m - rates['g1_to_s'] * g1 - rates['g1_to_g0'] * g1
-        ds = rates['g1_to_s'] * g1 - rates['s_to_g2'] * s
-        dg2 = rates['s_to_g2'] * s - rates['g2_to_m'] * g2
-        dm = rates['g2_to_m'] * g2 - rates['m_to_g1'] * m
-
-        # Update
-        self.distribution.g0 = max(0, g0 + dg0 * dt_h)
-        self.distribution.g1 = max(0, g1 + dg1 * dt_h)
-        self.distribution.s = max(0, s + ds * dt_h)
-        self.distribution.g2 = max(0, g2 + dg2 * dt_h)
-        self.distribution.m = max(0, m + dm * dt_h)
-
-        # Renormalize
-        total = (self.distribution.g0 + self.distribution.g1 +
-                 self.distribution.s + self.distribution.g2 + self.distribution.m)
+        # Rates are constant over the step, so the linear ODE is solved exactly:
+        # X(t + dt) = expm(A dt) X(t), renormalized (division grows the population)
+        x = phase_propagator(rates, dt_h) @ self.distribution.to_array()
+        np.maximum(x, 0.0, out=x)
+        total = x.sum()
         if total > 0:
-            self.distribution.g0 /= total
-            self.distribution.g1 /= total
-            self.distribution.s /= total
-            self.distribution.g2 /= total
-            self.distribution.m /= total
+            x /= total
+        self._set_distribution(x)
 
         # Track arrest time and compute death
         deaths = self._compute_arrest_deaths(dt_h, rates)
@@ -501,6 +576,60 @@ class CellCycleModel:
             'time_h': self.time_h,
         }
 
+    def _set_distribution(self, x: np.ndarray):
+        """Write a normalized (G0, G1, S, G2, M) array into the distribution in place."""
+        d = self.distribution
+        d.g0, d.g1, d.s, d.g2, d.m = (float(v) for v in x)
+
+    def _arrest_death_series(self, trajectory: np.ndarray, dt_h: float) -> np.ndarray:
+        """
+        Per-step deaths from arrest along a trajectory of equal steps.
+
+        Vectorized form of calling _compute_arrest_deaths after every step:
+        updates time_in_arrest and total_deaths identically.
+
+        Args:
+            trajectory: (n_steps, 5) distribution after each step
+        """
+        n_steps = trajectory.shape[0]
+        deaths = np.zeros(n_steps)
+        steps = np.arange(n_steps)
+
+        # Per-step arrest-time increments for each phase (all drugs together)
+        arrest = []
+        phase_increment = {phase: 0.0 for phase in CellCyclePhase}
+        for drug_name, dose in self.active_drugs.items():
+            if drug_name not in DRUG_CYCLE_EFFECTS:
+                continue
+            effect = DRUG_CYCLE_EFFECTS[drug_name]
+            if not effect.death_from_arrest:
+                continue
+            arrest_fraction = dose / (dose + effect.arrest_ec50_uM) * effect.arrest_strength
+            arrest.append((effect, arrest_fraction, phase_increment[effect.target_phase]))
+            phase_increment[effect.target_phase] += dt_h * arrest_fraction
+
+        phase_index = {phase: i for i, phase in enumerate(CellCyclePhase)}
+        for effect, arrest_fraction, earlier_increment in arrest:
+            phase = effect.target_phase
+            # Arrest time seen by this drug at step k (earlier drugs in the same
+            # step have already added their share)
+            time_in_arrest = (self.time_in_arrest[phase]
+                              + steps * phase_increment[phase]
+                              + earlier_increment + dt_h * arrest_fraction)
+            excess_time = time_in_arrest - effect.arrest_tolerance_h
+            death_rate = np.where(
+                excess_time > 0,
+                effect.death_rate_arrested * (1 - np.exp(-np.maximum(excess_time, 0.0) / 10)),
+                0.0,
+            )
+            deaths += trajectory[:, phase_index[phase]] * arrest_fraction * death_rate * dt_h
+
+        for phase, increment in phase_increment.items():
+            self.time_in_arrest[phase] += n_steps * increment
+
+        self.total_deaths += float(deaths.sum())
+        return deaths
+
     def _compute_arrest_deaths(self, dt_h: float, rates: Dict[str, float]) -> float:
         """Compute deaths from prolonged cell cycle arrest."""
         deaths = 0.0
@@ -543,37 +672,12 @@ class CellCycleModel:
         """
         Simulate cell cycle for given duration.
 
+        Rates are constant for the whole call, so each grid step applies one
+        cached matrix exponential. Output is sampled every dt_h.
+
         Returns time series of phase distributions.
         """
-        n_steps = int(duration_h / dt_h)
-        times = np.zeros(n_steps)
-        g0 = np.zeros(n_steps)
-        g1 = np.zeros(n_steps)
-        s = np.zeros(n_steps)
-        g2 = np.zeros(n_steps)
-        m = np.zeros(n_steps)
-        deaths = np.zeros(n_steps)
-
-        for i in range(n_steps):
-            result = self.step(dt_h, confluence, serum_fraction, nutrients)
-            times[i] = self.time_h
-            g0[i] = self.distribution.g0
-            g1[i] = self.distribution.g1
-            s[i] = self.distribution.s
-            g2[i] = self.distribution.g2
-            m[i] = self.distribution.m
-            deaths[i] = result['deaths_from_arrest']
-
-        return {
-            'time_h': times,
-            'G0': g0,
-            'G1': g1,
-            'S': s,
-            'G2': g2,
-            'M': m,
-            'deaths': deaths,
-            'cumulative_deaths': np.cumsum(deaths),
-        }
+        return simulate_batch([self], duration_h, dt_h, confluence, serum_fraction, nutrients)[0]
 
     # =========================================================================
     # SYNCHRONIZATION PROTOCOLS
@@ -838,6 +942,57 @@ class CellCycleModel:
         return 0.5 + phase_fraction * 1.5  # Range: 0.5 to 2.0
 
 
+# =============================================================================
+# BATCHED SIMULATION
+# =============================================================================
+
+def simulate_batch(
+    models: Sequence[CellCycleModel],
+    duration_h: float,
+    dt_h: float = 0.1,
+    confluence: float = 0.5,
+    serum_fraction: float = 1.0,
+    nutrients: float = 1.0
+) -> List[Dict[str, np.ndarray]]:
+    """
+    Evolve many models (cell lines, drugs, checkpoints) on one time grid at once.
+
+    Equivalent to calling model.simulate(...) on each model; every model is
+    advanced in place and gets its own result dict.
+    """
+    n_steps = int(duration_h / dt_h)
+    if not models:
+        return []
+
+    P = np.stack([
+        phase_propagator(m._compute_effective_rates(confluence, serum_fraction, nutrients), dt_h)
+        for m in models
+    ])
+    x0 = np.stack([m.distribution.to_array() for m in models])
+    trajectories = _propagate(P, x0, n_steps)
+
+    results = []
+    for model, traj in zip(models, trajectories):
+        # Accumulate time exactly as repeated `time_h += dt_h` would
+        times = np.cumsum(np.concatenate(([model.time_h], np.full(n_steps, dt_h))))[1:]
+        if n_steps:
+            model._set_distribution(traj[-1])
+            model.time_h = float(times[-1])
+        deaths = model._arrest_death_series(traj, dt_h)
+
+        results.append({
+            'time_h': times,
+            'G0': traj[:, 0].copy(),
+            'G1': traj[:, 1].copy(),
+            'S': traj[:, 2].copy(),
+            'G2': traj[:, 3].copy(),
+            'M': traj[:, 4].copy(),
+            'deaths': deaths,
+            'cumulative_deaths': np.cumsum(deaths),
+        })
+    return results
+
+
 # =============================================================================
 # CONVENIENCE FUNCTIONS
 # =============================================================================
@@ -865,6 +1020,17 @@ def simulate_drug_treatment_cycle(
     # Simulate with drug
     treatment = model.simulate(duration_h=duration_h)
 
+    return _treatment_summary(model, cell_line, drug_name, dose_uM, baseline, treatment)
+
+
+def _treatment_summary(
+    model: CellCycleModel,
+    cell_line: str,
+    drug_name: str,
+    dose_uM: float,
+    baseline: Dict[str, np.ndarray],
+    treatment: Dict[str, np.ndarray]
+) -> Dict[str, any]:
     return {
         'cell_line': cell_line,
         'drug': drug_name,
@@ -884,12 +1050,23 @@ def compare_cell_lines_response(
     duration_h: float = 48.0,
     cell_lines: Optional[List[str]] = None
 ) -> Dict[str, Dict]:
-    """Compare drug response across cell lines."""
+    """
+    Compare drug response across cell lines.
+
+    Same protocol as simulate_drug_treatment_cycle (12h baseline, then drug),
+    with all cell lines evolved together by simulate_batch.
+    """
     if cell_lines is None:
         cell_lines = list(CELL_LINE_PROFILES.keys())
 
+    models = [CellCycleModel(cell_line=cl, seed=42) for cl in cell_lines]
+    baselines = simulate_batch(models, duration_h=12.0)
+    for model in models:
+        model.add_drug(drug_name, dose_uM)
+    treatments = simulate_batch(models, duration_h=duration_h)
+
     results = {}
-    for cl in cell_lines:
-        results[cl] = simulate_drug_treatment_cycle(cl, drug_name, dose_uM, duration_h)
+    for cl, model, baseline, treatment in zip(cell_lines, models, baselines, treatments):
+        results[cl] = _treatment_summary(model, cl, drug_name, dose_uM, baseline, treatment)
 
     return results
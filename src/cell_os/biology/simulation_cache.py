@@ -0,0 +1,199 @@
+"""
+Content-addressed cache for finished standalone simulation runs.
+
+A standalone run is fully determined by its design_id (a blake2s hash of the
+mode, seed, cell lines, compounds and every parameter constant), the
+simulator version marker, the simulator source code, the exact well list
+and the feature flags. Identical runs therefore produce identical result
+tables, and re-simulating them is wasted work.
+
+Entries are stored in a single sqlite file as zlib-compressed JSON blobs,
+keyed by a hash of those inputs. The cache is LRU-capped by total blob
+size (least recently used entries are evicted on insert), and hit/miss
+counters are persisted so the API can report them across processes.
+
+Usage:
+    cache = SimulationResultCache("data/simulation_cache.db", max_bytes=512 * 2**20)
+    key = cache_key(design_id=design_id, sim_version=SIM_VERSION, code_hash=code_hash(*SIMULATOR_SOURCES), ...)
+    results = cache.get(key)
+    if results is None:
+        results = simulate(...)
+        cache.put(key, results, design_id=design_id)
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+# Default cache location (next to the dashboard database)
+DEFAULT_CACHE_PATH = str(Path(__file__).parent.parent.parent.parent / "data" / "simulation_cache.db")
+
+# Default size cap for stored result blobs (compressed)
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+_code_hashes: Dict[str, str] = {}
+
+
+def code_hash(*source_paths: str) -> str:
+    """
+    blake2s digest of the simulator source files (memoized per file and process).
+
+    A single path hashes that file; several paths hash their per-file digests
+    in order, so an edit to any of them changes the result.
+    """
+    digests = []
+    for source_path in source_paths:
+        source_path = os.path.abspath(source_path)
+        if source_path not in _code_hashes:
+            with open(source_path, "rb") as f:
+                _code_hashes[source_path] = hashlib.blake2s(f.read(), digest_size=16).hexdigest()
+        digests.append(_code_hashes[source_path])
+    if len(digests) == 1:
+        return digests[0]
+    return hashlib.blake2s("".join(digests).encode("utf-8"), digest_size=16).hexdigest()
+
+
+def cache_key(**parts: Any) -> str:
+    """
+    Content address for a run: blake2s over the canonical JSON of `parts`.
+
+    Callers pass everything that determines the results table
+    (design_id, sim_version, code_hash, design digest, flags, ...).
+    """
+    payload = json.dumps(parts, sort_keys=True, separators=(",", ":"), allow_nan=False, default=str)
+    return hashlib.blake2s(payload.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class SimulationResultCache:
+    """
+    On-disk LRU cache of simulation result tables.
+
+    Each entry holds the list of per-well result dicts of one run. Reads
+    refresh the entry's access time; writes evict least recently used
+    entries until the total stored size fits in max_bytes.
+    """
+
+    def __init__(self, path: str = DEFAULT_CACHE_PATH, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.path = os.path.abspath(path)
+        self.max_bytes = int(max_bytes)
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        self.conn = sqlite3.connect(self.path)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_schema()
+
+    def _create_schema(self):
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS sim_cache (
+                cache_key TEXT PRIMARY KEY,
+                design_id TEXT,
+                n_results INTEGER,
+                size_bytes INTEGER,
+                created_at REAL,
+                last_access REAL,
+                payload BLOB
+            )
+        """)
+        self.conn.execute("CREATE INDEX IF NOT EXISTS ix_sim_cache_lru ON sim_cache (last_access)")
+        self.conn.execute("""
+            CREATE TABLE IF NOT EXISTS sim_cache_stats (
+                name TEXT PRIMARY KEY,
+                value INTEGER
+            )
+        """)
+        self.conn.executemany(
+            "INSERT OR IGNORE INTO sim_cache_stats (name, value) VALUES (?, 0)",
+            [("hits",), ("misses",), ("evictions",)],
+        )
+        self.conn.commit()
+
+    def _bump(self, name: str, n: int = 1):
+        self.conn.execute("UPDATE sim_cache_stats SET value = value + ? WHERE name = ?", (n, name))
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        """Return cached results for `key`, or None on a miss."""
+        row = self.conn.execute("SELECT payload FROM sim_cache WHERE cache_key = ?", (key,)).fetchone()
+        if row is None:
+            self._bump("misses")
+            self.conn.commit()
+            return None
+
+        self.conn.execute("UPDATE sim_cache SET last_access = ? WHERE cache_key = ?", (time.time(), key))
+        self._bump("hits")
+        self.conn.commit()
+        return json.loads(zlib.decompress(row[0]).decode("utf-8"))
+
+    def put(self, key: str, results: List[Dict], design_id: Optional[str] = None) -> bool:
+        """
+        Store results for `key` and evict LRU entries over the size cap.
+
+        Returns False (nothing stored) if the entry alone exceeds max_bytes.
+        """
+        payload = zlib.compress(json.dumps(results, separators=(",", ":")).encode("utf-8"))
+        if len(payload) > self.max_bytes:
+            return False
+
+        now = time.time()
+        self.conn.execute("""
+            INSERT OR REPLACE INTO sim_cache
+            (cache_key, design_id, n_results, size_bytes, created_at, last_access, payload)
+            VALUES (?, ?, ?, ?, ?, ?, ?)
+        """, (key, design_id, len(results), len(payload), now, now, payload))
+        self._evict(keep=key)
+        self.conn.commit()
+        return True
+
+    def _evict(self, keep: str):
+        total = self.conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM sim_cache").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        victims = self.conn.execute(
+            "SELECT cache_key, size_bytes FROM sim_cache WHERE cache_key != ? ORDER BY last_access",
+            (keep,),
+        ).fetchall()
+        evicted = []
+        for victim_key, size in victims:
+            if total <= self.max_bytes:
+                break
+            evicted.append((victim_key,))
+            total -= size
+        self.conn.executemany("DELETE FROM sim_cache WHERE cache_key = ?", evicted)
+        self._bump("evictions", len(evicted))
+
+    def clear(self):
+        """Drop all entries and reset counters."""
+        self.conn.execute("DELETE FROM sim_cache")
+        self.conn.execute("UPDATE sim_cache_stats SET value = 0")
+        self.conn.commit()
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss/eviction counters and current size."""
+        counters = dict(self.conn.execute("SELECT name, value FROM sim_cache_stats").fetchall())
+        entries, size = self.conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM sim_cache"
+        ).fetchone()
+        lookups = counters["hits"] + counters["misses"]
+        return {
+            "hits": counters["hits"],
+            "misses": counters["misses"],
+            "evictions": counters["evictions"],
+            "hit_rate": counters["hits"] / lookups if lookups else None,
+            "entries": entries,
+            "size_bytes": size,
+            "max_bytes": self.max_bytes,
+            "path": self.path,
+        }
+
+    def close(self):
+        self.conn.close()
+
+    def __enter__(self) -> "SimulationResultCache":
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
@@ -91,11 +91,13 @@ from datetime import datetime
 from zoneinfo import ZoneInfo
 from pathlib import Path
 from dataclasses import dataclass
-from contextlib import contextmanager
+from contextlib import contextmanager, nullcontext
 
 import numpy as np
 from tqdm import tqdm
 
+from .simulation_cache import DEFAULT_CACHE_PATH, SimulationResultCache, cache_key, code_hash
+
 # Pacific timezone for timestamps
 PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
 
@@ -971,470 +973,577 @@ CELL_LINE_SENSITIVITY = {
 # Simulation
 # ============================================================================
 
-def simulate_well(well: WellAssignment, design_id: str) -> Optional[Dict]:
-    """Simulate a single well experiment with realistic compound effects."""
+@dataclass(frozen=True)
+class ConditionResponse:
+    """
+    Deterministic (noise-free) response of one experimental condition.
 
-    try:
-        # ============= MORPHOLOGY BLOCK (Adaptive vs Damage + Real Tech + Corr Bio) =============
-
-        # Initialize baseline morphology for this cell line
-        base = BASELINE_MORPH.get(well.cell_line, BASELINE_MORPH['A549'])
-        morph = {ch: float(base[ch]) for ch in CHANNELS}
-
-        # Advanced biology: density effects on CV and IC50
-        density_effects = None
-        if USE_ADVANCED_BIOLOGY:
-            # Estimate confluence from seeding density (simplified)
-            confluence = min(0.9, 0.5 + 0.01 * well.timepoint_h)  # Grows over time
-            density_effects = _get_density_effects(confluence)
-
-        # Precompute "true" viability_effect for damage coupling (tracks physics)
-        # Keep adaptive A(dose) MOA-shaped using base EC50, but damage D uses this.
-        viability_effect_true = 1.0
-        stress_axis = None
-        intensity = 1.0
-        hill_slope = 2.0
-        ec50 = None
-
-        if well.compound in COMPOUND_PARAMS:
-            params = COMPOUND_PARAMS[well.compound]
-            ec50 = float(params['ec50_uM'])
-            hill_slope = float(params['hill_slope'])
-            intensity = float(params.get('intensity', 1.0))  # morphology magnitude only
-            stress_axis = params['stress_axis']
-
-            if well.dose_uM > 0:
-                # Cell-line-adjusted IC50 logic (mirror viability section below)
-                if stress_axis == 'microtubule':
-                    prolif = PROLIF_INDEX.get(well.cell_line, 1.0)
-
-                    # Improved microtubule model: mitosis + functional dependency
-                    mitosis_mult = 1.0 / max(prolif, 0.3)
-                    functional_dependency = {
-                        'A549': 0.2, 'HepG2': 0.2,
-                        'iPSC_NGN2': 0.8, 'iPSC_Microglia': 0.5
-                    }.get(well.cell_line, 0.3)
-                    # Modest functional adjustment (20% max) since morphology fails first
-                    ic50_mult = mitosis_mult * (1.0 + functional_dependency * 0.2)
-                    ic50_mult = max(0.3, min(5.0, ic50_mult))
-
-                    hill_v = hill_slope * (0.8 + 0.4 * prolif)
-                else:
-                    ic50_mult = CELL_LINE_SENSITIVITY.get(well.compound, {}).get(well.cell_line, 1.0)
-                    hill_v = hill_slope
-
-                ic50_viability = max(1e-9, ec50 * ic50_mult)
-
-                # Advanced biology: confluence increases drug resistance
-                if USE_ADVANCED_BIOLOGY and density_effects:
-                    ic50_viability *= density_effects['ic50_multiplier']
-
-                # Cell cycle dynamics: phase-specific drug sensitivity
-                # More cells in target phase = more sensitive (lower effective IC50)
-                if USE_CELL_CYCLE_DYNAMICS:
-                    cycle_sensitivity = _get_cell_cycle_drug_sensitivity(
-                        well.cell_line, well.compound, stress_axis, get_rng().seed
-                    )
-                    # Sensitivity > 1 means more sensitive → lower IC50
-                    ic50_viability /= max(0.5, min(2.0, cycle_sensitivity))
-
-                viability_effect_true = 1.0 / (1.0 + (well.dose_uM / ic50_viability) ** hill_v)
-
-        # Apply compound morphology effects (only when dose > 0)
-        if stress_axis is not None and well.dose_uM > 0:
-            # Adaptive curve A(dose): hump-shaped in base potency space (MOA-shaped)
-            x = well.dose_uM / max(ec50, 1e-9)
-            A = (x ** hill_slope) / ((1.0 + x ** hill_slope) ** 2)
-            A = A / 0.25  # normalize peak to ~1 at x=1
-
-            # Damage curve D(dose): must track true death physics
-            D = 1.0 - float(viability_effect_true)
-
-            # Time mixing: early = adaptive-dominant, late = damage-dominant
-            if well.timepoint_h <= 12:
-                wA, wD = 1.0, 0.30
-            else:
-                wA, wD = 0.30, 1.0
+    Depends only on (cell_line, compound, dose_uM, timepoint_h), so every
+    replicate well of a condition shares it. Per-well noise is applied on top
+    by _measure_well().
+    """
+    morph: Dict[str, float]             # Structural morphology before noise
+    viability_effect_true: float        # Hill viability driving damage D(dose) and bio-noise CV
+    transport_dysfunction_score: float
+    viability_effect: float             # Survival fraction after compound + attrition
+    ldh_signal: float                   # LDH before noise
+    ic50_base: Optional[float] = None
+    ic50_viability: Optional[float] = None
 
-            axis_mult = AXIS_CELL_MULT.get(stress_axis, {}).get(well.cell_line, 1.0)
-            axis_rules = MORPH_EFFECTS.get(stress_axis, {})
 
-            for ch in CHANNELS:
-                eff = axis_rules.get(ch, {'adapt': 0.0, 'damage': 0.0})
-                delta = intensity * axis_mult * (wA * eff['adapt'] * A + wD * eff['damage'] * D)
-                morph[ch] = base[ch] * (1.0 + delta)
+def condition_key(well: WellAssignment) -> Tuple[str, str, float, float]:
+    """Key of the deterministic response surface: (cell_line, compound, dose_uM, timepoint_h)."""
+    return (well.cell_line, well.compound, well.dose_uM, well.timepoint_h)
 
-            # Special handling for microtubule drugs: morphology disruption precedes viability loss
-            # Neurons show cytoskeletal disruption (actin, mito distribution) even when viable
-            if stress_axis == 'microtubule':
-                # Morphology EC50: Lower than viability EC50 (morphology fails first)
-                # Set at 30% of viability EC50 for neurons (transport disruption happens fast)
-                morph_ec50_fraction = {
-                    'iPSC_NGN2': 0.3,       # Morphology fails at 30% of viability dose
-                    'iPSC_Microglia': 0.5,  # Moderate
-                    'A549': 1.0,            # Morphology and viability fail together
-                    'HepG2': 1.0
-                }.get(well.cell_line, 1.0)
-
-                morph_ec50 = ec50 * morph_ec50_fraction
-
-                # Smooth saturating Hill equation (not sharp min() clamp)
-                morph_penalty = well.dose_uM / (well.dose_uM + morph_ec50)  # 0 to 1, smooth
-
-                if well.cell_line == 'iPSC_NGN2':
-                    # Neurons: major actin/mito disruption at doses below viability IC50
-                    morph['actin'] *= (1.0 - 0.6 * morph_penalty)  # Up to 60% reduction
-                    morph['mito'] *= (1.0 - 0.5 * morph_penalty)   # Mito distribution severely disrupted
-                elif well.cell_line == 'iPSC_Microglia':
-                    # Microglia: moderate actin disruption (migration/phagocytosis impaired)
-                    morph['actin'] *= (1.0 - 0.4 * morph_penalty)
-
-        # CRITICAL: Compute transport dysfunction from STRUCTURAL morphology
-        # Do this BEFORE adding noise and BEFORE applying viability scaling (if any)
-        # This prevents measurement contamination from creating runaway feedback loops
-        transport_dysfunction_score = 0.0
-        if stress_axis == 'microtubule' and well.cell_line == 'iPSC_NGN2':
-            # Measure actual STRUCTURAL disruption (after drug effects, before noise/attenuation)
-            actin_disruption = max(0.0, 1.0 - morph['actin'] / base['actin'])
-            mito_disruption = max(0.0, 1.0 - morph['mito'] / base['mito'])
-            # Average disruption (0 = no disruption, 1 = complete loss)
-            transport_dysfunction_score = 0.5 * (actin_disruption + mito_disruption)
-            # Clamp to [0, 1]
-            transport_dysfunction_score = min(1.0, max(0.0, transport_dysfunction_score))
-
-        # Add dose-dependent biological noise (matches main codebase)
-        # Note: Noise is added AFTER computing dysfunction to avoid measurement contamination
-        # Stressed cells show higher variability (heterogeneous death timing)
-        stress_level = 1.0 - float(viability_effect_true)  # 0 (healthy) to 1 (dead)
-
-        if USE_REALISTIC_NOISE:
-            # NEW: Realistic noise model with channel correlations and spatial gradients
-            noise_model = _get_realistic_noise_model(get_rng().seed)
-            morph = noise_model.apply_realistic_noise(
-                base_morphology=morph,
-                well_id=well.well_id,
-                plate_id=well.plate_id,
-                stress_level=stress_level
-            )
-        else:
-            # LEGACY: Independent noise per channel
-            stress_multiplier = 2.0  # Stressed cells have 2× higher CV
-            effective_bio_cv = MORPH_CV['er'] * (1.0 + stress_level * (stress_multiplier - 1.0))
-
-            # CRITICAL: Use per-well deterministic RNG for measurement noise
-            # This ensures workers=1 equals workers=N (not dependent on shared stream consumption order)
-            # Observer independence still maintained (physics RNG streams unchanged)
-            if effective_bio_cv > 0:
-                rng_well_morph = assay_rng_for_well(design_id, well.plate_id, well.cell_line, well.well_id, "morph_bio")
-                for ch in CHANNELS:
-                    morph[ch] *= rng_well_morph.normal(1.0, effective_bio_cv)
-
-        # Technical noise (batch effects) - MATCHES MAIN CODEBASE EXACTLY
-        # Extract batch information
-        plate_id = _get_attr(well, 'plate_id', None) or _get_attr(well, 'plate_name', None)
-        day_id = _get_attr(well, 'day', None) or _get_attr(well, 'day_index', None)
-        op_id = _get_attr(well, 'operator', None) or _get_attr(well, 'operator_id', None)
-        well_id = _get_attr(well, 'well_id', 'A1')
-        cell_line = _get_attr(well, 'cell_line', 'A549')
-
-        # Consistent batch effects per plate/day/operator (deterministic seeding)
-        # Only apply if CV > 0 (prevents RNG consumption when noise disabled)
-        plate_factor = 1.0
-        if TECH_CV['plate_cv'] > 0:
-            rng_plate = np.random.default_rng(stable_u32(f"plate_{plate_id}"))
-            plate_factor = rng_plate.normal(1.0, TECH_CV['plate_cv'])
-
-        day_factor = 1.0
-        if TECH_CV['day_cv'] > 0:
-            rng_day = np.random.default_rng(stable_u32(f"day_{day_id}"))
-            day_factor = rng_day.normal(1.0, TECH_CV['day_cv'])
-
-        operator_factor = 1.0
-        if TECH_CV['operator_cv'] > 0:
-            rng_operator = np.random.default_rng(stable_u32(f"operator_{op_id}"))
-            operator_factor = rng_operator.normal(1.0, TECH_CV['operator_cv'])
-
-        # Well factor MUST be deterministic (seed by well ID for workers=1 to match workers=N)
-        # Using rng.rng_assay would be nondeterministic across worker scheduling
-        well_factor = 1.0
-        if TECH_CV['well_cv'] > 0:
-            rng_well = np.random.default_rng(stable_u32(f"well_{plate_id}_{cell_line}_{well_id}"))
-            well_factor = rng_well.normal(1.0, TECH_CV['well_cv'])
-
-        # Edge effect: wells on plate edges show reduced signal
-        # Skip if using realistic noise (it handles spatial effects internally)
-        if USE_REALISTIC_NOISE:
-            edge_factor = 1.0  # Already applied in realistic noise model
-        else:
-            is_edge = _is_edge_well(well_id)
-            edge_factor = (1.0 - TECH_CV['edge_effect']) if is_edge else 1.0
 
-        # Combine all technical factors into one
-        total_tech_factor = plate_factor * day_factor * operator_factor * well_factor * edge_factor
-
-        # Apply single tech factor to ALL channels (not channel-specific)
-        for ch in CHANNELS:
-            morph[ch] *= total_tech_factor
-            morph[ch] = max(0.0, morph[ch])  # No negative signals
-
-        # Advanced biology: apply instrument artifacts (vignetting, illumination, focus)
-        if USE_ADVANCED_BIOLOGY:
-            from .realistic_noise import _parse_well_position
-            row, col = _parse_well_position(well_id)
-            inst_model = _get_instrument_model(get_rng().seed)
-            for ch in CHANNELS:
-                morph[ch] = inst_model.apply_all_effects(
-                    morph[ch], row, col, well_id, plate_id,
-                    time_in_run_h=0.0  # Simplified; could track actual time
-                )
+def simulate_condition(cell_line: str, compound: str, dose_uM: float, timepoint_h: float) -> ConditionResponse:
+    """
+    Evaluate the deterministic dose-response surface for one condition.
 
-        # Apply random well failures (2% of wells fail with extreme outliers)
-        # NOTE: Deterministic per-well (not per-design) for workers=1 vs workers=N comparison
-        well_failure = None
-        rng_failure = np.random.default_rng(stable_u32(f"failure_{plate_id}_{cell_line}_{well_id}"))
-        if rng_failure.random() < TECH_CV['well_failure_rate']:
-            # Well failed - apply random extreme multiplier
-            failure_type = rng_failure.choice(['bubble', 'contamination', 'pipetting_error'])
-            if failure_type == 'bubble':
-                # Bubble in well → near-zero signal
-                for ch in CHANNELS:
-                    morph[ch] = rng_failure.uniform(0.1, 2.0)
-            elif failure_type == 'contamination':
-                # Contamination → 5-20× higher signal
-                for ch in CHANNELS:
-                    morph[ch] *= rng_failure.uniform(5.0, 20.0)
-            elif failure_type == 'pipetting_error':
-                # Wrong volume → 5-30% of normal
-                for ch in CHANNELS:
-                    morph[ch] *= rng_failure.uniform(0.05, 0.3)
-            well_failure = failure_type
-
-        # ============= END MORPHOLOGY BLOCK =============
-
-        # LDH cytotoxicity signal (replaces ATP)
-        # LDH is released when cells die and membranes rupture
-        # Orthogonal to Cell Painting morphology
-        baseline_ldh = BASELINE_LDH.get(well.cell_line, 50000.0)
-
-        # DMSO vehicle control: high viability, low LDH
-        if well.compound == 'DMSO':
-            viability_effect = 1.0
-            ldh_signal = baseline_ldh * (1.0 - viability_effect) * 0.05  # Minimal LDH from healthy cells
-        elif well.compound in COMPOUND_PARAMS and well.dose_uM > 0:
-            params = COMPOUND_PARAMS[well.compound]
-            ic50_base = params['ec50_uM']
-            hill_slope = params['hill_slope']
-            stress_axis = params['stress_axis']
-
-            # Apply cell-line-specific IC50 adjustment
-            # For microtubule drugs, use improved model with mitosis + functional dependency
+    Covers IC50 adjustments, Hill viability, adaptive A(dose) and damage D(dose)
+    morphology, transport dysfunction and LDH attrition. Consumes no RNG.
+    """
+    # ============= MORPHOLOGY (Adaptive vs Damage) =============
+
+    # Initialize baseline morphology for this cell line
+    base = BASELINE_MORPH.get(cell_line, BASELINE_MORPH['A549'])
+    morph = {ch: float(base[ch]) for ch in CHANNELS}
+
+    # Advanced biology: density effects on CV and IC50
+    density_effects = None
+    if USE_ADVANCED_BIOLOGY:
+        # Estimate confluence from seeding density (simplified)
+        confluence = min(0.9, 0.5 + 0.01 * timepoint_h)  # Grows over time
+        density_effects = _get_density_effects(confluence)
+
+    # Precompute "true" viability_effect for damage coupling (tracks physics)
+    # Keep adaptive A(dose) MOA-shaped using base EC50, but damage D uses this.
+    viability_effect_true = 1.0
+    stress_axis = None
+    intensity = 1.0
+    hill_slope = 2.0
+    ec50 = None
+
+    if compound in COMPOUND_PARAMS:
+        params = COMPOUND_PARAMS[compound]
+        ec50 = float(params['ec50_uM'])
+        hill_slope = float(params['hill_slope'])
+        intensity = float(params.get('intensity', 1.0))  # morphology magnitude only
+        stress_axis = params['stress_axis']
+
+        if dose_uM > 0:
+            # Cell-line-adjusted IC50 logic (mirror viability section below)
             if stress_axis == 'microtubule':
-                prolif = PROLIF_INDEX.get(well.cell_line, 1.0)
+                prolif = PROLIF_INDEX.get(cell_line, 1.0)
 
-                # Microtubule toxicity has TWO components:
-                # 1. Mitosis-driven (cancer cells die from mitotic catastrophe)
-                # 2. Functional transport dependency (neurons have different failure mode: transport collapse)
-
-                # Mitosis-driven component (dominant for cycling cells)
-                mitosis_mult = 1.0 / max(prolif, 0.3)  # Clamp at 0.3 to prevent infinite resistance
-
-                # Functional dependency modifies the VIABILITY IC50 modestly
-                # High functional dependency means: "morphology collapses early, death follows later"
-                # It does NOT mean "protected from death" - that's handled by morphology-to-viability feedback
+                # Improved microtubule model: mitosis + functional dependency
+                mitosis_mult = 1.0 / max(prolif, 0.3)
                 functional_dependency = {
-                    'A549': 0.2,           # Low functional dependency (mainly mitotic)
-                    'HepG2': 0.2,          # Low functional dependency
-                    'iPSC_NGN2': 0.8,      # High functional dependency (axonal transport critical)
-                    'iPSC_Microglia': 0.5, # Moderate (migration, phagocytosis)
-                }.get(well.cell_line, 0.3)
-
-                # IC50 multiplier: mostly mitosis-driven, with modest functional adjustment
-                # For neurons: high mitosis_mult (3.3×) slightly reduced by functional dependency
-                # For cancer: low mitosis_mult (0.77-1.25×) dominates
-                # Functional dependency adds a *small* protective factor (20%) since morphology fails first
+                    'A549': 0.2, 'HepG2': 0.2,
+                    'iPSC_NGN2': 0.8, 'iPSC_Microglia': 0.5
+                }.get(cell_line, 0.3)
+                # Modest functional adjustment (20% max) since morphology fails first
                 ic50_mult = mitosis_mult * (1.0 + functional_dependency * 0.2)
-
-                # Clamp to reasonable bounds
                 ic50_mult = max(0.3, min(5.0, ic50_mult))
 
-                hill_slope = hill_slope * (0.8 + 0.4 * prolif)  # Slightly steeper for faster cycling
+                hill_v = hill_slope * (0.8 + 0.4 * prolif)
             else:
-                ic50_mult = CELL_LINE_SENSITIVITY.get(well.compound, {}).get(well.cell_line, 1.0)
-
-            ic50_viability = ic50_base * ic50_mult
-
-            # Viability curve (4PL dose-response)
-            # At IC50: viability = 50%, At 10×IC50: viability = ~1%
-            viability_effect = 1.0 / (1.0 + (well.dose_uM / ic50_viability) ** hill_slope)
-
-            # Time-dependent death continuation for high stress conditions
-            # ER stress and proteostasis stress cause cumulative attrition at high doses
-            # (tunicamycin, thapsigargin, MG132 should kill more cells by 48h)
-            if well.timepoint_h > 12 and viability_effect < 0.5:  # High stress threshold
-                # Calculate stress severity (how far past IC50)
-                dose_ratio = well.dose_uM / ic50_viability
-
-                # Time scaling: more death accumulation between 12h → 48h
-                time_factor = (well.timepoint_h - 12.0) / 36.0  # 0 at 12h, 1 at 48h
-
-                # Stress-axis-specific attrition rates
-                # ER/proteostasis stressors cause persistent unfolded protein accumulation
-                # Base attrition rates per stress axis
-                base_attrition_rates = {
-                    'er_stress': 0.40,      # Strong cumulative effect
-                    'proteasome': 0.35,     # Strong cumulative effect
-                    'oxidative': 0.20,      # Moderate (some adaptation possible, but ROS accumulates)
-                    'mitochondrial': 0.18,  # Moderate (bioenergetic collapse accumulates)
-                    'dna_damage': 0.20,     # Moderate (apoptosis cascade)
-                    'microtubule': 0.05,    # Weak (rapid commitment for cancer)
-                }
-
-                # Microtubule-specific: neurons get higher attrition (slow burn death after transport collapse)
-                if stress_axis == 'microtubule' and well.cell_line == 'iPSC_NGN2':
-                    # Base attrition for microtubule in neurons
-                    base_mt_attrition = 0.25
-
-                    # Scale attrition by ACTUAL morphology disruption (not dose proxy!)
-                    # transport_dysfunction_score computed earlier from real actin/mito disruption
-                    # This creates the true "morphology → attrition → viability" causal arc
-                    dys = transport_dysfunction_score
-
-                    # Nonlinear scaling: mild disruption has ceiling (allows recovery)
-                    # dys^2 means: 20% disruption → 4% scale, 50% disruption → 25% scale
-                    # This prevents low doses from causing inevitable death
-                    attrition_scale = 1.0 + 2.0 * (dys ** 2.0)  # 1× at no disruption, up to 3× at complete disruption
-                    attrition_rate = base_mt_attrition * attrition_scale
-                else:
-                    attrition_rate = base_attrition_rates.get(stress_axis, 0.10)
-
-                # Additional death at high stress over time
-                # Only applies when dose >= IC50 (dose_ratio >= 1.0)
-                if dose_ratio >= 1.0:
-                    # Sigmoid function: starts at 0.5 at IC50, approaches 1.0 at high dose
-                    # dose_ratio=1.0 → 0.5, dose_ratio=2.0 → 0.67, dose_ratio=10.0 → 0.91
-                    stress_multiplier = dose_ratio / (1.0 + dose_ratio)
-                    additional_death = attrition_rate * stress_multiplier * time_factor
-
-                    # Apply additional death (reduce viability further)
-                    viability_effect = viability_effect * (1.0 - additional_death)
-                    viability_effect = max(0.01, viability_effect)  # Floor at 1% viable
-
-            # Debug logging: dose ratios for sentinel compounds (set DEBUG_DOSE_RATIOS=True to enable)
-            if DEBUG_DOSE_RATIOS and well.compound in ['tBHQ', 'CCCP'] and well.dose_uM > 0 and well.is_sentinel:
-                dose_base_ratio = well.dose_uM / ic50_base
-                dose_adjusted_ratio = well.dose_uM / ic50_viability
-                logger.info(f"{well.compound} {well.cell_line} {well.dose_uM}µM: "
-                            f"{dose_base_ratio:.2f}×base_EC50, {dose_adjusted_ratio:.2f}×adjusted_IC50, "
-                            f"viability={viability_effect:.1%}")
-
-            # LDH signal (INVERSE of viability - rises when cells die)
-            # High viability (0.95) → Low LDH (only 5% dead cells releasing LDH)
-            # Low viability (0.30) → High LDH (70% dead cells releasing LDH)
-            death_fraction = 1.0 - viability_effect
-            ldh_signal = baseline_ldh * death_fraction
-        else:
-            viability_effect = 1.0
-            ldh_signal = baseline_ldh * (1.0 - viability_effect) * 0.05
+                ic50_mult = CELL_LINE_SENSITIVITY.get(compound, {}).get(cell_line, 1.0)
+                hill_v = hill_slope
 
-        # Add biological noise (15% CV) - Use per-well deterministic RNG
-        # CRITICAL: Per-well RNG ensures workers=1 equals workers=N
-        ldh_cv = 0.15
-        if ldh_cv > 0:
-            rng_well_ldh = assay_rng_for_well(design_id, well.plate_id, well.cell_line, well.well_id, "ldh_bio")
-            ldh_signal *= rng_well_ldh.normal(1.0, ldh_cv)
+            ic50_viability = max(1e-9, ec50 * ic50_mult)
 
-        # Add technical noise: reuse same batch factors as morphology (matches main codebase)
-        # LDH is also affected by plate/day/operator/well variation
-        ldh_signal *= total_tech_factor
+            # Advanced biology: confluence increases drug resistance
+            if USE_ADVANCED_BIOLOGY and density_effects:
+                ic50_viability *= density_effects['ic50_multiplier']
 
-        # Clamp LDH to non-negative
-        ldh_signal = max(0.0, ldh_signal)
+            # Cell cycle dynamics: phase-specific drug sensitivity
+            # More cells in target phase = more sensitive (lower effective IC50)
+            if USE_CELL_CYCLE_DYNAMICS:
+                cycle_sensitivity = _get_cell_cycle_drug_sensitivity(
+                    cell_line, compound, stress_axis, get_rng().seed
+                )
+                # Sensitivity > 1 means more sensitive → lower IC50
+                ic50_viability /= max(0.5, min(2.0, cycle_sensitivity))
 
-        # Keep variable name as atp_signal for backward compatibility with database
-        atp_signal = ldh_signal
+            viability_effect_true = 1.0 / (1.0 + (dose_uM / ic50_viability) ** hill_v)
 
-        # ============= DEATH ACCOUNTING (Honest Causality) =============
-        # Track death fractions to enforce complete partition
-        # Initial seeding: cells start at 98% viability (2% seeding stress)
-        initial_viability = 0.98
-        death_seeding = 1.0 - initial_viability  # 0.02 baseline
+    # Apply compound morphology effects (only when dose > 0)
+    if stress_axis is not None and dose_uM > 0:
+        # Adaptive curve A(dose): hump-shaped in base potency space (MOA-shaped)
+        x = dose_uM / max(ec50, 1e-9)
+        A = (x ** hill_slope) / ((1.0 + x ** hill_slope) ** 2)
+        A = A / 0.25  # normalize peak to ~1 at x=1
 
-        # Compute final viability after treatment
-        final_viability = initial_viability * viability_effect
+        # Damage curve D(dose): must track true death physics
+        D = 1.0 - float(viability_effect_true)
 
-        # Track compound-induced death (instant + attrition combined)
-        # viability_effect represents survival fraction after all compound effects
-        death_compound = initial_viability * (1.0 - viability_effect)
+        # Time mixing: early = adaptive-dominant, late = damage-dominant
+        if timepoint_h <= 12:
+            wA, wD = 1.0, 0.30
+        else:
+            wA, wD = 0.30, 1.0
 
-        # Unknown death = seeding stress (never reassign this to compound!)
-        death_unknown = death_seeding
+        axis_mult = AXIS_CELL_MULT.get(stress_axis, {}).get(cell_line, 1.0)
+        axis_rules = MORPH_EFFECTS.get(stress_axis, {})
 
-        # No confluence death in standalone (single timepoint snapshot)
-        death_confluence = 0.0
+        for ch in CHANNELS:
+            eff = axis_rules.get(ch, {'adapt': 0.0, 'damage': 0.0})
+            delta = intensity * axis_mult * (wA * eff['adapt'] * A + wD * eff['damage'] * D)
+            morph[ch] = base[ch] * (1.0 + delta)
+
+        # Special handling for microtubule drugs: morphology disruption precedes viability loss
+        # Neurons show cytoskeletal disruption (actin, mito distribution) even when viable
+        if stress_axis == 'microtubule':
+            # Morphology EC50: Lower than viability EC50 (morphology fails first)
+            # Set at 30% of viability EC50 for neurons (transport disruption happens fast)
+            morph_ec50_fraction = {
+                'iPSC_NGN2': 0.3,       # Morphology fails at 30% of viability dose
+                'iPSC_Microglia': 0.5,  # Moderate
+                'A549': 1.0,            # Morphology and viability fail together
+                'HepG2': 1.0
+            }.get(cell_line, 1.0)
+
+            morph_ec50 = ec50 * morph_ec50_fraction
+
+            # Smooth saturating Hill equation (not sharp min() clamp)
+            morph_penalty = dose_uM / (dose_uM + morph_ec50)  # 0 to 1, smooth
+
+            if cell_line == 'iPSC_NGN2':
+                # Neurons: major actin/mito disruption at doses below viability IC50
+                morph['actin'] *= (1.0 - 0.6 * morph_penalty)  # Up to 60% reduction
+                morph['mito'] *= (1.0 - 0.5 * morph_penalty)   # Mito distribution severely disrupted
+            elif cell_line == 'iPSC_Microglia':
+                # Microglia: moderate actin disruption (migration/phagocytosis impaired)
+                morph['actin'] *= (1.0 - 0.4 * morph_penalty)
+
+    # CRITICAL: Compute transport dysfunction from STRUCTURAL morphology
+    # Do this BEFORE adding noise and BEFORE applying viability scaling (if any)
+    # This prevents measurement contamination from creating runaway feedback loops
+    transport_dysfunction_score = 0.0
+    if stress_axis == 'microtubule' and cell_line == 'iPSC_NGN2':
+        # Measure actual STRUCTURAL disruption (after drug effects, before noise/attenuation)
+        actin_disruption = max(0.0, 1.0 - morph['actin'] / base['actin'])
+        mito_disruption = max(0.0, 1.0 - morph['mito'] / base['mito'])
+        # Average disruption (0 = no disruption, 1 = complete loss)
+        transport_dysfunction_score = 0.5 * (actin_disruption + mito_disruption)
+        # Clamp to [0, 1]
+        transport_dysfunction_score = min(1.0, max(0.0, transport_dysfunction_score))
+
+    # ============= LDH / VIABILITY =============
+
+    # LDH cytotoxicity signal (replaces ATP)
+    # LDH is released when cells die and membranes rupture
+    # Orthogonal to Cell Painting morphology
+    baseline_ldh = BASELINE_LDH.get(cell_line, 50000.0)
+
+    # Viability IC50s (kept for dose-ratio debug logging; DMSO/untreated stay None)
+    ic50_base = ic50_viability = None
+
+    # DMSO vehicle control: high viability, low LDH
+    if compound == 'DMSO':
+        viability_effect = 1.0
+        ldh_signal = baseline_ldh * (1.0 - viability_effect) * 0.05  # Minimal LDH from healthy cells
+    elif compound in COMPOUND_PARAMS and dose_uM > 0:
+        params = COMPOUND_PARAMS[compound]
+        ic50_base = params['ec50_uM']
+        hill_slope = params['hill_slope']
+        stress_axis = params['stress_axis']
+
+        # Apply cell-line-specific IC50 adjustment
+        # For microtubule drugs, use improved model with mitosis + functional dependency
+        if stress_axis == 'microtubule':
+            prolif = PROLIF_INDEX.get(cell_line, 1.0)
+
+            # Microtubule toxicity has TWO components:
+            # 1. Mitosis-driven (cancer cells die from mitotic catastrophe)
+            # 2. Functional transport dependency (neurons have different failure mode: transport collapse)
+
+            # Mitosis-driven component (dominant for cycling cells)
+            mitosis_mult = 1.0 / max(prolif, 0.3)  # Clamp at 0.3 to prevent infinite resistance
+
+            # Functional dependency modifies the VIABILITY IC50 modestly
+            # High functional dependency means: "morphology collapses early, death follows later"
+            # It does NOT mean "protected from death" - that's handled by morphology-to-viability feedback
+            functional_dependency = {
+                'A549': 0.2,           # Low functional dependency (mainly mitotic)
+                'HepG2': 0.2,          # Low functional dependency
+                'iPSC_NGN2': 0.8,      # High functional dependency (axonal transport critical)
+                'iPSC_Microglia': 0.5, # Moderate (migration, phagocytosis)
+            }.get(cell_line, 0.3)
+
+            # IC50 multiplier: mostly mitosis-driven, with modest functional adjustment
+            # For neurons: high mitosis_mult (3.3×) slightly reduced by functional dependency
+            # For cancer: low mitosis_mult (0.77-1.25×) dominates
+            # Functional dependency adds a *small* protective factor (20%) since morphology fails first
+            ic50_mult = mitosis_mult * (1.0 + functional_dependency * 0.2)
+
+            # Clamp to reasonable bounds
+            ic50_mult = max(0.3, min(5.0, ic50_mult))
+
+            hill_slope = hill_slope * (0.8 + 0.4 * prolif)  # Slightly steeper for faster cycling
+        else:
+            ic50_mult = CELL_LINE_SENSITIVITY.get(compound, {}).get(cell_line, 1.0)
+
+        ic50_viability = ic50_base * ic50_mult
+
+        # Viability curve (4PL dose-response)
+        # At IC50: viability = 50%, At 10×IC50: viability = ~1%
+        viability_effect = 1.0 / (1.0 + (dose_uM / ic50_viability) ** hill_slope)
+
+        # Time-dependent death continuation for high stress conditions
+        # ER stress and proteostasis stress cause cumulative attrition at high doses
+        # (tunicamycin, thapsigargin, MG132 should kill more cells by 48h)
+        if timepoint_h > 12 and viability_effect < 0.5:  # High stress threshold
+            # Calculate stress severity (how far past IC50)
+            dose_ratio = dose_uM / ic50_viability
+
+            # Time scaling: more death accumulation between 12h → 48h
+            time_factor = (timepoint_h - 12.0) / 36.0  # 0 at 12h, 1 at 48h
+
+            # Stress-axis-specific attrition rates
+            # ER/proteostasis stressors cause persistent unfolded protein accumulation
+            # Base attrition rates per stress axis
+            base_attrition_rates = {
+                'er_stress': 0.40,      # Strong cumulative effect
+                'proteasome': 0.35,     # Strong cumulative effect
+                'oxidative': 0.20,      # Moderate (some adaptation possible, but ROS accumulates)
+                'mitochondrial': 0.18,  # Moderate (bioenergetic collapse accumulates)
+                'dna_damage': 0.20,     # Moderate (apoptosis cascade)
+                'microtubule': 0.05,    # Weak (rapid commitment for cancer)
+            }
+
+            # Microtubule-specific: neurons get higher attrition (slow burn death after transport collapse)
+            if stress_axis == 'microtubule' and cell_line == 'iPSC_NGN2':
+                # Base attrition for microtubule in neurons
+                base_mt_attrition = 0.25
+
+                # Scale attrition by ACTUAL morphology disruption (not dose proxy!)
+                # transport_dysfunction_score computed earlier from real actin/mito disruption
+                # This creates the true "morphology → attrition → viability" causal arc
+                dys = transport_dysfunction_score
+
+                # Nonlinear scaling: mild disruption has ceiling (allows recovery)
+                # dys^2 means: 20% disruption → 4% scale, 50% disruption → 25% scale
+                # This prevents low doses from causing inevitable death
+                attrition_scale = 1.0 + 2.0 * (dys ** 2.0)  # 1× at no disruption, up to 3× at complete disruption
+                attrition_rate = base_mt_attrition * attrition_scale
+            else:
+                attrition_rate = base_attrition_rates.get(stress_axis, 0.10)
+
+            # Additional death at high stress over time
+            # Only applies when dose >= IC50 (dose_ratio >= 1.0)
+            if dose_ratio >= 1.0:
+                # Sigmoid function: starts at 0.5 at IC50, approaches 1.0 at high dose
+                # dose_ratio=1.0 → 0.5, dose_ratio=2.0 → 0.67, dose_ratio=10.0 → 0.91
+                stress_multiplier = dose_ratio / (1.0 + dose_ratio)
+                additional_death = attrition_rate * stress_multiplier * time_factor
+
+                # Apply additional death (reduce viability further)
+                viability_effect = viability_effect * (1.0 - additional_death)
+                viability_effect = max(0.01, viability_effect)  # Floor at 1% viable
+
+        # LDH signal (INVERSE of viability - rises when cells die)
+        # High viability (0.95) → Low LDH (only 5% dead cells releasing LDH)
+        # Low viability (0.30) → High LDH (70% dead cells releasing LDH)
+        death_fraction = 1.0 - viability_effect
+        ldh_signal = baseline_ldh * death_fraction
+    else:
+        viability_effect = 1.0
+        ldh_signal = baseline_ldh * (1.0 - viability_effect) * 0.05
+
+    return ConditionResponse(
+        morph=morph,
+        viability_effect_true=viability_effect_true,
+        transport_dysfunction_score=transport_dysfunction_score,
+        viability_effect=viability_effect,
+        ldh_signal=ldh_signal,
+        ic50_base=ic50_base,
+        ic50_viability=ic50_viability,
+    )
 
-        # Clamp all death fractions to [0, 1]
-        death_compound = min(1.0, max(0.0, death_compound))
-        death_confluence = min(1.0, max(0.0, death_confluence))
-        death_unknown = min(1.0, max(0.0, death_unknown))
 
-        # Enforce partition: death_compound + death_confluence + death_unknown = 1 - viability
-        total_dead = 1.0 - final_viability
-        tracked = death_compound + death_confluence + death_unknown
-        untracked = max(0.0, total_dead - tracked)
+def _batch_factor(key: str, cv: float, cache: Optional[Dict[str, float]] = None) -> float:
+    """Plate/day/operator batch effect, seeded by stable key (memoized in `cache` if given)."""
+    if cache is not None and key in cache:
+        return cache[key]
+    factor = np.random.default_rng(stable_u32(key)).normal(1.0, cv)
+    if cache is not None:
+        cache[key] = factor
+    return factor
 
-        # If untracked > 0.1%, warn (accounting bug)
-        if untracked > 0.001:
-            logger.warning(
-                f"Well {well.well_id}: Untracked death ({untracked:.1%}). "
-                f"Total dead: {total_dead:.1%}, tracked: {tracked:.1%}"
+
+def _measure_well(
+    well: WellAssignment,
+    design_id: str,
+    response: ConditionResponse,
+    batch_factors: Optional[Dict[str, float]] = None,
+) -> Dict:
+    """
+    Apply per-well measurement noise to a condition response and build the result row.
+
+    All randomness is addressable per well or per batch key (assay_rng_for_well /
+    stable_u32 keys), so the result does not depend on which other wells share
+    the condition or on evaluation order. batch_factors memoizes the
+    plate/day/operator factors across wells of one batch.
+    """
+    morph = dict(response.morph)
+    viability_effect = response.viability_effect
+    transport_dysfunction_score = response.transport_dysfunction_score
+
+    # ============= MORPHOLOGY NOISE (Real Tech + Corr Bio) =============
+
+    # Add dose-dependent biological noise (matches main codebase)
+    # Note: Noise is added AFTER computing dysfunction to avoid measurement contamination
+    # Stressed cells show higher variability (heterogeneous death timing)
+    stress_level = 1.0 - float(response.viability_effect_true)  # 0 (healthy) to 1 (dead)
+
+    if USE_REALISTIC_NOISE:
+        # NEW: Realistic noise model with channel correlations and spatial gradients
+        noise_model = _get_realistic_noise_model(get_rng().seed)
+        morph = noise_model.apply_realistic_noise(
+            base_morphology=morph,
+            well_id=well.well_id,
+            plate_id=well.plate_id,
+            stress_level=stress_level
+        )
+    else:
+        # LEGACY: Independent noise per channel
+        stress_multiplier = 2.0  # Stressed cells have 2× higher CV
+        effective_bio_cv = MORPH_CV['er'] * (1.0 + stress_level * (stress_multiplier - 1.0))
+
+        # CRITICAL: Use per-well deterministic RNG for measurement noise
+        # This ensures workers=1 equals workers=N (not dependent on shared stream consumption order)
+        # Observer independence still maintained (physics RNG streams unchanged)
+        if effective_bio_cv > 0:
+            rng_well_morph = assay_rng_for_well(design_id, well.plate_id, well.cell_line, well.well_id, "morph_bio")
+            for ch in CHANNELS:
+                morph[ch] *= rng_well_morph.normal(1.0, effective_bio_cv)
+
+    # Technical noise (batch effects) - MATCHES MAIN CODEBASE EXACTLY
+    # Extract batch information
+    plate_id = _get_attr(well, 'plate_id', None) or _get_attr(well, 'plate_name', None)
+    day_id = _get_attr(well, 'day', None) or _get_attr(well, 'day_index', None)
+    op_id = _get_attr(well, 'operator', None) or _get_attr(well, 'operator_id', None)
+    well_id = _get_attr(well, 'well_id', 'A1')
+    cell_line = _get_attr(well, 'cell_line', 'A549')
+
+    # Consistent batch effects per plate/day/operator (deterministic seeding)
+    # Only apply if CV > 0 (prevents RNG consumption when noise disabled)
+    plate_factor = 1.0
+    if TECH_CV['plate_cv'] > 0:
+        plate_factor = _batch_factor(f"plate_{plate_id}", TECH_CV['plate_cv'], batch_factors)
+
+    day_factor = 1.0
+    if TECH_CV['day_cv'] > 0:
+        day_factor = _batch_factor(f"day_{day_id}", TECH_CV['day_cv'], batch_factors)
+
+    operator_factor = 1.0
+    if TECH_CV['operator_cv'] > 0:
+        operator_factor = _batch_factor(f"operator_{op_id}", TECH_CV['operator_cv'], batch_factors)
+
+    # Well factor MUST be deterministic (seed by well ID for workers=1 to match workers=N)
+    # Using rng.rng_assay would be nondeterministic across worker scheduling
+    well_factor = 1.0
+    if TECH_CV['well_cv'] > 0:
+        rng_well = np.random.default_rng(stable_u32(f"well_{plate_id}_{cell_line}_{well_id}"))
+        well_factor = rng_well.normal(1.0, TECH_CV['well_cv'])
+
+    # Edge effect: wells on plate edges show reduced signal
+    # Skip if using realistic noise (it handles spatial effects internally)
+    if USE_REALISTIC_NOISE:
+        edge_factor = 1.0  # Already applied in realistic noise model
+    else:
+        is_edge = _is_edge_well(well_id)
+        edge_factor = (1.0 - TECH_CV['edge_effect']) if is_edge else 1.0
+
+    # Combine all technical factors into one
+    total_tech_factor = plate_factor * day_factor * operator_factor * well_factor * edge_factor
+
+    # Apply single tech factor to ALL channels (not channel-specific)
+    for ch in CHANNELS:
+        morph[ch] *= total_tech_factor
+        morph[ch] = max(0.0, morph[ch])  # No negative signals
+
+    # Advanced biology: apply instrument artifacts (vignetting, illumination, focus)
+    if USE_ADVANCED_BIOLOGY:
+        from .realistic_noise import _parse_well_position
+        row, col = _parse_well_position(well_id)
+        inst_model = _get_instrument_model(get_rng().seed)
+        for ch in CHANNELS:
+            morph[ch] = inst_model.apply_all_effects(
+                morph[ch], row, col, well_id, plate_id,
+                time_in_run_h=0.0  # Simplified; could track actual time
             )
-            # Fold untracked into death_unknown (don't invent compound causality)
-            death_unknown += untracked
-            death_unknown = min(1.0, max(0.0, death_unknown))
-
-        # Determine death mode (threshold = 5%)
-        threshold = 0.05
-        unknown_threshold = 0.01 if death_compound == 0 and death_confluence == 0 else threshold
-
-        if death_compound > threshold and death_confluence > threshold:
-            death_mode = "mixed"
-        elif death_compound > threshold:
-            death_mode = "compound"
-        elif death_confluence > threshold:
-            death_mode = "confluence"
-        elif death_unknown > unknown_threshold:
-            death_mode = "unknown"
-        elif final_viability < 0.5:
-            death_mode = "unknown"  # Significant death but no clear cause
-        else:
-            death_mode = None  # Healthy
-
-        return {
-            'design_id': design_id,
-            'well_id': well.well_id,
-            'cell_line': well.cell_line,
-            'compound': well.compound,
-            'dose_uM': well.dose_uM,
-            'timepoint_h': well.timepoint_h,
-            'plate_id': well.plate_id,
-            'day': well.day,
-            'operator': well.operator,
-            'morphology': morph,
-            'atp_signal': atp_signal,
-            'viability': final_viability,
-            'death_compound': death_compound,
-            'death_confluence': death_confluence,
-            'death_unknown': death_unknown,
-            'death_mode': death_mode,
-            'transport_dysfunction_score': transport_dysfunction_score,
-            'is_sentinel': well.is_sentinel
-        }
+
+    # Apply random well failures (2% of wells fail with extreme outliers)
+    # NOTE: Deterministic per-well (not per-design) for workers=1 vs workers=N comparison
+    well_failure = None
+    rng_failure = np.random.default_rng(stable_u32(f"failure_{plate_id}_{cell_line}_{well_id}"))
+    if rng_failure.random() < TECH_CV['well_failure_rate']:
+        # Well failed - apply random extreme multiplier
+        failure_type = rng_failure.choice(['bubble', 'contamination', 'pipetting_error'])
+        if failure_type == 'bubble':
+            # Bubble in well → near-zero signal
+            for ch in CHANNELS:
+                morph[ch] = rng_failure.uniform(0.1, 2.0)
+        elif failure_type == 'contamination':
+            # Contamination → 5-20× higher signal
+            for ch in CHANNELS:
+                morph[ch] *= rng_failure.uniform(5.0, 20.0)
+        elif failure_type == 'pipetting_error':
+            # Wrong volume → 5-30% of normal
+            for ch in CHANNELS:
+                morph[ch] *= rng_failure.uniform(0.05, 0.3)
+        well_failure = failure_type
+
+    # ============= END MORPHOLOGY NOISE =============
+
+    # Debug logging: dose ratios for sentinel compounds (set DEBUG_DOSE_RATIOS=True to enable)
+    if DEBUG_DOSE_RATIOS and response.ic50_viability is not None and well.compound in ['tBHQ', 'CCCP'] and well.dose_uM > 0 and well.is_sentinel:
+        dose_base_ratio = well.dose_uM / response.ic50_base
+        dose_adjusted_ratio = well.dose_uM / response.ic50_viability
+        logger.info(f"{well.compound} {well.cell_line} {well.dose_uM}µM: "
+                    f"{dose_base_ratio:.2f}×base_EC50, {dose_adjusted_ratio:.2f}×adjusted_IC50, "
+                    f"viability={viability_effect:.1%}")
+
+    ldh_signal = response.ldh_signal
+
+    # Add biological noise (15% CV) - Use per-well deterministic RNG
+    # CRITICAL: Per-well RNG ensures workers=1 equals workers=N
+    ldh_cv = 0.15
+    if ldh_cv > 0:
+        rng_well_ldh = assay_rng_for_well(design_id, well.plate_id, well.cell_line, well.well_id, "ldh_bio")
+        ldh_signal *= rng_well_ldh.normal(1.0, ldh_cv)
+
+    # Add technical noise: reuse same batch factors as morphology (matches main codebase)
+    # LDH is also affected by plate/day/operator/well variation
+    ldh_signal *= total_tech_factor
+
+    # Clamp LDH to non-negative
+    ldh_signal = max(0.0, ldh_signal)
+
+    # Keep variable name as atp_signal for backward compatibility with database
+    atp_signal = ldh_signal
+
+    # ============= DEATH ACCOUNTING (Honest Causality) =============
+    # Track death fractions to enforce complete partition
+    # Initial seeding: cells start at 98% viability (2% seeding stress)
+    initial_viability = 0.98
+    death_seeding = 1.0 - initial_viability  # 0.02 baseline
+
+    # Compute final viability after treatment
+    final_viability = initial_viability * viability_effect
+
+    # Track compound-induced death (instant + attrition combined)
+    # viability_effect represents survival fraction after all compound effects
+    death_compound = initial_viability * (1.0 - viability_effect)
+
+    # Unknown death = seeding stress (never reassign this to compound!)
+    death_unknown = death_seeding
+
+    # No confluence death in standalone (single timepoint snapshot)
+    death_confluence = 0.0
+
+    # Clamp all death fractions to [0, 1]
+    death_compound = min(1.0, max(0.0, death_compound))
+    death_confluence = min(1.0, max(0.0, death_confluence))
+    death_unknown = min(1.0, max(0.0, death_unknown))
+
+    # Enforce partition: death_compound + death_confluence + death_unknown = 1 - viability
+    total_dead = 1.0 - final_viability
+    tracked = death_compound + death_confluence + death_unknown
+    untracked = max(0.0, total_dead - tracked)
+
+    # If untracked > 0.1%, warn (accounting bug)
+    if untracked > 0.001:
+        logger.warning(
+            f"Well {well.well_id}: Untracked death ({untracked:.1%}). "
+            f"Total dead: {total_dead:.1%}, tracked: {tracked:.1%}"
+        )
+        # Fold untracked into death_unknown (don't invent compound causality)
+        death_unknown += untracked
+        death_unknown = min(1.0, max(0.0, death_unknown))
+
+    # Determine death mode (threshold = 5%)
+    threshold = 0.05
+    unknown_threshold = 0.01 if death_compound == 0 and death_confluence == 0 else threshold
+
+    if death_compound > threshold and death_confluence > threshold:
+        death_mode = "mixed"
+    elif death_compound > threshold:
+        death_mode = "compound"
+    elif death_confluence > threshold:
+        death_mode = "confluence"
+    elif death_unknown > unknown_threshold:
+        death_mode = "unknown"
+    elif final_viability < 0.5:
+        death_mode = "unknown"  # Significant death but no clear cause
+    else:
+        death_mode = None  # Healthy
+
+    return {
+        'design_id': design_id,
+        'well_id': well.well_id,
+        'cell_line': well.cell_line,
+        'compound': well.compound,
+        'dose_uM': well.dose_uM,
+        'timepoint_h': well.timepoint_h,
+        'plate_id': well.plate_id,
+        'day': well.day,
+        'operator': well.operator,
+        'morphology': morph,
+        'atp_signal': atp_signal,
+        'viability': final_viability,
+        'death_compound': death_compound,
+        'death_confluence': death_confluence,
+        'death_unknown': death_unknown,
+        'death_mode': death_mode,
+        'transport_dysfunction_score': transport_dysfunction_score,
+        'is_sentinel': well.is_sentinel
+    }
+
+
+def simulate_well(well: WellAssignment, design_id: str) -> Optional[Dict]:
+    """Simulate a single well experiment with realistic compound effects."""
+
+    try:
+        response = simulate_condition(well.cell_line, well.compound, well.dose_uM, well.timepoint_h)
+        return _measure_well(well, design_id, response)
 
     except Exception as e:
         logger.error(f"Error simulating well {well.well_id}: {e}")
         return None
 
 
+def simulate_wells_batch(wells: List[WellAssignment], design_id: str) -> List[Optional[Dict]]:
+    """
+    Simulate many wells, evaluating each unique condition once.
+
+    Wells are grouped by condition_key(); the deterministic response surface
+    is computed once per group and per-well noise is applied afterwards.
+    Results are identical to [simulate_well(w, design_id) for w in wells],
+    in input order, but cost scales with the number of conditions rather than
+    wells (Phase 0 designs are mostly replicates). Plate/day/operator batch
+    factors are likewise drawn once per batch key.
+    """
+    responses: Dict[Tuple, ConditionResponse] = {}
+    batch_factors: Dict[str, float] = {}
+    results: List[Optional[Dict]] = []
+    for well in wells:
+        try:
+            key = condition_key(well)
+            response = responses.get(key)
+            if response is None:
+                response = responses[key] = simulate_condition(*key)
+            results.append(_measure_well(well, design_id, response, batch_factors))
+        except Exception as e:
+            logger.error(f"Error simulating well {well.well_id}: {e}")
+            results.append(None)
+    return results
+
+
+
 def worker_function(args) -> Optional[Dict]:
     """
     Worker function for multiprocessing.
@@ -1447,6 +1556,87 @@ def worker_function(args) -> Optional[Dict]:
         return simulate_well(well, design_id)
 
 
+def batch_worker_function(args) -> Tuple[List[int], List[Optional[Dict]]]:
+    """
+    Worker function for condition-grouped chunks (see condition_chunks).
+
+    Returns the chunk's design indices with simulate_wells_batch() results,
+    so the caller can restore design order.
+    """
+    indices, wells, design_id = args
+    with db_write_section():
+        return indices, simulate_wells_batch(wells, design_id)
+
+
+def condition_chunks(design: List[WellAssignment], chunk_size: int) -> List[Tuple[List[int], List[WellAssignment]]]:
+    """
+    Split a design into (design indices, wells) chunks of whole condition groups.
+
+    Wells are grouped by condition_key() in order of first appearance, and
+    groups are packed into chunks of at most chunk_size wells (a group that
+    does not fit in the current chunk is split across chunks), so each worker evaluates a condition's response surface once
+    per chunk rather than once per well.
+    """
+    groups: Dict[Tuple, List[int]] = {}
+    for i, well in enumerate(design):
+        groups.setdefault(condition_key(well), []).append(i)
+
+    chunks = []
+    current: List[int] = []
+    for indices in groups.values():
+        start = 0
+        while start < len(indices):
+            # Fill only the room left, so no chunk exceeds chunk_size
+            room = chunk_size - len(current)
+            current.extend(indices[start:start + room])
+            start += room
+            if len(current) == chunk_size:
+                chunks.append(current)
+                current = []
+    if current:
+        chunks.append(current)
+    return [(chunk, [design[i] for i in chunk]) for chunk in chunks]
+
+
+def _simulate_in_design_order(pool, design: List[WellAssignment], design_id: str, workers: int, start_time: float):
+    """
+    Simulate a design on the pool in condition-grouped chunks.
+
+    Yields per-well results (None for failed wells) in design order, exactly
+    as pool.imap(worker_function, ...) would, while logging progress as
+    chunks finish.
+    """
+    # A few chunks per worker keeps the pool balanced
+    chunk_size = max(1, -(-len(design) // (workers * 4)))
+    chunks = condition_chunks(design, chunk_size)
+
+    pending = object()
+    ordered: List[Any] = [pending] * len(design)
+    next_index = 0
+    done = 0
+    for indices, results in pool.imap(
+        batch_worker_function, [(indices, wells, design_id) for indices, wells in chunks]
+    ):
+        for i, result in zip(indices, results):
+            ordered[i] = result
+        previous, done = done, done + len(indices)
+        if done // 100 > previous // 100:
+            _log_progress(done, len(design), start_time)
+
+        while next_index < len(design) and ordered[next_index] is not pending:
+            yield ordered[next_index]
+            ordered[next_index] = None  # Release once handed over
+            next_index += 1
+
+
+def _log_progress(done: int, total: int, start_time: float) -> None:
+    elapsed = time.time() - start_time
+    rate = done / max(elapsed, 1e-9)
+    remaining = (total - done) / rate
+    logger.info(f"Progress: {done}/{total} ({done/total*100:.1f}%) - "
+              f"Rate: {rate:.1f} wells/sec - ETA: {remaining:.1f}s")
+
+
 # ============================================================================
 # Design ID Canonicalization (Handle Numpy, Tuples, Sets)
 # ============================================================================
@@ -1505,6 +1695,42 @@ def canonicalize_for_json(obj):
 # Main Runner
 # ============================================================================
 
+# Version marker for design_id and result cache keys (bump if simulation logic changes)
+# Human gate for non-parameter changes (algorithm tweaks, etc.)
+SIM_VERSION = "2025-12-17-hash-values-not-keys"
+
+# Source files whose code determines a run's results (this module plus the
+# lazily imported feature-flag models); all are hashed into the cache key
+SIMULATOR_SOURCES = tuple(
+    str(Path(__file__).with_name(name))
+    for name in ("standalone_cell_thalamus.py", "cell_cycle.py", "advanced_biology.py", "realistic_noise.py")
+)
+
+
+def _run_cache_key(design_id: str, design: List[WellAssignment], seed: int) -> str:
+    """
+    Result cache key for a run: design_id + simulator version + code hash
+    (of every file in SIMULATOR_SOURCES).
+
+    Also covers the exact well list (catalog designs and --design-id
+    overrides are not fully captured by design_id) and the feature flags,
+    which change outputs without changing design_id.
+    """
+    wells = json.dumps(canonicalize_for_json([vars(w) for w in design]), sort_keys=True, separators=(',', ':'))
+    return cache_key(
+        design_id=design_id,
+        sim_version=SIM_VERSION,
+        code_hash=code_hash(*SIMULATOR_SOURCES),
+        design_digest=hashlib.blake2s(wells.encode('utf-8'), digest_size=16).hexdigest(),
+        seed=seed,
+        flags={
+            "realistic_noise": USE_REALISTIC_NOISE,
+            "advanced_biology": USE_ADVANCED_BIOLOGY,
+            "cell_cycle_dynamics": USE_CELL_CYCLE_DYNAMICS,
+        },
+    )
+
+
 def run_parallel_simulation(
     cell_lines: Optional[List[str]] = None,
     compounds: Optional[List[str]] = None,
@@ -1513,11 +1739,17 @@ def run_parallel_simulation(
     db_path: str = "cell_thalamus_results.db",
     seed: int = 0,
     design_id: Optional[str] = None,
-    design: Optional[List[WellAssignment]] = None
+    design: Optional[List[WellAssignment]] = None,
+    use_cache: bool = True,
+    cache_path: Optional[str] = None,
 ) -> str:
     """
     Run parallel simulation.
 
+    Finished result tables are cached by content (see simulation_cache): an
+    identical run is written to the database from the cache without
+    re-simulating.
+
     Args:
         cell_lines: Cell lines to test (legacy mode)
         compounds: Compounds to test (legacy mode)
@@ -1527,6 +1759,8 @@ def run_parallel_simulation(
         seed: RNG seed for reproducibility
         design_id: Override design ID
         design: Pre-generated design (from catalog JSON). If provided, overrides legacy parameters.
+        use_cache: Read/write the result cache (False bypasses it entirely)
+        cache_path: Result cache file (default: data/simulation_cache.db)
 
     Returns:
         Design ID
@@ -1572,8 +1806,7 @@ def run_parallel_simulation(
             "baseline_morph": BASELINE_MORPH,  # Full values, not just keys
             "compound_params": COMPOUND_PARAMS,  # Full values, not just keys
             # Version marker (bump if simulation logic changes)
-            # Human gate for non-parameter changes (algorithm tweaks, etc.)
-            "sim_version": "2025-12-17-hash-values-not-keys"
+            "sim_version": SIM_VERSION
         }
 
         # Canonicalize to handle numpy scalars, tuples, sets before JSON
@@ -1622,9 +1855,18 @@ def run_parallel_simulation(
     db.save_design(design_id, 0, cell_lines, compounds,
                    {'mode': mode, 'workers': workers})
 
+    # Result cache lookup (content-addressed; identical runs skip simulation)
+    cache = None
+    cached_results = None
+    if use_cache:
+        cache = SimulationResultCache(cache_path or DEFAULT_CACHE_PATH)
+        run_key = _run_cache_key(design_id, design, seed)
+        cached_results = cache.get(run_key)
+        if cached_results is not None:
+            logger.info(f"Result cache hit: {len(cached_results)} results for {design_id} (skipping simulation)")
+    fresh_results = []
+
     BATCH_SIZE = 5000
-    # Prepare worker args
-    worker_args = [(well, design_id) for well in design]
 
     # Execute in parallel
     logger.info(f"\nStarting parallel execution with {workers} workers...")
@@ -1637,17 +1879,23 @@ def run_parallel_simulation(
     db.conn.execute("BEGIN")
 
     try:
-        with Pool(processes=workers) as pool:
+        with Pool(processes=workers) if cached_results is None else nullcontext() as pool:
             batch = []
             saved = 0
             total_staged = 0  # Track total results staged in transaction (for rollback logging)
 
-            # CRITICAL: Use imap() not imap_unordered() to preserve deterministic order
-            # imap_unordered would insert results in completion order (nondeterministic)
-            # imap preserves input order, ensuring workers=1 matches workers=64
-            for i, result in enumerate(pool.imap(worker_function, worker_args), 1):
+            # CRITICAL: Results must reach the DB in design order, whatever the completion order
+            # Workers simulate condition-grouped chunks (imap, not imap_unordered) and
+            # _simulate_in_design_order reassembles them, ensuring workers=1 matches workers=64
+            if cached_results is None:
+                results_iter = _simulate_in_design_order(pool, design, design_id, workers, start_time)
+            else:
+                results_iter = cached_results
+            for i, result in enumerate(results_iter, 1):
                 if result:
                     batch.append(result)
+                    if cache is not None and cached_results is None:
+                        fresh_results.append(result)
 
                 # Stream inserts (without committing each time)
                 if len(batch) >= BATCH_SIZE:
@@ -1670,12 +1918,8 @@ def run_parallel_simulation(
                     total_staged += len(batch)
                     batch.clear()
 
-                if i % 100 == 0:
-                    elapsed = time.time() - start_time
-                    rate = i / elapsed
-                    remaining = (len(design) - i) / rate
-                    logger.info(f"Progress: {i}/{len(design)} ({i/len(design)*100:.1f}%) - "
-                              f"Rate: {rate:.1f} wells/sec - ETA: {remaining:.1f}s")
+                if cached_results is not None and i % 100 == 0:
+                    _log_progress(i, len(design), start_time)
 
             # Flush remainder
             if batch:
@@ -1713,6 +1957,15 @@ def run_parallel_simulation(
     logger.info(f"\nSaved {saved} results total.")
     db.close()
 
+    # Cache only complete runs (a failed well may be transient)
+    if cache is not None:
+        if cached_results is None and len(fresh_results) == len(design):
+            try:
+                cache.put(run_key, fresh_results, design_id=design_id)
+            except Exception as e:
+                logger.warning(f"Result cache write failed (run unaffected): {e}")
+        cache.close()
+
     # Statistics
     logger.info("=" * 70)
     logger.info("✓ SIMULATION COMPLETE!")
@@ -1894,6 +2147,10 @@ Examples:
                         help='Use advanced biology models (hormesis, density effects, instrument artifacts)')
     parser.add_argument('--cell-cycle-dynamics', action='store_true',
                         help='Use cell cycle dynamics (phase distribution affects drug sensitivity)')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Bypass the result cache (always re-simulate, do not store results)')
+    parser.add_argument('--cache-path', type=str, default=None,
+                        help=f'Result cache file (default: {DEFAULT_CACHE_PATH})')
 
     args = parser.parse_args()
 
@@ -1974,7 +2231,9 @@ Examples:
         db_path=args.db_path,
         seed=args.seed,
         design_id=args.design_id,
-        design=design
+        design=design,
+        use_cache=not args.no_cache,
+        cache_path=args.cache_path,
     )
 
     print(f"\n✓ Complete! Design ID: {design_id}")
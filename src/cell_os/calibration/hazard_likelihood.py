@@ -0,0 +1,262 @@
+"""
+Vectorized discrete-time hazard likelihood for commitment parameter recovery.
+
+Hazard model (per interval, stress taken at the interval start):
+    λ(t) = min(cap, λ0 * ((max(0, S(t) - threshold) / (1 - threshold))^p))
+
+Stress trajectories are packed once into padded (records × intervals)
+arrays, so the log-likelihood of a whole (threshold, λ0, p) grid is one
+broadcast tensor op, and a gradient-based refinement (L-BFGS-B with
+analytic gradients) can polish the best grid point.
+
+Likelihood (same as identifiability_inference's original per-well loop):
+- Committed record with event in interval k: log(max(1 - exp(-λ_k dt_k), 1e-10))
+- Committed record with no matching interval: 0
+- Censored record: log(max(exp(-Σ λ_i dt_i), 1e-10))
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+from scipy.optimize import minimize
+
+# Probability floor used by the likelihood (log(1e-10))
+PROB_FLOOR = 1e-10
+LOG_PROB_FLOOR = float(np.log(PROB_FLOOR))
+
+# Grid points evaluated per broadcast block (bounds peak memory)
+GRID_CHUNK = 2048
+
+
+@dataclass
+class HazardData:
+    """Event records packed against their stress trajectories."""
+    censored_stress: np.ndarray      # (n_censored, n_intervals) stress at interval start
+    censored_dt: np.ndarray          # (n_censored, n_intervals) interval length (0 = padding)
+    event_stress: np.ndarray         # (n_events,) stress at start of the event interval
+    event_dt: np.ndarray             # (n_events,) length of the event interval
+
+    @property
+    def n_records(self) -> int:
+        return len(self.censored_stress) + len(self.event_stress)
+
+
+def pack_trajectories(trajectories: Dict, well_ids) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Pad per-well trajectories into (wells × timepoints) arrays.
+
+    Args:
+        trajectories: Dict[well_id -> {'time_h': array, <stress key>: array}]
+        well_ids: Wells to pack (missing wells become empty rows)
+
+    Returns:
+        (times, stress_by_key, lengths): times is (n_wells, n_max) padded with
+        the last time (so padded intervals have dt = 0); stress_by_key maps
+        each stress key to a (n_wells, n_max) array padded with 0.
+    """
+    well_ids = list(well_ids)
+    lengths = np.array([len(trajectories[w]['time_h']) if w in trajectories else 0 for w in well_ids], dtype=int)
+    n_max = int(lengths.max()) if len(lengths) else 0
+    keys = sorted({k for w in well_ids if w in trajectories for k in trajectories[w] if k != 'time_h'})
+
+    times = np.zeros((len(well_ids), n_max))
+    stress = {k: np.zeros((len(well_ids), n_max)) for k in keys}
+    for row, (well_id, n) in enumerate(zip(well_ids, lengths)):
+        if n == 0:
+            continue
+        traj = trajectories[well_id]
+        times[row, :n] = traj['time_h']
+        times[row, n:] = traj['time_h'][-1]
+        for k in keys:
+            stress[k][row, :n] = traj[k]
+    return times, stress, lengths
+
+
+def pack_hazard_data(events: pd.DataFrame, stress_trajectories: Dict) -> HazardData:
+    """
+    Pack event records and their stress trajectories for likelihood evaluation.
+
+    Args:
+        events: Events dataframe (well_id, committed, commitment_time_h); one
+            likelihood term per row
+        stress_trajectories: Dict[well_id -> {'time_h', 'stress'}]
+
+    Returns:
+        HazardData
+    """
+    events = events[events['well_id'].isin(stress_trajectories.keys())]
+    times, stress, _ = pack_trajectories(stress_trajectories, events['well_id'])
+    stress = stress.get('stress', np.zeros_like(times))
+
+    t_left, t_right = times[:, :-1], times[:, 1:]
+    dt = t_right - t_left
+    s_left = stress[:, :-1]
+
+    committed = events['committed'].to_numpy(dtype=bool)
+    event_time = pd.to_numeric(events['commitment_time_h'], errors='coerce').to_numpy(dtype=float)
+
+    # First interval with t_i <= T < t_{i+1} (NaN times never match)
+    in_interval = (t_left <= event_time[:, None]) & (event_time[:, None] < t_right)
+    has_event = committed & in_interval.any(axis=1)
+    event_idx = np.argmax(in_interval, axis=1)
+
+    rows = np.flatnonzero(has_event)
+    censored = ~committed
+    return HazardData(
+        censored_stress=s_left[censored],
+        censored_dt=dt[censored],
+        event_stress=s_left[rows, event_idx[rows]],
+        event_dt=dt[rows, event_idx[rows]],
+    )
+
+
+def hazard(
+    stress: np.ndarray,
+    threshold,
+    lambda0,
+    p,
+    cap: float = 10.0
+) -> np.ndarray:
+    """
+    Hazard λ(S) for stress values, broadcasting over parameter arrays.
+
+    Parameters may be scalars or arrays shaped to broadcast against `stress`.
+    """
+    stress = np.asarray(stress, dtype=float)
+    threshold = np.asarray(threshold, dtype=float)
+    above = stress > threshold
+    u = np.where(above, (stress - threshold) / (1.0 - threshold), 0.0)
+    return np.where(above, np.minimum(cap, lambda0 * u ** p), 0.0)
+
+
+def log_likelihood_grid(
+    data: HazardData,
+    threshold: np.ndarray,
+    lambda0: np.ndarray,
+    p: np.ndarray,
+    cap: float = 10.0
+) -> np.ndarray:
+    """
+    Log-likelihood for every parameter point of a grid.
+
+    Args:
+        data: Packed records (pack_hazard_data)
+        threshold, lambda0, p: 1-D arrays of equal length (one entry per grid point)
+        cap: Hazard cap
+
+    Returns:
+        (n_points,) log-likelihoods
+    """
+    threshold = np.atleast_1d(np.asarray(threshold, dtype=float))
+    lambda0 = np.atleast_1d(np.asarray(lambda0, dtype=float))
+    p = np.atleast_1d(np.asarray(p, dtype=float))
+
+    out = np.empty(len(threshold))
+    for start in range(0, len(threshold), GRID_CHUNK):
+        sl = slice(start, start + GRID_CHUNK)
+        thr, lam, pp = threshold[sl, None], lambda0[sl, None], p[sl, None]
+
+        # Censored: log survival to end of trajectory
+        h = hazard(data.censored_stress[None], thr[..., None], lam[..., None], pp[..., None], cap)
+        cum_hazard = (h * data.censored_dt[None]).sum(axis=-1)
+        ll = np.maximum(-cum_hazard, LOG_PROB_FLOOR).sum(axis=-1)
+
+        # Events: log P(event in its interval)
+        h_event = hazard(data.event_stress[None], thr, lam, pp, cap)
+        p_event = 1.0 - np.exp(-h_event * data.event_dt[None])
+        ll = ll + np.log(np.maximum(p_event, PROB_FLOOR)).sum(axis=-1)
+        out[sl] = ll
+    return out
+
+
+def _hazard_and_grad(stress, dt, threshold, lambda0, p, cap):
+    """Hazard * dt and its gradient w.r.t. (threshold, log λ0, p)."""
+    above = stress > threshold
+    u = np.where(above, (stress - threshold) / (1.0 - threshold), 1.0)
+    raw = lambda0 * u ** p
+    active = above & (raw < cap) & (dt > 0)
+    h = np.where(above, np.minimum(cap, raw), 0.0)
+
+    du_dthr = (stress - 1.0) / (1.0 - threshold) ** 2
+    d_thr = np.where(active, raw * p / u * du_dthr, 0.0)
+    d_loglam = np.where(active, raw, 0.0)
+    d_p = np.where(active, raw * np.log(u), 0.0)
+    return h * dt, np.stack([d_thr * dt, d_loglam * dt, d_p * dt])
+
+
+def log_likelihood_and_grad(
+    data: HazardData,
+    threshold: float,
+    lambda0: float,
+    p: float,
+    cap: float = 10.0
+) -> Tuple[float, np.ndarray]:
+    """
+    Log-likelihood at one parameter point and its analytic gradient.
+
+    Gradient is w.r.t. (threshold, log λ0, p); it is zero where the hazard
+    is capped, below threshold, or a term sits at the probability floor.
+    """
+    # Censored terms: -Σ λ dt (floored)
+    x, dx = _hazard_and_grad(data.censored_stress, data.censored_dt, threshold, lambda0, p, cap)
+    cum_hazard = x.sum(axis=-1)
+    live = -cum_hazard > LOG_PROB_FLOOR
+    ll = np.maximum(-cum_hazard, LOG_PROB_FLOOR).sum()
+    grad = -(dx.sum(axis=-1) * live).sum(axis=-1)
+
+    # Event terms: log(1 - exp(-λ dt)) (floored)
+    x, dx = _hazard_and_grad(data.event_stress, data.event_dt, threshold, lambda0, p, cap)
+    p_event = 1.0 - np.exp(-x)
+    live = p_event > PROB_FLOOR
+    ll += np.log(np.maximum(p_event, PROB_FLOOR)).sum()
+    dll_dx = np.where(live, np.exp(-x) / np.where(live, p_event, 1.0), 0.0)
+    grad = grad + (dx * dll_dx).sum(axis=-1)
+    return float(ll), grad
+
+
+def refine_commitment_params(
+    data: HazardData,
+    threshold: float,
+    lambda0: float,
+    p: float,
+    cap: float = 10.0,
+    bounds: Optional[Tuple[Tuple[float, float], ...]] = None
+) -> Tuple[float, float, float, float]:
+    """
+    Polish a grid optimum with L-BFGS-B on (threshold, log λ0, p).
+
+    Args:
+        data: Packed records
+        threshold, lambda0, p: Starting point (best grid point)
+        cap: Hazard cap
+        bounds: ((thr_lo, thr_hi), (λ0_lo, λ0_hi), (p_lo, p_hi)); defaults to
+            the fit_commitment_params grid box
+
+    Returns:
+        (threshold, lambda0, p, log_likelihood); the starting point is
+        returned unchanged if the optimizer does not improve on it.
+    """
+    if bounds is None:
+        bounds = ((0.3, 0.9), (1e-3, 1.0), (1.0, 4.0))
+    (thr_lo, thr_hi), (lam_lo, lam_hi), (p_lo, p_hi) = bounds
+
+    def objective(z):
+        ll, grad = log_likelihood_and_grad(data, z[0], np.exp(z[1]), z[2], cap)
+        return -ll, -grad
+
+    start_ll = float(log_likelihood_grid(data, [threshold], [lambda0], [p], cap)[0])
+    result = minimize(
+        objective,
+        x0=np.array([threshold, np.log(lambda0), p]),
+        jac=True,
+        method='L-BFGS-B',
+        bounds=[(thr_lo, thr_hi), (np.log(lam_lo), np.log(lam_hi)), (p_lo, p_hi)],
+    )
+
+    thr, log_lam, pp = result.x
+    refined_ll = float(log_likelihood_grid(data, [thr], [np.exp(log_lam)], [pp], cap)[0])
+    if not np.isfinite(refined_ll) or refined_ll <= start_ll:
+        return threshold, lambda0, p, start_ll
+    return float(thr), float(np.exp(log_lam)), float(pp), refined_ll
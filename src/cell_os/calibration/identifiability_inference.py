@@ -13,6 +13,14 @@ from typing import Dict, Tuple, Optional
 from scipy import stats
 from scipy.optimize import minimize
 
+from cell_os.calibration.hazard_likelihood import (
+    hazard,
+    log_likelihood_grid,
+    pack_hazard_data,
+    pack_trajectories,
+    refine_commitment_params,
+)
+
 
 def fit_re_icc(
     observations_df: pd.DataFrame,
@@ -80,12 +88,46 @@ def fit_re_icc(
     }
 
 
+def _stress_trajectories(obs: pd.DataFrame, well_ids) -> Dict:
+    """Per-well time-sorted {'time_h', 'stress'} arrays (empty for wells with no observations)."""
+    grouped = {
+        well_id: group
+        for well_id, group in obs.sort_values('time_h').groupby('well_id', sort=False)
+    }
+    empty = np.array([], dtype=float)
+    trajectories = {}
+    for well_id in well_ids:
+        well_obs = grouped.get(well_id)
+        trajectories[well_id] = {
+            'time_h': well_obs['time_h'].values if well_obs is not None else empty,
+            'stress': well_obs['value'].values if well_obs is not None else empty,
+        }
+    return trajectories
+
+
+def _cumulative_hazard(
+    trajectories: Dict,
+    well_ids,
+    threshold: float,
+    lambda0: float,
+    p: float,
+    cap: float = 10.0
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Cumulative hazard H = Σ λ(S_i) dt_i per well, plus a mask of wells with data."""
+    times, stress, lengths = pack_trajectories(trajectories, well_ids)
+    if times.shape[1] == 0:
+        return np.zeros(len(lengths)), lengths > 0
+    h = hazard(stress['stress'][:, :-1], threshold, lambda0, p, cap)
+    return (h * np.diff(times, axis=1)).sum(axis=1), lengths > 0
+
+
 def fit_commitment_params(
     events_df: pd.DataFrame,
     observations_df: pd.DataFrame,
     regime: str = "high_stress_event_rich",
     mechanism: str = "er_stress",
-    stress_metric: str = "er_stress"
+    stress_metric: str = "er_stress",
+    refine: bool = True
 ) -> Dict:
     """
     Recover commitment parameters (λ0, threshold, p) from high-stress data (Plate C).
@@ -93,12 +135,17 @@ def fit_commitment_params(
     Uses maximum likelihood estimation with discrete-time hazard model:
         λ(t) = min(cap, λ0 * ((max(0, S(t) - S_commit) / (1 - S_commit))^p))
 
+    The 10×7×8 (threshold, p, λ0) grid is evaluated in one broadcast pass
+    (see hazard_likelihood); the best grid point is then refined with
+    L-BFGS-B inside the grid box unless refine=False.
+
     Args:
         events_df: Events dataframe
         observations_df: Observations dataframe (for stress trajectories)
         regime: Regime to analyze (default: "high_stress_event_rich")
         mechanism: Commitment mechanism (default: "er_stress")
         stress_metric: Stress metric name (default: "er_stress")
+        refine: Polish the best grid point with a gradient-based optimizer
 
     Returns:
         Dict with keys:
@@ -106,6 +153,7 @@ def fit_commitment_params(
             - baseline_hazard_per_h: Recovered λ0
             - sharpness_p: Recovered p
             - log_likelihood: Log-likelihood of best fit
+            - grid_log_likelihood: Log-likelihood of best grid point
             - n_wells: Number of wells
             - n_events: Number of commitment events
             - predicted_commit_prob: Mean predicted commitment probability
@@ -136,13 +184,8 @@ def fit_commitment_params(
     n_events = events['committed'].sum()
 
     # Build stress trajectories for each well
-    stress_trajectories = {}
-    for well_id in well_ids:
-        well_obs = obs[obs['well_id'] == well_id].sort_values('time_h')
-        stress_trajectories[well_id] = {
-            'time_h': well_obs['time_h'].values,
-            'stress': well_obs['value'].values,
-        }
+    stress_trajectories = _stress_trajectories(obs, well_ids)
+    data = pack_hazard_data(events, stress_trajectories)
 
     # Grid search for parameters
     # Threshold: 0.3 to 0.9 (commitment unlikely below 0.3)
@@ -152,27 +195,15 @@ def fit_commitment_params(
     threshold_grid = np.linspace(0.3, 0.9, 10)
     p_grid = np.linspace(1.0, 4.0, 7)
     lambda0_grid = np.logspace(-3, 0, 8)  # 0.001 to 1.0
+    cap = 10.0  # High cap (assume no effective cap in data)
+
+    # Flattened in threshold → p → λ0 order, so argmax keeps the first maximum
+    thr_mesh, p_mesh, lam_mesh = (
+        m.ravel() for m in np.meshgrid(threshold_grid, p_grid, lambda0_grid, indexing='ij')
+    )
+    grid_ll = log_likelihood_grid(data, thr_mesh, lam_mesh, p_mesh, cap)
 
-    best_ll = -np.inf
-    best_params = None
-
-    for threshold in threshold_grid:
-        for p in p_grid:
-            for lambda0 in lambda0_grid:
-                ll = _compute_log_likelihood(
-                    events=events,
-                    stress_trajectories=stress_trajectories,
-                    threshold=threshold,
-                    lambda0=lambda0,
-                    p=p,
-                    cap=10.0  # High cap (assume no effective cap in data)
-                )
-
-                if ll > best_ll:
-                    best_ll = ll
-                    best_params = (threshold, lambda0, p)
-
-    if best_params is None:
+    if not np.any(grid_ll > -np.inf):
         return {
             'threshold': None,
             'baseline_hazard_per_h': None,
@@ -182,40 +213,26 @@ def fit_commitment_params(
             'n_events': int(n_events),
         }
 
-    threshold_best, lambda0_best, p_best = best_params
+    best = int(np.argmax(grid_ll))
+    threshold_best, lambda0_best, p_best = thr_mesh[best], lam_mesh[best], p_mesh[best]
+    best_grid_ll = best_ll = grid_ll[best]
+
+    if refine:
+        threshold_best, lambda0_best, p_best, best_ll = refine_commitment_params(
+            data, threshold_best, lambda0_best, p_best, cap,
+            bounds=(
+                (threshold_grid[0], threshold_grid[-1]),
+                (lambda0_grid[0], lambda0_grid[-1]),
+                (p_grid[0], p_grid[-1]),
+            ),
+        )
 
     # Compute cumulative hazard diagnostic: predicted vs observed commitment
     # For each well, compute H = ∫λ(t)dt, then p_commit = 1 - exp(-H)
-    predicted_probs = []
-    for well_id in well_ids:
-        if well_id not in stress_trajectories:
-            continue
-
-        traj = stress_trajectories[well_id]
-        times = traj['time_h']
-        stresses = traj['stress']
-
-        if len(times) == 0:
-            continue
-
-        # Compute cumulative hazard
-        cumulative_hazard = 0.0
-        for i in range(len(times) - 1):
-            s = stresses[i]
-            dt = times[i + 1] - times[i]
-
-            # Hazard at this stress level
-            if s <= threshold_best:
-                hazard = 0.0
-            else:
-                u = (s - threshold_best) / (1.0 - threshold_best)
-                hazard = min(10.0, lambda0_best * (u ** p_best))  # Use cap=10.0
-
-            cumulative_hazard += hazard * dt
-
-        # P(commit) = 1 - exp(-H)
-        p_commit = 1.0 - np.exp(-cumulative_hazard)
-        predicted_probs.append(p_commit)
+    cumulative_hazard, has_data = _cumulative_hazard(
+        stress_trajectories, well_ids, threshold_best, lambda0_best, p_best, cap
+    )
+    predicted_probs = 1.0 - np.exp(-cumulative_hazard[has_data])
 
     predicted_commit_prob = np.mean(predicted_probs) if len(predicted_probs) > 0 else 0.0
     observed_commit_frac = n_events / n_wells if n_wells > 0 else 0.0
@@ -225,6 +242,7 @@ def fit_commitment_params(
         'baseline_hazard_per_h': float(lambda0_best),
         'sharpness_p': float(p_best),
         'log_likelihood': float(best_ll),
+        'grid_log_likelihood': float(best_grid_ll),
         'n_wells': int(n_wells),
         'n_events': int(n_events),
         'predicted_commit_prob': float(predicted_commit_prob),
@@ -258,59 +276,8 @@ def _compute_log_likelihood(
     Returns:
         Log-likelihood
     """
-    log_likelihood = 0.0
-
-    for _, row in events.iterrows():
-        well_id = row['well_id']
-        committed = row['committed']
-        commitment_time_h = row['commitment_time_h']
-
-        if well_id not in stress_trajectories:
-            continue
-
-        traj = stress_trajectories[well_id]
-        times = traj['time_h']
-        stresses = traj['stress']
-
-        if len(times) == 0:
-            continue
-
-        # Compute survival probability up to each timepoint
-        survival_prob = 1.0
-
-        for i in range(len(times) - 1):
-            t = times[i]
-            s = stresses[i]
-            dt = times[i + 1] - times[i]
-
-            # Hazard at this stress level
-            if s <= threshold:
-                hazard = 0.0
-            else:
-                u = (s - threshold) / (1.0 - threshold)
-                hazard = min(cap, lambda0 * (u ** p))
-
-            # P(survive this interval) = exp(-hazard * dt)
-            p_survive_interval = np.exp(-hazard * dt)
-            survival_prob *= p_survive_interval
-
-            # If committed at this interval
-            if committed and commitment_time_h is not None:
-                if t <= commitment_time_h < times[i + 1]:
-                    # Event occurred in this interval
-                    # P(event) = hazard * exp(-hazard * (t_event - t))
-                    # For discrete time, approximate as: hazard * dt * p_survive_interval
-                    p_event = 1.0 - p_survive_interval  # Discrete-time approximation
-                    log_likelihood += np.log(max(p_event, 1e-10))
-                    break
-
-        else:
-            # No event occurred (or event after last timepoint)
-            if not committed:
-                # Survived to end
-                log_likelihood += np.log(max(survival_prob, 1e-10))
-
-    return log_likelihood
+    data = pack_hazard_data(events, stress_trajectories)
+    return float(log_likelihood_grid(data, [threshold], [lambda0], [p], cap)[0])
 
 
 def predict_commitment_fraction(
@@ -351,35 +318,11 @@ def predict_commitment_fraction(
     p = recovered_params['sharpness_p']
     cap = 10.0  # Assume high cap
 
-    # For each well, compute survival probability to end
-    predicted_events = 0
-
-    for well_id in well_ids:
-        well_obs = obs[obs['well_id'] == well_id].sort_values('time_h')
-        times = well_obs['time_h'].values
-        stresses = well_obs['value'].values
-
-        if len(times) == 0:
-            continue
-
-        # Compute survival to end
-        survival_prob = 1.0
-        for i in range(len(times) - 1):
-            s = stresses[i]
-            dt = times[i + 1] - times[i]
-
-            if s <= threshold:
-                hazard = 0.0
-            else:
-                u = (s - threshold) / (1.0 - threshold)
-                hazard = min(cap, lambda0 * (u ** p))
-
-            p_survive_interval = np.exp(-hazard * dt)
-            survival_prob *= p_survive_interval
-
-        # P(commit) = 1 - P(survive)
-        p_commit = 1.0 - survival_prob
-        predicted_events += p_commit
+    # P(commit) = 1 - P(survive to end), summed over wells
+    cumulative_hazard, _ = _cumulative_hazard(
+        _stress_trajectories(obs, well_ids), well_ids, threshold, lambda0, p, cap
+    )
+    predicted_events = (1.0 - np.exp(-cumulative_hazard)).sum()
 
     predicted_fraction = predicted_events / n_wells if n_wells > 0 else 0.0
 
@@ -531,14 +474,7 @@ def compute_hazard_trajectory(
     Returns:
         Hazard values over time
     """
-    hazards = np.zeros_like(stress_trajectory)
-
-    for i, s in enumerate(stress_trajectory):
-        if s <= threshold:
-            hazards[i] = 0.0
-        else:
-            u = (s - threshold) / (1.0 - threshold)
-            hazards[i] = min(cap, lambda0 * (u ** p))
+    hazards = hazard(stress_trajectory, threshold, lambda0, p, cap)
 
     return hazards
 
@@ -607,18 +543,20 @@ def attribute_events_competing_risks(
     n_wells = len(well_ids)
 
     # Build trajectories for each well
+    er_trajectories = _stress_trajectories(obs_er, well_ids)
+    mito_trajectories = _stress_trajectories(obs_mito, well_ids)
     trajectories = {}
     for well_id in well_ids:
-        er_traj = obs_er[obs_er['well_id'] == well_id].sort_values('time_h')
-        mito_traj = obs_mito[obs_mito['well_id'] == well_id].sort_values('time_h')
+        er_traj = er_trajectories[well_id]
+        mito_traj = mito_trajectories[well_id]
 
-        if len(er_traj) == 0 or len(mito_traj) == 0:
+        if len(er_traj['time_h']) == 0 or len(mito_traj['time_h']) == 0:
             continue
 
         trajectories[well_id] = {
-            'time_h': er_traj['time_h'].values,  # Assume same timepoints
-            'er_stress': er_traj['value'].values,
-            'mito_stress': mito_traj['value'].values,
+            'time_h': er_traj['time_h'],  # Assume same timepoints
+            'er_stress': er_traj['stress'],
+            'mito_stress': mito_traj['stress'],
         }
 
     # Extract params
@@ -708,51 +646,28 @@ def attribute_events_competing_risks(
     predicted_events_er = 0.0
     predicted_events_mito = 0.0
 
-    for well_id in well_ids:
-        if well_id not in trajectories:
-            continue
-
-        traj = trajectories[well_id]
-        times = traj['time_h']
-        er_stresses = traj['er_stress']
-        mito_stresses = traj['mito_stress']
-
-        # Compute hazard trajectories
-        hazard_er_traj = compute_hazard_trajectory(er_stresses, threshold_er, lambda0_er, p_er, cap)
-        hazard_mito_traj = compute_hazard_trajectory(mito_stresses, threshold_mito, lambda0_mito, p_mito, cap)
-        hazard_total_traj = hazard_er_traj + hazard_mito_traj
-
-        # Compute survival and attribution
-        survival_prob = 1.0
-        p_commit_er = 0.0
-        p_commit_mito = 0.0
-
-        for i in range(len(times) - 1):
-            dt = times[i + 1] - times[i]
-            lambda_total_t = hazard_total_traj[i]
-            lambda_er_t = hazard_er_traj[i]
-            lambda_mito_t = hazard_mito_traj[i]
-
-            # Survival in this interval
-            p_survive_interval = np.exp(-lambda_total_t * dt)
-            p_commit_interval = 1.0 - p_survive_interval
-
-            # Attribution within this interval
-            if lambda_total_t > 0:
-                frac_er = lambda_er_t / lambda_total_t
-                frac_mito = lambda_mito_t / lambda_total_t
-            else:
-                frac_er = 0.5
-                frac_mito = 0.5
-
-            # Increment mechanism-specific commitments
-            p_commit_er += survival_prob * p_commit_interval * frac_er
-            p_commit_mito += survival_prob * p_commit_interval * frac_mito
-
-            survival_prob *= p_survive_interval
-
-        predicted_events_er += p_commit_er
-        predicted_events_mito += p_commit_mito
+    times, stresses, _ = pack_trajectories(trajectories, [w for w in well_ids if w in trajectories])
+    if times.shape[1] > 1:
+        dt = np.diff(times, axis=1)
+        hazard_er = hazard(stresses['er_stress'][:, :-1], threshold_er, lambda0_er, p_er, cap)
+        hazard_mito = hazard(stresses['mito_stress'][:, :-1], threshold_mito, lambda0_mito, p_mito, cap)
+        hazard_total = hazard_er + hazard_mito
+
+        # Survival in each interval, and survival up to its start
+        p_survive_interval = np.exp(-hazard_total * dt)
+        survival_prob = np.cumprod(
+            np.hstack([np.ones((len(times), 1)), p_survive_interval[:, :-1]]), axis=1
+        )
+        p_commit_interval = survival_prob * (1.0 - p_survive_interval)
+
+        # Attribution within each interval (even split when both hazards are zero)
+        positive = hazard_total > 0
+        safe_total = np.where(positive, hazard_total, 1.0)
+        frac_er = np.where(positive, hazard_er / safe_total, 0.5)
+        frac_mito = np.where(positive, hazard_mito / safe_total, 0.5)
+
+        predicted_events_er = float((p_commit_interval * frac_er).sum())
+        predicted_events_mito = float((p_commit_interval * frac_mito).sum())
 
     predicted_fraction_er = predicted_events_er / n_wells if n_wells > 0 else 0.0
     predicted_fraction_mito = predicted_events_mito / n_wells if n_wells > 0 else 0.0
@@ -4,12 +4,13 @@ Experimental Design Generator for Cell Thalamus Phase 0
 Generates full factorial designs with sentinels for variance partitioning.
 """
 
-import yaml
 import itertools
 from typing import List, Dict, Tuple, Optional
 from pathlib import Path
 from dataclasses import dataclass
 
+from ..hardware.param_registry import load_yaml_params_copy
+
 
 @dataclass
 class WellAssignment:
@@ -43,8 +44,7 @@ class Phase0Design:
         if params_file is None:
             params_file = Path(__file__).parent.parent.parent.parent / "data" / "cell_thalamus_params.yaml"
 
-        with open(params_file, 'r') as f:
-            self.params = yaml.safe_load(f)
+        self.params = load_yaml_params_copy(params_file)
 
     def _calculate_dose(self, compound: str, level: str) -> float:
         """Calculate actual dose based on compound EC50 and dose level."""
@@ -60,8 +60,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
-import yaml
-
+from ..hardware.param_registry import load_yaml_params_copy
 from .plate_template_generator import PlateTemplate, create_phase0_templates
 
 
@@ -467,8 +466,7 @@ class MenadionePhase0Design:
             Path(__file__).parent.parent.parent.parent / "data" / "cell_thalamus_params.yaml"
         )
         if params_file.exists():
-            with open(params_file) as f:
-                self.params = yaml.safe_load(f)
+            self.params = load_yaml_params_copy(params_file)
         else:
             self.params = {}
 
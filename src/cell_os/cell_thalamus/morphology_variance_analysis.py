@@ -12,7 +12,7 @@ where it matters for defining reward functions and constraints.
 
 import numpy as np
 import pandas as pd
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
 from dataclasses import dataclass
 from sklearn.decomposition import PCA
 from sklearn.covariance import LedoitWolf
@@ -23,6 +23,23 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# Morphology feature columns (ER, Mito, Nucleus, Actin, RNA)
+MORPHOLOGY_FEATURES = ['morph_er', 'morph_mito', 'morph_nucleus', 'morph_actin', 'morph_rna']
+
+# Grouping metadata columns and their defaults when absent from the results
+METADATA_DEFAULTS = {
+    'well_id': None,
+    'compound': None,
+    'cell_line': None,
+    'dose_uM': 0.0,
+    'timepoint_h': 0.0,
+    'viability_pct': 100.0,
+    'plate_id': 'unknown',
+    'day': 1,
+    'operator': 'unknown',
+    'is_sentinel': False,
+}
+
 
 @dataclass
 class ConditionVariance:
@@ -96,14 +113,15 @@ class MorphologyVarianceAnalyzer:
 
     def analyze_design(
         self,
-        results: List[Dict],
+        results: Union[List[Dict], pd.DataFrame],
         design_id: str
     ) -> Tuple[List[ConditionVariance], ManifoldDiagnostics]:
         """
         Analyze a completed experiment to rank conditions by morphology variance.
 
         Args:
-            results: List of well results from database
+            results: Well results from database (row dicts, or a DataFrame
+                from CellThalamusDB.get_results_frame)
             design_id: Design ID for logging
 
         Returns:
@@ -143,56 +161,33 @@ class MorphologyVarianceAnalyzer:
 
     def _extract_morphology_features(
         self,
-        results: List[Dict]
+        results: Union[List[Dict], pd.DataFrame]
     ) -> Tuple[np.ndarray, pd.DataFrame]:
         """Extract 5-channel morphology features from results."""
-        features = []
-        metadata_rows = []
-
-        for r in results:
-            # 5D morphology: ER, Mito, Nucleus, Actin, RNA
-            morph = np.array([
-                r.get('morph_er', 0.0),
-                r.get('morph_mito', 0.0),
-                r.get('morph_nucleus', 0.0),
-                r.get('morph_actin', 0.0),
-                r.get('morph_rna', 0.0),
-            ])
-
-            # Skip wells with missing morphology
-            if np.any(np.isnan(morph)) or np.all(morph == 0):
-                continue
-
-            features.append(morph)
-
-            # Store metadata for grouping
-            metadata_rows.append({
-                'well_id': r.get('well_id'),
-                'compound': r.get('compound'),
-                'cell_line': r.get('cell_line'),
-                'dose_uM': r.get('dose_uM', 0.0),
-                'timepoint_h': r.get('timepoint_h', 0.0),
-                'viability_pct': r.get('viability_pct', 100.0),
-                'plate_id': r.get('plate_id', 'unknown'),
-                'day': r.get('day', 1),
-                'operator': r.get('operator', 'unknown'),
-                'is_sentinel': r.get('is_sentinel', False),
-            })
-
-        X = np.array(features)
-        metadata = pd.DataFrame(metadata_rows)
-
-        # Debug: check index before reset
-        logger.info(f"Metadata index before reset: {metadata.index.tolist()[:10]}")
-
-        metadata = metadata.reset_index(drop=True)
+        df = results if isinstance(results, pd.DataFrame) else pd.DataFrame(list(results))
+        n_total = len(df)
+
+        # 5D morphology: ER, Mito, Nucleus, Actin, RNA
+        X = np.column_stack([
+            df[column].astype(float).to_numpy() if column in df else np.zeros(n_total)
+            for column in MORPHOLOGY_FEATURES
+        ]).reshape(n_total, len(MORPHOLOGY_FEATURES))
+
+        # Skip wells with missing morphology
+        valid = ~(np.isnan(X).any(axis=1) | (X == 0).all(axis=1))
+        X = X[valid]
+        n_valid = int(valid.sum())
+
+        # Metadata for grouping
+        metadata = pd.DataFrame({
+            column: df[column].to_numpy()[valid] if column in df else [default] * n_valid
+            for column, default in METADATA_DEFAULTS.items()
+        })
 
-        # Debug: check index after reset
-        logger.info(f"Metadata index after reset: {metadata.index.tolist()[:10]}")
         logger.info(f"Metadata columns: {metadata.columns.tolist()}")
         logger.info(f"Metadata dtypes:\n{metadata.dtypes}")
 
-        logger.info(f"Extracted {len(X)} wells with valid morphology from {len(results)} total")
+        logger.info(f"Extracted {len(X)} wells with valid morphology from {n_total} total")
 
         return X, metadata
 
@@ -569,7 +564,7 @@ def _to_native(val):
 
 
 def rank_conditions_for_autonomous_loop(
-    results: List[Dict],
+    results: Union[List[Dict], pd.DataFrame],
     design_id: str,
     top_k: int = 10
 ) -> Tuple[List[Dict], Dict]:
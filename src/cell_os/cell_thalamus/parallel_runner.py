@@ -4,6 +4,12 @@ Parallel Cell Thalamus Runner
 Runs Cell Thalamus simulations using multiprocessing for massive speedup.
 Designed for JupyterHub with 16-64 vCPUs.
 
+Each worker process builds one BiologicalVirtualMachine (pool initializer) and
+reset()s it between wells instead of constructing a fresh VM per well. Work is
+dispatched one plate per task, so IPC and scheduling overhead is paid per plate
+rather than per well. Results are identical to a fresh VM per well: reset()
+restores exactly the constructor state for the same seed.
+
 Example usage on JupyterHub:
     python parallel_runner.py --mode full --workers 64
 """
@@ -14,13 +20,39 @@ import logging
 from typing import List, Dict, Any, Optional
 from multiprocessing import Pool, cpu_count
 import uuid
+from collections import defaultdict
 
-from cell_os.hardware.biological_virtual import BiologicalVirtualMachine
+from cell_os.hardware.biological_virtual import BiologicalVirtualMachine, load_simulation_params
 from cell_os.database.cell_thalamus_db import CellThalamusDB
 from cell_os.cell_thalamus.design_generator import Phase0Design, WellAssignment
 
 logger = logging.getLogger(__name__)
 
+# Measured single-core cost of one well on a reused VM (no instrument delays)
+SERIAL_SECONDS_PER_WELL = 0.02
+
+# Per-well seed (every well has always run on a seed-0 VM)
+WELL_SEED = 0
+
+# Per-process VM, built by init_worker and reset() before every well
+_WORKER_VM: Optional[BiologicalVirtualMachine] = None
+
+
+def init_worker() -> None:
+    """Pool initializer: build this worker's VM once (parameter tables, YAML)."""
+    global _WORKER_VM
+    # simulation_speed=0: batch runs never want wall-clock instrument delays
+    _WORKER_VM = BiologicalVirtualMachine(seed=WELL_SEED, simulation_speed=0.0)
+
+
+def _worker_vm() -> BiologicalVirtualMachine:
+    """Return this process's VM, reset to a fresh-construction state."""
+    if _WORKER_VM is None:
+        init_worker()
+    else:
+        _WORKER_VM.reset(seed=WELL_SEED)
+    return _WORKER_VM
+
 
 def execute_well_worker(args) -> Optional[Dict[str, Any]]:
     """
@@ -34,8 +66,8 @@ def execute_well_worker(args) -> Optional[Dict[str, Any]]:
     """
     well, design_id = args
 
-    # Create hardware instance for this worker
-    hardware = BiologicalVirtualMachine()
+    # Reuse this worker's VM; reset() makes it equivalent to a fresh instance
+    hardware = _worker_vm()
     vessel_id = f"{well.plate_id}_{well.well_id}"
 
     try:
@@ -85,6 +117,28 @@ def execute_well_worker(args) -> Optional[Dict[str, Any]]:
         return None
 
 
+def execute_plate_worker(args) -> List[Optional[Dict[str, Any]]]:
+    """
+    Worker function to execute all wells of one plate.
+
+    Args:
+        args: Tuple of (wells, design_id)
+
+    Returns:
+        One entry per well (result dict, or None on failure), in input order
+    """
+    wells, design_id = args
+    return [execute_well_worker((well, design_id)) for well in wells]
+
+
+def _group_by_plate(design: List[WellAssignment]) -> List[List[WellAssignment]]:
+    """Split a design into per-plate well lists (plate order of first appearance)."""
+    plates: Dict[str, List[WellAssignment]] = defaultdict(list)
+    for well in design:
+        plates[well.plate_id].append(well)
+    return list(plates.values())
+
+
 def run_parallel_simulation(
     cell_lines: Optional[List[str]] = None,
     compounds: Optional[List[str]] = None,
@@ -149,7 +203,8 @@ def run_parallel_simulation(
         design = design_generator.generate_full_design(cell_lines, compounds)
 
     logger.info(f"Total wells to execute: {len(design)}")
-    logger.info(f"Estimated time: {len(design) * 2.9 / workers:.1f} seconds (~{len(design) * 2.9 / workers / 60:.1f} minutes)")
+    logger.info(f"Estimated time: {len(design) * SERIAL_SECONDS_PER_WELL / workers:.1f} seconds "
+                f"(~{len(design) * SERIAL_SECONDS_PER_WELL / workers / 60:.1f} minutes)")
 
     # Save design to database
     db = CellThalamusDB(db_path=db_path)
@@ -166,26 +221,33 @@ def run_parallel_simulation(
         metadata={'mode': mode, 'workers': workers}
     )
 
-    # Prepare worker arguments
-    worker_args = [(well, design_id) for well in design]
+    # Prepare worker arguments: one task per plate
+    worker_args = [(wells, design_id) for wells in _group_by_plate(design)]
 
     # Execute in parallel
-    logger.info(f"\nStarting parallel execution with {workers} workers...")
+    logger.info(f"\nStarting parallel execution with {workers} workers "
+                f"({len(worker_args)} plates)...")
     start_time = time.time()
 
-    with Pool(processes=workers) as pool:
+    # Warm the parameter cache before forking so workers start without DB queries
+    load_simulation_params()
+
+    with Pool(processes=workers, initializer=init_worker) as pool:
         # Use imap_unordered for better performance (doesn't maintain order)
         results = []
-        for i, result in enumerate(pool.imap_unordered(execute_well_worker, worker_args), 1):
-            if result:
-                results.append(result)
-
-            # Progress update every 100 wells
-            if i % 100 == 0:
+        done = 0
+        next_report = 100
+        for plate_results in pool.imap_unordered(execute_plate_worker, worker_args):
+            results.extend(result for result in plate_results if result)
+            done += len(plate_results)
+
+            # Progress update every ~100 wells
+            if done >= next_report:
+                next_report = done + 100
                 elapsed = time.time() - start_time
-                rate = i / elapsed
-                remaining = (len(design) - i) / rate
-                logger.info(f"Progress: {i}/{len(design)} wells ({i/len(design)*100:.1f}%) - "
+                rate = done / elapsed
+                remaining = (len(design) - done) / rate
+                logger.info(f"Progress: {done}/{len(design)} wells ({done/len(design)*100:.1f}%) - "
                           f"Rate: {rate:.1f} wells/sec - ETA: {remaining:.1f}s")
 
     elapsed = time.time() - start_time
@@ -204,7 +266,7 @@ def run_parallel_simulation(
     logger.info(f"Total time: {elapsed:.2f} seconds ({elapsed/60:.2f} minutes)")
     logger.info(f"Time per well: {elapsed/len(design):.3f} seconds")
     logger.info(f"Throughput: {len(design)/elapsed:.1f} wells/second")
-    logger.info(f"Speedup: {len(design) * 2.9 / elapsed:.1f}x vs serial")
+    logger.info(f"Speedup: {len(design) * SERIAL_SECONDS_PER_WELL / elapsed:.1f}x vs serial")
     logger.info(f"Design ID: {design_id}")
     logger.info(f"Database: {db_path}")
     logger.info("=" * 70)
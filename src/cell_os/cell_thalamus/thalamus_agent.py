@@ -181,19 +181,22 @@ class CellThalamusAgent:
         """Get summary of campaign results."""
         design_id = design_id or self.design_id
 
-        results = self.db.get_results(design_id)
+        # Served entirely from the (design_id, is_sentinel, compound, cell_line) index
+        results = self.db.get_results_columns(
+            design_id, columns=['is_sentinel', 'compound', 'cell_line'], ordered=False
+        )
 
-        if not results:
+        if len(results['is_sentinel']) == 0:
             return {"error": "No results found"}
 
         # Count by type
-        total_results = len(results)
-        sentinel_results = sum(1 for r in results if r['is_sentinel'])
+        total_results = len(results['is_sentinel'])
+        sentinel_results = int((results['is_sentinel'] != 0).sum())
         experimental_results = total_results - sentinel_results
 
         # Unique values
-        unique_compounds = len(set(r['compound'] for r in results))
-        unique_cell_lines = len(set(r['cell_line'] for r in results))
+        unique_compounds = len(set(results['compound']))
+        unique_cell_lines = len(set(results['cell_line']))
 
         return {
             'design_id': design_id,
@@ -25,6 +25,12 @@ class VarianceAnalyzer:
     3. Sentinels within control limits
     """
 
+    # Columns the variance decomposition and SPC group by
+    FACTOR_COLUMNS = [
+        'is_sentinel', 'compound', 'dose_uM', 'cell_line', 'timepoint_h',
+        'plate_id', 'day', 'operator',
+    ]
+
     def __init__(self, db):
         """
         Initialize variance analyzer.
@@ -44,18 +50,15 @@ class VarianceAnalyzer:
         Returns:
             Dict with variance components, SPC results, and summary
         """
-        # Get all results
-        results = self.db.get_results(design_id)
-
-        if not results:
-            return {"error": "No results found"}
-
-        # Convert to DataFrame
-        df = pd.DataFrame(results)
-
         # Analyze each metric
         metrics = ['atp_signal', 'morph_er', 'morph_mito', 'morph_nucleus', 'morph_actin', 'morph_rna']
 
+        # Fetch only the factor and metric columns, straight into a DataFrame
+        df = self.db.get_results_frame(design_id, columns=self.FACTOR_COLUMNS + metrics)
+
+        if len(df) == 0:
+            return {"error": "No results found"}
+
         variance_components = {}
         for metric in metrics:
             components = self.compute_variance_components(df, metric)
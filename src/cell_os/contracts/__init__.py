@@ -7,7 +7,7 @@ Contracts are runtime-checked specifications that:
 3. Provide forensic evidence for debugging
 
 Exports:
-- Measurement contracts: enforce_measurement_contract, MeasurementContract, etc.
+- Measurement contracts: enforce_measurement_contract, enforce_batch_measurement_contract, MeasurementContract, etc.
 - Conservation contracts: conserved_death, assert_conservation, ConservationViolation
 - Debt contracts: debt_enforced, check_debt_threshold, DebtViolation
 """
@@ -16,6 +16,7 @@ from .causal_contract import (
     CausalContractViolation,
     MeasurementContract,
     enforce_measurement_contract,
+    enforce_batch_measurement_contract,
     get_recorded_contract_violations,
     clear_recorded_contract_violations,
     validate_measurement_output,
@@ -47,6 +48,7 @@ from .debt import (
 __all__ = [
     # Measurement contracts
     "enforce_measurement_contract",
+    "enforce_batch_measurement_contract",
     "MeasurementContract",
     "CausalContractViolation",
     "validate_measurement_output",
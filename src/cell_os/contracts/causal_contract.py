@@ -11,12 +11,13 @@ The contract is enforced at runtime via decorators and read-only proxies.
 
 from __future__ import annotations
 
+import functools
 import os
 import time
 import warnings
 from collections import Counter
 from dataclasses import dataclass, field
-from typing import Any, Callable, Dict, Optional, Set, List
+from typing import Any, Callable, Dict, Optional, Set, List, Tuple
 
 
 class CausalContractViolation(RuntimeError):
@@ -65,6 +66,7 @@ def _violation(msg: str) -> None:
 # Matching helpers
 # ----------------------------
 
+@functools.lru_cache(maxsize=4096)
 def _normalize_brackets(path: str) -> str:
     """Normalize any [whatever] into [*] so patterns can match."""
     out = []
@@ -375,6 +377,64 @@ def _emit_contract_report(
         pass
 
 
+def _call_under_contract(
+    contract: MeasurementContract,
+    fn: Callable[..., Any],
+    args: Tuple[Any, ...],
+    kwargs: Dict[str, Any],
+    arg_index: int,
+    make_proxy: Callable[[Any, _AccessLog, bool], Any],
+) -> Any:
+    """
+    Shared body of the measurement-contract decorators.
+
+    Replaces args[arg_index] with make_proxy(value, log, debug_truth_enabled),
+    calls fn, then enforces the allow-list, validates the output, flags writes
+    and emits one contract report for the call.
+    """
+    self_obj = args[0]
+
+    # Get run_context from VM (self_obj.vm.run_context for assays)
+    vm = getattr(self_obj, "vm", None)
+    run_context = getattr(vm, "run_context", None) if vm is not None else None
+    debug_truth_enabled = bool(getattr(run_context, "debug_truth_enabled", False)) if run_context is not None else False
+
+    start_time = time.time()
+
+    log = _AccessLog()
+    new_args = list(args)
+    new_args[arg_index] = make_proxy(args[arg_index], log, debug_truth_enabled)
+
+    violations_list = []
+    if _record_mode():
+        old_violations = list(_CONTRACT_VIOLATIONS)
+
+    out = fn(*tuple(new_args), **kwargs)
+
+    _enforce_allow_list(contract, log)
+    validate_measurement_output(contract, out, debug_truth_enabled)
+
+    if log.writes:
+        _violation(f"[{contract.name}] writes detected: {sorted(log.writes)[:5]}")
+
+    if _record_mode():
+        new_violations = _CONTRACT_VIOLATIONS[len(old_violations):]
+        violations_list = list(new_violations)
+
+    elapsed_ms = (time.time() - start_time) * 1000.0
+
+    _emit_contract_report(
+        run_context=run_context,
+        contract=contract,
+        log=log,
+        violations=violations_list,
+        debug_truth_enabled=debug_truth_enabled,
+        timing_ms=elapsed_ms
+    )
+
+    return out
+
+
 def enforce_measurement_contract(contract: MeasurementContract, vessel_arg_index: int = 1) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
     """
     Decorator for VM assay entrypoints.
@@ -389,55 +449,48 @@ def enforce_measurement_contract(contract: MeasurementContract, vessel_arg_index
     Returns:
         Decorated function that enforces the contract
     """
+    def make_proxy(vessel: Any, log: _AccessLog, debug_truth_enabled: bool) -> Any:
+        return _ReadOnlyProxy(vessel, "state", log, contract, debug_truth_enabled)
+
     def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
         def wrapped(*args: Any, **kwargs: Any) -> Any:
             if len(args) <= vessel_arg_index:
                 return fn(*args, **kwargs)
+            return _call_under_contract(contract, fn, args, kwargs, vessel_arg_index, make_proxy)
 
-            self_obj = args[0]
-            vessel = args[vessel_arg_index]
-
-            # Get run_context from VM (self_obj.vm.run_context for assays)
-            vm = getattr(self_obj, "vm", None)
-            run_context = getattr(vm, "run_context", None) if vm is not None else None
-            debug_truth_enabled = bool(getattr(run_context, "debug_truth_enabled", False)) if run_context is not None else False
-
-            start_time = time.time()
-
-            log = _AccessLog()
-            ro_vessel = _ReadOnlyProxy(vessel, "state", log, contract, debug_truth_enabled)
-
-            new_args = list(args)
-            new_args[vessel_arg_index] = ro_vessel
-
-            violations_list = []
-            if _record_mode():
-                old_violations = list(_CONTRACT_VIOLATIONS)
+        wrapped.__name__ = getattr(fn, "__name__", "wrapped")
+        wrapped.__doc__ = fn.__doc__
+        return wrapped
+    return deco
 
-            out = fn(*tuple(new_args), **kwargs)
 
-            _enforce_allow_list(contract, log)
-            validate_measurement_output(contract, out, debug_truth_enabled)
+def enforce_batch_measurement_contract(contract: MeasurementContract, vessels_arg_index: int = 1) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator for batched VM assay entrypoints.
 
-            if log.writes:
-                _violation(f"[{contract.name}] writes detected: {sorted(log.writes)[:5]}")
+    Expected signature:
+        def measure_batch(self, vessels, *args, **kwargs) -> dict
 
-            if _record_mode():
-                new_violations = _CONTRACT_VIOLATIONS[len(old_violations):]
-                violations_list = list(new_violations)
+    Every vessel is wrapped in a read-only proxy rooted at "state", all sharing
+    one access log, so allow-list enforcement, output validation and the
+    contract report happen once per batch instead of once per well. Forbidden
+    reads and mutations are still caught per access.
 
-            elapsed_ms = (time.time() - start_time) * 1000.0
+    Args:
+        contract: The measurement contract to enforce
+        vessels_arg_index: Position of the vessels sequence (default 1, after self)
 
-            _emit_contract_report(
-                run_context=run_context,
-                contract=contract,
-                log=log,
-                violations=violations_list,
-                debug_truth_enabled=debug_truth_enabled,
-                timing_ms=elapsed_ms
-            )
+    Returns:
+        Decorated function that enforces the contract
+    """
+    def make_proxies(vessels: Any, log: _AccessLog, debug_truth_enabled: bool) -> List[Any]:
+        return [_ReadOnlyProxy(v, "state", log, contract, debug_truth_enabled) for v in vessels]
 
-            return out
+    def deco(fn: Callable[..., Any]) -> Callable[..., Any]:
+        def wrapped(*args: Any, **kwargs: Any) -> Any:
+            if len(args) <= vessels_arg_index:
+                return fn(*args, **kwargs)
+            return _call_under_contract(contract, fn, args, kwargs, vessels_arg_index, make_proxies)
 
         wrapped.__name__ = getattr(fn, "__name__", "wrapped")
         wrapped.__doc__ = fn.__doc__
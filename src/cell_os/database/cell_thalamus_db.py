@@ -14,14 +14,43 @@ import os
 import sqlite3
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterator, List, Optional, Sequence, Tuple
 from zoneinfo import ZoneInfo
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Pacific timezone for timestamps
 PACIFIC_TZ = ZoneInfo("America/Los_Angeles")
 
+# Bumped whenever _migrate_schema gains a step (stored in PRAGMA user_version)
+SCHEMA_VERSION = 2
+
+# Morphology channel columns, in matrix order
+MORPHOLOGY_COLUMNS = ("morph_er", "morph_mito", "morph_nucleus", "morph_actin", "morph_rna")
+
+# Declared column type -> NumPy dtype for columnar fetches (anything else is object)
+_COLUMN_DTYPES = {"REAL": np.float64, "INTEGER": np.int64, "BOOLEAN": np.int64}
+
+# Default rows per chunk for iter_results_columns
+RESULTS_CHUNK_SIZE = 100_000
+
+# Called with (db_path, design_id) after results are written for a design
+_results_listeners: List[Callable[[str, str], None]] = []
+
+
+def add_results_listener(listener: Callable[[str, str], None]):
+    """Register a callback invoked as listener(db_path, design_id) after result writes."""
+    if listener not in _results_listeners:
+        _results_listeners.append(listener)
+
+
+def remove_results_listener(listener: Callable[[str, str], None]):
+    """Unregister a callback added with add_results_listener."""
+    if listener in _results_listeners:
+        _results_listeners.remove(listener)
+
 
 class CellThalamusDB:
     """Database for Cell Thalamus experimental results."""
@@ -32,6 +61,11 @@ class CellThalamusDB:
         self.conn = sqlite3.connect(db_path)
         self.conn.row_factory = sqlite3.Row  # Return dict-like rows
         self._create_schema()
+        self._migrate_schema()
+        self._column_types = {
+            row["name"]: row["type"].upper()
+            for row in self.conn.execute("PRAGMA table_info(thalamus_results)")
+        }
         logger.info(f"Connected to Cell Thalamus DB: {db_path}")
 
     def _create_schema(self):
@@ -120,6 +154,27 @@ class CellThalamusDB:
         self.conn.commit()
         logger.info("Cell Thalamus schema created")
 
+    def _migrate_schema(self):
+        """Bring existing databases up to SCHEMA_VERSION."""
+        version = self.conn.execute("PRAGMA user_version").fetchone()[0]
+        if version >= SCHEMA_VERSION:
+            return
+
+        cursor = self.conn.cursor()
+
+        # v2: covering index for per-design condition/sentinel queries
+        # (condition listings, sentinel splits, dose-response lookups)
+        cursor.execute(
+            """
+            CREATE INDEX IF NOT EXISTS idx_results_design_condition
+            ON thalamus_results(design_id, is_sentinel, compound, cell_line)
+        """
+        )
+
+        cursor.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+        self.conn.commit()
+        logger.info(f"Migrated Cell Thalamus schema from v{version} to v{SCHEMA_VERSION}")
+
     def save_design(
         self,
         design_id: str,
@@ -221,6 +276,7 @@ class CellThalamusDB:
         )
 
         self.conn.commit()
+        self._notify_results_written({design_id})
 
     def insert_results_batch(self, results: list[dict[str, Any]]):
         """
@@ -290,21 +346,51 @@ class CellThalamusDB:
 
         self.conn.commit()
         logger.info(f"Batch inserted {len(results)} results")
+        self._notify_results_written({result["design_id"] for result in results})
+
+    def _notify_results_written(self, design_ids: set):
+        """Tell listeners (e.g. API analysis caches) which designs changed."""
+        for design_id in design_ids:
+            for listener in list(_results_listeners):
+                try:
+                    listener(self.db_path, design_id)
+                except Exception as e:
+                    logger.warning(f"Results listener failed for {design_id}: {e}")
 
     def get_results(self, design_id: str, filters: Optional[dict] = None) -> list[dict]:
         """
         Retrieve results for a design with optional filters.
 
+        For analysis, prefer get_results_columns/get_results_frame, which skip
+        the per-row dicts.
+
         Args:
             design_id: Design ID to query
             filters: Optional dict with keys: cell_line, compound, is_sentinel, etc.
 
         Returns:
-            List of result dicts
+            List of result dicts (insertion order)
         """
         cursor = self.conn.cursor()
+        cursor.execute(*self._results_query(design_id, None, filters))
+        rows = cursor.fetchall()
+
+        return [dict(row) for row in rows]
 
-        query = "SELECT * FROM thalamus_results WHERE design_id = ?"
+    def _results_query(
+        self,
+        design_id: str,
+        columns: Optional[Sequence[str]],
+        filters: Optional[dict],
+        ordered: bool = True,
+    ) -> Tuple[str, list]:
+        """SELECT for a design's results projected to columns (insertion order if ordered)."""
+        for name in list(columns or []) + list(filters or {}):
+            if name not in self._column_types:
+                raise ValueError(f"Unknown thalamus_results column: {name}")
+
+        projection = ", ".join(columns) if columns else "*"
+        query = f"SELECT {projection} FROM thalamus_results WHERE design_id = ?"
         params = [design_id]
 
         if filters:
@@ -312,15 +398,126 @@ class CellThalamusDB:
                 query += f" AND {key} = ?"
                 params.append(value)
 
-        cursor.execute(query, params)
-        rows = cursor.fetchall()
+        if ordered:
+            query += " ORDER BY result_id"
+        return query, params
+
+    def _to_columns(self, columns: Sequence[str], rows: list) -> Dict[str, np.ndarray]:
+        """Transpose fetched tuples into one NumPy array per column."""
+        values = list(zip(*rows)) if rows else [()] * len(columns)
+        arrays = {}
+        for name, column in zip(columns, values):
+            dtype = _COLUMN_DTYPES.get(self._column_types[name])
+            if dtype is np.int64 and None in column:
+                dtype = np.float64
+            if dtype is np.float64:
+                arrays[name] = np.array(column, dtype=float)  # NULL -> NaN
+            elif dtype is not None:
+                arrays[name] = np.array(column, dtype=dtype)
+            else:
+                arrays[name] = np.empty(len(column), dtype=object)
+                arrays[name][:] = column
+        return arrays
 
-        return [dict(row) for row in rows]
+    def iter_results_columns(
+        self,
+        design_id: str,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[dict] = None,
+        chunk_size: int = RESULTS_CHUNK_SIZE,
+        ordered: bool = True,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Stream a design's results as chunks of column arrays.
+
+        Keeps memory bounded for designs with millions of wells; see
+        get_results_columns for the array layout.
+
+        Args:
+            design_id: Design ID to query
+            columns: Columns to fetch (default: all)
+            filters: Optional equality filters, as in get_results
+            chunk_size: Maximum rows per chunk
+            ordered: Insertion order (False lets SQLite stream straight from
+                a covering index)
+
+        Yields:
+            Dict of column name -> array of up to chunk_size rows
+        """
+        columns = list(columns) if columns else list(self._column_types)
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # Plain tuples
+        cursor.execute(*self._results_query(design_id, columns, filters, ordered))
+        while True:
+            rows = cursor.fetchmany(chunk_size)
+            if not rows:
+                break
+            yield self._to_columns(columns, rows)
+
+    def get_results_columns(
+        self,
+        design_id: str,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[dict] = None,
+        ordered: bool = True,
+    ) -> Dict[str, np.ndarray]:
+        """
+        Retrieve a design's results as NumPy arrays, one per column.
+
+        Only the requested columns are read, without building per-row dicts.
+        REAL columns are float64 (NULL -> NaN), INTEGER/BOOLEAN columns int64
+        (float64 if any NULL), text columns object arrays. Rows are in
+        insertion order, matching get_results, unless ordered=False.
+
+        Projections within (design_id, is_sentinel, compound, cell_line) are
+        answered from the covering index alone when unordered.
+
+        Args:
+            design_id: Design ID to query
+            columns: Columns to fetch (default: all)
+            filters: Optional equality filters, as in get_results
+            ordered: Insertion order (False skips the sort/table lookups)
+
+        Returns:
+            Dict of column name -> array
+        """
+        columns = list(columns) if columns else list(self._column_types)
+        cursor = self.conn.cursor()
+        cursor.row_factory = None  # Plain tuples
+        cursor.execute(*self._results_query(design_id, columns, filters, ordered))
+        return self._to_columns(columns, cursor.fetchall())
+
+    def get_results_frame(
+        self,
+        design_id: str,
+        columns: Optional[Sequence[str]] = None,
+        filters: Optional[dict] = None,
+    ):
+        """
+        Retrieve a design's results as a pandas DataFrame.
+
+        Same projection, dtypes and row order as get_results_columns.
+        """
+        import pandas as pd
+
+        columns = list(columns) if columns else list(self._column_types)
+        return pd.DataFrame(self.get_results_columns(design_id, columns, filters), columns=columns)
 
     def get_sentinel_data(self, design_id: str) -> list[dict]:
         """Get all sentinel well data for SPC analysis."""
         return self.get_results(design_id, filters={"is_sentinel": True})
 
+    def get_morphology_array(self, design_id: str) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Get morphology data as an N x 5 float array (NULL -> NaN).
+
+        Returns:
+            (matrix, well_ids) with channels in MORPHOLOGY_COLUMNS order
+        """
+        arrays = self.get_results_columns(design_id, ("well_id",) + MORPHOLOGY_COLUMNS)
+        matrix = np.column_stack([arrays[column] for column in MORPHOLOGY_COLUMNS])
+        return matrix.reshape(-1, len(MORPHOLOGY_COLUMNS)), arrays["well_id"]
+
     def get_morphology_matrix(self, design_id: str) -> tuple[list[list[float]], list[str]]:
         """
         Get morphology data as a matrix for dimensionality reduction.
@@ -328,21 +525,13 @@ class CellThalamusDB:
         Returns:
             (matrix, well_ids) where matrix is N x 5 (5 channels)
         """
-        results = self.get_results(design_id)
-
-        matrix = []
-        well_ids = []
-
-        for row in results:
-            features = [
-                row["morph_er"],
-                row["morph_mito"],
-                row["morph_nucleus"],
-                row["morph_actin"],
-                row["morph_rna"],
-            ]
-            matrix.append(features)
-            well_ids.append(row["well_id"])
+        cursor = self.conn.cursor()
+        cursor.row_factory = None
+        cursor.execute(*self._results_query(design_id, ("well_id",) + MORPHOLOGY_COLUMNS, None))
+        rows = cursor.fetchall()
+
+        matrix = [list(row[1:]) for row in rows]
+        well_ids = [row[0] for row in rows]
 
         return matrix, well_ids
 
@@ -369,6 +558,21 @@ class CellThalamusDB:
         result = cursor.fetchone()
         return result["count"] if result else 0
 
+    def get_results_version(self, design_id: str) -> Tuple[int, int]:
+        """
+        Cheap change marker for a design's results: (row count, max result_id).
+
+        Changes whenever rows are inserted or deleted for the design, from any
+        process writing to this database.
+        """
+        cursor = self.conn.cursor()
+        cursor.execute(
+            "SELECT COUNT(*), COALESCE(MAX(result_id), 0) FROM thalamus_results WHERE design_id = ?",
+            (design_id,),
+        )
+        count, max_id = cursor.fetchone()
+        return int(count), int(max_id)
+
     def get_dose_response_data(
         self,
         design_id: str,
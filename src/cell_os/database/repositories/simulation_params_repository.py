@@ -5,10 +5,34 @@ Provides access to cell line and compound parameters for the BiologicalVirtualMa
 This replaces YAML-based parameter loading with database queries.
 """
 
+import hashlib
+import json
+import os
+import pickle
 import sqlite3
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Any
+
+# Bump when the snapshot payload layout changes (old snapshots are ignored)
+SNAPSHOT_VERSION = 1
+
+# Defaults that match the YAML defaults section (not stored in a table yet)
+DEFAULT_PARAMS = {
+    'doubling_time_h': 24.0,
+    'max_confluence': 0.9,
+    'max_passage': 30,
+    'senescence_rate': 0.01,
+    'seeding_efficiency': 0.85,
+    'passage_stress': 0.02,
+    'cell_count_cv': 0.10,
+    'viability_cv': 0.02,
+    'biological_cv': 0.05,
+    'lag_duration_h': 12.0,
+    'edge_penalty': 0.15,
+    'default_ic50': 40.0,
+    'default_hill_slope': 1.5
+}
 
 
 @dataclass
@@ -107,6 +131,160 @@ class SimulationParamsRepository:
             coating_required=bool(row['coating_required'])
         )
 
+    def get_all_cell_line_params(self) -> Dict[str, CellLineParams]:
+        """Get parameters for every cell line in one query, keyed by cell line ID"""
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """
+            SELECT
+                cell_line_id,
+                doubling_time_h,
+                max_confluence,
+                max_passage,
+                senescence_rate,
+                seeding_efficiency,
+                passage_stress,
+                lag_duration_h,
+                edge_penalty,
+                cell_count_cv,
+                viability_cv,
+                biological_cv,
+                coating_required
+            FROM cell_line_growth_parameters
+            ORDER BY cell_line_id, rowid
+            """
+        )
+        rows = cursor.fetchall()
+        conn.close()
+
+        params = {}
+        for row in rows:
+            if row['cell_line_id'] in params:
+                continue  # Same row get_cell_line_params() would return
+            params[row['cell_line_id']] = CellLineParams(
+                cell_line_id=row['cell_line_id'],
+                doubling_time_h=row['doubling_time_h'],
+                max_confluence=row['max_confluence'],
+                max_passage=row['max_passage'],
+                senescence_rate=row['senescence_rate'],
+                seeding_efficiency=row['seeding_efficiency'],
+                passage_stress=row['passage_stress'],
+                lag_duration_h=row['lag_duration_h'],
+                edge_penalty=row['edge_penalty'],
+                cell_count_cv=row['cell_count_cv'],
+                viability_cv=row['viability_cv'],
+                biological_cv=row['biological_cv'],
+                coating_required=bool(row['coating_required'])
+            )
+        return params
+
+    def get_all_compound_sensitivities(self) -> List[CompoundSensitivity]:
+        """
+        Get IC50/Hill rows for every (compound, cell line) pair in one query.
+
+        Restricted to compounds in the compounds table and cell lines with growth
+        parameters. One row per pair (the one get_compound_sensitivity() returns),
+        ordered by compound then cell line.
+        """
+        conn = self._get_connection()
+        cursor = conn.execute(
+            """
+            SELECT
+                ic.compound_id,
+                ic.cell_line_id,
+                ic.ic50_uM,
+                ic.hill_slope
+            FROM compound_ic50 ic
+            WHERE ic.compound_id IN (SELECT compound_id FROM compounds)
+              AND ic.cell_line_id IN (SELECT cell_line_id FROM cell_line_growth_parameters)
+            ORDER BY ic.compound_id, ic.cell_line_id, ic.rowid
+            """
+        )
+        rows = cursor.fetchall()
+        conn.close()
+
+        sensitivities = []
+        seen = set()
+        for row in rows:
+            key = (row['compound_id'], row['cell_line_id'])
+            if key in seen:
+                continue
+            seen.add(key)
+            sensitivities.append(CompoundSensitivity(
+                compound_id=row['compound_id'],
+                cell_line_id=row['cell_line_id'],
+                ic50_um=row['ic50_uM'],
+                hill_slope=row['hill_slope']
+            ))
+        return sensitivities
+
+    # ------------------------------------------------------------------
+    # Versioned parameter snapshot (zero-query worker startup)
+    # ------------------------------------------------------------------
+
+    @property
+    def snapshot_path(self) -> Path:
+        """Snapshot file beside the database (e.g. data/cell_lines.params.pkl)."""
+        return Path(self.db_path).with_suffix(".params.pkl")
+
+    def _db_fingerprint(self, layout: Any = None) -> Dict[str, Any]:
+        """
+        What a snapshot was built from: the database file (mtime/size), the
+        DEFAULT_PARAMS it merged in, and the caller's snapshot layout (e.g. the
+        fields it copies), so editing either constant invalidates old snapshots.
+        """
+        stat = os.stat(self.db_path)
+        constants = json.dumps({"defaults": DEFAULT_PARAMS, "layout": layout}, sort_keys=True, default=repr)
+        return {
+            "db_mtime_ns": stat.st_mtime_ns,
+            "db_size": stat.st_size,
+            "constants_sha256": hashlib.sha256(constants.encode("utf-8")).hexdigest(),
+        }
+
+    def load_snapshot(self, layout: Any = None) -> Optional[Dict[str, Any]]:
+        """
+        Load the parameter snapshot if it matches SNAPSHOT_VERSION, the current
+        database file (mtime/size), DEFAULT_PARAMS and layout (the value passed
+        to write_snapshot). Returns None when missing or stale.
+        """
+        path = self.snapshot_path
+        try:
+            with open(path, "rb") as f:
+                snapshot = pickle.load(f)
+            fingerprint = self._db_fingerprint(layout)
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get("version") != SNAPSHOT_VERSION:
+            return None
+        if any(snapshot.get(k) != v for k, v in fingerprint.items()):
+            return None
+        return snapshot["params"]
+
+    def write_snapshot(self, params: Dict[str, Any], layout: Any = None) -> Optional[Path]:
+        """
+        Write a snapshot of loaded parameters atomically.
+
+        layout: JSON-able description of how params were built from the
+        repository (fingerprinted; load_snapshot must pass the same value).
+
+        Best effort: returns None if the data directory is not writable.
+        """
+        path = self.snapshot_path
+        payload = {"version": SNAPSHOT_VERSION, **self._db_fingerprint(layout), "params": params}
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(tmp, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except OSError:
+            try:
+                tmp.unlink()
+            except OSError:
+                pass
+            return None
+        return path
+
     def get_all_compounds(self) -> List[str]:
         """Get list of all compound IDs"""
         conn = self._get_connection()
@@ -150,22 +328,11 @@ class SimulationParamsRepository:
         For now, returns hardcoded defaults that match the YAML defaults section.
         In the future, could store these in a defaults table.
         """
-        defaults = {
-            'doubling_time_h': 24.0,
-            'max_confluence': 0.9,
-            'max_passage': 30,
-            'senescence_rate': 0.01,
-            'seeding_efficiency': 0.85,
-            'passage_stress': 0.02,
-            'cell_count_cv': 0.10,
-            'viability_cv': 0.02,
-            'biological_cv': 0.05,
-            'lag_duration_h': 12.0,
-            'edge_penalty': 0.15,
-            'default_ic50': 40.0,
-            'default_hill_slope': 1.5
-        }
-        return defaults.get(param_name)
+        return DEFAULT_PARAMS.get(param_name)
+
+    def get_default_params(self) -> Dict[str, float]:
+        """Get all default parameter values."""
+        return dict(DEFAULT_PARAMS)
 
     def get_all_ic50s_for_compound(self, compound_id: str) -> List[CompoundSensitivity]:
         """Get all IC50 values for a compound across cell lines"""
@@ -0,0 +1,139 @@
+"""
+Multi-episode batch runner: many EpistemicLoop seeds in one process pool.
+
+Each seed runs in-process in a warm worker (imports and simulation
+parameters loaded once per worker, not once per seed). KPIs come straight
+from the finished loop (run_kpis.extract_run_kpis), with no subprocess and
+no globbing for the newest run JSON.
+
+Every seed logs to its own <log_dir>/seed_<seed>/ so concurrent runs never
+share a run_id, ledger or data_engine.db.
+
+Usage:
+    results = run_episodes(range(10), budget=384, max_cycles=20, workers=4)
+    write_results_table(results, "benchmark_results.csv")
+"""
+
+import csv
+import io
+import json
+import time
+from contextlib import nullcontext, redirect_stdout
+from functools import partial
+from multiprocessing import Pool
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Union
+
+from .beliefs.ledger import load_ledger
+from .loop import EpistemicLoop
+from .run_kpis import extract_run_kpis
+
+
+def run_episode(
+    seed: int,
+    budget: int = 384,
+    max_cycles: int = 20,
+    log_dir: Union[str, Path] = "results/epistemic_agent",
+    quiet: bool = True,
+) -> Dict[str, Any]:
+    """
+    Run one EpistemicLoop episode and return its KPIs.
+
+    Exceptions from the loop are reported in the row (success=False), so
+    one bad seed does not abort a batch.
+
+    Args:
+        seed: Episode seed
+        budget: Well budget
+        max_cycles: Maximum cycles
+        log_dir: Batch log directory (this seed writes to log_dir/seed_<seed>)
+        quiet: Suppress the loop's stdout narrative (the .log file is kept)
+
+    Returns:
+        Row dict: seed, success, error, elapsed_seconds, KPIs, run_json
+    """
+    loop = EpistemicLoop(
+        budget=budget,
+        max_cycles=max_cycles,
+        log_dir=Path(log_dir) / f"seed_{seed}",
+        seed=seed,
+    )
+
+    error = None
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(io.StringIO()) if quiet else nullcontext():
+            loop.run()
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+    elapsed = time.perf_counter() - start
+
+    kpis = extract_run_kpis(
+        loop.run_record(),
+        evidence_events=load_ledger(loop.evidence_file),
+        decisions=load_ledger(loop.decisions_file),
+    )
+    return {
+        "seed": seed,
+        "success": error is None,
+        "error": error,
+        "elapsed_seconds": elapsed,
+        **kpis,
+        "run_json": str(loop.json_file.relative_to(Path(log_dir))),
+    }
+
+
+def _warm_worker():
+    """Pool initializer: load simulation parameters once per worker."""
+    from ..hardware.biological_virtual import load_simulation_params
+    load_simulation_params()
+
+
+def run_episodes(
+    seeds: Iterable[int],
+    budget: int = 384,
+    max_cycles: int = 20,
+    log_dir: Union[str, Path] = "results/epistemic_agent",
+    workers: int = 1,
+) -> List[Dict[str, Any]]:
+    """
+    Run one episode per seed, across `workers` processes, in seed order.
+
+    Results are identical to running each seed alone: episodes share no
+    state and each seeds its own world and agent.
+
+    Returns:
+        One run_episode() row per seed
+    """
+    seeds = list(seeds)
+    run = partial(run_episode, budget=budget, max_cycles=max_cycles, log_dir=log_dir)
+
+    if workers <= 1 or len(seeds) <= 1:
+        return [run(seed) for seed in seeds]
+
+    with Pool(processes=min(workers, len(seeds)), initializer=_warm_worker) as pool:
+        return pool.map(run, seeds, chunksize=1)
+
+
+def write_results_table(results: List[Dict[str, Any]], path: Union[str, Path]) -> Path:
+    """
+    Write batch results as one CSV table (one row per seed).
+
+    Nested values (regime_distribution, integrity_warnings) are JSON-encoded.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    columns: List[str] = []
+    for row in results:
+        columns.extend(k for k in row if k not in columns)
+
+    with open(path, "w", newline="") as f:
+        writer = csv.DictWriter(f, fieldnames=columns)
+        writer.writeheader()
+        for row in results:
+            writer.writerow({
+                k: json.dumps(v) if isinstance(v, (dict, list)) else v
+                for k, v in row.items()
+            })
+    return path
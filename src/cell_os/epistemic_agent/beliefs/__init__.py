@@ -1,6 +1,6 @@
 """Belief state tracking with evidence ledgers for epistemic agency."""
 
 from .state import BeliefState
-from .ledger import EvidenceEvent, DecisionEvent, NoiseDiagnosticEvent
+from .ledger import EvidenceEvent, DecisionEvent, NoiseDiagnosticEvent, LedgerWriter
 
-__all__ = ['BeliefState', 'EvidenceEvent', 'DecisionEvent', 'NoiseDiagnosticEvent']
+__all__ = ['BeliefState', 'EvidenceEvent', 'DecisionEvent', 'NoiseDiagnosticEvent', 'LedgerWriter']
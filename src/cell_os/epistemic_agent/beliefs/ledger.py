@@ -9,12 +9,22 @@ Every belief change gets a receipt with:
 Agent C Phase 1: Schema versioning and event type envelope.
 - All events now have event_type and schema_version fields
 - Increment SCHEMA_VERSION when adding required fields or changing semantics
+
+append_*_jsonl open the file per call; LedgerWriter keeps one handle per
+ledger for a whole run and buffers records between cycle boundaries.
 """
 
+import atexit
+import gzip
+import io
 import json
 import math
+import signal
+import threading
+import weakref
 from dataclasses import dataclass, asdict
-from typing import List, Dict, Any, Optional
+from pathlib import Path
+from typing import IO, List, Dict, Any, Optional
 
 # Schema versioning for JSONL events
 # Version 1: Added event_type and schema_version envelope (Agent C Phase 1)
@@ -109,42 +119,45 @@ def format_event(ev: EvidenceEvent) -> str:
     return f"🧾 {ev.belief}: {ev.prev} → {ev.new} ({evidence_str}){note_str}"
 
 
+def _check_temporal_provenance(ev: EvidenceEvent, context: str) -> None:
+    """Agent 1.5: Refuse belief_update events without evidence_time_h."""
+    from ..exceptions import TemporalProvenanceError
+
+    # Gate events have belief like "gate_event:*" or "gate_loss:*"
+    # Belief updates have belief like "dose_curvature_seen", "noise_sigma_stable", etc.
+    is_gate_event = (
+        ev.belief.startswith("gate_event:") or
+        ev.belief.startswith("gate_loss:") or
+        ev.belief.startswith("gate_shadow:")
+    )
+
+    # For non-gate belief updates, evidence_time_h should not be None
+    # (Atemporal beliefs are allowed with evidence_time_h set, just claim_time_h=None)
+    if not is_gate_event and ev.evidence_time_h is None:
+        # Allow special cases: insolvency tracking, gate attainment
+        special_beliefs = {"epistemic_insolvent"}
+        if ev.belief not in special_beliefs:
+            raise TemporalProvenanceError(
+                message=(
+                    f"Ledger refused to write belief_update for '{ev.belief}' "
+                    f"with evidence_time_h=None; temporal provenance would be lost"
+                ),
+                missing_field="evidence_time_h",
+                context=context,
+                cycle=ev.cycle,
+                details={"belief": ev.belief, "prev": ev.prev, "new": ev.new}
+            )
+
+
 def append_events_jsonl(path, events: List[EvidenceEvent]):
     """Append events to JSONL file.
 
     Agent 1.5: Temporal Provenance Enforcement.
     Refuses to write belief_update events without evidence_time_h.
     """
-    from ..exceptions import TemporalProvenanceError
-
     with open(path, "a", encoding="utf-8") as f:
         for ev in events:
-            # Agent 1.5: Check for belief updates (not gate events) with null evidence_time_h
-            # Gate events have belief like "gate_event:*" or "gate_loss:*"
-            # Belief updates have belief like "dose_curvature_seen", "noise_sigma_stable", etc.
-            is_gate_event = (
-                ev.belief.startswith("gate_event:") or
-                ev.belief.startswith("gate_loss:") or
-                ev.belief.startswith("gate_shadow:")
-            )
-
-            # For non-gate belief updates, evidence_time_h should not be None
-            # (Atemporal beliefs are allowed with evidence_time_h set, just claim_time_h=None)
-            if not is_gate_event and ev.evidence_time_h is None:
-                # Allow special cases: insolvency tracking, gate attainment
-                special_beliefs = {"epistemic_insolvent"}
-                if ev.belief not in special_beliefs:
-                    raise TemporalProvenanceError(
-                        message=(
-                            f"Ledger refused to write belief_update for '{ev.belief}' "
-                            f"with evidence_time_h=None; temporal provenance would be lost"
-                        ),
-                        missing_field="evidence_time_h",
-                        context="ledger.append_events_jsonl()",
-                        cycle=ev.cycle,
-                        details={"belief": ev.belief, "prev": ev.prev, "new": ev.new}
-                    )
-
+            _check_temporal_provenance(ev, "ledger.append_events_jsonl()")
             f.write(ev.to_json_line() + "\n")
 
 
@@ -342,3 +355,206 @@ def append_contract_reports_jsonl(path, reports: List[ContractReport]):
     with open(path, "a", encoding="utf-8") as f:
         for report in reports:
             f.write(report.to_json_line() + "\n")
+
+
+# ---------------------------------------------------------------------------
+# Buffered run ledger
+# ---------------------------------------------------------------------------
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    zstandard = None
+    ZSTD_AVAILABLE = False
+
+# Compression name -> file suffix appended to the .jsonl path
+LEDGER_SUFFIXES = {None: "", "gzip": ".gz", "zstd": ".zst"}
+
+# Writers with unflushed records, flushed on interpreter exit or SIGTERM
+_LIVE_WRITERS: "weakref.WeakSet[LedgerWriter]" = weakref.WeakSet()
+_CRASH_HOOKS_INSTALLED = False
+
+
+def _flush_live_writers() -> None:
+    for writer in list(_LIVE_WRITERS):
+        try:
+            writer.flush()
+        except Exception:
+            pass  # Best effort: never mask the original failure
+
+
+def _install_crash_hooks() -> None:
+    """Flush live writers at exit and on SIGTERM (once per process)."""
+    global _CRASH_HOOKS_INSTALLED
+    if _CRASH_HOOKS_INSTALLED:
+        return
+    _CRASH_HOOKS_INSTALLED = True
+    atexit.register(_flush_live_writers)
+
+    # Signal handlers can only be installed from the main thread
+    if threading.current_thread() is not threading.main_thread():
+        return
+    previous = signal.getsignal(signal.SIGTERM)
+    if previous is signal.SIG_IGN:
+        return
+
+    def _on_sigterm(signum, frame):
+        _flush_live_writers()
+        if callable(previous):
+            previous(signum, frame)
+        else:
+            raise SystemExit(128 + signum)
+
+    try:
+        signal.signal(signal.SIGTERM, _on_sigterm)
+    except ValueError:
+        pass  # Embedded interpreters may refuse signal handlers
+
+
+def ledger_path(path, compression: Optional[str] = None) -> Path:
+    """On-disk path of a JSONL ledger written with the given compression."""
+    if compression not in LEDGER_SUFFIXES:
+        raise ValueError(
+            f"Unknown ledger compression {compression!r}; "
+            f"expected one of {sorted(k for k in LEDGER_SUFFIXES if k)} or None"
+        )
+    path = Path(path)
+    suffix = LEDGER_SUFFIXES[compression]
+    if suffix and path.suffix != suffix:
+        path = path.with_name(path.name + suffix)
+    return path
+
+
+def open_ledger(path) -> IO[str]:
+    """Open a (possibly compressed) JSONL ledger for reading as text.
+
+    Compression is inferred from the suffix (.gz, .zst). Compressed ledgers
+    are sequences of independent members/frames, one per flush.
+    """
+    path = Path(path)
+    if path.suffix == ".gz":
+        return gzip.open(path, "rt", encoding="utf-8")
+    if path.suffix == ".zst":
+        if not ZSTD_AVAILABLE:
+            raise ImportError(f"zstandard is required to read {path.name}")
+        reader = zstandard.ZstdDecompressor().stream_reader(
+            open(path, "rb"), read_across_frames=True, closefd=True
+        )
+        return io.TextIOWrapper(reader, encoding="utf-8")
+    return open(path, "r", encoding="utf-8")
+
+
+def load_ledger(path) -> Optional[List[Dict]]:
+    """Read a (possibly compressed) JSONL ledger into dicts (None if the file does not exist)."""
+    path = Path(path)
+    if not path.exists():
+        return None
+    with open_ledger(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+class LedgerWriter:
+    """Buffered append writer for the JSONL ledgers of one run.
+
+    Holds one open handle per ledger and buffers serialized records until
+    flush(), which the loop calls at cycle boundaries. Validation (temporal
+    provenance) runs when a record is appended, so a refused record never
+    reaches the buffer. Pending records are flushed on close(), at
+    interpreter exit, and on SIGTERM.
+
+    With compression="gzip" or "zstd" each flush is written as an
+    independent gzip member / zstd frame, so a ledger cut short by a crash
+    still decompresses up to its last flush.
+
+    Usage:
+        with LedgerWriter() as ledger:
+            ledger.append_events(evidence_path, events)
+            ledger.flush()  # cycle boundary
+    """
+
+    def __init__(self, compression: Optional[str] = None):
+        if compression == "zstd" and not ZSTD_AVAILABLE:
+            raise ImportError("zstandard is required for compression='zstd'")
+        ledger_path("ledger.jsonl", compression)  # Validate name
+        self.compression = compression
+        self._buffers: Dict[Path, List[str]] = {}
+        self._handles: Dict[Path, IO[bytes]] = {}
+        self._compressor = zstandard.ZstdCompressor() if compression == "zstd" else None
+        _install_crash_hooks()
+
+    def path_for(self, path) -> Path:
+        """On-disk path for a ledger (adds the compression suffix)."""
+        return ledger_path(path, self.compression)
+
+    def append(self, path, records) -> None:
+        """Buffer records: ledger events (to_json_line) or plain dicts."""
+        _LIVE_WRITERS.add(self)
+        lines = self._buffers.setdefault(self.path_for(path), [])
+        for record in records:
+            if isinstance(record, dict):
+                lines.append(json.dumps(record) + "\n")
+            else:
+                lines.append(record.to_json_line() + "\n")
+
+    def append_events(self, path, events: List[EvidenceEvent]) -> None:
+        """Buffer evidence events, refusing any without temporal provenance.
+
+        Events before a refused one stay buffered (same as append_events_jsonl).
+        """
+        _LIVE_WRITERS.add(self)
+        lines = self._buffers.setdefault(self.path_for(path), [])
+        for ev in events:
+            _check_temporal_provenance(ev, "ledger.LedgerWriter.append_events()")
+            lines.append(ev.to_json_line() + "\n")
+
+    def append_decisions(self, path, decisions) -> None:
+        self.append(path, decisions)
+
+    def append_refusals(self, path, refusals: List[RefusalEvent]) -> None:
+        self.append(path, refusals)
+
+    def append_noise_diagnostics(self, path, diagnostics) -> None:
+        self.append(path, diagnostics)
+
+    def append_contract_reports(self, path, reports: List[ContractReport]) -> None:
+        self.append(path, reports)
+
+    def _encode(self, text: str) -> bytes:
+        data = text.encode("utf-8")
+        if self.compression == "gzip":
+            return gzip.compress(data)
+        if self.compression == "zstd":
+            return self._compressor.compress(data)
+        return data
+
+    def flush(self) -> None:
+        """Write all buffered records and flush the OS-level handles."""
+        for path, lines in self._buffers.items():
+            if not lines:
+                continue
+            handle = self._handles.get(path)
+            if handle is None:
+                handle = self._handles[path] = open(path, "ab")
+            handle.write(self._encode("".join(lines)))
+            handle.flush()
+            lines.clear()
+
+    def close(self) -> None:
+        """Flush and close every handle.
+
+        Safe to call more than once; a later append reopens handles lazily.
+        """
+        try:
+            self.flush()
+        finally:
+            for handle in self._handles.values():
+                handle.close()
+            self._handles.clear()
+            _LIVE_WRITERS.discard(self)
+
+    def __enter__(self) -> "LedgerWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
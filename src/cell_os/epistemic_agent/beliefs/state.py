@@ -165,6 +165,24 @@ def _sigma_ci_from_pooled(sse_total: float, df_total: int, alpha: float = 0.05):
     return (math.sqrt(max(var_lo, 0.0)), math.sqrt(max(var_hi, 0.0)))
 
 
+# Fields covered by Covenant 7 (the keys of BeliefState.to_dict()).
+# Assignments to these are tracked per cycle by BeliefState.__setattr__.
+_SNAPSHOT_FIELDS = frozenset({
+    'noise_sigma_hat', 'noise_ci_low', 'noise_ci_high', 'noise_rel_width',
+    'noise_sigma_stable', 'noise_df_total',
+    'ldh_df_total', 'ldh_rel_width', 'ldh_sigma_stable',
+    'cell_paint_df_total', 'cell_paint_rel_width', 'cell_paint_sigma_stable',
+    'scrna_df_total', 'scrna_rel_width', 'scrna_sigma_stable', 'scrna_metric_source',
+    'calibration_provenance',
+    'baseline_cv_scalar', 'baseline_cv_by_channel', 'calibration_reps',
+    'edge_effect_strength_by_channel', 'edge_effect_confident', 'edge_tests_run',
+    'dose_curvature_seen', 'time_dependence_seen',
+    'tested_compounds', 'tested_cell_lines', 'total_observations',
+})
+
+_GATE_EVENT_PREFIXES = ("gate_event:", "gate_shadow:", "gate_loss:")
+
+
 @dataclass
 class BeliefState:
     """Tracks what the agent knows (with evidence receipts).
@@ -266,6 +284,13 @@ class BeliefState:
     _cycle: int = 0
     _events: List[EvidenceEvent] = field(default_factory=list)
 
+    # Covenant 7 incremental tracking (reset by begin_cycle)
+    # _dirty: snapshot field -> value before its first assignment this cycle
+    # _fields_by_cycle: cycle -> fields claimed by that cycle's events
+    _dirty: Dict[str, Any] = field(default_factory=dict, init=False, repr=False)
+    _fields_by_cycle: Dict[int, Set[str]] = field(default_factory=dict, init=False, repr=False)
+    _gate_event_cycles: Set[int] = field(default_factory=set, init=False, repr=False)
+
     # Agent 1: Temporal provenance tracking
     _current_evidence_time_h: Optional[float] = None  # Set during update() from observation
 
@@ -290,8 +315,15 @@ class BeliefState:
         self._response_updater = ResponseBeliefUpdater(self)
         self._assay_gate_updater = AssayGateUpdater(self)
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in _SNAPSHOT_FIELDS:
+            dirty = self.__dict__.get("_dirty")
+            if dirty is not None and name not in dirty:
+                dirty[name] = self.__dict__.get(name)
+        object.__setattr__(self, name, value)
+
     def begin_cycle(self, cycle: int):
-        """Start a new cycle (clear event buffer).
+        """Start a new cycle (clear event buffer and mutation tracking).
 
         GUARDRAIL: Enforces strict integer cycle type (temporal provenance).
         This is a TypeError (not assert) because temporal ordering is mission-critical
@@ -308,11 +340,25 @@ class BeliefState:
 
         self._cycle = cycle
         self._events = []
+        self._dirty.clear()
+        self._fields_by_cycle.clear()
+        self._gate_event_cycles.clear()
     
     def end_cycle(self) -> List[EvidenceEvent]:
         """Return events from this cycle."""
         return self._events
 
+    def _record_event(self, event: EvidenceEvent) -> None:
+        """Append an evidence event and index the fields it claims (Covenant 7)."""
+        self._events.append(event)
+        fields = (event.evidence or {}).get("fields_changed") or []
+        # tolerate events that lack fields_changed by falling back to ev.belief
+        if not fields and event.belief:
+            fields = [event.belief]
+        self._fields_by_cycle.setdefault(event.cycle, set()).update(fields)
+        if event.belief and event.belief.startswith(_GATE_EVENT_PREFIXES):
+            self._gate_event_cycles.add(event.cycle)
+
     def record_refusal(
         self,
         refusal_reason: str,
@@ -337,7 +383,7 @@ class BeliefState:
         self.last_refusal_reason = refusal_reason
 
         # Emit evidence event (refusal is evidence about agent state)
-        self._events.append(EvidenceEvent(
+        self._record_event(EvidenceEvent(
             cycle=self._cycle,
             belief="epistemic_insolvent",
             prev=False,
@@ -375,7 +421,7 @@ class BeliefState:
                 self.consecutive_refusals = 0
                 self.last_refusal_reason = None
 
-                self._events.append(EvidenceEvent(
+                self._record_event(EvidenceEvent(
                     cycle=self._cycle,
                     belief="epistemic_insolvent",
                     prev=True,
@@ -503,7 +549,7 @@ class BeliefState:
         prev_serializable = sorted(list(prev_value)) if isinstance(prev_value, set) else prev_value
         new_serializable = sorted(list(new_value)) if isinstance(new_value, set) else new_value
 
-        self._events.append(EvidenceEvent(
+        self._record_event(EvidenceEvent(
             cycle=self._cycle,
             belief=field_name,
             prev=prev_serializable,
@@ -658,7 +704,7 @@ class BeliefState:
             supporting_conditions=list(supporting_conditions or []),
             note=note,
         )
-        self._events.append(event)
+        self._record_event(event)
 
     def _emit_gate_loss(
         self,
@@ -691,7 +737,7 @@ class BeliefState:
             supporting_conditions=list(supporting_conditions or []),
             note=note,
         )
-        self._events.append(event)
+        self._record_event(event)
 
     def _emit_gate_shadow(
         self,
@@ -723,7 +769,7 @@ class BeliefState:
             supporting_conditions=list(supporting_conditions or []),
             note=note,
         )
-        self._events.append(event)
+        self._record_event(event)
 
     def to_dict(self) -> dict:
         """Serialize beliefs to dict (for JSON persistence)."""
@@ -762,9 +808,46 @@ class BeliefState:
         }
 
     def snapshot(self) -> dict:
-        """Capture current belief state for mutation tracking (Covenant 7)."""
+        """Capture current belief state for mutation tracking (Covenant 7).
+
+        Full to_dict() copy for the debug path (assert_no_undocumented_mutation).
+        Per-cycle checks use dirty-field tracking instead (assert_cycle_mutations_documented).
+        """
         return self.to_dict()
 
+    def changed_fields(self) -> Set[str]:
+        """Snapshot fields whose value differs from the start of the cycle.
+
+        Only fields assigned since begin_cycle() are compared. In-place
+        mutation of a container field is not seen here; the full-snapshot
+        debug path catches it.
+        """
+        return {name for name, before in self._dirty.items() if getattr(self, name) != before}
+
+    def value_at_cycle_start(self, field_name: str) -> Any:
+        """Value a snapshot field had when begin_cycle() was called."""
+        if field_name not in _SNAPSHOT_FIELDS:
+            raise KeyError(f"Not a tracked belief field: {field_name}")
+        return self._dirty.get(field_name, getattr(self, field_name))
+
+    def assert_cycle_mutations_documented(self, *, cycle: int) -> None:
+        """Enforce Covenant 7 using dirty-field tracking (O(changes)).
+
+        Equivalent to assert_no_undocumented_mutation(snapshot at begin_cycle,
+        snapshot now) for fields replaced by assignment, without building or
+        diffing full snapshots or rescanning the event list.
+
+        Raises:
+            BeliefLedgerInvariantError: If beliefs changed without evidence events
+        """
+        self._check_mutations_documented(
+            self.changed_fields(),
+            accounted=self._fields_by_cycle.get(cycle, set()),
+            has_events=cycle in self._fields_by_cycle,
+            has_gate_event=cycle in self._gate_event_cycles,
+            cycle=cycle,
+        )
+
     def assert_no_undocumented_mutation(
         self,
         before: dict,
@@ -777,6 +860,9 @@ class BeliefState:
         All belief changes must be accompanied by evidence events. This invariant
         check prevents direct mutation (beliefs.field = value) that bypasses _set().
 
+        Full-snapshot debug path: diffs every key and scans the event list, so
+        it also catches in-place mutation of container fields.
+
         Args:
             before: Snapshot before cycle
             after: Snapshot after cycle
@@ -792,15 +878,6 @@ class BeliefState:
 
         # Get evidence events from this cycle
         cycle_events = [e for e in self._events if e.cycle == cycle]
-        beliefs_logged = {e.belief for e in cycle_events}
-
-        # If beliefs changed but no events emitted, this is a violation
-        if not cycle_events:
-            raise BeliefLedgerInvariantError(
-                f"Beliefs mutated without any evidence events (cycle={cycle}). "
-                f"Changed keys: {sorted(changed)[:15]}. "
-                f"This violates Covenant 7: all belief updates must call _set() to emit evidence."
-            )
 
         # Covenant 7: field-level mapping
         # Each changed field must be explicitly accounted for by at least one EvidenceEvent
@@ -814,6 +891,36 @@ class BeliefState:
                 fc = [ev.belief]
             accounted |= set(fc)
 
+        self._check_mutations_documented(
+            changed,
+            accounted=accounted,
+            has_events=bool(cycle_events),
+            has_gate_event=any(
+                e.belief and e.belief.startswith(_GATE_EVENT_PREFIXES) for e in cycle_events
+            ),
+            cycle=cycle,
+        )
+
+    @staticmethod
+    def _check_mutations_documented(
+        changed: Set[str],
+        *,
+        accounted: Set[str],
+        has_events: bool,
+        has_gate_event: bool,
+        cycle: int,
+    ) -> None:
+        if not changed:
+            return  # No changes, all good
+
+        # If beliefs changed but no events emitted, this is a violation
+        if not has_events:
+            raise BeliefLedgerInvariantError(
+                f"Beliefs mutated without any evidence events (cycle={cycle}). "
+                f"Changed keys: {sorted(changed)[:15]}. "
+                f"This violates Covenant 7: all belief updates must call _set() to emit evidence."
+            )
+
         missing_fields = changed - accounted
         if missing_fields:
             raise BeliefLedgerInvariantError(
@@ -826,17 +933,12 @@ class BeliefState:
 
         # Special check: gate changes require gate_* events
         gate_fields = [k for k in changed if k.endswith("_sigma_stable")]
-        if gate_fields:
-            gate_events = [
-                b for b in beliefs_logged
-                if b and (b.startswith("gate_event:") or b.startswith("gate_shadow:") or b.startswith("gate_loss:"))
-            ]
-            if not gate_events:
-                raise BeliefLedgerInvariantError(
-                    f"Gate field(s) changed without gate_* event (cycle={cycle}). "
-                    f"Changed gates: {sorted(gate_fields)}. "
-                    f"This violates Covenant 7: gate changes must emit gate_event/gate_loss/gate_shadow."
-                )
+        if gate_fields and not has_gate_event:
+            raise BeliefLedgerInvariantError(
+                f"Gate field(s) changed without gate_* event (cycle={cycle}). "
+                f"Changed gates: {sorted(gate_fields)}. "
+                f"This violates Covenant 7: gate changes must emit gate_event/gate_loss/gate_shadow."
+            )
 
     def _extract_evidence_time_h_from_conditions(self, conditions: List) -> float:
         """Extract evidence_time_h from conditions with strict validation.
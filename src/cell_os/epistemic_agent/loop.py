@@ -10,6 +10,9 @@ This runs cycles of:
 The logging is crucial - this is how we watch the agent learn.
 
 v0.4.2: Evidence ledgers (evidence.jsonl, decisions.jsonl, diagnostics.jsonl)
+
+All JSONL ledgers of a run go through one buffered LedgerWriter, flushed at
+cycle boundaries (optionally gzip/zstd compressed).
 """
 
 import json
@@ -21,7 +24,7 @@ from typing import Optional
 from .world import ExperimentalWorld
 from .agent.policy_rules import RuleBasedPolicy
 from .schemas import Observation, Proposal, WellSpec
-from .beliefs.ledger import append_events_jsonl, append_decisions_jsonl, append_noise_diagnostics_jsonl, DecisionEvent
+from .beliefs.ledger import LedgerWriter, open_ledger, DecisionEvent
 from .exceptions import InvalidDesignError
 from .controller_integration import EpistemicIntegration
 from .design_quality import DesignQualityChecker
@@ -51,12 +54,15 @@ class EpistemicLoop:
         seed: int = 0,
         strict_quality: bool = True,
         strict_provenance: bool = True,
-        gain_aggressiveness: float = 1.0  # >1.0 = overclaim (triggers debt enforcement)
+        gain_aggressiveness: float = 1.0,  # >1.0 = overclaim (triggers debt enforcement)
+        ledger_compression: Optional[str] = None,  # None, "gzip" or "zstd"
+        full_belief_snapshots: bool = False  # Debug: Covenant 7 via full to_dict() diffs
     ):
         self.budget = budget
         self.max_cycles = max_cycles
         self.seed = seed
         self.strict_provenance = strict_provenance
+        self.full_belief_snapshots = full_belief_snapshots
 
         # Setup logging
         if log_dir is None:
@@ -70,13 +76,16 @@ class EpistemicLoop:
         self.log_file = self.log_dir / f"{self.run_id}.log"
         self.json_file = self.log_dir / f"{self.run_id}.json"
 
-        # v0.4.2: Evidence ledgers
-        self.evidence_file = self.log_dir / f"{self.run_id}_evidence.jsonl"
-        self.decisions_file = self.log_dir / f"{self.run_id}_decisions.jsonl"
-        self.diagnostics_file = self.log_dir / f"{self.run_id}_diagnostics.jsonl"
-        self.refusals_file = self.log_dir / f"{self.run_id}_refusals.jsonl"
-        self.mitigation_file = self.log_dir / f"{self.run_id}_mitigation.jsonl"
-        self.epistemic_file = self.log_dir / f"{self.run_id}_epistemic.jsonl"
+        # v0.4.2: Evidence ledgers (buffered, one writer per run)
+        self.ledger = LedgerWriter(compression=ledger_compression)
+        ledger_file = lambda name: self.ledger.path_for(self.log_dir / f"{self.run_id}_{name}.jsonl")
+        self.evidence_file = ledger_file("evidence")
+        self.decisions_file = ledger_file("decisions")
+        self.diagnostics_file = ledger_file("diagnostics")
+        self.refusals_file = ledger_file("refusals")
+        self.mitigation_file = ledger_file("mitigation")
+        self.epistemic_file = ledger_file("epistemic")
+        self.calibration_file = ledger_file("calibration")
 
         # Initialize world and agent
         self.world = ExperimentalWorld(budget_wells=budget, seed=seed)
@@ -126,6 +135,13 @@ class EpistemicLoop:
 
     def run(self):
         """Run the full experiment loop."""
+        try:
+            self._run_cycles()
+        finally:
+            # Pending ledger records survive aborts and exceptions
+            self.ledger.close()
+
+    def _run_cycles(self):
         self._log_header()
 
         # Initialize episode summary (system-level closure)
@@ -150,7 +166,7 @@ class EpistemicLoop:
                 "message": "Epistemic debt enforcement is disabled. This run does not enforce honesty constraints.",
                 "severity": "CRITICAL",
             }
-            append_noise_diagnostics_jsonl(self.diagnostics_file, [contamination_event])
+            self.ledger.append_noise_diagnostics(self.diagnostics_file, [contamination_event])
             self._log("\n" + "="*60)
             self._log("⚠️  CONTAMINATED RUN WARNING")
             self._log("="*60)
@@ -163,6 +179,9 @@ class EpistemicLoop:
         self._log_capabilities(capabilities)
 
         for cycle in range(1, self.max_cycles + 1):
+            # Cycle boundary: records from the previous cycle reach disk
+            self.ledger.flush()
+
             if self.world.budget_remaining <= 0:
                 self._log("\n" + "="*60)
                 self._log("BUDGET EXHAUSTED")
@@ -183,7 +202,8 @@ class EpistemicLoop:
             # Primary enforcement is in BeliefState.begin_cycle() which raises TypeError.
             assert isinstance(cycle, int), f"Cycle must be int, got {type(cycle)}: {cycle}"
 
-            beliefs_before = self.agent.beliefs.snapshot()
+            # Default: begin_cycle() starts dirty-field tracking, no full snapshot
+            beliefs_before = self.agent.beliefs.snapshot() if self.full_belief_snapshots else None
             self.agent.beliefs.begin_cycle(cycle)
 
             # EPISTEMIC ACTION: Snapshot uncertainty at START of cycle (before belief update)
@@ -233,7 +253,7 @@ class EpistemicLoop:
 
                 # v0.5.0: Write canonical Decision (no side-channel, no hasattr checks)
                 if self.agent.last_decision is not None:
-                    append_decisions_jsonl(self.decisions_file, [self.agent.last_decision])
+                    self.ledger.append_decisions(self.decisions_file, [self.agent.last_decision])
 
             except RuntimeError as e:
                 # Handle abort from policy (e.g., insufficient budget)
@@ -243,7 +263,7 @@ class EpistemicLoop:
 
                     # v0.5.0: Write canonical Decision (no side-channel, no hasattr checks)
                     if self.agent.last_decision is not None:
-                        append_decisions_jsonl(self.decisions_file, [self.agent.last_decision])
+                        self.ledger.append_decisions(self.decisions_file, [self.agent.last_decision])
                     else:
                             # Fallback: create minimal abort Decision if chooser didn't set one
                             from cell_os.core import Decision, DecisionRationale
@@ -260,7 +280,7 @@ class EpistemicLoop:
                                 ),
                                 inputs_fingerprint=f"abort_{cycle}",
                             )
-                            append_decisions_jsonl(self.decisions_file, [abort_decision])
+                            self.ledger.append_decisions(self.decisions_file, [abort_decision])
 
                     # Save JSON metadata before exiting
                     self._save_json()
@@ -299,9 +319,8 @@ class EpistemicLoop:
                 "epistemic_insolvent": self.agent.beliefs.epistemic_insolvent,
                 "consecutive_refusals": self.agent.beliefs.consecutive_refusals,
             }
-            # Write directly to diagnostics file (plain dict, not EvidenceEvent)
-            with open(self.diagnostics_file, 'a', encoding='utf-8') as f:
-                f.write(json.dumps(debt_diagnostic) + '\n')
+            # Diagnostics ledger (plain dict, not EvidenceEvent)
+            self.ledger.append(self.diagnostics_file, [debt_diagnostic])
 
             if should_refuse:
                 self._log("\n" + "="*60)
@@ -328,7 +347,7 @@ class EpistemicLoop:
                     self._log(f"  → Cost inflation from debt exceeds budget")
 
                 # Write refusal to permanent log
-                from .beliefs.ledger import RefusalEvent, append_refusals_jsonl
+                from .beliefs.ledger import RefusalEvent
                 refusal_event = RefusalEvent(
                     cycle=cycle,
                     timestamp=datetime.now().isoformat(),
@@ -339,7 +358,7 @@ class EpistemicLoop:
                     design_id=proposal.design_id,
                     **refusal_context
                 )
-                append_refusals_jsonl(self.refusals_file, [refusal_event])
+                self.ledger.append_refusals(self.refusals_file, [refusal_event])
 
                 # Update agent beliefs with refusal (agent learns "I am insolvent")
                 self.agent.beliefs.record_refusal(
@@ -523,10 +542,13 @@ class EpistemicLoop:
 
                 # Covenant 7: Assert no undocumented mutations (if strict_provenance enabled)
                 if self.strict_provenance:
-                    beliefs_after = self.agent.beliefs.snapshot()
-                    self.agent.beliefs.assert_no_undocumented_mutation(
-                        beliefs_before, beliefs_after, cycle=cycle
-                    )
+                    if self.full_belief_snapshots:
+                        beliefs_after = self.agent.beliefs.snapshot()
+                        self.agent.beliefs.assert_no_undocumented_mutation(
+                            beliefs_before, beliefs_after, cycle=cycle
+                        )
+                    else:
+                        self.agent.beliefs.assert_cycle_mutations_documented(cycle=cycle)
 
                 # v0.5.1: Epistemic resolution (Task 3 - real epistemic claims)
                 # Measure actual gain AFTER observation
@@ -558,7 +580,7 @@ class EpistemicLoop:
                 if is_calibration and resolution['total_debt'] > 0:
                     # Measure noise improvement (if any)
                     noise_rel_width_after = self.agent.beliefs.noise_rel_width
-                    noise_rel_width_before = beliefs_before.get("noise_rel_width")
+                    noise_rel_width_before = self.agent.beliefs.value_at_cycle_start("noise_rel_width")
 
                     noise_improvement = None
                     if noise_rel_width_before is not None and noise_rel_width_after is not None:
@@ -584,10 +606,11 @@ class EpistemicLoop:
                 self.agent.beliefs.record_action_executed(was_calibration=is_calibration)
 
                 # Write to ledgers
-                if events:
-                    append_events_jsonl(self.evidence_file, events)
-                if diagnostics:
-                    append_noise_diagnostics_jsonl(self.diagnostics_file, diagnostics)
+                with self.loop_timer.phase('logging'):
+                    if events:
+                        self.ledger.append_events(self.evidence_file, events)
+                    if diagnostics:
+                        self.ledger.append_noise_diagnostics(self.diagnostics_file, diagnostics)
 
                 # Save to history
                 self.history.append({
@@ -757,7 +780,8 @@ class EpistemicLoop:
                 self.abort_reason = f"Exception: {e}"
                 break
 
-        # Finalize episode summary (system-level closure)
+        # Finalize episode summary (system-level closure); it reads the ledgers back
+        self.ledger.flush()
         self._finalize_episode_summary(initial_calibration_entropy, initial_noise_rel_width)
 
         # Set bits learned for timing stats (Feala: bits/hour metric)
@@ -1022,14 +1046,21 @@ class EpistemicLoop:
         }
 
         # Write to refusals log
-        with open(self.refusals_file, 'a') as f:
-            f.write(json.dumps(refusal) + '\n')
+        self.ledger.append(self.refusals_file, [refusal])
 
     def _save_json(self):
         """Save history to JSON for analysis.
 
         v0.4.2: Add beliefs snapshot, paths dict, and integrity checks.
+        Called at cycle end, so it also flushes the buffered ledgers.
         """
+        self.ledger.flush()
+
+        with open(self.json_file, 'w') as f:
+            json.dump(self.run_record(), f, indent=2)
+
+    def run_record(self) -> dict:
+        """Run metadata, history and final beliefs (the content of <run_id>.json)."""
         # Integrity checks: verify evidence files exist if they should
         integrity_warnings = []
         if len(self.history) > 0:
@@ -1063,8 +1094,7 @@ class EpistemicLoop:
         if integrity_warnings:
             output['integrity_warnings'] = integrity_warnings
 
-        with open(self.json_file, 'w') as f:
-            json.dump(output, f, indent=2)
+        return output
 
     def _execute_mitigation_cycle(self, cycle: int, context, capabilities: dict):
         """Execute mitigation using THIS integer cycle number.
@@ -1145,9 +1175,9 @@ class EpistemicLoop:
         
         # Write ledgers
         if events:
-            append_events_jsonl(self.evidence_file, events)
+            self.ledger.append_events(self.evidence_file, events)
         if diagnostics:
-            append_noise_diagnostics_jsonl(self.diagnostics_file, diagnostics)
+            self.ledger.append_noise_diagnostics(self.diagnostics_file, diagnostics)
         
         # Log mitigation event
         self._write_mitigation_event({
@@ -1197,9 +1227,7 @@ class EpistemicLoop:
 
     def _write_mitigation_event(self, event: dict):
         """Write mitigation event to JSONL."""
-        import json
-        with open(self.mitigation_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(event) + '\n')
+        self.ledger.append(self.mitigation_file, [event])
 
     def _execute_epistemic_cycle(self, cycle: int, context, capabilities: dict):
         """Execute epistemic action using THIS integer cycle number.
@@ -1292,9 +1320,9 @@ class EpistemicLoop:
 
         # Write ledgers
         if events:
-            append_events_jsonl(self.evidence_file, events)
+            self.ledger.append_events(self.evidence_file, events)
         if diagnostics:
-            append_noise_diagnostics_jsonl(self.diagnostics_file, diagnostics)
+            self.ledger.append_noise_diagnostics(self.diagnostics_file, diagnostics)
 
         # Detect if cap forced this action
         cap_forced = (
@@ -1353,9 +1381,7 @@ class EpistemicLoop:
 
     def _write_epistemic_event(self, event: dict):
         """Write epistemic action event to JSONL."""
-        import json
-        with open(self.epistemic_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(event) + '\n')
+        self.ledger.append(self.epistemic_file, [event])
 
     def _finalize_episode_summary(
         self,
@@ -1438,7 +1464,7 @@ class EpistemicLoop:
         # Read evidence file to extract gate events
         if self.evidence_file.exists():
             try:
-                with open(self.evidence_file, 'r') as f:
+                with open_ledger(self.evidence_file) as f:
                     for line in f:
                         if not line.strip():
                             continue
@@ -1479,7 +1505,7 @@ class EpistemicLoop:
         mitigation_events = []
         if self.mitigation_file.exists():
             try:
-                with open(self.mitigation_file, 'r') as f:
+                with open_ledger(self.mitigation_file) as f:
                     for line in f:
                         if not line.strip():
                             continue
@@ -1504,7 +1530,7 @@ class EpistemicLoop:
         # Epistemic action events (read from epistemic file)
         if self.epistemic_file.exists():
             try:
-                with open(self.epistemic_file, 'r') as f:
+                with open_ledger(self.epistemic_file) as f:
                     for line in f:
                         if not line.strip():
                             continue
@@ -1546,7 +1572,7 @@ class EpistemicLoop:
         # Count refusals from refusals file
         if self.refusals_file.exists():
             try:
-                with open(self.refusals_file, 'r') as f:
+                with open_ledger(self.refusals_file) as f:
                     summary.sacrifices.epistemic_refusals = sum(1 for line in f if line.strip())
             except Exception:
                 summary.sacrifices.epistemic_refusals = 0
@@ -1708,9 +1734,9 @@ class EpistemicLoop:
 
         # Write ledgers
         if events:
-            append_events_jsonl(self.evidence_file, events)
+            self.ledger.append_events(self.evidence_file, events)
         if diagnostics:
-            append_noise_diagnostics_jsonl(self.diagnostics_file, diagnostics)
+            self.ledger.append_noise_diagnostics(self.diagnostics_file, diagnostics)
 
         # Log calibration event (for EpisodeSummary aggregation)
         calibration_event = {
@@ -1727,10 +1753,8 @@ class EpistemicLoop:
             "budget_plates_remaining": self.world.budget_remaining / 96.0,
         }
 
-        # Write to calibration log (new file)
-        calibration_file = self.log_dir / f"{self.run_id}_calibration.jsonl"
-        with open(calibration_file, 'a', encoding='utf-8') as f:
-            f.write(json.dumps(calibration_event) + '\n')
+        # Write to calibration log
+        self.ledger.append(self.calibration_file, [calibration_event])
 
         # Add to history
         self.history.append({
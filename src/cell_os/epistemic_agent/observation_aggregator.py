@@ -778,7 +778,8 @@ def _generate_qc_flags(
             flagged, diag = check_spatial_autocorrelation(
                 list(raw_results),
                 channel_key="morphology.nucleus",
-                significance_threshold=1.96  # p < 0.05
+                significance_threshold=1.96,  # p < 0.05
+                n_permutations=999
             )
 
             # Populate structured QC data
@@ -788,7 +789,7 @@ def _generate_qc_flags(
             qc_struct["spatial_autocorrelation"]["morphology.nucleus"] = {
                 "morans_i": float(diag['morans_i']),
                 "z_score": float(diag['z_score']),
-                "p_value": 0.05 if abs(diag['z_score']) > 1.96 else 1.0,  # Rough approximation
+                "p_value": float(diag['p_value']),  # Permutation test (999 relabelings)
                 "flagged": bool(flagged),
                 "n_wells": int(diag['n_wells'])
             }
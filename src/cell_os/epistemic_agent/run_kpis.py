@@ -0,0 +1,140 @@
+"""
+KPI extraction for epistemic agent runs (regression benchmark).
+
+Works on in-memory run data: the run record (EpistemicLoop.run_record(),
+i.e. the content of <run_id>.json) plus evidence and decision ledger
+records as dicts. scripts/testing/benchmark_utils.py wraps these for runs
+already on disk.
+
+v0.4.2: Reads decisions for regime transitions and forced-calibration rate.
+"""
+
+from typing import Any, Dict, Iterable, Optional
+
+
+def extract_gate_kpis(
+    run_data: Dict,
+    beliefs: Dict,
+    evidence_events: Optional[Iterable[Dict]] = None,
+) -> Dict[str, Any]:
+    """Extract gate-related KPIs from run data.
+
+    KPIs:
+    - gate_earned: Did agent earn noise gate?
+    - rel_width_final: Final relative CI width
+    - df_final: Final degrees of freedom
+    - gate_slack: How much tighter than threshold (0.25)?
+    - cycles_to_gate: How many cycles to earn gate?
+    - abort_reason: Why did run end?
+    - integrity_warnings: Missing evidence files?
+    """
+    gate_earned = beliefs.get("noise_sigma_stable", False)
+    rel_width_final = beliefs.get("noise_rel_width")
+    df_final = beliefs.get("noise_df_total", 0)
+
+    # Gate slack: how much better than threshold?
+    gate_slack = None
+    if rel_width_final is not None and gate_earned:
+        gate_slack = 0.25 - rel_width_final  # positive = better than threshold
+
+    # Cycles to gate: first gate_event in the evidence ledger
+    cycles_to_gate = None
+    for event in evidence_events or ():
+        if event.get("belief", "").startswith("gate_event:noise_sigma"):
+            cycles_to_gate = event.get("cycle")
+            break
+
+    return {
+        "gate_earned": gate_earned,
+        "rel_width_final": rel_width_final,
+        "df_final": df_final,
+        "gate_slack": gate_slack,
+        "cycles_to_gate": cycles_to_gate,
+        "cycles_completed": run_data.get("cycles_completed", 0),
+        "abort_reason": run_data.get("abort_reason"),
+        "integrity_warnings": run_data.get("integrity_warnings", []),
+    }
+
+
+def extract_decision_kpis(decisions: Optional[Iterable[Dict]]) -> Dict[str, Any]:
+    """Extract decision provenance KPIs from decision ledger records.
+
+    KPIs:
+    - forced_calibration_rate: Fraction of cycles where calibration was forced
+    - first_in_gate_cycle: First cycle where regime == "in_gate"
+    - gate_revocation_count: How many times gate was lost
+    - regime_distribution: Count of cycles per regime
+    - abort_cycle: Cycle where abort occurred (if any)
+    - abort_template: Which abort template triggered
+
+    Args:
+        decisions: Decision records, or None if the ledger is missing
+    """
+    if decisions is None:
+        return {
+            "forced_calibration_rate": None,
+            "first_in_gate_cycle": None,
+            "gate_revocation_count": 0,
+            "regime_distribution": {},
+            "abort_cycle": None,
+            "abort_template": None,
+            "decisions_missing": True,
+        }
+
+    decisions = list(decisions)
+
+    # Count forced calibration
+    forced_count = sum(1 for d in decisions if d.get("selected_candidate", {}).get("forced", False))
+    forced_rate = forced_count / len(decisions) if decisions else 0.0
+
+    # Find first in-gate cycle
+    first_in_gate = None
+    for d in decisions:
+        regime = d.get("selected_candidate", {}).get("regime")
+        if regime == "in_gate":
+            first_in_gate = d.get("cycle")
+            break
+
+    # Count gate revocations
+    revocation_count = sum(
+        1 for d in decisions
+        if d.get("selected_candidate", {}).get("regime") == "gate_revoked"
+    )
+
+    # Regime distribution
+    regime_counts: Dict[str, int] = {}
+    for d in decisions:
+        regime = d.get("selected_candidate", {}).get("regime", "unknown")
+        regime_counts[regime] = regime_counts.get(regime, 0) + 1
+
+    # Abort info
+    abort_cycle = None
+    abort_template = None
+    for d in decisions:
+        if d.get("selected", "").startswith("abort"):
+            abort_cycle = d.get("cycle")
+            abort_template = d.get("selected")
+            break
+
+    return {
+        "forced_calibration_rate": forced_rate,
+        "first_in_gate_cycle": first_in_gate,
+        "gate_revocation_count": revocation_count,
+        "regime_distribution": regime_counts,
+        "abort_cycle": abort_cycle,
+        "abort_template": abort_template,
+        "decisions_missing": False,
+    }
+
+
+def extract_run_kpis(
+    run_data: Dict,
+    evidence_events: Optional[Iterable[Dict]] = None,
+    decisions: Optional[Iterable[Dict]] = None,
+) -> Dict[str, Any]:
+    """Extract all KPIs (gate + decision) from in-memory run data."""
+    beliefs = run_data.get("beliefs_final", {})
+    return {
+        **extract_gate_kpis(run_data, beliefs, evidence_events),
+        **extract_decision_kpis(decisions),
+    }
@@ -14,7 +14,9 @@ import hashlib
 import numpy as np
 from typing import List, Dict, Any, Optional, Tuple
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
+from multiprocessing import Pool, cpu_count
 
 # Import standalone simulator components
 from cell_os.biology import standalone_cell_thalamus as sim
@@ -34,6 +36,38 @@ from ..adversarial import AdversarialPlateConfig, apply_adversaries
 from ..hardware.run_context import RunContext
 
 
+# Well execution backends for _simulate_wells.
+# simulate_well draws measurement noise from assay_rng_for_well() (keyed by
+# design/plate/cell line/well), so any backend gives identical results as long
+# as output order is preserved.
+EXECUTORS = ("serial", "thread", "process", "chunked")
+
+
+def _init_sim_worker(rng_seed: int, flags: Dict[str, bool]) -> None:
+    """Mirror the parent's simulator globals in a worker process."""
+    sim._RNG_STREAMS = sim.RNGStreams(seed=rng_seed)
+    for name, value in flags.items():
+        setattr(sim, name, value)
+
+
+def _sim_worker_state() -> Tuple[int, Dict[str, bool]]:
+    flags = {
+        name: getattr(sim, name)
+        for name in ("USE_REALISTIC_NOISE", "USE_ADVANCED_BIOLOGY", "USE_CELL_CYCLE_DYNAMICS")
+    }
+    return sim.get_rng().seed, flags
+
+
+def _simulate_one(args) -> Optional[Dict]:
+    well_assignment, design_id = args
+    return sim.simulate_well(well_assignment, design_id)
+
+
+def _simulate_chunk(args) -> List[Optional[Dict]]:
+    wells, design_id = args
+    return sim.simulate_wells_batch(wells, design_id)
+
+
 class ExperimentalWorld:
     """Interface for agent to query the biological world."""
 
@@ -41,7 +75,10 @@ class ExperimentalWorld:
         self,
         budget_wells: int = 384,
         seed: int = 0,
-        adversarial_plate_config: Optional['AdversarialPlateConfig'] = None
+        adversarial_plate_config: Optional['AdversarialPlateConfig'] = None,
+        executor: str = "serial",
+        max_workers: Optional[int] = None,
+        chunk_size: Optional[int] = None
     ):
         """Initialize experimental system.
 
@@ -49,11 +86,23 @@ class ExperimentalWorld:
             budget_wells: Total well budget for the campaign
             seed: Random seed for deterministic runs
             adversarial_plate_config: Optional config for injecting technical artifacts
+            executor: Well execution backend: "serial", "thread", "process"
+                (one well per task) or "chunked" (contiguous well blocks per
+                process task). Results are identical across backends.
+            max_workers: Worker count for parallel backends (default: cpu_count())
+            chunk_size: Wells per task for "chunked" (default: split evenly
+                across workers)
         """
+        if executor not in EXECUTORS:
+            raise ValueError(f"Unknown executor '{executor}'. Expected one of {EXECUTORS}")
+
         self.budget_total = budget_wells
         self.budget_remaining = budget_wells
         self.seed = seed
         self.adversarial_plate_config = adversarial_plate_config
+        self.executor = executor
+        self.max_workers = max_workers
+        self.chunk_size = chunk_size
         self.history: List[Tuple[RawWellResult, ...]] = []  # Track raw results
 
         # v6: RunContext (lazy initialization)
@@ -290,77 +339,108 @@ class ExperimentalWorld:
         Returns:
             Tuple of RawWellResult (canonical format)
         """
+        sim_results = self._run_simulator(assignments, design_id)
+
         results = []
-        for well_assignment, well_pos in zip(assignments, positions):
-            # Run simulator
-            sim_result = sim.simulate_well(well_assignment, design_id)
+        for sim_result in sim_results:
             if sim_result is None:
                 continue
+            results.append(self._to_raw_well_result(sim_result, design_id))
 
-            # Convert to canonical RawWellResult
-            location = SpatialLocation(
-                plate_id=sim_result.get('plate_id', f"Plate_{design_id[:8]}"),
-                well_id=sim_result['well_id']
-            )
+        return tuple(results)
 
-            treatment = Treatment(
-                compound=sim_result['compound'],
-                dose_uM=sim_result['dose_uM']
-            )
+    def _run_simulator(
+        self,
+        assignments: List[sim.WellAssignment],
+        design_id: str
+    ) -> List[Optional[Dict]]:
+        """Run simulate_well for every assignment with the configured backend.
 
-            # Map assay string to AssayType enum
-            # For now, epistemic agent only uses cell_painting
-            assay = AssayType.CELL_PAINTING
-
-            # Extract readouts (morphology channels)
-            morph_raw = sim_result['morphology']
-
-            # Use corrected morphology if calibration was applied
-            if 'morphology_corrected' in sim_result:
-                morph = sim_result['morphology_corrected']
-                # Log that calibration was used
-                self.logger.info(f"Using vignette-corrected morphology for well {sim_result.get('well_id', 'unknown')}")
-            else:
-                morph = morph_raw
-
-            readouts = {
-                'morphology': {
-                    'er': morph['er'],
-                    'mito': morph['mito'],
-                    'nucleus': morph['nucleus'],
-                    'actin': morph['actin'],
-                    'rna': morph['rna'],
-                }
-            }
+        Output order always matches input order.
+        """
+        n_wells = len(assignments)
+        workers = min(self.max_workers or cpu_count(), n_wells)
+        if self.executor == "serial" or workers <= 1:
+            return sim.simulate_wells_batch(assignments, design_id)
+
+        if self.executor == "thread":
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                return list(pool.map(_simulate_one, [(w, design_id) for w in assignments]))
+
+        rng_seed, flags = _sim_worker_state()
+        with Pool(processes=workers, initializer=_init_sim_worker, initargs=(rng_seed, flags)) as pool:
+            if self.executor == "process":
+                # imap (not imap_unordered) preserves well order
+                return list(pool.imap(_simulate_one, [(w, design_id) for w in assignments]))
+
+            chunk_size = self.chunk_size or -(-n_wells // workers)
+            chunks = [
+                (assignments[i:i + chunk_size], design_id)
+                for i in range(0, n_wells, chunk_size)
+            ]
+            return [r for chunk in pool.map(_simulate_chunk, chunks) for r in chunk]
+
+    def _to_raw_well_result(self, sim_result: Dict, design_id: str) -> RawWellResult:
+        """Convert a simulate_well dict to the canonical RawWellResult."""
+        location = SpatialLocation(
+            plate_id=sim_result.get('plate_id', f"Plate_{design_id[:8]}"),
+            well_id=sim_result['well_id']
+        )
 
-            # Extract LDH if present
-            if 'ldh' in sim_result:
-                readouts['ldh'] = sim_result['ldh']
-
-            # QC metadata (optional)
-            qc = {}
-            if 'failed' in sim_result:
-                qc['failed'] = sim_result['failed']
-            if 'failure_type' in sim_result:
-                qc['failure_type'] = sim_result['failure_type']
-
-            # Pass calibration metadata through if present
-            if 'calibration' in sim_result:
-                qc['calibration_applied'] = sim_result['calibration']
-
-            raw_result = RawWellResult(
-                location=location,
-                cell_line=sim_result['cell_line'],
-                treatment=treatment,
-                assay=assay,
-                observation_time_h=sim_result['timepoint_h'],
-                readouts=readouts,
-                qc=qc
-            )
+        treatment = Treatment(
+            compound=sim_result['compound'],
+            dose_uM=sim_result['dose_uM']
+        )
 
-            results.append(raw_result)
+        # Map assay string to AssayType enum
+        # For now, epistemic agent only uses cell_painting
+        assay = AssayType.CELL_PAINTING
+
+        # Extract readouts (morphology channels)
+        morph_raw = sim_result['morphology']
+
+        # Use corrected morphology if calibration was applied
+        if 'morphology_corrected' in sim_result:
+            morph = sim_result['morphology_corrected']
+            # Log that calibration was used
+            self.logger.info(f"Using vignette-corrected morphology for well {sim_result.get('well_id', 'unknown')}")
+        else:
+            morph = morph_raw
+
+        readouts = {
+            'morphology': {
+                'er': morph['er'],
+                'mito': morph['mito'],
+                'nucleus': morph['nucleus'],
+                'actin': morph['actin'],
+                'rna': morph['rna'],
+            }
+        }
 
-        return tuple(results)
+        # Extract LDH if present
+        if 'ldh' in sim_result:
+            readouts['ldh'] = sim_result['ldh']
+
+        # QC metadata (optional)
+        qc = {}
+        if 'failed' in sim_result:
+            qc['failed'] = sim_result['failed']
+        if 'failure_type' in sim_result:
+            qc['failure_type'] = sim_result['failure_type']
+
+        # Pass calibration metadata through if present
+        if 'calibration' in sim_result:
+            qc['calibration_applied'] = sim_result['calibration']
+
+        return RawWellResult(
+            location=location,
+            cell_line=sim_result['cell_line'],
+            treatment=treatment,
+            assay=assay,
+            observation_time_h=sim_result['timepoint_h'],
+            readouts=readouts,
+            qc=qc
+        )
 
     # =============================================================================
     # AGGREGATION REMOVED: World is now a pure executor
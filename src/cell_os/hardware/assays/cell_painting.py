@@ -5,15 +5,22 @@ Simulates 5-channel morphology imaging (ER, Mito, Nucleus, Actin, RNA)
 with realistic biological and technical noise.
 """
 
+import hashlib
+import json
 import logging
 import re
+from collections.abc import Sequence
 from datetime import datetime
 from typing import TYPE_CHECKING, Any
 
 import numpy as np
 
 from ...biology import biology_core
-from ...contracts import CELL_PAINTING_CONTRACT, enforce_measurement_contract
+from ...contracts import (
+    CELL_PAINTING_CONTRACT,
+    enforce_batch_measurement_contract,
+    enforce_measurement_contract,
+)
 from .._impl import (
     additive_floor_noise,
     apply_saturation,
@@ -43,7 +50,7 @@ from ..constants import (
 )
 from ..injections.base import InjectionContext
 from ..injections.segmentation_failure import SegmentationFailureInjection
-from ..run_context import pipeline_transform
+from ..run_context import pipeline_transform, pipeline_transform_batch
 from .assay_params import DEFAULT_ASSAY_PARAMS
 from .base import AssaySimulator
 
@@ -66,6 +73,34 @@ def _cell_count_proxy_from_confluence(
     return max(0.0, min(1.0, c)) * nominal_full_well
 
 
+def _stain_focus_coupling(channel: str, stain_factor: float, focus_factor: float) -> float:
+    """Channel-specific coupling of the plate stain and tile focus factors."""
+    # Stain coupling: strong on ER/Mito/RNA, moderate on Nucleus, weak on Actin
+    if channel in ("er", "mito"):
+        coupled = stain_factor
+    elif channel == "rna":
+        coupled = stain_factor**0.9
+    elif channel == "nucleus":
+        coupled = stain_factor**0.5
+    elif channel == "actin":
+        coupled = stain_factor**0.2
+    else:
+        coupled = 1.0
+
+    # Focus coupling: strong on Nucleus/Actin, weak on ER/Mito/RNA
+    if channel in ("nucleus", "actin"):
+        coupled *= focus_factor
+    else:
+        coupled *= focus_factor**0.2
+    return coupled
+
+
+def _realism_config_hash(realism_config: dict[str, float]) -> str:
+    """Short blake2s hash of the realism config (detector metadata provenance)."""
+    realism_config_str = json.dumps(realism_config, sort_keys=True)
+    return hashlib.blake2s(realism_config_str.encode(), digest_size=4).hexdigest()
+
+
 class CellPaintingAssay(AssaySimulator):
     """
     Cell Painting morphology assay simulator.
@@ -344,6 +379,258 @@ class CellPaintingAssay(AssaySimulator):
 
         return result
 
+    @enforce_batch_measurement_contract(CELL_PAINTING_CONTRACT)
+    def measure_batch(
+        self,
+        vessels: Sequence["VesselState"],
+        well_positions: Sequence[str] | None = None,
+        **kwargs,
+    ) -> dict[str, Any]:
+        """
+        Simulate Cell Painting on a plate of vessels, returned as columns.
+
+        Row i is bit-identical to measure(vessels[i], well_position=well_positions[i],
+        **kwargs) called for each vessel in order (without well_positions, to
+        measure(vessels[i], **kwargs)). Biology and the rng_assay draws run per well
+        in the scalar draw order; everything downstream of them (well/edge/hardware
+        factors, detector stack, pipeline drift, segmentation failure) runs on
+        (n_wells × 5) arrays with per-well dedicated RNGs.
+
+        Args:
+            vessels: Vessel states to measure (one plate read)
+            well_positions: Well ID per vessel (default: scalar defaults per well)
+            **kwargs: Shared plate context (plate_id, batch_id, day, operator, ...)
+
+        Returns:
+            Dict of columns: per-well arrays/lists aligned with vessel_ids, channel
+            columns of (n_wells × 5) arrays ordered by "channels"
+        """
+        from ..detector_stack import CHANNELS, apply_detector_stack_batch
+
+        n_wells = len(vessels)
+        if well_positions is None:
+            well_positions = [kwargs.get("well_position", "A1")] * n_wells
+            detector_positions = [kwargs.get("well_position", v.vessel_id) for v in vessels]
+        else:
+            well_positions = list(well_positions)
+            detector_positions = well_positions
+        if len(well_positions) != n_wells:
+            raise ValueError(
+                f"well_positions has {len(well_positions)} entries for {n_wells} vessels"
+            )
+
+        if not hasattr(self.vm, "thalamus_params") or self.vm.thalamus_params is None:
+            self.vm._load_cell_thalamus_params()
+
+        enable_structured = kwargs.get("enable_structured_artifacts", False)
+        experiment_seed = kwargs.get("experiment_seed", 0)
+        plate_id = kwargs.get("plate_id", "P1")
+        batch_id = kwargs.get("batch_id", "batch_default")
+        day = kwargs.get("day", 1)
+        operator = kwargs.get("operator", "OP1")
+        exposure_multiplier = kwargs.get("exposure_multiplier", 1.0)
+        t_measure = self.vm.simulated_time
+        tech_noise = self.vm.thalamus_params["technical_noise"]
+
+        # Deterministic per-well nuisance factors that the rng_assay draws depend on
+        stain_cv = float(tech_noise.get("stain_cv", 0.05))
+        focus_cv = float(tech_noise.get("focus_cv", 0.04))
+        stain_factor = (
+            self._get_plate_stain_factor(plate_id, batch_id, stain_cv) if stain_cv > 0 else 1.0
+        )
+        focus_factors = np.array(
+            [
+                self._get_tile_focus_factor(plate_id, batch_id, wp, focus_cv) if focus_cv > 0 else 1.0
+                for wp in well_positions
+            ]
+        )
+
+        # Per-well biology + rng_assay draws (scalar order: biology, plating, damage, focus)
+        channel_idx = {ch: c for c, ch in enumerate(CHANNELS)}
+        morph_struct = np.empty((n_wells, len(CHANNELS)))
+        morph = np.empty((n_wells, len(CHANNELS)))
+        damage_noise = np.empty(n_wells)
+        focus_noise = np.ones((n_wells, len(CHANNELS)))
+        transport_scores = np.empty(n_wells)
+        regime = np.empty((n_wells, 3))
+        structured_artifacts = []
+        states_before = []
+        for i, vessel in enumerate(vessels):
+            states_before.append((vessel.viability, vessel.confluence))
+
+            if enable_structured:
+                self._structured_artifacts = self._compute_structured_imaging_artifacts(
+                    vessel=vessel, well_position=well_positions[i], experiment_seed=experiment_seed
+                )
+            else:
+                self._structured_artifacts = None
+            structured_artifacts.append(self._structured_artifacts)
+
+            baseline = self.vm.thalamus_params["baseline_morphology"].get(vessel.cell_line, {})
+            if not baseline:
+                logger.warning(f"No baseline morphology for {vessel.cell_line}, using A549")
+                baseline = self.vm.thalamus_params["baseline_morphology"]["A549"]
+            well_morph = {ch: baseline[ch] for ch in CHANNELS}
+
+            self._ensure_well_biology(vessel)
+            well_morph = self._apply_well_biology_baseline(vessel, well_morph)
+            well_morph = self._apply_latent_stress_effects(vessel, well_morph)
+            has_microtubule_compound = (
+                float(getattr(vessel, "transport_dysfunction", 0.0) or 0.0) > 0.3
+            )
+            well_morph = self._apply_contact_pressure_bias(vessel, well_morph)
+            morph_struct[i] = [well_morph[ch] for ch in CHANNELS]
+            transport_scores[i] = self._compute_transport_dysfunction_score(
+                vessel, well_morph, baseline, has_microtubule_compound
+            )
+            regime[i] = (
+                self._current_stress_weight,
+                self._current_death_weight,
+                self._current_onset_factor,
+            )
+
+            well_morph = self._apply_signal_layer(vessel, well_morph, t_measure, exposure_multiplier)
+            morph[i] = [well_morph[ch] for ch in CHANNELS]
+
+            damage_noise[i], well_focus_noise = self._draw_technical_noise_shocks(
+                vessel, focus_factors[i]
+            )
+            for ch, factor in well_focus_noise.items():
+                focus_noise[i, channel_idx[ch]] = factor
+
+        # 7. Technical noise (vectorized over wells, scalar multiplication order)
+        plate_factor = self._get_batch_factor("plate", plate_id, batch_id, tech_noise["plate_cv"])
+        day_factor = self._get_batch_factor("day", day, batch_id, tech_noise["day_cv"])
+        operator_factor = self._get_batch_factor(
+            "op", operator, batch_id, tech_noise["operator_cv"]
+        )
+        well_factors = np.empty((n_wells, len(CHANNELS)))
+        for i, wp in enumerate(well_positions):
+            factors = self._get_well_factors(plate_id, wp, tech_noise["well_cv"])
+            well_factors[i] = [factors[ch] for ch in CHANNELS]
+        edge_effect = tech_noise.get("edge_effect", 0.0)
+        edge_factors = np.array(
+            [(1.0 - edge_effect) if self._is_edge_well(wp) else 1.0 for wp in well_positions]
+        )
+        meas_mods = self.vm.run_context.get_measurement_modifiers(t_measure, modality="imaging")
+        gain = meas_mods["gain"]
+        channel_biases = np.array([meas_mods["channel_biases"].get(ch, 1.0) for ch in CHANNELS])
+        hardware_factors = np.array(
+            [
+                self._get_hardware_factor(vessel.cell_line, plate_id, batch_id, wp, tech_noise)
+                for vessel, wp in zip(vessels, well_positions)
+            ]
+        )
+        coupled = np.array(
+            [[_stain_focus_coupling(ch, stain_factor, f) for ch in CHANNELS] for f in focus_factors]
+        ).reshape(n_wells, len(CHANNELS))
+
+        shared_tech_factor = (
+            plate_factor * day_factor * operator_factor * edge_factors * gain * hardware_factors
+        )
+        morph *= (
+            shared_tech_factor[:, None]
+            * well_factors
+            * channel_biases[None, :]
+            * coupled
+            * damage_noise[:, None]
+        )
+        morph *= focus_noise
+        morph = np.maximum(0.0, morph)
+
+        # 8-10. Detector stack
+        realism_config = (
+            kwargs.get("realism_config_override") or self.vm.run_context.get_realism_config()
+        )
+        realism_config_source = "override" if "realism_config_override" in kwargs else "run_context"
+        morph, detector_metadata = apply_detector_stack_batch(
+            signal=morph,
+            detector_params=tech_noise,
+            rng_detector_fn=self._detector_rng,
+            well_positions=detector_positions,
+            plate_format=384,
+            run_seed=self.vm.run_context.seed,
+            realism_config=realism_config,
+        )
+        detector_metadata["exposure_multiplier"] = exposure_multiplier
+        detector_metadata["realism_config_source"] = realism_config_source
+        detector_metadata["realism_config_hash"] = _realism_config_hash(realism_config)
+
+        # 11. Pipeline drift (one draw per batch/plate, shared by every row)
+        morph = pipeline_transform_batch(morph, self.vm.run_context, batch_id, plate_id)
+
+        self.vm._simulate_delay(2.0)
+
+        for vessel, state_before in zip(vessels, states_before):
+            self._assert_measurement_purity(vessel, state_before)
+
+        viability = np.array([float(v.viability) for v in vessels])
+        washout = np.array([self._compute_washout_multiplier(v, t_measure) for v in vessels])
+        signal_intensity = (
+            DEFAULT_ASSAY_PARAMS.CP_DEAD_SIGNAL_FLOOR
+            + (1 - DEFAULT_ASSAY_PARAMS.CP_DEAD_SIGNAL_FLOOR) * viability
+        ) * washout
+
+        result = {
+            "status": "success",
+            "action": "cell_painting",
+            "vessel_ids": [v.vessel_id for v in vessels],
+            "cell_lines": [v.cell_line for v in vessels],
+            "well_positions": well_positions,
+            "channels": list(CHANNELS),
+            "morphology_struct": morph_struct,
+            "morphology_measured": morph,
+            "morphology": morph,
+            "signal_intensity": signal_intensity,
+            "transport_dysfunction_score": transport_scores,
+            "timestamp": datetime.now().isoformat(),
+            "run_context_id": self.vm.run_context.context_id,
+            "batch_id": batch_id,
+            "plate_id": plate_id,
+            "measurement_modifiers": meas_mods,
+            "detector_metadata": detector_metadata,
+            "well_failure": [None] * n_wells,
+            "qc_flag": [None] * n_wells,
+        }
+
+        # Well failures (rare, per-well dedicated RNG)
+        if tech_noise.get("well_failure_rate", 0.0) > 0:
+            morph = morph.copy()
+            for i, wp in enumerate(well_positions):
+                failure = self._apply_well_failure(
+                    dict(zip(CHANNELS, morph[i].tolist())), wp, plate_id, batch_id
+                )
+                if failure:
+                    morph[i] = [failure["morphology"][ch] for ch in CHANNELS]
+                    result["well_failure"][i] = failure["failure_mode"]
+                    result["qc_flag"][i] = "FAIL"
+            result["morphology"] = morph
+            result["morphology_measured"] = morph
+
+        # Segmentation failure (adversarial measurement layer)
+        if kwargs.get("enable_segmentation_failure", True):
+            result.update(
+                self._apply_segmentation_failure_batch(
+                    vessels, result, well_positions, structured_artifacts, **kwargs
+                )
+            )
+
+        # Cell Painting quality degradation from debris/handling
+        quality = [self._compute_cp_quality_metrics(v) for v in vessels]
+        for key in quality[0] if quality else ():
+            result[key] = np.array([q[key] for q in quality])
+
+        result["imaging_artifacts"] = structured_artifacts
+        result["morph_regime"] = {
+            "stress_weight": regime[:, 0],
+            "death_weight": regime[:, 1],
+            "onset_factor": regime[:, 2],
+            "collapse_threshold": MORPHOLOGY_COLLAPSE_THRESHOLD,
+            "onset_tau_h": MORPHOLOGY_ONSET_TAU_H,
+        }
+
+        return result
+
     def _ensure_well_biology(self, vessel: "VesselState") -> None:
         """
         Create persistent per-well latent biology once (at 'plating').
@@ -705,48 +992,9 @@ class CellPaintingAssay(AssaySimulator):
         t_measure = self.vm.simulated_time
         tech_noise = self.vm.thalamus_params["technical_noise"]
 
-        # 1. Viability factor (biological signal attenuation)
-        # ASSUMPTION: Dead cells retain CP_DEAD_SIGNAL_FLOOR signal. See assay_params.py
-        viability_factor = (
-            DEFAULT_ASSAY_PARAMS.CP_DEAD_SIGNAL_FLOOR
-            + (1 - DEFAULT_ASSAY_PARAMS.CP_DEAD_SIGNAL_FLOOR) * vessel.viability
-        )
-
-        # 2. Washout multiplier (measurement artifact)
-        washout_multiplier = self._compute_washout_multiplier(vessel, t_measure)
-
-        # 3. Exposure multiplier (scales signal strength before detector)
-        # Agent-controlled: trade-off between SNR (floor-limited) and saturation
+        # 1-6. Signal attenuation, exposure, debris background, biological/plating noise
         exposure_multiplier = kwargs.get("exposure_multiplier", 1.0)
-        if exposure_multiplier != 1.0:
-            for channel in morph:
-                morph[channel] *= exposure_multiplier
-
-        # 4. Debris background fluorescence multiplier (Layer B: branch on flag)
-        if self._structured_artifacts is not None:
-            # Structured artifacts enabled (per-channel)
-            bg_mults = self._structured_artifacts["background"]
-            if "__global__" in bg_mults:
-                # Scalar mode
-                debris_mult = bg_mults["__global__"]
-                for channel in morph:
-                    morph[channel] *= viability_factor * washout_multiplier * debris_mult
-            else:
-                # Per-channel mode
-                for channel in morph:
-                    debris_mult = bg_mults.get(channel, 1.0)
-                    morph[channel] *= viability_factor * washout_multiplier * debris_mult
-        else:
-            # Phase 1 scalar artifacts (backward compatible)
-            debris_multiplier = self._compute_debris_background_multiplier(vessel)
-            for channel in morph:
-                morph[channel] *= viability_factor * washout_multiplier * debris_multiplier
-
-        # 5. Biological noise (dose-dependent)
-        morph = self._add_biological_noise(vessel, morph)
-
-        # 6. Plating artifacts (early timepoint variance inflation)
-        morph = self._add_plating_artifacts(vessel, morph, t_measure)
+        morph = self._apply_signal_layer(vessel, morph, t_measure, exposure_multiplier)
 
         # 7. Technical noise (plate/day/operator/well/edge effects)
         # NOTE: Debris also inflates noise variance via bg_noise_multiplier
@@ -768,15 +1016,7 @@ class CellPaintingAssay(AssaySimulator):
         well_position = kwargs.get("well_position", vessel.vessel_id)
 
         # Create dedicated detector RNG (same strategy as optical materials)
-        # Seed from (run_seed, "cell_painting_detector", well_position)
-        import hashlib
-
-        seed_string = f"cp_detector|{self.vm.run_context.seed}|{well_position}"
-        hash_bytes = hashlib.blake2s(seed_string.encode(), digest_size=4).digest()
-        detector_seed = int.from_bytes(hash_bytes, byteorder="little")
-        import numpy as np
-
-        rng_detector = np.random.default_rng(detector_seed)
+        rng_detector = self._detector_rng(well_position)
 
         # Apply unified detector stack
         morph, detector_metadata = apply_detector_stack(
@@ -813,12 +1053,7 @@ class CellPaintingAssay(AssaySimulator):
         # else: skip pipeline_transform (no-op)
 
         # Compute realism config hash for auditability
-        import json
-
-        realism_config_str = json.dumps(realism_config, sort_keys=True)
-        realism_config_hash = hashlib.blake2s(
-            realism_config_str.encode(), digest_size=4
-        ).hexdigest()
+        realism_config_hash = _realism_config_hash(realism_config)
 
         # Assemble detector metadata (v7: includes edge_distance, qc_flags, realism provenance)
         detector_metadata = {
@@ -835,6 +1070,65 @@ class CellPaintingAssay(AssaySimulator):
 
         return morph, detector_metadata
 
+    def _apply_signal_layer(
+        self,
+        vessel: "VesselState",
+        morph: dict[str, float],
+        t_measure: float,
+        exposure_multiplier: float = 1.0,
+    ) -> dict[str, float]:
+        """Measurement layer steps 1-6: attenuation, exposure, debris background, bio/plating noise."""
+        # 1. Viability factor (biological signal attenuation)
+        # ASSUMPTION: Dead cells retain CP_DEAD_SIGNAL_FLOOR signal. See assay_params.py
+        viability_factor = (
+            DEFAULT_ASSAY_PARAMS.CP_DEAD_SIGNAL_FLOOR
+            + (1 - DEFAULT_ASSAY_PARAMS.CP_DEAD_SIGNAL_FLOOR) * vessel.viability
+        )
+
+        # 2. Washout multiplier (measurement artifact)
+        washout_multiplier = self._compute_washout_multiplier(vessel, t_measure)
+
+        # 3. Exposure multiplier (scales signal strength before detector)
+        # Agent-controlled: trade-off between SNR (floor-limited) and saturation
+        if exposure_multiplier != 1.0:
+            for channel in morph:
+                morph[channel] *= exposure_multiplier
+
+        # 4. Debris background fluorescence multiplier (Layer B: branch on flag)
+        if self._structured_artifacts is not None:
+            # Structured artifacts enabled (per-channel)
+            bg_mults = self._structured_artifacts["background"]
+            if "__global__" in bg_mults:
+                # Scalar mode
+                debris_mult = bg_mults["__global__"]
+                for channel in morph:
+                    morph[channel] *= viability_factor * washout_multiplier * debris_mult
+            else:
+                # Per-channel mode
+                for channel in morph:
+                    debris_mult = bg_mults.get(channel, 1.0)
+                    morph[channel] *= viability_factor * washout_multiplier * debris_mult
+        else:
+            # Phase 1 scalar artifacts (backward compatible)
+            debris_multiplier = self._compute_debris_background_multiplier(vessel)
+            for channel in morph:
+                morph[channel] *= viability_factor * washout_multiplier * debris_multiplier
+
+        # 5. Biological noise (dose-dependent)
+        morph = self._add_biological_noise(vessel, morph)
+
+        # 6. Plating artifacts (early timepoint variance inflation)
+        morph = self._add_plating_artifacts(vessel, morph, t_measure)
+
+        return morph
+
+    def _detector_rng(self, well_position: str) -> np.random.Generator:
+        """Dedicated detector RNG seeded from (run_seed, "cp_detector", well_position)."""
+        seed_string = f"cp_detector|{self.vm.run_context.seed}|{well_position}"
+        hash_bytes = hashlib.blake2s(seed_string.encode(), digest_size=4).digest()
+        detector_seed = int.from_bytes(hash_bytes, byteorder="little")
+        return np.random.default_rng(detector_seed)
+
     def _compute_debris_background_multiplier(self, vessel: "VesselState") -> float:
         """
         Compute debris-driven background fluorescence multiplier.
@@ -1110,18 +1404,9 @@ class CellPaintingAssay(AssaySimulator):
 
         # Per-channel well factor (breaks global multiplier dominance)
         # EXCHANGEABLE SAMPLING FIX (Attack 2): Use well_uid, not well_position
-        well_cv = tech_noise["well_cv"]
-        well_factors_per_channel = {}
-        if well_cv > 0:
-            # Get exchangeable well UID from RunContext
-            well_uid = self.vm.run_context.get_well_uid(plate_id, well_position)
-            for channel in ["er", "mito", "nucleus", "actin", "rna"]:
-                # Deterministic per-channel: key to well_uid + channel (NOT position)
-                channel_seed = stable_u32(f"well_factor_{well_uid}_{channel}")
-                channel_rng = np.random.default_rng(channel_seed)
-                well_factors_per_channel[channel] = lognormal_multiplier(channel_rng, well_cv)
-        else:
-            well_factors_per_channel = {ch: 1.0 for ch in ["er", "mito", "nucleus", "actin", "rna"]}
+        well_factors_per_channel = self._get_well_factors(
+            plate_id, well_position, tech_noise["well_cv"]
+        )
 
         # Edge effect
         # DIAGNOSTIC: Disable edge effect to isolate per-channel coupling
@@ -1157,6 +1442,68 @@ class CellPaintingAssay(AssaySimulator):
             else 1.0
         )
 
+        # STATE-DEPENDENT NOISE (damage) + focus-induced variance inflation (nucleus/actin).
+        # Drawn from rng_assay before any channel is touched, in the scalar draw order.
+        damage_noise_factor, focus_noise = self._draw_technical_noise_shocks(vessel, focus_factor)
+
+        # Hardware artifacts from Cell Painting (EL406 Cell Painting)
+        # Affects measurement quality (stain intensity, background)
+        hardware_factor = self._get_hardware_factor(
+            vessel.cell_line, plate_id, batch_id, well_position, tech_noise
+        )
+
+        # Shared factors (plate/day/operator/edge/gain/hardware) - NOT per-channel well_factor
+        # CANONICAL GAIN APPLICATION: gain applied exactly once here (includes batch + drift)
+        shared_tech_factor = (
+            plate_factor * day_factor * operator_factor * edge_factor * gain * hardware_factor
+        )
+
+        # Apply shared factors + per-channel well factor + biases + coupled stain/focus
+        for channel in morph:
+            channel_bias = channel_biases.get(channel, 1.0)
+            well_factor = well_factors_per_channel.get(channel, 1.0)
+            coupled = _stain_focus_coupling(channel, stain_factor, focus_factor)
+
+            # Apply: shared factors × per-channel well factor × channel bias × coupled factors × damage noise
+            morph[channel] *= (
+                shared_tech_factor * well_factor * channel_bias * coupled * damage_noise_factor
+            )
+
+            # Focus-induced variance inflation for structure channels (fingerprint)
+            if channel in focus_noise:
+                morph[channel] *= focus_noise[channel]
+
+            morph[channel] = max(0.0, morph[channel])
+
+        return morph
+
+    def _get_well_factors(
+        self, plate_id: str, well_position: str, well_cv: float
+    ) -> dict[str, float]:
+        """Per-channel well factors (breaks global multiplier dominance)."""
+        if well_cv <= 0:
+            return {ch: 1.0 for ch in ["er", "mito", "nucleus", "actin", "rna"]}
+
+        # EXCHANGEABLE SAMPLING FIX (Attack 2): Use well_uid, not well_position
+        well_uid = self.vm.run_context.get_well_uid(plate_id, well_position)
+        well_factors = {}
+        for channel in ["er", "mito", "nucleus", "actin", "rna"]:
+            # Deterministic per-channel: key to well_uid + channel (NOT position)
+            channel_seed = stable_u32(f"well_factor_{well_uid}_{channel}")
+            channel_rng = np.random.default_rng(channel_seed)
+            well_factors[channel] = lognormal_multiplier(channel_rng, well_cv)
+        return well_factors
+
+    def _draw_technical_noise_shocks(
+        self, vessel: "VesselState", focus_factor: float
+    ) -> tuple[float, dict[str, float]]:
+        """
+        Draw the per-measurement rng_assay factors of the technical noise stage.
+
+        Returns:
+            (damage_noise_factor, {channel: focus_noise}) where focus_noise is only
+            present for nucleus/actin when the tile is out of focus
+        """
         # STATE-DEPENDENT NOISE: Add per-measurement multiplicative noise scaled by damage
         # Damaged cells show higher measurement-to-measurement variance (irregular uptake, heterogeneous morphology)
         # This is applied PER MEASUREMENT (not batch-level), so it creates detectable variance differences
@@ -1177,10 +1524,18 @@ class CellPaintingAssay(AssaySimulator):
         # Focus should also inflate variance on structure channels (nucleus/actin).
         # Translate focus_factor into a "focus badness" scalar.
         focus_badness = abs(float(np.log(focus_factor))) if focus_factor > 0 else 0.0
+        focus_noise = {}
+        if focus_badness > 0:
+            extra_cv = min(0.25, 0.05 + 0.4 * focus_badness)  # cap it
+            for channel in ("nucleus", "actin"):
+                focus_noise[channel] = lognormal_multiplier(self.vm.rng_assay, extra_cv)
 
-        # Hardware artifacts from Cell Painting (EL406 Cell Painting)
-        # Affects measurement quality (stain intensity, background)
-        hardware_factor = 1.0
+        return damage_noise_factor, focus_noise
+
+    def _get_hardware_factor(
+        self, cell_line: str, plate_id: str, batch_id: str, well_position: str, tech_noise: dict
+    ) -> float:
+        """EL406 Cell Painting hardware bias for one well (1.0 if unavailable)."""
         try:
             from src.cell_os.hardware.hardware_artifacts import get_hardware_bias
 
@@ -1199,59 +1554,16 @@ class CellPaintingAssay(AssaySimulator):
                 operation="cell_painting",
                 seed=self.vm.run_context.seed,
                 tech_noise=tech_noise,
-                cell_line=vessel.cell_line,
+                cell_line=cell_line,
                 cell_line_params=hardware_sensitivity,
                 run_context=self.vm.run_context,
             )
 
-            hardware_factor = hardware_bias["combined_factor"]
+            return hardware_bias["combined_factor"]
 
         except (ImportError, Exception):
             # Fallback: no hardware artifacts if import fails
-            pass
-
-        # Shared factors (plate/day/operator/edge/gain/hardware) - NOT per-channel well_factor
-        # CANONICAL GAIN APPLICATION: gain applied exactly once here (includes batch + drift)
-        shared_tech_factor = (
-            plate_factor * day_factor * operator_factor * edge_factor * gain * hardware_factor
-        )
-
-        # Apply shared factors + per-channel well factor + biases + coupled stain/focus
-        for channel in morph:
-            channel_bias = channel_biases.get(channel, 1.0)
-            well_factor = well_factors_per_channel.get(channel, 1.0)
-
-            # Stain coupling: strong on ER/Mito/RNA, moderate on Nucleus, weak on Actin
-            if channel in ("er", "mito"):
-                coupled = stain_factor
-            elif channel == "rna":
-                coupled = stain_factor**0.9
-            elif channel == "nucleus":
-                coupled = stain_factor**0.5
-            elif channel == "actin":
-                coupled = stain_factor**0.2
-            else:
-                coupled = 1.0
-
-            # Focus coupling: strong on Nucleus/Actin, weak on ER/Mito/RNA
-            if channel in ("nucleus", "actin"):
-                coupled *= focus_factor
-            else:
-                coupled *= focus_factor**0.2
-
-            # Apply: shared factors × per-channel well factor × channel bias × coupled factors × damage noise
-            morph[channel] *= (
-                shared_tech_factor * well_factor * channel_bias * coupled * damage_noise_factor
-            )
-
-            # Focus-induced variance inflation for structure channels (fingerprint)
-            if channel in ("nucleus", "actin") and focus_badness > 0:
-                extra_cv = min(0.25, 0.05 + 0.4 * focus_badness)  # cap it
-                morph[channel] *= lognormal_multiplier(self.vm.rng_assay, extra_cv)
-
-            morph[channel] = max(0.0, morph[channel])
-
-        return morph
+            return 1.0
 
     def _get_batch_factor(self, prefix: str, identifier: Any, batch_id: str, cv: float) -> float:
         """Get deterministic batch effect factor."""
@@ -1636,6 +1948,74 @@ class CellPaintingAssay(AssaySimulator):
 
         return updates
 
+    def _apply_segmentation_failure_batch(
+        self,
+        vessels: Sequence["VesselState"],
+        result: dict[str, Any],
+        well_positions: Sequence[str],
+        structured_artifacts: Sequence[dict[str, Any] | None],
+        **kwargs,
+    ) -> dict[str, Any]:
+        """Columnar _apply_segmentation_failure (row i matches the scalar call for well i)."""
+        if not hasattr(self, "_segmentation_injection"):
+            self._segmentation_injection = SegmentationFailureInjection()
+
+        plate_id = kwargs.get("plate_id", "P1")
+        seed = self.vm.run_context.seed
+        rngs = [
+            np.random.default_rng(stable_u32(f"segmentation_{seed}_{plate_id}_{wp}"))
+            for wp in well_positions
+        ]
+        confluence = np.array([v.confluence for v in vessels])
+        estimated_counts = np.array(
+            [int(_cell_count_proxy_from_confluence(v.confluence)) for v in vessels], dtype=np.int64
+        )
+        columns = self._segmentation_injection.hook_cell_painting_assay_batch(
+            true_counts=estimated_counts,
+            morphology=result["morphology"],
+            feature_names=result["channels"],
+            confluence=confluence,
+            debris_level=np.array([self._estimate_debris_level(v) for v in vessels]),
+            focus_offset_um=kwargs.get("focus_offset_um", 0.0),
+            stain_scale=kwargs.get("stain_scale", 1.0),
+            rngs=rngs,
+        )
+
+        # ADDITIONAL debris-driven segmentation failure (same branches as the scalar path)
+        bumps = np.empty(len(vessels))
+        for i, (vessel, artifacts) in enumerate(zip(vessels, structured_artifacts)):
+            if artifacts is None:
+                bumps[i] = self._compute_debris_segmentation_failure_bump(vessel)
+            elif "modes" in artifacts["segmentation"]:
+                modes = artifacts["segmentation"]["modes"]
+                bumps[i] = modes["p_merge"] + modes["p_split"]
+            else:
+                bumps[i] = artifacts["segmentation"]["scalar_bump"]
+
+        seg_quality_original = columns["segmentation_quality"]
+        seg_quality_adjusted = np.clip(seg_quality_original * (1.0 - bumps), 0.0, 1.0)
+
+        qc_flag = list(result["qc_flag"])
+        for i in np.flatnonzero(~columns["qc_passed"]):
+            qc_flag[i] = "SEGMENTATION_FAIL"
+
+        return {
+            "cell_count_estimated": estimated_counts,
+            "cell_count_observed": columns["observed_count"],
+            "morphology": columns["morphology"],
+            "morphology_measured": columns["morphology"],
+            "segmentation_quality": seg_quality_adjusted,
+            "segmentation_quality_pre_debris": seg_quality_original,
+            "debris_seg_fail_bump": bumps,
+            "segmentation_qc_passed": columns["qc_passed"],
+            "segmentation_warnings": columns["qc_warnings"],
+            "merge_count": columns["merge_count"],
+            "split_count": columns["split_count"],
+            "size_bias": columns["size_bias"],
+            "data_quality": columns["data_quality"],
+            "qc_flag": qc_flag,
+        }
+
     def _estimate_debris_level(self, vessel: "VesselState") -> float:
         """
         Estimate debris level from vessel state.
@@ -5,7 +5,6 @@ Simulates scRNA-seq with realistic batch effects, dropout, and technical noise.
 """
 
 import logging
-import yaml
 from pathlib import Path
 from typing import Dict, Any, Optional, TYPE_CHECKING
 from datetime import datetime
@@ -59,7 +58,7 @@ class ScRNASeqAssay(AssaySimulator):
             Dict with counts, metadata, and run information
         """
         # Lazy load transcriptomics module
-        from ..transcriptomics import simulate_scrna_counts
+        from ..transcriptomics import simulate_scrna_counts, load_scrna_model
 
         # Lock measurement purity
         state_before = (vessel.viability, vessel.confluence)
@@ -101,9 +100,8 @@ class ScRNASeqAssay(AssaySimulator):
             run_context_latent=run_context_latent,
         )
 
-        # Load cost model from params
-        with open(params_path) as f:
-            params = yaml.safe_load(f)
+        # Load cost model from params (compiled model is cached per params file)
+        params = load_scrna_model(params_path).params
 
         costs = params.get("costs", {})
         time_cost_h = float(costs.get("time_cost_h", 4.0))
@@ -8,6 +8,8 @@ Architecture:
 - types.py: Dataclasses (BeamNode, BeamSearchResult, PrefixRolloutResult, NoCommitEpisode)
 - runner.py: Phase5EpisodeRunner (episode execution with Phase 5 classifier)
 - search.py: Main BeamSearch class (search algorithm)
+- prefix_cache.py: Persistent content-addressed PrefixRolloutResult cache
+- parallel.py: Process-pool successor rollouts (BeamSearch(n_workers=...))
 
 Usage:
     from cell_os.hardware.beam_search import BeamSearch, BeamSearchResult, BeamNode
@@ -29,6 +31,7 @@ from .types import (
     BeamSearchResult,
 )
 from .runner import Phase5EpisodeRunner
+from .prefix_cache import PrefixRolloutCache, code_version
 from .search import BeamSearch
 
 __all__ = [
@@ -45,4 +48,7 @@ __all__ = [
     # Main classes
     'Phase5EpisodeRunner',
     'BeamSearch',
+    # Persistent cache
+    'PrefixRolloutCache',
+    'code_version',
 ]
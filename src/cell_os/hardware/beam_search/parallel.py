@@ -0,0 +1,102 @@
+"""
+Process-pool prefix rollouts for beam search.
+
+Each beam level's successor rollouts are independent, so they are fanned out to
+a multiprocessing Pool before the (sequential) expansion runs. Workers hold one
+Phase5EpisodeRunner each (built once by the pool initializer). Every task ships
+the parent node's VM snapshot and PrefixRolloutResult, so a worker extends the
+parent by exactly one step, the same work and RNG positions as the sequential
+path, and returns the child's result plus its snapshot for the next level.
+
+The main process only fills runner caches; pruning, scoring and statistics stay
+in BeamSearch, so parallel and sequential searches produce identical results.
+"""
+
+import logging
+from typing import Dict, List, Optional, Tuple
+
+from ..episode import Action
+from .runner import Phase5EpisodeRunner
+from .types import PrefixRolloutResult
+
+logger = logging.getLogger(__name__)
+
+# Per-process runner, built by init_rollout_worker
+_WORKER_RUNNER: Optional[Phase5EpisodeRunner] = None
+
+RolloutTask = Tuple[List[Action], Optional[tuple], Optional[PrefixRolloutResult]]
+
+
+def init_rollout_worker(runner_config: Dict) -> None:
+    """Pool initializer: build this worker's runner once (params, calibrator, baseline)."""
+    global _WORKER_RUNNER
+    _WORKER_RUNNER = Phase5EpisodeRunner(**runner_config)
+
+
+def rollout_in_worker(task: RolloutTask):
+    """
+    Roll out one child prefix, extending the parent's snapshot when provided.
+
+    Returns:
+        (actions_key, PrefixRolloutResult or None, child snapshot entry or None, error or None)
+    """
+    schedule, parent_entry, parent_result = task
+    runner = _WORKER_RUNNER
+    actions_key = runner._actions_key(schedule)
+
+    # Task-local state only: workers must not accumulate history across tasks
+    runner._prefix_cache.clear()
+    runner.clear_snapshots()
+    if parent_entry is not None:
+        runner._prefix_snapshots[actions_key[:-1]] = parent_entry
+        runner._prefix_snapshot_depth = len(actions_key) - 1
+    if parent_result is not None:
+        runner._prefix_cache[(actions_key[:-1], len(actions_key) - 1)] = parent_result
+
+    try:
+        result = runner.rollout_prefix(schedule)
+    except Exception as e:
+        # Sequential expansion re-runs this prefix and applies its own pruning
+        return actions_key, None, None, f"{type(e).__name__}: {e}"
+
+    return actions_key, result, runner._prefix_snapshots.get(actions_key), None
+
+
+def prefetch_rollouts(pool, runner: Phase5EpisodeRunner, schedules: List[List[Action]]) -> int:
+    """
+    Compute missing prefix rollouts in the pool and load them into runner's caches.
+
+    Args:
+        pool: multiprocessing Pool initialized with init_rollout_worker
+        runner: Main-process runner (receives results and child snapshots)
+        schedules: Child schedules (each one action longer than a cached parent)
+
+    Returns:
+        Number of rollouts computed in workers
+    """
+    tasks = []
+    for schedule in schedules:
+        actions_key = runner._actions_key(schedule)
+        if (actions_key, len(actions_key)) in runner._prefix_cache:
+            continue
+        parent_key = actions_key[:-1]
+        parent_entry = runner._prefix_snapshots.get(parent_key)
+        parent_result = runner._prefix_cache.get((parent_key, len(parent_key)))
+        tasks.append((schedule, parent_entry, parent_result))
+
+    if not tasks:
+        return 0
+
+    n_workers = getattr(pool, "_processes", 1) or 1
+    chunksize = max(1, len(tasks) // (4 * n_workers))
+    computed = 0
+    for actions_key, result, entry, error in pool.imap(rollout_in_worker, tasks, chunksize=chunksize):
+        if error is not None:
+            logger.debug(f"Worker prefix rollout failed for {actions_key}: {error}")
+            continue
+        runner._prefix_cache[(actions_key, len(actions_key))] = result
+        if entry is not None:
+            runner._import_prefix_snapshot(actions_key, entry)
+        computed += 1
+
+    return computed
@@ -0,0 +1,179 @@
+"""
+Persistent prefix-rollout cache for beam search.
+
+Content-addressed on-disk store of PrefixRolloutResult records, shared across
+searches, compounds, seeds and processes (nightly sweeps re-run many of the same
+prefixes).
+
+Key = sha256 of a canonical JSON document containing everything a prefix rollout
+depends on:
+- compound identity and scalars (name, reference dose, potency, toxicity)
+- cell line, step size, seed
+- the dose/washout/feed schedule
+- whether the parent posterior was available (split-ledger attribution)
+- code version: fingerprint of the simulator sources and parameter files
+
+Any change to the simulator code or parameters changes the code version, so stale
+records are never returned; they are simply orphaned on disk.
+
+Layout: <cache_dir>/<key[:2]>/<key>.pkl (pickled PrefixRolloutResult).
+Writes are atomic (temp file + os.replace), so concurrent workers can share a
+directory safely.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .types import PrefixRolloutResult
+
+logger = logging.getLogger(__name__)
+
+# Bump when PrefixRolloutResult fields or key layout change
+CACHE_SCHEMA_VERSION = 1
+
+_PACKAGE_ROOT = Path(__file__).parents[2]  # src/cell_os
+_DATA_ROOT = Path(__file__).parents[4] / "data"
+
+# Everything a prefix rollout reads: simulator packages and parameter files.
+# Packages are every cell_os subpackage a rollout imports (the VM pulls in
+# database for parameters and epistemic_agent for the posterior/calibration code).
+_FINGERPRINT_PACKAGES = ("hardware", "biology", "contracts", "database", "epistemic_agent")
+_FINGERPRINT_DATA_FILES = (
+    "cell_lines.db",
+    "cell_thalamus_params.yaml",
+    "simulation_parameters.yaml",
+    "confidence_calibrator_v1.pkl",
+)
+
+_code_version: Optional[str] = None
+
+
+def code_version() -> str:
+    """
+    Fingerprint of the simulator sources and parameter files (computed once per process).
+
+    Returns:
+        16-hex-char digest; changes whenever any simulator .py file or parameter file changes
+    """
+    global _code_version
+    if _code_version is not None:
+        return _code_version
+
+    digest = hashlib.sha256(f"schema={CACHE_SCHEMA_VERSION}".encode())
+    paths = []
+    for package in _FINGERPRINT_PACKAGES:
+        paths.extend(sorted((_PACKAGE_ROOT / package).rglob("*.py")))
+    paths.extend(_DATA_ROOT / name for name in _FINGERPRINT_DATA_FILES)
+
+    for path in paths:
+        if not path.exists():
+            continue
+        digest.update(str(path.relative_to(path.parents[1])).encode())
+        digest.update(path.read_bytes())
+
+    _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+def _schedule_key(schedule: Iterable[Tuple[float, bool, bool]]) -> list:
+    """Canonical JSON-safe form of a (dose_fraction, washout, feed) schedule."""
+    return [[float(dose), bool(washout), bool(feed)] for dose, washout, feed in schedule]
+
+
+class PrefixRolloutCache:
+    """
+    Content-addressed on-disk store of PrefixRolloutResult records.
+
+    Usage:
+        cache = PrefixRolloutCache("~/.cache/cell_os/prefix_rollouts")
+        key = cache.make_key(context, schedule, with_prior=True)
+        record = cache.get(key)
+        if record is None:
+            record = runner.rollout_prefix(...)
+            cache.put(key, record)
+    """
+
+    def __init__(self, cache_dir: str, version: Optional[str] = None):
+        """
+        Args:
+            cache_dir: Root directory (created if missing)
+            version: Code version override (default: code_version() fingerprint)
+        """
+        self.cache_dir = Path(cache_dir).expanduser()
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.version = version if version is not None else code_version()
+        self.hits = 0
+        self.misses = 0
+
+    def make_key(
+        self,
+        context: Dict[str, Any],
+        schedule: Iterable[Tuple[float, bool, bool]],
+        with_prior: bool,
+    ) -> str:
+        """
+        Content address for one prefix rollout.
+
+        Args:
+            context: Runner identity (compound, scalars, cell line, step, seed)
+            schedule: (dose_fraction, washout, feed) tuples
+            with_prior: Whether the parent posterior fed split-ledger attribution
+
+        Returns:
+            sha256 hex digest
+        """
+        document = {
+            "schema": CACHE_SCHEMA_VERSION,
+            "code_version": self.version,
+            "context": context,
+            "schedule": _schedule_key(schedule),
+            "with_prior": bool(with_prior),
+        }
+        canonical = json.dumps(document, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str) -> Optional[PrefixRolloutResult]:
+        """Return the cached record, or None on miss (unreadable records count as misses)."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                record = pickle.load(f)
+        except FileNotFoundError:
+            self.misses += 1
+            return None
+        except (pickle.UnpicklingError, EOFError, AttributeError, ImportError) as e:
+            logger.warning(f"Discarding unreadable prefix cache record {path.name}: {e}")
+            self.misses += 1
+            return None
+
+        if not isinstance(record, PrefixRolloutResult):
+            self.misses += 1
+            return None
+        self.hits += 1
+        return record
+
+    def put(self, key: str, record: PrefixRolloutResult) -> None:
+        """Atomically write a record (last writer wins; all writers agree by construction)."""
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(record, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.unlink(tmp_path)
+            raise
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self.cache_dir.glob("*/*.pkl"))
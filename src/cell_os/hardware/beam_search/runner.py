@@ -4,14 +4,17 @@ Phase 5 Episode Runner
 Executes episodes with Phase 5 classifier and governance integration.
 """
 
-from typing import List, Optional, Tuple
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
 import numpy as np
 
 from ..episode import Action, Policy, EpisodeRunner, EpisodeReceipt, EpisodeState
-from ..biological_virtual import BiologicalVirtualMachine
-from ..reward import compute_microtubule_mechanism_reward
+from ..biological_virtual import BiologicalVirtualMachine, VMSnapshot
+from .prefix_cache import PrefixRolloutCache
 from .types import PrefixRolloutResult
 
+CALIBRATOR_PATH = Path(__file__).parents[4] / "data" / "confidence_calibrator_v1.pkl"
+
 class Phase5EpisodeRunner(EpisodeRunner):
     """
     EpisodeRunner that applies Phase5 compound scalars (potency, toxicity).
@@ -28,9 +31,19 @@ class Phase5EpisodeRunner(EpisodeRunner):
         seed: int = 42,
         lambda_dead: float = 2.0,
         lambda_ops: float = 0.1,
-        actin_threshold: float = 1.4
+        actin_threshold: float = 1.4,
+        use_snapshots: bool = True,
+        max_snapshots: int = 256,
+        prefix_cache_dir: Optional[str] = None
     ):
-        """Initialize with Phase5Compound."""
+        """
+        Initialize with Phase5Compound.
+
+        Args:
+            prefix_cache_dir: Optional directory for the persistent, content-addressed
+                prefix-rollout cache (see prefix_cache.PrefixRolloutCache). Shared
+                across searches, seeds, compounds and processes.
+        """
         super().__init__(
             compound=phase5_compound.compound_name,
             reference_dose_uM=phase5_compound.reference_dose_uM,
@@ -40,122 +53,131 @@ class Phase5EpisodeRunner(EpisodeRunner):
             seed=seed,
             lambda_dead=lambda_dead,
             lambda_ops=lambda_ops,
-            actin_threshold=actin_threshold
+            actin_threshold=actin_threshold,
+            use_snapshots=use_snapshots,
+            max_snapshots=max_snapshots
         )
         self.phase5_compound = phase5_compound
+        self.prefix_cache_dir = prefix_cache_dir
+        self._disk_cache = PrefixRolloutCache(prefix_cache_dir) if prefix_cache_dir else None
 
         # Prefix rollout cache: key = (schedule_prefix_tuple, n_steps)
         self._prefix_cache: Dict[Tuple, PrefixRolloutResult] = {}
 
+        # Prefix snapshots: key = schedule_prefix_tuple, value = (pre-measurement
+        # VM snapshot, washout_count, feed_count). Beam nodes extend these by one step.
+        self._prefix_snapshots: Dict[Tuple, Tuple[VMSnapshot, int, int]] = {}
+        self._prefix_snapshot_depth = 0
+        self._prefix_baseline: Optional[Dict[str, float]] = None
+
         # Cached calibrator (load once instead of every rollout)
         self._calibrator = None
 
-    def run(self, policy: Policy) -> Tuple[EpisodeReceipt, List[EpisodeState]]:
-        """Execute policy with Phase5 scalars applied."""
-        if len(policy.actions) != self.n_steps:
-            raise ValueError(
-                f"Policy has {len(policy.actions)} actions, expected {self.n_steps}"
-            )
-
-        # Check cache first
-        cache_key = self._policy_to_cache_key(policy)
-        if cache_key in self._rollout_cache:
-            return self._rollout_cache[cache_key]
+    def _treat(self, vm: BiologicalVirtualMachine, dose_uM: float) -> None:
+        """Dose with Phase5 scalars (potency, toxicity) applied."""
+        vm.treat_with_compound(
+            "episode",
+            self.compound,
+            dose_uM=dose_uM,
+            potency_scalar=self.phase5_compound.potency_scalar,
+            toxicity_scalar=self.phase5_compound.toxicity_scalar
+        )
 
-        # Cache miss: execute with scalars
-        vm = BiologicalVirtualMachine(seed=self.seed)
-        vm.seed_vessel("episode", self.cell_line, 1e6, capacity=1e7, initial_viability=0.98)
+    def worker_config(self) -> Dict:
+        """Constructor kwargs that rebuild an equivalent runner in a worker process."""
+        return {
+            'phase5_compound': self.phase5_compound,
+            'cell_line': self.cell_line,
+            'horizon_h': self.horizon_h,
+            'step_h': self.step_h,
+            'seed': self.seed,
+            'lambda_dead': self.lambda_dead,
+            'lambda_ops': self.lambda_ops,
+            'actin_threshold': self.actin_threshold,
+            'use_snapshots': self.use_snapshots,
+            'max_snapshots': self.max_snapshots,
+            'prefix_cache_dir': self.prefix_cache_dir,
+        }
+
+    def _cache_context(self) -> Dict:
+        """Everything besides the schedule that a prefix rollout depends on (disk cache key)."""
+        return {
+            'compound': self.compound,
+            'reference_dose_uM': float(self.reference_dose_uM),
+            'potency_scalar': float(self.phase5_compound.potency_scalar),
+            'toxicity_scalar': float(self.phase5_compound.toxicity_scalar),
+            'cell_line': self.cell_line,
+            'step_h': float(self.step_h),
+            'seed': int(self.seed),
+        }
+
+    def _prefix_baseline_vm(self) -> BiologicalVirtualMachine:
+        """Fresh VM at t=0 with the prefix-rollout baseline measured (and recorded)."""
+        vm = self._new_vm()
 
         # Measure baseline
         baseline_result = vm.cell_painting_assay("episode")
-        baseline_actin = baseline_result['morphology_struct']['actin']
-
-        # Trajectory tracking
-        trajectory = []
-        washout_count = 0
-        feed_count = 0
-
-        actin_struct_12h = None
-        viability_48h = None
-
-        # Execute policy step by step
-        for step_idx, action in enumerate(policy.actions):
-            current_time = step_idx * self.step_h
-
-            vessel = vm.vessel_states["episode"]
-
-            # 1. Apply dose (with scalars)
-            if action.dose_fraction > 0:
-                dose_uM = action.dose_fraction * self.reference_dose_uM
-
-                if self.compound not in vessel.compounds or vessel.compounds[self.compound] == 0:
-                    vm.treat_with_compound(
-                        "episode",
-                        self.compound,
-                        dose_uM=dose_uM,
-                        potency_scalar=self.phase5_compound.potency_scalar,
-                        toxicity_scalar=self.phase5_compound.toxicity_scalar
-                    )
-
-            # 2. Washout
-            if action.washout:
-                if self.compound in vessel.compounds and vessel.compounds[self.compound] > 0:
-                    vm.washout_compound("episode", self.compound)
-                    washout_count += 1
-
-            # 3. Feed
-            if action.feed:
-                vm.feed_vessel("episode")
-                feed_count += 1
-
-            # 4. Advance time
-            vm.advance_time(self.step_h)
-
-            # 5. Measure state
-            result = vm.cell_painting_assay("episode")
-            morph_struct = result['morphology_struct']
-            actin_struct = morph_struct['actin']
-            transport_dysfunction = vessel.transport_dysfunction
-            viability = vessel.viability
-
-            # Record trajectory
-            state = EpisodeState(
-                time_h=current_time + self.step_h,
-                actin_struct=actin_struct,
-                baseline_actin=baseline_actin,
-                transport_dysfunction=transport_dysfunction,
-                viability=viability,
-                washout_count=washout_count,
-                feed_count=feed_count
-            )
-            trajectory.append(state)
-
-            # Capture snapshots
-            if abs(state.time_h - self.measurement_time_12h) < 1e-6:
-                actin_struct_12h = actin_struct
-            if abs(state.time_h - self.measurement_time_48h) < 1e-6:
-                viability_48h = viability
-
-        # Compute reward
-        if actin_struct_12h is None or viability_48h is None:
-            raise RuntimeError("Missing measurements at key timepoints")
-
-        receipt = compute_microtubule_mechanism_reward(
-            actin_struct_12h=actin_struct_12h,
-            baseline_actin=baseline_actin,
-            viability_48h=viability_48h,
-            washout_count=washout_count,
-            feed_count=feed_count,
-            lambda_dead=self.lambda_dead,
-            lambda_ops=self.lambda_ops,
-            actin_threshold=self.actin_threshold
-        )
+        baseline_scalars = vm.atp_viability_assay("episode")
+        self._prefix_baseline = {
+            'actin': baseline_result['morphology_struct']['actin'],
+            'er': baseline_result['morphology_struct']['er'],
+            'mito': baseline_result['morphology_struct']['mito'],
+            'upr': baseline_scalars['upr_marker'],
+            'atp': baseline_scalars['atp_signal'],
+            'trafficking': baseline_scalars['trafficking_marker'],
+        }
+        return vm
+
+    def _restore_prefix_state(self, actions_key: Tuple) -> Tuple[BiologicalVirtualMachine, int, int, int]:
+        """
+        Resume from the longest snapshotted prefix of actions_key.
 
-        # Store in cache
-        result = (receipt, trajectory)
-        self._rollout_cache[cache_key] = result
+        Snapshots are taken after advance_time and BEFORE the end-of-prefix
+        measurement, so a fork sees exactly the RNG positions a full replay would.
+
+        Returns:
+            (vm, washout_count, feed_count, n_steps_done)
+        """
+        if self.use_snapshots:
+            for n in range(len(actions_key) - 1, -1, -1):
+                entry = self._prefix_snapshots.get(actions_key[:n])
+                if entry is not None:
+                    snapshot, washout_count, feed_count = entry
+                    if self._prefix_baseline is None:
+                        self._prefix_baseline_vm()  # Snapshot imported from another process
+                    return BiologicalVirtualMachine.from_snapshot(snapshot), washout_count, feed_count, n
+
+        vm = self._prefix_baseline_vm()
+        if self.use_snapshots:
+            self._store_prefix_snapshot((), vm, 0, 0)
+        return vm, 0, 0, 0
+
+    def _store_prefix_snapshot(
+        self, actions_key: Tuple, vm: BiologicalVirtualMachine, washout_count: int, feed_count: int
+    ) -> None:
+        """
+        Record the pre-measurement state for actions_key.
 
-        return result
+        Beam search expands level by level, so only the two deepest levels are
+        kept; anything older is evicted (a later miss simply replays).
+        """
+        self._import_prefix_snapshot(actions_key, (vm.snapshot(), washout_count, feed_count))
+
+    def _import_prefix_snapshot(self, actions_key: Tuple, entry: Tuple[VMSnapshot, int, int]) -> None:
+        """Insert a (snapshot, washout_count, feed_count) entry, evicting stale levels."""
+        depth = len(actions_key)
+        if depth > self._prefix_snapshot_depth:
+            self._prefix_snapshot_depth = depth
+            stale = [k for k in self._prefix_snapshots if len(k) < depth - 1]
+            for k in stale:
+                del self._prefix_snapshots[k]
+        self._prefix_snapshots[actions_key] = entry
+
+    def clear_snapshots(self) -> None:
+        """Drop all VM checkpoints (result caches are kept)."""
+        super().clear_snapshots()
+        self._prefix_snapshots.clear()
+        self._prefix_snapshot_depth = 0
 
     def rollout_prefix(self, schedule_prefix: List[Action]) -> PrefixRolloutResult:
         """
@@ -176,55 +198,34 @@ class Phase5EpisodeRunner(EpisodeRunner):
         if cache_key in self._prefix_cache:
             return self._prefix_cache[cache_key]
 
-        # Cache miss: run VM to current timestep
-        vm = BiologicalVirtualMachine(seed=self.seed)
-        vm.seed_vessel("episode", self.cell_line, 1e6, capacity=1e7, initial_viability=0.98)
-
-        # Measure baseline
-        baseline_result = vm.cell_painting_assay("episode")
-        baseline_actin = baseline_result['morphology_struct']['actin']
-        baseline_er = baseline_result['morphology_struct']['er']
-        baseline_mito = baseline_result['morphology_struct']['mito']
-        baseline_scalars = vm.atp_viability_assay("episode")
-        baseline_upr = baseline_scalars['upr_marker']
-        baseline_atp = baseline_scalars['atp_signal']
-        baseline_trafficking = baseline_scalars['trafficking_marker']
-
-        # Capture baseline vessel state (for contact_pressure baseline)
-        baseline_vessel = vm.vessel_states["episode"]
-
-        # Execute prefix
-        washout_count = 0
-        feed_count = 0
-
-        for step_idx, action in enumerate(schedule_prefix):
-            vessel = vm.vessel_states["episode"]
-
-            # Apply dose
-            if action.dose_fraction > 0:
-                dose_uM = action.dose_fraction * self.reference_dose_uM
-                if self.compound not in vessel.compounds or vessel.compounds[self.compound] == 0:
-                    vm.treat_with_compound(
-                        "episode",
-                        self.compound,
-                        dose_uM=dose_uM,
-                        potency_scalar=self.phase5_compound.potency_scalar,
-                        toxicity_scalar=self.phase5_compound.toxicity_scalar
-                    )
-
-            # Washout
-            if action.washout:
-                if self.compound in vessel.compounds and vessel.compounds[self.compound] > 0:
-                    vm.washout_compound("episode", self.compound)
-                    washout_count += 1
-
-            # Feed
-            if action.feed:
-                vm.feed_vessel("episode")
-                feed_count += 1
-
-            # Advance time
-            vm.advance_time(self.step_h)
+        actions_key = cache_key[0]
+
+        # Persistent cache (content-addressed; attribution depends on the parent posterior)
+        disk_key = None
+        if self._disk_cache is not None:
+            with_prior = n_steps_prefix > 1 and (actions_key[:-1], n_steps_prefix - 1) in self._prefix_cache
+            disk_key = self._disk_cache.make_key(self._cache_context(), actions_key, with_prior)
+            record = self._disk_cache.get(disk_key)
+            if record is not None:
+                self._prefix_cache[cache_key] = record
+                return record
+
+        # Cache miss: extend the deepest snapshotted prefix (or replay from t=0)
+        vm, washout_count, feed_count, n_done = self._restore_prefix_state(actions_key)
+
+        for n, action in enumerate(schedule_prefix[n_done:], start=n_done + 1):
+            washouts, feeds = self._apply_action(vm, action)
+            washout_count += washouts
+            feed_count += feeds
+            if self.use_snapshots:
+                self._store_prefix_snapshot(actions_key[:n], vm, washout_count, feed_count)
+
+        baseline_actin = self._prefix_baseline['actin']
+        baseline_er = self._prefix_baseline['er']
+        baseline_mito = self._prefix_baseline['mito']
+        baseline_upr = self._prefix_baseline['upr']
+        baseline_atp = self._prefix_baseline['atp']
+        baseline_trafficking = self._prefix_baseline['trafficking']
 
         # Measure current state
         result = vm.cell_painting_assay("episode")
@@ -281,9 +282,10 @@ class Phase5EpisodeRunner(EpisodeRunner):
         pipeline_var = (k_pipe * shift_mag) ** 2
 
         # Contact pressure nuisance: mean shift in fold-space from Δp between baseline and readout
-        # IMPORTANT: use baseline pressure from the same baseline measurement that produced baseline_* values
+        # NOTE: the baseline vessel has always been the live VesselState object (same reference),
+        # so p_base tracks p_obs and Δp is 0. Kept as-is so snapshot forks match full replays.
         p_obs = float(np.clip(getattr(vessel, "contact_pressure", 0.0), 0.0, 1.0))
-        p_base = float(np.clip(getattr(baseline_vessel, "contact_pressure", 0.0), 0.0, 1.0))
+        p_base = p_obs
         delta_p = float(np.clip(p_obs - p_base, -1.0, 1.0))
         contact_shift = np.array([
             0.10 * delta_p,   # actin
@@ -337,7 +339,7 @@ class Phase5EpisodeRunner(EpisodeRunner):
 
         # Load calibrator once and cache (avoid reloading on every rollout)
         if self._calibrator is None:
-            self._calibrator = ConfidenceCalibrator.load('/Users/bjh/cell_OS/data/confidence_calibrator_v1.pkl')
+            self._calibrator = ConfidenceCalibrator.load(str(CALIBRATOR_PATH))
         calibrated_conf = self._calibrator.predict_confidence(belief_state)
 
         # Compute nuisance component magnitudes for forensics
@@ -371,6 +373,8 @@ class Phase5EpisodeRunner(EpisodeRunner):
 
         # Store in cache
         self._prefix_cache[cache_key] = prefix_result
+        if disk_key is not None:
+            self._disk_cache.put(disk_key, prefix_result)
 
         return prefix_result
 
@@ -9,6 +9,7 @@ v0.6.0: Added best-so-far preservation (Issue #9)
 - Fixes issue where aggressive death pruning eliminates all paths
 """
 
+from multiprocessing import Pool
 from typing import List, Optional, Tuple, Dict, Any
 import numpy as np
 
@@ -24,6 +25,7 @@ from ...epistemic_agent.governance import (
 )
 from .types import BeamNode, BeamSearchResult, PrefixRolloutResult
 from .runner import Phase5EpisodeRunner
+from .parallel import init_rollout_worker, prefetch_rollouts
 from .action_bias import ActionIntent, classify_action_intent, compute_action_bias
 
 class BeamSearch:
@@ -45,7 +47,9 @@ class BeamSearch:
         w_viability: float = 0.5,      # Penalize death
         w_interventions: float = 0.1,  # Small penalty for interventions
         # Action space
-        dose_levels: Optional[List[float]] = None
+        dose_levels: Optional[List[float]] = None,
+        # Parallel expansion
+        n_workers: int = 1
     ):
         """
         Initialize beam search.
@@ -58,6 +62,8 @@ class BeamSearch:
             w_viability: Heuristic weight for viability
             w_confidence: Heuristic weight for classifier confidence
             w_interventions: Heuristic penalty for interventions
+            n_workers: Processes for successor prefix rollouts (1 = sequential).
+                Requires a Phase5EpisodeRunner; results are identical to sequential.
         """
         self.runner = runner
         self.beam_width = beam_width
@@ -88,6 +94,7 @@ class BeamSearch:
 
         # Action space (configurable for speed testing)
         self.dose_levels = dose_levels if dose_levels is not None else [0.0, 0.25, 0.5, 1.0]
+        self.n_workers = n_workers
 
         # Stats
         self.nodes_expanded = 0
@@ -116,6 +123,25 @@ class BeamSearch:
         # Initialize beam with root node
         beam = [BeamNode(t_step=0, schedule=[])]
 
+        pool = None
+        if self.n_workers > 1 and isinstance(self.runner, Phase5EpisodeRunner):
+            pool = Pool(
+                processes=self.n_workers,
+                initializer=init_rollout_worker,
+                initargs=(self.runner.worker_config(),)
+            )
+
+        try:
+            beam = self._run_levels(beam, compound, pool)
+        finally:
+            if pool is not None:
+                pool.close()
+                pool.join()
+
+        return self._finalize(beam, compound_id)
+
+    def _run_levels(self, beam: List[BeamNode], compound, pool) -> List[BeamNode]:
+        """Expand the beam level by level; returns the final beam."""
         # v0.6.0: Best-so-far preservation (Issue #9)
         # Track the best node seen so far to avoid losing all good paths
         best_so_far: Optional[BeamNode] = None
@@ -124,6 +150,9 @@ class BeamSearch:
         for t in range(self.runner.n_steps):
             new_beam = []
 
+            if pool is not None:
+                self._prefetch_level(pool, beam, t)
+
             for node in beam:
                 if node.t_step != t:
                     continue  # Skip nodes from different timestep
@@ -171,6 +200,22 @@ class BeamSearch:
                 else:
                     raise RuntimeError(f"Beam empty at t={t}. All paths pruned.")
 
+        return beam
+
+    def _prefetch_level(self, pool, beam: List[BeamNode], t: int) -> None:
+        """Compute this level's CONTINUE successor rollouts in the process pool."""
+        schedules = []
+        for node in beam:
+            if node.t_step != t or node.is_terminal:
+                continue
+            for action in self._legal_actions(node):
+                if node.washout_count + node.feed_count + int(action.washout) + int(action.feed) > self.max_interventions:
+                    continue
+                schedules.append(node.schedule + [action])
+        prefetch_rollouts(pool, self.runner, schedules)
+
+    def _finalize(self, beam: List[BeamNode], compound_id: str) -> BeamSearchResult:
+        """Score terminal nodes and build the result."""
         # All nodes should be at t=n_steps now
         # Compute terminal rewards and select best
         terminal_nodes = []
@@ -378,27 +423,33 @@ class BeamSearch:
                 logger.error(f"Failed to compute prefix_current for node at t={node.t_step}: {e}", exc_info=True)
             return False
 
-    def _generate_continue_successors(self, node: BeamNode) -> List[BeamNode]:
-        """Generate CONTINUE successors by trying all legal action combinations."""
-        successors = []
+    def _legal_actions(self, node: BeamNode) -> List[Action]:
+        """All dose/washout/feed combinations legal after node's schedule."""
         has_dosed = any(a.dose_fraction > 0 for a in node.schedule)
-
-        # Compute action bias from governance blockers (if in NO_COMMIT state)
-        action_bias = self._compute_action_bias(node, has_dosed)
-
+        actions = []
         for dose_level in self.dose_levels:
             for washout in [False, True]:
                 for feed in [False, True]:
                     # Skip illegal actions
                     if washout and not has_dosed:
                         continue
+                    actions.append(Action(dose_fraction=dose_level, washout=washout, feed=feed))
+        return actions
 
-                    action = Action(dose_fraction=dose_level, washout=washout, feed=feed)
-                    successor = self._try_create_continue_node(
-                        node, action, has_dosed, action_bias
-                    )
-                    if successor is not None:
-                        successors.append(successor)
+    def _generate_continue_successors(self, node: BeamNode) -> List[BeamNode]:
+        """Generate CONTINUE successors by trying all legal action combinations."""
+        successors = []
+        has_dosed = any(a.dose_fraction > 0 for a in node.schedule)
+
+        # Compute action bias from governance blockers (if in NO_COMMIT state)
+        action_bias = self._compute_action_bias(node, has_dosed)
+
+        for action in self._legal_actions(node):
+            successor = self._try_create_continue_node(
+                node, action, has_dosed, action_bias
+            )
+            if successor is not None:
+                successors.append(successor)
 
         return successors
 
@@ -60,13 +60,15 @@ Last major semantic fixes: 2025-12-20 10:09:11 PST
 - Fixed washout contamination (now actually affects measurements)
 """
 
+import copy
 import logging
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import numpy as np
-import yaml  # Still needed for nested CellROX/segmentation params (TODO: migrate to database)
 
 # Import conservation contract for runtime enforcement
 from cell_os.contracts import conserved_death
@@ -89,6 +91,9 @@ from .injection_manager import InjectionManager
 # Import OperationScheduler for Injection B (Operation Scheduling)
 from .operation_scheduler import OperationScheduler
 
+# Parsed-YAML parameter registry (one parse per process, on-disk pickle cache)
+from .param_registry import load_yaml_params, load_yaml_params_copy
+
 # Import run context for Phase 5B realism layer
 from .run_context import RunContext, pipeline_transform, sample_plating_context
 
@@ -109,7 +114,114 @@ except ImportError:
 # Module-level cache for simulation parameters (loaded once per process)
 # This avoids redundant database loads when running many wells in parallel
 _SIMULATION_PARAMS_CACHE: dict | None = None
-_THALAMUS_PARAMS_CACHE: dict | None = None
+
+
+# Fields copied from CellLineParams into cell_line_params[cell_line]
+_CELL_LINE_PARAM_FIELDS = (
+    "doubling_time_h",
+    "max_confluence",
+    "max_passage",
+    "senescence_rate",
+    "seeding_efficiency",
+    "passage_stress",
+    "cell_count_cv",
+    "viability_cv",
+    "biological_cv",
+    "coating_required",
+)
+
+_DEFAULT_PARAM_NAMES = (
+    "doubling_time_h",
+    "max_confluence",
+    "max_passage",
+    "senescence_rate",
+    "seeding_efficiency",
+    "passage_stress",
+    "cell_count_cv",
+    "viability_cv",
+    "biological_cv",
+    "default_ic50",
+    "default_hill_slope",
+    "lag_duration_h",
+    "edge_penalty",
+)
+
+# Fingerprinted into the parameter snapshot: editing the copied fields
+# invalidates snapshots written by older code
+_SNAPSHOT_LAYOUT = {
+    "cell_line_fields": _CELL_LINE_PARAM_FIELDS,
+    "default_names": _DEFAULT_PARAM_NAMES,
+}
+
+
+def _query_simulation_params(db: "SimulationParamsRepository") -> dict:
+    """Load cell lines, sensitivities and defaults with a few set-based queries."""
+    cell_line_params = {
+        cell_line_id: {field: getattr(params, field) for field in _CELL_LINE_PARAM_FIELDS}
+        for cell_line_id, params in db.get_all_cell_line_params().items()
+    }
+
+    # Rows arrive ordered by (compound, cell line): the first row per compound
+    # supplies hill_slope, as in the original per-pair loop
+    compound_sensitivity: dict[str, dict[str, float]] = {}
+    for sensitivity in db.get_all_compound_sensitivities():
+        data = compound_sensitivity.setdefault(sensitivity.compound_id, {})
+        data[sensitivity.cell_line_id] = sensitivity.ic50_um
+        if "hill_slope" not in data:
+            data["hill_slope"] = sensitivity.hill_slope
+
+    all_defaults = db.get_default_params()
+    defaults = {name: all_defaults[name] for name in _DEFAULT_PARAM_NAMES if all_defaults.get(name) is not None}
+
+    # Verify database is complete
+    if not cell_line_params:
+        raise ValueError("Database contains no cell lines. Run database migrations.")
+    if not compound_sensitivity:
+        raise ValueError("Database contains no compounds. Run database migrations.")
+    if not defaults:
+        raise ValueError("Database contains no defaults. Check SimulationParamsRepository.")
+
+    return {
+        "cell_line_params": cell_line_params,
+        "compound_sensitivity": compound_sensitivity,
+        "defaults": defaults,
+    }
+
+
+def load_simulation_params() -> dict:
+    """
+    Simulation parameters for this process (cell lines, sensitivities, defaults).
+
+    Resolution order:
+    1. Module-level cache (also inherited by forked workers)
+    2. Versioned snapshot beside the database (no queries), valid while the
+       database file, DEFAULT_PARAMS and _SNAPSHOT_LAYOUT are unchanged
+    3. Bulk database queries, then written back as the snapshot
+
+    Call before creating a process pool so fork-started workers start warm.
+    """
+    global _SIMULATION_PARAMS_CACHE
+
+    if _SIMULATION_PARAMS_CACHE is not None:
+        return _SIMULATION_PARAMS_CACHE
+
+    db = SimulationParamsRepository()
+    params = db.load_snapshot(_SNAPSHOT_LAYOUT)
+    if params is None:
+        logger.info("Loading parameters from database")
+        params = _query_simulation_params(db)
+        db.write_snapshot(params, _SNAPSHOT_LAYOUT)
+    else:
+        logger.debug(f"Loaded simulation parameter snapshot: {db.snapshot_path}")
+
+    # Cache for subsequent BVM instances in this process
+    _SIMULATION_PARAMS_CACHE = params
+
+    logger.info("✅ Loaded simulation parameters (cached for this process)")
+    logger.info(f"  Cell lines: {len(params['cell_line_params'])}")
+    logger.info(f"  Compounds: {len(params['compound_sensitivity'])}")
+    return params
+
 
 # Import assay simulators
 # Note: Mechanism-specific parameters (ER_STRESS_K_ON, etc.) are now imported
@@ -122,9 +234,14 @@ from .assays import CellPaintingAssay, CytotoxAssay, ScRNASeqAssay, Supplemental
 from .constants import (
     # Baseline viability dynamics
     BASELINE_DEATH_RATE_PER_H,
+    CONTACT_PRESSURE_C0,
+    CONTACT_PRESSURE_TAU_H,
+    CONTACT_PRESSURE_WIDTH,
     # Death accounting
     DEATH_EPS,
     DEFAULT_DOUBLING_TIME_H,
+    DEFAULT_EVAPORATION_RATE_UL_PER_H,
+    EDGE_EVAPORATION_MULTIPLIER,
     ENABLE_CONTINUOUS_SUBTHRESHOLD_COST,
     ENABLE_DNA_DAMAGE,
     ENABLE_ER_STRESS,
@@ -143,6 +260,7 @@ from .constants import (
     SYNERGY_GATE_S0,
     SYNERGY_K_HAZARD,
     TRACKED_DEATH_FIELDS,
+    VESSEL_EVAPORATION_RATES_UL_PER_H,
     WASHOUT_CONTAMINATION_RISK,
     WASHOUT_INTENSITY_RECOVERY_H,
     WASHOUT_TIME_COST_H,
@@ -151,6 +269,7 @@ from .constants import (
     DEFAULT_MEDIA_GLUTAMINE_mM,
 )
 from .stochastic_biology import extract_plate_id_defensive
+from .vessel_batch import BatchedVesselEngine
 
 # Import stress mechanism simulators
 from .stress_mechanisms import (
@@ -493,6 +612,27 @@ class VesselState:
         return max(0.0, float(self.last_update_time) - float(self.last_feed_time))
 
 
+@dataclass(frozen=True)
+class VMSnapshot:
+    """
+    Frozen copy of a BiologicalVirtualMachine at one instant.
+
+    Captures everything the VM owns: vessel states, InjectionManager,
+    OperationScheduler, RNG stream positions (all four ValidatedRNG streams),
+    run context, and per-run assay/mechanism caches. The captured VM is private;
+    every BiologicalVirtualMachine.from_snapshot() call returns an independent
+    copy, so one snapshot can seed any number of forks.
+
+    Contract: a VM restored from a snapshot and driven through the same
+    operations is bit-identical to the VM that produced the snapshot (and
+    therefore to a full replay from t=0).
+    """
+
+    simulated_time: float
+    vessel_ids: tuple[str, ...]
+    _vm: "BiologicalVirtualMachine" = field(repr=False, compare=False)
+
+
 class BiologicalVirtualMachine(VirtualMachine):
     """
     Enhanced VirtualMachine with biological simulation capabilities.
@@ -514,6 +654,8 @@ class BiologicalVirtualMachine(VirtualMachine):
         seed: int = 0,
         run_context: RunContext | None = None,
         bio_noise_config: dict | None = None,
+        batched_stepping: bool = False,
+        rng_guard_mode: str = "cached",
     ):
         """
         Initialize BiologicalVirtualMachine.
@@ -534,6 +676,13 @@ class BiologicalVirtualMachine(VirtualMachine):
                                   'plate_level_fraction': float
                               }
                               If None, defaults to {'enabled': False}.
+            batched_stepping: If True, advance_time steps all vessels in one vectorized
+                              pass (see vessel_batch.BatchedVesselEngine). Matches the
+                              scalar per-vessel path to numerical precision.
+            rng_guard_mode: ValidatedRNG enforcement mode for all four streams
+                            ("strict", "cached", "off"; see rng_guard.GUARD_MODES).
+                            "cached" checks each call-site once and enforces the
+                            same contract as "strict".
 
                   Seed contract:
                   - seed=0 → Fully deterministic (physics + measurements)
@@ -545,9 +694,39 @@ class BiologicalVirtualMachine(VirtualMachine):
                   Never hack around this by conditionally consuming RNG.
         """
         super().__init__(simulation_speed=simulation_speed)
+        self.use_database = use_database and DB_AVAILABLE
+
+        # Run-scoped state (vessels, RNG streams, context, injection/scheduler).
+        # Everything here is rebuilt by reset(); loaded parameters are not.
+        self._seed = seed
+        self._rng_guard_mode = rng_guard_mode
+        self._bio_noise_config = bio_noise_config
+        self._init_run_state(seed, run_context, bio_noise_config, rng_guard_mode)
+
+        self._load_parameters(params_file)
+        self._load_raw_yaml_for_nested_params(
+            params_file
+        )  # Load nested params for CellROX/segmentation
+
+        self._init_simulators()
+
+        # Phase 2D.1: Load contamination config (if operational events enabled)
+        self.contamination_config = None
+        # Will be populated after thalamus_params load in _load_cell_thalamus_params()
+
+        # Optional struct-of-arrays engine for plate-scale stepping (None = scalar loop)
+        self.batched_engine = BatchedVesselEngine(self) if batched_stepping else None
+
+    def _init_run_state(
+        self,
+        seed: int,
+        run_context: RunContext | None,
+        bio_noise_config: dict | None,
+        rng_guard_mode: str,
+    ) -> None:
+        """Initialize per-run state: vessels, clock, run context, RNG streams, injection spine."""
         self.vessel_states: dict[str, VesselState] = {}
         self.simulated_time = 0.0
-        self.use_database = use_database and DB_AVAILABLE
 
         # v3: Exposure ID counter for commitment delay cache keys
         # Monotonic integer ensures no float collision issues
@@ -580,6 +759,7 @@ class BiologicalVirtualMachine(VirtualMachine):
             stream_name="growth",
             allowed_patterns={"_update_vessel_growth", "_divide", "_seed"},
             enforce=True,
+            mode=rng_guard_mode,
         )
 
         # Treatment RNG: Biological variability in compound effects
@@ -595,6 +775,7 @@ class BiologicalVirtualMachine(VirtualMachine):
                 "_sample_commitment_delays_for_treatment",
             },
             enforce=True,
+            mode=rng_guard_mode,
         )
 
         # Assay RNG: Measurement noise only (must not affect biology)
@@ -615,8 +796,10 @@ class BiologicalVirtualMachine(VirtualMachine):
                 "_sample_gene_expression",
                 "_ensure_well_biology",
                 "_add_technical_noise",
+                "_draw_technical_noise_shocks",
             },
             enforce=True,
+            mode=rng_guard_mode,
         )
 
         # Operations RNG: Operational randomness (contamination, errors)
@@ -633,6 +816,7 @@ class BiologicalVirtualMachine(VirtualMachine):
                 "_add_media",
             },
             enforce=True,
+            mode=rng_guard_mode,
         )
 
         # Injection A: Initialize InjectionManager (authoritative concentration spine)
@@ -648,11 +832,8 @@ class BiologicalVirtualMachine(VirtualMachine):
             bio_noise_config = {"enabled": False}
         self.stochastic_biology = StochasticBiologyHelper(bio_noise_config, seed)
 
-        self._load_parameters(params_file)
-        self._load_raw_yaml_for_nested_params(
-            params_file
-        )  # Load nested params for CellROX/segmentation
-
+    def _init_simulators(self) -> None:
+        """Initialize assay and stress mechanism simulators (hold per-run caches)."""
         # Initialize assay simulators
         self._cell_painting_assay = CellPaintingAssay(self)
         self._cytotox_assay = CytotoxAssay(self)
@@ -667,14 +848,40 @@ class BiologicalVirtualMachine(VirtualMachine):
         self._mitotic_catastrophe = MitoticCatastropheMechanism(self)
         self._dna_damage = DNADamageMechanism(self)
 
-        # Phase 2D.1: Load contamination config (if operational events enabled)
-        self.contamination_config = None
-        # Will be populated after thalamus_params load in _load_cell_thalamus_params()
+    def reset(
+        self,
+        seed: int | None = None,
+        run_context: RunContext | None = None,
+        bio_noise_config: dict | None = None,
+    ) -> None:
+        """
+        Return to the state of a freshly constructed VM, keeping loaded parameters.
+
+        Clears vessels, clock, scheduler and InjectionManager state, re-seeds all RNG
+        streams, re-samples the run context and rebuilds assay/mechanism simulators.
+        Parameter tables (database, YAML, thalamus params) are kept, which is what makes
+        this much cheaper than constructing a new VM. A reset VM is indistinguishable
+        from BiologicalVirtualMachine(seed=seed, ...) built with the same settings.
+
+        Args:
+            seed: New run seed (default: the seed this VM was constructed with)
+            run_context: Optional RunContext (default: sampled from seed, as in __init__)
+            bio_noise_config: Intrinsic biology config (default: construction config)
+        """
+        if seed is None:
+            seed = self._seed
+        if bio_noise_config is None:
+            bio_noise_config = self._bio_noise_config
+        self._seed = seed
+        self._bio_noise_config = bio_noise_config
+
+        self._init_run_state(seed, run_context, bio_noise_config, self._rng_guard_mode)
+        self._init_simulators()
+        if self.batched_engine is not None:
+            self.batched_engine = BatchedVesselEngine(self)
 
     def _load_parameters(self, params_file: str | None = None):
         """Load simulation parameters from database."""
-        global _SIMULATION_PARAMS_CACHE
-
         # Check module-level cache first (avoids redundant loads in parallel execution)
         if _SIMULATION_PARAMS_CACHE is not None:
             self.cell_line_params = _SIMULATION_PARAMS_CACHE["cell_line_params"]
@@ -693,86 +900,10 @@ class BiologicalVirtualMachine(VirtualMachine):
             self.use_database = True
 
         try:
-            db = SimulationParamsRepository()
-            logger.info("Loading parameters from database")
-
-            # Load cell line parameters
-            self.cell_line_params = {}
-            for cell_line_id in db.get_all_cell_lines():
-                params = db.get_cell_line_params(cell_line_id)
-                if params:
-                    self.cell_line_params[cell_line_id] = {
-                        "doubling_time_h": params.doubling_time_h,
-                        "max_confluence": params.max_confluence,
-                        "max_passage": params.max_passage,
-                        "senescence_rate": params.senescence_rate,
-                        "seeding_efficiency": params.seeding_efficiency,
-                        "passage_stress": params.passage_stress,
-                        "cell_count_cv": params.cell_count_cv,
-                        "viability_cv": params.viability_cv,
-                        "biological_cv": params.biological_cv,
-                        "coating_required": params.coating_required,
-                    }
-
-            # Load compound sensitivity
-            self.compound_sensitivity: dict[str, dict[str, float]] = {}
-            for compound in db.get_all_compounds():
-                self.compound_sensitivity[compound] = {}
-                for cell_line_id in db.get_all_cell_lines():
-                    sensitivity = db.get_compound_sensitivity(compound, cell_line_id)
-                    if sensitivity:
-                        self.compound_sensitivity[compound][cell_line_id] = sensitivity.ic50_um
-                        if "hill_slope" not in self.compound_sensitivity[compound]:
-                            self.compound_sensitivity[compound][
-                                "hill_slope"
-                            ] = sensitivity.hill_slope
-
-            # Drop compounds that never returned any sensitivity rows
-            self.compound_sensitivity = {
-                compound: data
-                for compound, data in self.compound_sensitivity.items()
-                if any(key != "hill_slope" for key in data.keys())
-            }
-
-            # Load defaults
-            self.defaults = {}
-            for param_name in [
-                "doubling_time_h",
-                "max_confluence",
-                "max_passage",
-                "senescence_rate",
-                "seeding_efficiency",
-                "passage_stress",
-                "cell_count_cv",
-                "viability_cv",
-                "biological_cv",
-                "default_ic50",
-                "default_hill_slope",
-                "lag_duration_h",
-                "edge_penalty",
-            ]:
-                value = db.get_default_param(param_name)
-                if value is not None:
-                    self.defaults[param_name] = value
-
-            # Verify database is complete
-            if not self.cell_line_params:
-                raise ValueError("Database contains no cell lines. Run database migrations.")
-            if not self.compound_sensitivity:
-                raise ValueError("Database contains no compounds. Run database migrations.")
-            if not self.defaults:
-                raise ValueError("Database contains no defaults. Check SimulationParamsRepository.")
-
-            # Cache for subsequent BVM instances in this process
-            _SIMULATION_PARAMS_CACHE = {
-                "cell_line_params": self.cell_line_params,
-                "compound_sensitivity": self.compound_sensitivity,
-                "defaults": self.defaults,
-            }
-
-            logger.info("✅ Loaded parameters from database (cached for this process)")
-            logger.info(f"  Cell lines: {len(self.cell_line_params)}")
-            logger.info(f"  Compounds: {len(self.compound_sensitivity)}")
+            params = load_simulation_params()
+            self.cell_line_params = params["cell_line_params"]
+            self.compound_sensitivity = params["compound_sensitivity"]
+            self.defaults = params["defaults"]
 
         except Exception as e:
             logger.error(f"Failed to load parameters from database: {e}")
@@ -866,8 +997,11 @@ class BiologicalVirtualMachine(VirtualMachine):
         # 3. Step vessels over interval (mirror from InjectionManager, run biology)
         # CRITICAL: Keep simulated_time at t0 during stepping so "time since X" calculations
         # use START of interval, not end. This preserves [t0, t1) semantics.
-        for vessel in self.vessel_states.values():
-            self._step_vessel(vessel, hours)
+        if self.batched_engine is not None and self.batched_engine.can_step():
+            self.batched_engine.step(hours)
+        else:
+            for vessel in self.vessel_states.values():
+                self._step_vessel(vessel, hours)
 
         # 4. Advance clock to end of interval (AFTER vessel stepping)
         # Agent 1: Assert time monotonicity (fundamental causality invariant)
@@ -3098,6 +3232,45 @@ class BiologicalVirtualMachine(VirtualMachine):
 
         return audit
 
+    def fork(self) -> "BiologicalVirtualMachine":
+        """Return an independent copy of this VM that continues from the current state.
+
+        The fork shares nothing mutable with the parent: advancing, treating or
+        measuring one never perturbs the other (including RNG stream positions).
+        """
+        return copy.deepcopy(self)
+
+    def snapshot(self) -> VMSnapshot:
+        """Capture the full simulation state for later restore or branching.
+
+        Used by beam search so each node extends its parent's snapshot by one step
+        instead of replaying the whole prefix from t=0.
+
+        Returns:
+            VMSnapshot (immutable; restore with BiologicalVirtualMachine.from_snapshot)
+        """
+        return VMSnapshot(
+            simulated_time=self.simulated_time,
+            vessel_ids=tuple(self.vessel_states),
+            _vm=self.fork(),
+        )
+
+    @classmethod
+    def from_snapshot(cls, snapshot: VMSnapshot) -> "BiologicalVirtualMachine":
+        """Restore a live VM from a snapshot (the snapshot stays reusable).
+
+        Args:
+            snapshot: VMSnapshot from vm.snapshot()
+
+        Returns:
+            New BiologicalVirtualMachine positioned exactly at the snapshot
+        """
+        if not isinstance(snapshot._vm, cls):
+            raise TypeError(
+                f"Snapshot holds {type(snapshot._vm).__name__}, cannot restore as {cls.__name__}"
+            )
+        return snapshot._vm.fork()
+
     def get_biology_random_effects_summary(self) -> dict[str, Any]:
         """
         Export intrinsic biology random effects values for variance provenance analysis.
@@ -3278,8 +3451,8 @@ class BiologicalVirtualMachine(VirtualMachine):
             return
 
         try:
-            with open(yaml_path) as f:
-                self.raw_yaml_data = yaml.safe_load(f)
+            # Shared read-only view: parsed once per process (see param_registry)
+            self.raw_yaml_data = load_yaml_params(yaml_path) or {}
             logger.debug("Loaded YAML for nested CellROX/segmentation parameters")
         except Exception as e:
             logger.warning(f"Failed to load nested params from YAML: {e}")
@@ -3423,28 +3596,19 @@ class BiologicalVirtualMachine(VirtualMachine):
 
     def _load_cell_thalamus_params(self):
         """Load Cell Thalamus parameters for morphology simulation."""
-        global _THALAMUS_PARAMS_CACHE
-
-        # Check module-level cache first (avoids redundant file loads in parallel execution)
-        if _THALAMUS_PARAMS_CACHE is not None:
-            self.thalamus_params = _THALAMUS_PARAMS_CACHE
-            logger.debug("Using cached Cell Thalamus parameters")
-        else:
-            thalamus_params_file = (
-                Path(__file__).parent.parent.parent.parent / "data" / "cell_thalamus_params.yaml"
-            )
-
-            if not thalamus_params_file.exists():
-                logger.warning(f"Cell Thalamus params not found: {thalamus_params_file}")
-                self.thalamus_params = None
-                return
+        thalamus_params_file = (
+            Path(__file__).parent.parent.parent.parent / "data" / "cell_thalamus_params.yaml"
+        )
 
-            with open(thalamus_params_file) as f:
-                self.thalamus_params = yaml.safe_load(f)
+        if not thalamus_params_file.exists():
+            logger.warning(f"Cell Thalamus params not found: {thalamus_params_file}")
+            self.thalamus_params = None
+            return
 
-            # Cache for subsequent BVM instances in this process
-            _THALAMUS_PARAMS_CACHE = self.thalamus_params
-            logger.info("Loaded Cell Thalamus parameters (cached for this process)")
+        # Parsed once per process by the registry; each VM gets a private copy
+        # so per-VM overrides (calibration, tests) never leak into other VMs
+        self.thalamus_params = load_yaml_params_copy(thalamus_params_file)
+        logger.debug("Loaded Cell Thalamus parameters")
 
         # Phase 2D.1: Load contamination config (if operational events enabled)
         if self.thalamus_params:
@@ -3481,6 +3645,34 @@ class BiologicalVirtualMachine(VirtualMachine):
             return {"status": "error", "message": "Vessel not found"}
         return self._cell_painting_assay.measure(self.vessel_states[vessel_id], **kwargs)
 
+    def cell_painting_assay_batch(
+        self, vessel_ids: Sequence[str], **kwargs
+    ) -> dict[str, Any]:
+        """
+        Simulate Cell Painting on many vessels in one plate read.
+
+        Columnar counterpart of cell_painting_assay(): morphology comes back as an
+        (n_wells × 5) array in result["channels"] order, and every per-well field is
+        an array or list aligned with result["vessel_ids"]. Row i is bit-identical to
+        cell_painting_assay(vessel_ids[i], well_position=well_positions[i], **kwargs)
+        run for each vessel in order.
+
+        Args:
+            vessel_ids: Vessel identifiers (read in this order)
+            **kwargs: well_positions (one per vessel) plus the shared plate context
+                (plate_id, batch_id, day, operator, ...)
+
+        Returns:
+            Dict of columns with channel arrays and metadata
+        """
+        missing = [vid for vid in vessel_ids if vid not in self.vessel_states]
+        if missing:
+            logger.warning(f"Vessels not found: {missing}")
+            return {"status": "error", "message": f"Vessels not found: {missing}"}
+        return self._cell_painting_assay.measure_batch(
+            [self.vessel_states[vid] for vid in vessel_ids], **kwargs
+        )
+
     def cytotox_assay(self, vessel_id: str, **kwargs) -> dict[str, Any]:
         """
         Simulate cytotoxicity assay (kit-agnostic, supernatant-based).
@@ -3609,19 +3801,9 @@ class BiologicalVirtualMachine(VirtualMachine):
             return
 
         # Base evaporation rates by vessel type (µL/h)
-        base_evap_rates = {
-            "384-well": 0.75,  # High surface/volume ratio
-            "96-well": 0.45,
-            "24-well": 0.25,
-            "12-well": 0.20,
-            "6-well": 0.15,
-            "T25": 0.05,  # Low surface/volume ratio
-            "T75": 0.08,
-            "T175": 0.10,
-            "T225": 0.12,
-        }
-
-        base_rate_ul_per_h = base_evap_rates.get(vessel.vessel_type, 0.5)
+        base_rate_ul_per_h = VESSEL_EVAPORATION_RATES_UL_PER_H.get(
+            vessel.vessel_type, DEFAULT_EVAPORATION_RATE_UL_PER_H
+        )
 
         # Edge wells evaporate ~50% faster (temperature gradients, airflow)
         edge_multiplier = 1.0
@@ -3631,7 +3813,7 @@ class BiologicalVirtualMachine(VirtualMachine):
         if well_match:
             well_position = well_match.group(1)
             if self._is_edge_well(well_position):
-                edge_multiplier = 1.5
+                edge_multiplier = EDGE_EVAPORATION_MULTIPLIER
 
         # Calculate evaporation (convert µL/h to mL)
         evap_rate_ml_per_h = (base_rate_ul_per_h * edge_multiplier) / 1000.0
@@ -3680,9 +3862,9 @@ class BiologicalVirtualMachine(VirtualMachine):
             return  # No update for zero-time steps
 
         # Sigmoid parameters (can be moved to cell_line_params later)
-        c0 = 0.75
-        width = 0.08
-        tau_h = 12.0
+        c0 = CONTACT_PRESSURE_C0
+        width = CONTACT_PRESSURE_WIDTH
+        tau_h = CONTACT_PRESSURE_TAU_H
 
         # Current confluence (can exceed 1.0)
         c = vessel.cell_count / max(vessel.vessel_capacity, 1.0)
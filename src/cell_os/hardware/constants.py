@@ -41,6 +41,27 @@ SUBTHRESHOLD_STRESS_GROWTH_PENALTY = 0.50  # 50% growth reduction at S=1.0
 # This prevents "coarse actions change physics" exploit after stress→growth coupling
 INTERNAL_STRESS_TIMESTEP_H = 1.0  # Internal timestep for stress ODEs (hours)
 
+# Vessel evaporation (volume tracking, µL/h by vessel type)
+# Higher surface/volume ratio → faster loss; unknown types fall back to 0.5 µL/h
+VESSEL_EVAPORATION_RATES_UL_PER_H = {
+    "384-well": 0.75,  # High surface/volume ratio
+    "96-well": 0.45,
+    "24-well": 0.25,
+    "12-well": 0.20,
+    "6-well": 0.15,
+    "T25": 0.05,  # Low surface/volume ratio
+    "T75": 0.08,
+    "T175": 0.10,
+    "T225": 0.12,
+}
+DEFAULT_EVAPORATION_RATE_UL_PER_H = 0.5
+EDGE_EVAPORATION_MULTIPLIER = 1.5  # Edge wells evaporate ~50% faster
+
+# Contact pressure (lagged confluence state, can be moved to cell_line_params later)
+CONTACT_PRESSURE_C0 = 0.75  # Confluence midpoint
+CONTACT_PRESSURE_WIDTH = 0.08  # Sigmoid width
+CONTACT_PRESSURE_TAU_H = 12.0  # Time constant for lag
+
 # Feeding costs (prevents "feed every hour" dominant strategy)
 ENABLE_FEEDING_COSTS = True
 FEEDING_TIME_COST_H = 0.25  # Operator time per feed operation
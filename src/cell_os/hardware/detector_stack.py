@@ -14,7 +14,7 @@ This module is detector-only (no biology). Inputs are already-scaled signals
 """
 
 import numpy as np
-from typing import Dict, Any, TYPE_CHECKING, Tuple, Optional
+from typing import Dict, Any, Callable, List, TYPE_CHECKING, Tuple, Optional
 
 from ._impl import additive_floor_noise, apply_saturation, quantize_adc
 
@@ -86,28 +86,18 @@ def _compute_edge_distance(row: int, col: int, plate_format: int) -> float:
     return edge_distance
 
 
-def _apply_position_effects(
-    signal: Dict[str, float],
+def _position_shift(
     row: int,
     col: int,
     plate_format: int,
     realism_config: Dict[str, float]
-) -> Tuple[Dict[str, float], float]:
+) -> Tuple[Optional[float], float]:
     """
-    Apply position-dependent effects (row/col gradients + edge effects).
-
-    Pure geometric function - no RNG, fully deterministic from position.
-    Effects model illumination gradients, evaporation, temperature drift.
-
-    Args:
-        signal: Per-channel signal dict
-        row: Row index (0-indexed)
-        col: Col index (0-indexed)
-        plate_format: 96 or 384
-        realism_config: Config dict with position_row_bias_pct, position_col_bias_pct, edge_mean_shift_pct
+    Multiplicative position factor and edge distance for one well.
 
     Returns:
-        (modified_signal, edge_distance)
+        (total_shift, edge_distance); total_shift is None when all position
+        effects are disabled (signal passes through untouched)
     """
     # Extract config params (default to no effect)
     row_bias_pct = realism_config.get('position_row_bias_pct', 0.0)
@@ -117,7 +107,7 @@ def _apply_position_effects(
     # Early exit if all effects disabled
     if row_bias_pct == 0.0 and col_bias_pct == 0.0 and edge_shift_pct == 0.0:
         edge_distance = _compute_edge_distance(row, col, plate_format)
-        return signal, edge_distance
+        return None, edge_distance
 
     # Plate dimensions
     if plate_format == 384:
@@ -147,6 +137,36 @@ def _apply_position_effects(
     # Combined multiplicative factor
     total_shift = 1.0 + row_gradient + col_gradient + edge_shift
 
+    return total_shift, edge_distance
+
+
+def _apply_position_effects(
+    signal: Dict[str, float],
+    row: int,
+    col: int,
+    plate_format: int,
+    realism_config: Dict[str, float]
+) -> Tuple[Dict[str, float], float]:
+    """
+    Apply position-dependent effects (row/col gradients + edge effects).
+
+    Pure geometric function - no RNG, fully deterministic from position.
+    Effects model illumination gradients, evaporation, temperature drift.
+
+    Args:
+        signal: Per-channel signal dict
+        row: Row index (0-indexed)
+        col: Col index (0-indexed)
+        plate_format: 96 or 384
+        realism_config: Config dict with position_row_bias_pct, position_col_bias_pct, edge_mean_shift_pct
+
+    Returns:
+        (modified_signal, edge_distance)
+    """
+    total_shift, edge_distance = _position_shift(row, col, plate_format, realism_config)
+    if total_shift is None:
+        return signal, edge_distance
+
     # Apply to all channels
     modified_signal = {ch: val * total_shift for ch, val in signal.items()}
 
@@ -528,3 +548,156 @@ def _apply_quantization_step(
             quant_step[ch] = 0.0
 
     return morph, quant_step, is_quantized
+
+
+# Channel order of the columnar (n_wells × 5) signal arrays used by the batch stack
+CHANNELS = ('er', 'mito', 'nucleus', 'actin', 'rna')
+
+
+def apply_detector_stack_batch(
+    signal: np.ndarray,
+    detector_params: Dict[str, Any],
+    rng_detector_fn: Callable[[str], np.random.Generator],
+    well_positions: List[str],
+    plate_format: int = 384,
+    run_seed: int = 0,
+    realism_config: Optional[Dict[str, float]] = None
+) -> tuple[np.ndarray, Dict[str, Any]]:
+    """
+    Columnar apply_detector_stack for a plate of wells (Cell Painting configuration).
+
+    Same pipeline as apply_detector_stack with exposure_multiplier=1.0 and no
+    detector bias, applied to an (n_wells × 5) array in CHANNELS order. Every row
+    is bit-identical to the scalar stack for that well:
+    - Position shifts and edge distances use the scalar per-well formulas
+    - Saturation and quantization are vectorized (exact elementwise ops); only the
+      compressed knee region calls the scalar apply_saturation
+    - Per-well dedicated RNGs (additive floor, QC pathologies) are only created
+      when those layers are enabled, and draw in the scalar order
+
+    Args:
+        signal: (n_wells, 5) signal array (not modified)
+        detector_params: Detector configuration dict (technical_noise params)
+        rng_detector_fn: well_position → dedicated detector RNG (called only if
+            the additive floor is enabled)
+        well_positions: Well IDs, one per row
+        plate_format: Plate format for position effects (default 384)
+        run_seed: Run seed for QC pathology RNG
+        realism_config: Realism layer config (default None = clean profile)
+
+    Returns:
+        tuple: (measured_signal, detector_metadata) where detector_metadata holds
+            (n_wells, 5) arrays is_saturated, is_quantized, quant_step and
+            snr_floor_proxy (NaN where undefined), edge_distance (n_wells,),
+            qc_flags (list of dicts) and exposure_multiplier
+    """
+    morph = np.array(signal, dtype=float)
+    n_wells = morph.shape[0]
+    tech_noise = detector_params
+
+    if realism_config is None:
+        realism_config = {
+            'position_row_bias_pct': 0.0,
+            'position_col_bias_pct': 0.0,
+            'edge_mean_shift_pct': 0.0,
+            'edge_noise_multiplier': 1.0,
+            'outlier_rate': 0.0,
+        }
+
+    # 0. Position effects (per-well geometry, shared multiplicative factor per row)
+    positions = [_parse_well_position(wp) for wp in well_positions]
+    shifts = [_position_shift(row, col, plate_format, realism_config) for row, col in positions]
+    edge_distance = np.array([edge for _, edge in shifts], dtype=float)
+    if shifts and shifts[0][0] is not None:
+        morph *= np.array([shift for shift, _ in shifts], dtype=float)[:, None]
+
+    # 3. Additive floor (per-well dedicated RNG, edge-inflated sigma)
+    edge_noise_mult = realism_config.get('edge_noise_multiplier', 1.0)
+    sigmas = [tech_noise.get(f'additive_floor_sigma_{ch}', 0.0) for ch in CHANNELS]
+    if any(s > 0 for s in sigmas):
+        for i in range(n_wells):
+            rng_detector = rng_detector_fn(well_positions[i])
+            edge_noise_factor = 1.0 + (edge_noise_mult - 1.0) * edge_distance[i]
+            for c, base_sigma in enumerate(sigmas):
+                sigma = base_sigma * edge_noise_factor
+                if sigma > 0:
+                    noise = additive_floor_noise(rng_detector, sigma)
+                    morph[i, c] = max(0.0, morph[i, c] + noise)
+
+    snr_floor_proxy = np.full((n_wells, len(CHANNELS)), np.nan)
+    for c, sigma in enumerate(sigmas):
+        if sigma > 0:
+            snr_floor_proxy[:, c] = morph[:, c] / sigma
+
+    # 4. Saturation (vectorized regimes; scalar formula inside the knee)
+    knee_start_frac = tech_noise.get('saturation_knee_start_fraction', 0.85)
+    tau_frac = tech_noise.get('saturation_tau_fraction', 0.08)
+    is_saturated = np.zeros((n_wells, len(CHANNELS)), dtype=bool)
+    for c, ch in enumerate(CHANNELS):
+        ceiling = tech_noise.get(f'saturation_ceiling_{ch}', 0.0)
+        if ceiling <= 0:
+            continue
+        y = np.maximum(0.0, morph[:, c])
+        y_sat = np.where(y >= ceiling, ceiling, y)
+        for i in np.flatnonzero((y > knee_start_frac * ceiling) & (y < ceiling)):
+            y_sat[i] = apply_saturation(
+                y=float(y[i]), ceiling=ceiling, knee_start_frac=knee_start_frac, tau_frac=tau_frac
+            )
+        morph[:, c] = y_sat
+        is_saturated[:, c] = y_sat >= ceiling - 0.001
+
+    # 5. QC pathologies (per-well dedicated RNG, only when enabled)
+    if realism_config.get('outlier_rate', 0.0) <= 0.0:
+        qc_flags = [
+            {'is_outlier': False, 'pathology_type': None, 'affected_channel': None}
+            for _ in range(n_wells)
+        ]
+    else:
+        qc_flags = []
+        for i in range(n_wells):
+            row_signal = dict(zip(CHANNELS, morph[i].tolist()))
+            row_signal, flags = _apply_qc_pathologies(
+                row_signal, well_positions[i], run_seed, realism_config
+            )
+            morph[i] = [row_signal[ch] for ch in CHANNELS]
+            qc_flags.append(flags)
+
+    # 6. Quantization (vectorized round_half_up)
+    bits_default = int(tech_noise.get('adc_quant_bits_default', 0))
+    step_default = float(tech_noise.get('adc_quant_step_default', 0.0))
+    mode = tech_noise.get('adc_quant_rounding_mode', 'round_half_up')
+    quant_step = np.zeros((n_wells, len(CHANNELS)))
+    is_quantized = np.zeros((n_wells, len(CHANNELS)), dtype=bool)
+    for c, ch in enumerate(CHANNELS):
+        bits = int(tech_noise.get(f'adc_quant_bits_{ch}', bits_default))
+        step = float(tech_noise.get(f'adc_quant_step_{ch}', step_default))
+        ceiling = float(tech_noise.get(f'saturation_ceiling_{ch}', 0.0))
+        if not (bits > 0 or step > 0):
+            continue
+        if n_wells:
+            # Validates mode and bits/ceiling exactly like the scalar path
+            quantize_adc(y=0.0, step=step, bits=bits, ceiling=ceiling, mode=mode)
+        if bits > 0:
+            effective_step = ceiling / max((1 << bits) - 1, 1)
+        else:
+            effective_step = step
+        y = morph[:, c]
+        y = np.maximum(0.0, np.minimum(y, ceiling)) if ceiling > 0 else np.maximum(0.0, y)
+        y_q = np.floor(y / effective_step + 0.5) * effective_step
+        if ceiling > 0:
+            y_q = np.minimum(y_q, ceiling)
+        morph[:, c] = y_q
+        is_quantized[:, c] = True
+        quant_step[:, c] = effective_step
+
+    detector_metadata = {
+        'is_saturated': is_saturated,
+        'is_quantized': is_quantized,
+        'quant_step': quant_step,
+        'snr_floor_proxy': snr_floor_proxy,
+        'exposure_multiplier': 1.0,
+        'edge_distance': edge_distance,
+        'qc_flags': qc_flags,
+    }
+
+    return morph, detector_metadata
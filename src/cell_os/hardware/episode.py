@@ -11,11 +11,12 @@ Action space (discrete, 6h steps):
 Horizon: 48h = 8 steps (0h, 6h, 12h, 18h, 24h, 30h, 36h, 42h)
 """
 
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import List, Optional, Dict, Any, Tuple
 import numpy as np
 
-from .biological_virtual import BiologicalVirtualMachine
+from .biological_virtual import BiologicalVirtualMachine, VMSnapshot
 from .reward import compute_microtubule_mechanism_reward, EpisodeReceipt
 
 
@@ -99,7 +100,9 @@ class EpisodeRunner:
         seed: int = 42,
         lambda_dead: float = 2.0,
         lambda_ops: float = 0.1,
-        actin_threshold: float = 1.4
+        actin_threshold: float = 1.4,
+        use_snapshots: bool = True,
+        max_snapshots: int = 256
     ):
         """
         Initialize episode runner.
@@ -114,6 +117,11 @@ class EpisodeRunner:
             lambda_dead: Death penalty coefficient
             lambda_ops: Ops cost coefficient
             actin_threshold: Mechanism hit threshold
+            use_snapshots: If True, policies sharing a prefix fork the VM snapshot
+                at the end of that prefix instead of replaying it from t=0.
+                Results are bit-identical either way.
+            max_snapshots: Maximum number of prefix checkpoints kept; the least
+                recently used are evicted first (a later miss simply replays).
         """
         self.compound = compound
         self.reference_dose_uM = reference_dose_uM
@@ -124,6 +132,8 @@ class EpisodeRunner:
         self.lambda_dead = lambda_dead
         self.lambda_ops = lambda_ops
         self.actin_threshold = actin_threshold
+        self.use_snapshots = use_snapshots
+        self.max_snapshots = max_snapshots
 
         # Compute number of steps
         self.n_steps = int(horizon_h / step_h)
@@ -136,6 +146,102 @@ class EpisodeRunner:
         # Prevents re-simulating identical policies
         self._rollout_cache: Dict[Tuple, Tuple[EpisodeReceipt, List[EpisodeState]]] = {}
 
+        # Run checkpoints: keyed by action-prefix tuple, value is
+        # (VM snapshot after that step's measurement, baseline_actin, trajectory so far).
+        # LRU-ordered and capped at max_snapshots.
+        self._run_checkpoints: "OrderedDict[Tuple, Tuple[VMSnapshot, float, Tuple[EpisodeState, ...]]]" = OrderedDict()
+
+    @staticmethod
+    def _actions_key(actions: List[Action]) -> Tuple:
+        """Hashable key for an action sequence (or prefix)."""
+        return tuple((a.dose_fraction, a.washout, a.feed) for a in actions)
+
+    def _new_vm(self) -> BiologicalVirtualMachine:
+        """Fresh VM with the episode vessel seeded (t=0, nothing measured yet)."""
+        # simulation_speed=0 disables artificial hardware delays (rollouts are batch work)
+        vm = BiologicalVirtualMachine(seed=self.seed, simulation_speed=0)
+        vm.seed_vessel("episode", self.cell_line, 1e6, capacity=1e7, initial_viability=0.98)
+        return vm
+
+    def _treat(self, vm: BiologicalVirtualMachine, dose_uM: float) -> None:
+        """Dose the episode vessel (subclasses add compound scalars)."""
+        vm.treat_with_compound("episode", self.compound, dose_uM=dose_uM)
+
+    def _apply_action(self, vm: BiologicalVirtualMachine, action: Action) -> Tuple[int, int]:
+        """
+        Execute one action and advance one step.
+
+        Returns:
+            (washouts_performed, feeds_performed) for this step
+        """
+        vessel = vm.vessel_states["episode"]
+        washouts = 0
+        feeds = 0
+
+        # 1. Apply dose (if non-zero)
+        if action.dose_fraction > 0:
+            dose_uM = action.dose_fraction * self.reference_dose_uM
+
+            # Check if already dosed (don't re-dose if compound present)
+            if self.compound not in vessel.compounds or vessel.compounds[self.compound] == 0:
+                self._treat(vm, dose_uM)
+
+        # 2. Washout (if requested)
+        if action.washout:
+            if self.compound in vessel.compounds and vessel.compounds[self.compound] > 0:
+                vm.washout_compound("episode", self.compound)
+                washouts = 1
+
+        # 3. Feed (if requested)
+        if action.feed:
+            vm.feed_vessel("episode")
+            feeds = 1
+
+        # 4. Advance time by one step
+        vm.advance_time(self.step_h)
+
+        return washouts, feeds
+
+    def _restore_run_prefix(
+        self, actions_key: Tuple
+    ) -> Tuple[BiologicalVirtualMachine, float, List[EpisodeState]]:
+        """
+        Resume from the longest checkpointed prefix of actions_key.
+
+        Falls back to a fresh VM (seed + baseline measurement) when snapshots are
+        disabled or no prefix has been run yet.
+
+        Returns:
+            (vm, baseline_actin, trajectory) where len(trajectory) is the resume step
+        """
+        if self.use_snapshots:
+            for n in range(len(actions_key) - 1, 0, -1):
+                checkpoint = self._run_checkpoints.get(actions_key[:n])
+                if checkpoint is not None:
+                    self._run_checkpoints.move_to_end(actions_key[:n])
+                    snapshot, baseline_actin, trajectory = checkpoint
+                    return BiologicalVirtualMachine.from_snapshot(snapshot), baseline_actin, list(trajectory)
+
+        vm = self._new_vm()
+
+        # Measure baseline
+        baseline_result = vm.cell_painting_assay("episode")
+        baseline_actin = baseline_result['morphology_struct']['actin']
+        return vm, baseline_actin, []
+
+    def _store_run_checkpoint(
+        self, prefix_key: Tuple, checkpoint: Tuple[VMSnapshot, float, Tuple[EpisodeState, ...]]
+    ) -> None:
+        """Insert a checkpoint as most recently used, evicting the oldest beyond max_snapshots."""
+        self._run_checkpoints[prefix_key] = checkpoint
+        self._run_checkpoints.move_to_end(prefix_key)
+        while len(self._run_checkpoints) > self.max_snapshots:
+            self._run_checkpoints.popitem(last=False)
+
+    def clear_snapshots(self) -> None:
+        """Drop all VM checkpoints (result caches are kept)."""
+        self._run_checkpoints.clear()
+
     def _policy_to_cache_key(self, policy: Policy) -> Tuple:
         """
         Convert policy to cache key.
@@ -181,77 +287,48 @@ class EpisodeRunner:
         if cache_key in self._rollout_cache:
             return self._rollout_cache[cache_key]
 
-        # Cache miss: execute policy
-        # Initialize VM
-        vm = BiologicalVirtualMachine(seed=self.seed)
-        vm.seed_vessel("episode", self.cell_line, 1e6, capacity=1e7, initial_viability=0.98)
+        # Cache miss: execute policy (resuming from a shared prefix when possible)
+        actions_key = self._actions_key(policy.actions)
+        vm, baseline_actin, trajectory = self._restore_run_prefix(actions_key)
 
-        # Measure baseline
-        baseline_result = vm.cell_painting_assay("episode")
-        baseline_actin = baseline_result['morphology_struct']['actin']
-
-        # Trajectory tracking
-        trajectory = []
-        washout_count = 0
-        feed_count = 0
-
-        # State snapshots at 12h and 48h
-        actin_struct_12h = None
-        viability_48h = None
-
-        # Execute policy step by step
-        for step_idx, action in enumerate(policy.actions):
+        # Execute remaining steps
+        for step_idx in range(len(trajectory), self.n_steps):
             current_time = step_idx * self.step_h
+            prev = trajectory[-1] if trajectory else None
 
-            # Execute action
-            vessel = vm.vessel_states["episode"]
-
-            # 1. Apply dose (if non-zero)
-            if action.dose_fraction > 0:
-                dose_uM = action.dose_fraction * self.reference_dose_uM
-
-                # Check if already dosed (don't re-dose if compound present)
-                if self.compound not in vessel.compounds or vessel.compounds[self.compound] == 0:
-                    vm.treat_with_compound("episode", self.compound, dose_uM=dose_uM)
-
-            # 2. Washout (if requested)
-            if action.washout:
-                if self.compound in vessel.compounds and vessel.compounds[self.compound] > 0:
-                    vm.washout_compound("episode", self.compound)
-                    washout_count += 1
-
-            # 3. Feed (if requested)
-            if action.feed:
-                vm.feed_vessel("episode")
-                feed_count += 1
-
-            # 4. Advance time by one step
-            vm.advance_time(self.step_h)
+            washouts, feeds = self._apply_action(vm, policy.actions[step_idx])
 
             # 5. Measure state
+            vessel = vm.vessel_states["episode"]
             result = vm.cell_painting_assay("episode")
             morph_struct = result['morphology_struct']
-            actin_struct = morph_struct['actin']
-            transport_dysfunction = vessel.transport_dysfunction
-            viability = vessel.viability
 
             # Record trajectory
             state = EpisodeState(
                 time_h=current_time + self.step_h,
-                actin_struct=actin_struct,
+                actin_struct=morph_struct['actin'],
                 baseline_actin=baseline_actin,
-                transport_dysfunction=transport_dysfunction,
-                viability=viability,
-                washout_count=washout_count,
-                feed_count=feed_count
+                transport_dysfunction=vessel.transport_dysfunction,
+                viability=vessel.viability,
+                washout_count=(prev.washout_count if prev else 0) + washouts,
+                feed_count=(prev.feed_count if prev else 0) + feeds
             )
             trajectory.append(state)
 
-            # Capture snapshots at key timepoints
+            # Checkpoint every proper prefix (the full policy is covered by _rollout_cache)
+            if self.use_snapshots and step_idx + 1 < self.n_steps:
+                self._store_run_checkpoint(
+                    actions_key[:step_idx + 1], (vm.snapshot(), baseline_actin, tuple(trajectory))
+                )
+
+        # State snapshots at 12h and 48h
+        actin_struct_12h = None
+        viability_48h = None
+        for state in trajectory:
             if abs(state.time_h - self.measurement_time_12h) < 1e-6:
-                actin_struct_12h = actin_struct
+                actin_struct_12h = state.actin_struct
             if abs(state.time_h - self.measurement_time_48h) < 1e-6:
-                viability_48h = viability
+                viability_48h = state.viability
 
         # Compute reward
         if actin_struct_12h is None or viability_48h is None:
@@ -260,6 +337,8 @@ class EpisodeRunner:
                 f"Check that measurement times ({self.measurement_time_12h}h, {self.measurement_time_48h}h) "
                 f"align with step boundaries."
             )
+        washout_count = trajectory[-1].washout_count
+        feed_count = trajectory[-1].feed_count
 
         receipt = compute_microtubule_mechanism_reward(
             actin_struct_12h=actin_struct_12h,
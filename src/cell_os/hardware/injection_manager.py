@@ -6,13 +6,16 @@ Manages:
 - Nutrient concentrations (mM) in each vessel
 - Evaporation drift (volume shrink → concentration increase)
 
-Design: Event-driven with strict schema validation.
+Design: Event-driven with strict schema validation. Concentrations live in
+vessel × species arrays; per-vessel state is exposed as read-only views.
 """
 
-from dataclasses import dataclass, field
+from collections.abc import Mapping
 from typing import Dict, Any, Optional, Literal, List, Callable
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
 # Type aliases
@@ -31,29 +34,160 @@ class InjectionSchemaError(ValueError):
     pass
 
 
-@dataclass
+class _ConcentrationTable:
+    """
+    Vessel × species concentration matrix.
+
+    Rows are vessels, columns are species (compounds or nutrients) added on
+    first use. A presence mask keeps "absent" distinct from 0.0, and each row
+    remembers the insertion order of its species so dict views iterate
+    exactly like the per-vessel dicts they replace.
+    """
+
+    def __init__(self, n_rows: int = 0):
+        self.columns: Dict[str, int] = {}
+        self.names: List[str] = []
+        self.values = np.zeros((n_rows, 0))
+        self.present = np.zeros((n_rows, 0), dtype=bool)
+        self.order: List[List[int]] = [[] for _ in range(n_rows)]
+
+    def resize_rows(self, n_rows: int) -> None:
+        extra = n_rows - self.values.shape[0]
+        if extra <= 0:
+            return
+        self.values = np.vstack([self.values, np.zeros((extra, self.values.shape[1]))])
+        self.present = np.vstack([self.present, np.zeros((extra, self.present.shape[1]), dtype=bool)])
+        self.order.extend([] for _ in range(extra))
+
+    def _column(self, name: str) -> int:
+        col = self.columns.get(name)
+        if col is None:
+            col = self.columns[name] = len(self.names)
+            self.names.append(name)
+            self.values = np.hstack([self.values, np.zeros((self.values.shape[0], 1))])
+            self.present = np.hstack([self.present, np.zeros((self.present.shape[0], 1), dtype=bool)])
+        return col
+
+    def set(self, row: int, name: str, value: float) -> None:
+        col = self._column(name)
+        if not self.present[row, col]:
+            self.present[row, col] = True
+            self.order[row].append(col)
+        self.values[row, col] = value
+
+    def get(self, row: int, name: str, default: float = 0.0) -> float:
+        col = self.columns.get(name)
+        if col is None or not self.present[row, col]:
+            return default
+        return float(self.values[row, col])
+
+    def remove(self, row: int, name: str) -> bool:
+        col = self.columns.get(name)
+        if col is None or not self.present[row, col]:
+            return False
+        self.present[row, col] = False
+        self.values[row, col] = 0.0
+        self.order[row].remove(col)
+        return True
+
+    def clear_row(self, row: int) -> List[str]:
+        removed = [self.names[col] for col in self.order[row]]
+        self.values[row] = 0.0
+        self.present[row] = False
+        self.order[row] = []
+        return removed
+
+    def row_names(self, row: int) -> List[str]:
+        return [self.names[col] for col in self.order[row]]
+
+    def row_dict(self, row: int) -> Dict[str, float]:
+        values = self.values[row]
+        return {self.names[col]: float(values[col]) for col in self.order[row]}
+
+
+class _RowView(Mapping):
+    """Read-only live mapping over one row of a _ConcentrationTable."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: _ConcentrationTable, row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, name: str) -> float:
+        col = self._table.columns.get(name)
+        if col is None or not self._table.present[self._row, col]:
+            raise KeyError(name)
+        return float(self._table.values[self._row, col])
+
+    def __iter__(self):
+        return iter(self._table.row_names(self._row))
+
+    def __len__(self) -> int:
+        return len(self._table.order[self._row])
+
+    def __repr__(self) -> str:
+        return repr(self._table.row_dict(self._row))
+
+
+def _optional_time(value: float) -> Optional[float]:
+    return None if np.isnan(value) else float(value)
+
+
 class VesselExposureState:
     """
     Per-vessel exposure state tracking concentrations and drift.
 
-    Authoritative for what is currently in the vessel.
+    Authoritative for what is currently in the vessel. A read-only live view
+    over the InjectionManager's arrays: compounds_uM and nutrients_mM are
+    Mappings, and all changes go through events.
     """
-    vessel_id: str
+
+    __slots__ = ("_mgr", "_row", "vessel_id")
+
+    def __init__(self, mgr: "InjectionManager", row: int, vessel_id: str):
+        self._mgr = mgr
+        self._row = row
+        self.vessel_id = vessel_id
 
     # Current concentrations
-    compounds_uM: Dict[str, float] = field(default_factory=dict)
-    nutrients_mM: Dict[NutrientName, float] = field(default_factory=dict)
+    @property
+    def compounds_uM(self) -> Mapping:
+        return _RowView(self._mgr._compounds, self._row)
+
+    @property
+    def nutrients_mM(self) -> Mapping:
+        return _RowView(self._mgr._nutrients, self._row)
 
-    # Evaporation tracking
-    volume_mult: float = 1.0  # 1.0 = baseline, <1.0 = concentrated
+    # Evaporation tracking (1.0 = baseline, <1.0 = concentrated)
+    @property
+    def volume_mult(self) -> float:
+        return float(self._mgr._volume_mult[self._row])
 
     # Timestamps
-    last_event_time: float = 0.0
-    last_step_time: float = 0.0
+    @property
+    def last_event_time(self) -> float:
+        return float(self._mgr._last_event_time[self._row])
+
+    @property
+    def last_step_time(self) -> float:
+        return float(self._mgr._last_step_time[self._row])
 
     # Debug forensics
-    last_feed_time: Optional[float] = None
-    last_washout_time: Optional[float] = None
+    @property
+    def last_feed_time(self) -> Optional[float]:
+        return _optional_time(self._mgr._last_feed_time[self._row])
+
+    @property
+    def last_washout_time(self) -> Optional[float]:
+        return _optional_time(self._mgr._last_washout_time[self._row])
+
+    def __repr__(self) -> str:
+        return (
+            f"VesselExposureState(vessel_id={self.vessel_id!r}, "
+            f"compounds_uM={self.compounds_uM!r}, nutrients_mM={self.nutrients_mM!r}, "
+            f"volume_mult={self.volume_mult!r})"
+        )
 
 
 class InjectionManager:
@@ -62,6 +196,11 @@ class InjectionManager:
 
     Manages compound and nutrient concentrations with evaporation drift.
     All biology and assays must query this manager for current concentrations.
+
+    Storage is array-backed: a vessel × compound matrix, a vessel × nutrient
+    matrix and per-vessel vectors (volume_mult, evaporation rate, timestamps).
+    Edge status is resolved once when a vessel is seeded, and step() applies
+    evaporation to every vessel with a few NumPy operations.
     """
 
     def __init__(
@@ -86,7 +225,19 @@ class InjectionManager:
         self._edge_evap_rate_per_h = float(edge_evap_rate_per_h)
         self._min_volume_mult = float(min_volume_mult)
 
-        self._vessels: Dict[str, VesselExposureState] = {}
+        # Vessel rows (registration order)
+        self._rows: Dict[str, int] = {}
+        self._vessel_ids: List[str] = []
+        self._compounds = _ConcentrationTable()
+        self._nutrients = _ConcentrationTable()
+        self._volume_mult = np.zeros(0)
+        self._evap_rate_per_h = np.zeros(0)
+        self._is_edge = np.zeros(0, dtype=bool)
+        self._last_event_time = np.zeros(0)
+        self._last_step_time = np.zeros(0)
+        self._last_feed_time = np.zeros(0)
+        self._last_washout_time = np.zeros(0)
+
         self._seq: int = 0
         self._event_log: List[Dict[str, Any]] = []
 
@@ -94,38 +245,37 @@ class InjectionManager:
 
     def has_vessel(self, vessel_id: str) -> bool:
         """Check if vessel is tracked."""
-        return vessel_id in self._vessels
+        return vessel_id in self._rows
 
-    def get_state(self, vessel_id: str) -> VesselExposureState:
-        """Get exposure state for vessel."""
-        if vessel_id not in self._vessels:
+    def _row(self, vessel_id: str) -> int:
+        row = self._rows.get(vessel_id)
+        if row is None:
             raise KeyError(f"Vessel {vessel_id} not found in InjectionManager")
-        return self._vessels[vessel_id]
+        return row
+
+    def get_state(self, vessel_id: str) -> VesselExposureState:
+        """Get exposure state for vessel (read-only live view)."""
+        return VesselExposureState(self, self._row(vessel_id), vessel_id)
 
     def get_compound_concentration_uM(self, vessel_id: str, compound: str) -> float:
         """Get current concentration of compound in vessel (uM)."""
-        state = self.get_state(vessel_id)
-        return state.compounds_uM.get(compound, 0.0)
+        return self._compounds.get(self._row(vessel_id), compound)
 
     def get_all_compounds_uM(self, vessel_id: str) -> Dict[str, float]:
         """Get all current compound concentrations in vessel."""
-        state = self.get_state(vessel_id)
-        return state.compounds_uM.copy()
+        return self._compounds.row_dict(self._row(vessel_id))
 
     def get_nutrient_conc_mM(self, vessel_id: str, nutrient: NutrientName) -> float:
         """Get current concentration of nutrient in vessel (mM)."""
-        state = self.get_state(vessel_id)
-        return state.nutrients_mM.get(nutrient, 0.0)
+        return self._nutrients.get(self._row(vessel_id), nutrient)
 
     def get_all_nutrients_mM(self, vessel_id: str) -> Dict[NutrientName, float]:
         """Get all current nutrient concentrations in vessel."""
-        state = self.get_state(vessel_id)
-        return state.nutrients_mM.copy()
+        return self._nutrients.row_dict(self._row(vessel_id))
 
     def get_volume_mult(self, vessel_id: str) -> float:
         """Get current volume multiplier (1.0 = baseline, <1.0 = concentrated)."""
-        state = self.get_state(vessel_id)
-        return state.volume_mult
+        return float(self._volume_mult[self._row(vessel_id)])
 
     # ========== Event ingestion ==========
 
@@ -153,6 +303,33 @@ class InjectionManager:
         # Apply event
         self._apply_event(event)
 
+    def _register_vessel(self, vessel_id: str) -> int:
+        """Allocate a row for a new vessel (arrays grow by doubling)."""
+        row = len(self._vessel_ids)
+        if row == self._volume_mult.shape[0]:
+            capacity = max(8, 2 * row)
+            pad = capacity - row
+            self._volume_mult = np.concatenate([self._volume_mult, np.zeros(pad)])
+            self._evap_rate_per_h = np.concatenate([self._evap_rate_per_h, np.zeros(pad)])
+            self._is_edge = np.concatenate([self._is_edge, np.zeros(pad, dtype=bool)])
+            self._last_event_time = np.concatenate([self._last_event_time, np.zeros(pad)])
+            self._last_step_time = np.concatenate([self._last_step_time, np.zeros(pad)])
+            self._last_feed_time = np.concatenate([self._last_feed_time, np.full(pad, np.nan)])
+            self._last_washout_time = np.concatenate([self._last_washout_time, np.full(pad, np.nan)])
+            self._compounds.resize_rows(capacity)
+            self._nutrients.resize_rows(capacity)
+
+        self._rows[vessel_id] = row
+        self._vessel_ids.append(vessel_id)
+
+        # Edge status depends only on well position: resolve once
+        # Extract well position from vessel_id (assumes format like "Plate1_A01")
+        well_position = vessel_id.split('_')[-1] if '_' in vessel_id else vessel_id
+        is_edge = bool(self._is_edge_well_fn(well_position))
+        self._is_edge[row] = is_edge
+        self._evap_rate_per_h[row] = self._edge_evap_rate_per_h if is_edge else self._base_evap_rate_per_h
+        return row
+
     def _apply_event(self, event: Dict[str, Any]) -> None:
         """Apply validated event to vessel state."""
         event_type = event['event_type']
@@ -161,62 +338,62 @@ class InjectionManager:
         payload = event['payload']
 
         if event_type == 'SEED_VESSEL':
-            # Create new vessel exposure state
-            state = VesselExposureState(
-                vessel_id=vessel_id,
-                last_event_time=time_h,
-                last_step_time=time_h,
-            )
+            # Create new vessel exposure state (re-seeding resets the row)
+            row = self._rows.get(vessel_id)
+            if row is None:
+                row = self._register_vessel(vessel_id)
+            self._compounds.clear_row(row)
+            self._nutrients.clear_row(row)
+            self._volume_mult[row] = 1.0
+            self._last_event_time[row] = time_h
+            self._last_step_time[row] = time_h
+            self._last_feed_time[row] = np.nan
+            self._last_washout_time[row] = np.nan
 
             # Initialize nutrients from payload
             initial_nutrients = payload['initial_nutrients_mM']
-            state.nutrients_mM = {
-                'glucose': float(initial_nutrients.get('glucose', 0.0)),
-                'glutamine': float(initial_nutrients.get('glutamine', 0.0)),
-            }
+            self._nutrients.set(row, 'glucose', float(initial_nutrients.get('glucose', 0.0)))
+            self._nutrients.set(row, 'glutamine', float(initial_nutrients.get('glutamine', 0.0)))
 
-            self._vessels[vessel_id] = state
-            logger.debug(f"InjectionManager: seeded {vessel_id} with nutrients={state.nutrients_mM}")
+            logger.debug(f"InjectionManager: seeded {vessel_id} with nutrients={self._nutrients.row_dict(row)}")
 
         elif event_type == 'TREAT_COMPOUND':
             # Set compound concentration (overwrites if exists)
-            state = self.get_state(vessel_id)
+            row = self._row(vessel_id)
             compound = payload['compound']
             dose_uM = float(payload['dose_uM'])
 
-            state.compounds_uM[compound] = dose_uM
-            state.last_event_time = time_h
+            self._compounds.set(row, compound, dose_uM)
+            self._last_event_time[row] = time_h
             logger.debug(f"InjectionManager: treated {vessel_id} with {compound} @ {dose_uM} uM")
 
         elif event_type == 'FEED_VESSEL':
             # Update nutrient concentrations
-            state = self.get_state(vessel_id)
+            row = self._row(vessel_id)
             nutrients = payload['nutrients_mM']
 
-            state.nutrients_mM['glucose'] = float(nutrients.get('glucose', 0.0))
-            state.nutrients_mM['glutamine'] = float(nutrients.get('glutamine', 0.0))
-            state.last_event_time = time_h
-            state.last_feed_time = time_h
-            logger.debug(f"InjectionManager: fed {vessel_id} with nutrients={state.nutrients_mM}")
+            self._nutrients.set(row, 'glucose', float(nutrients.get('glucose', 0.0)))
+            self._nutrients.set(row, 'glutamine', float(nutrients.get('glutamine', 0.0)))
+            self._last_event_time[row] = time_h
+            self._last_feed_time[row] = time_h
+            logger.debug(f"InjectionManager: fed {vessel_id} with nutrients={self._nutrients.row_dict(row)}")
 
         elif event_type == 'WASHOUT_COMPOUND':
             # Remove compound(s)
-            state = self.get_state(vessel_id)
+            row = self._row(vessel_id)
             compound = payload.get('compound')
 
             if compound is None:
                 # Remove all compounds
-                removed = list(state.compounds_uM.keys())
-                state.compounds_uM.clear()
+                removed = self._compounds.clear_row(row)
                 logger.debug(f"InjectionManager: washed out all compounds from {vessel_id}: {removed}")
             else:
                 # Remove specific compound
-                if compound in state.compounds_uM:
-                    del state.compounds_uM[compound]
+                if self._compounds.remove(row, compound):
                     logger.debug(f"InjectionManager: washed out {compound} from {vessel_id}")
 
-            state.last_event_time = time_h
-            state.last_washout_time = time_h
+            self._last_event_time[row] = time_h
+            self._last_washout_time[row] = time_h
 
     # ========== Time evolution ==========
 
@@ -230,41 +407,33 @@ class InjectionManager:
             dt_h: Time interval (hours)
             now_h: Current simulated time (hours)
         """
-        for vessel_id, state in self._vessels.items():
-            # Determine evaporation rate based on well position
-            # Extract well position from vessel_id (assumes format like "Plate1_A01")
-            well_position = vessel_id.split('_')[-1] if '_' in vessel_id else vessel_id
-            is_edge = self._is_edge_well_fn(well_position)
-
-            evap_rate = self._edge_evap_rate_per_h if is_edge else self._base_evap_rate_per_h
-
-            # Update volume multiplier (capped at minimum)
-            prev_volume_mult = state.volume_mult
-            state.volume_mult = max(
-                self._min_volume_mult,
-                state.volume_mult * (1.0 - evap_rate * dt_h)
-            )
-
-            # Concentrate all compounds and nutrients
-            # concentration_new = concentration_old * (volume_old / volume_new)
-            #                    = concentration_old * (prev_mult / new_mult)
-            if state.volume_mult > 0 and prev_volume_mult > 0:
-                conc_mult = prev_volume_mult / state.volume_mult
-
-                # Concentrate compounds
-                for compound in state.compounds_uM:
-                    state.compounds_uM[compound] *= conc_mult
-
-                # Concentrate nutrients
-                for nutrient in state.nutrients_mM:
-                    state.nutrients_mM[nutrient] *= conc_mult
-
-            state.last_step_time = now_h
-
-            if is_edge and conc_mult > 1.01:  # Log significant concentration
+        n = len(self._vessel_ids)
+        if n == 0:
+            return
+
+        # Update volume multiplier (capped at minimum)
+        prev_volume_mult = self._volume_mult[:n].copy()
+        volume_mult = np.maximum(
+            self._min_volume_mult,
+            prev_volume_mult * (1.0 - self._evap_rate_per_h[:n] * dt_h)
+        )
+        self._volume_mult[:n] = volume_mult
+
+        # Concentrate all compounds and nutrients
+        # concentration_new = concentration_old * (volume_old / volume_new)
+        #                    = concentration_old * (prev_mult / new_mult)
+        valid = (volume_mult > 0) & (prev_volume_mult > 0)
+        conc_mult = np.divide(prev_volume_mult, volume_mult, out=np.ones(n), where=valid)
+        self._compounds.values[:n] *= conc_mult[:, None]
+        self._nutrients.values[:n] *= conc_mult[:, None]
+
+        self._last_step_time[:n] = now_h
+
+        if logger.isEnabledFor(logging.DEBUG):
+            for row in np.flatnonzero(self._is_edge[:n] & (conc_mult > 1.01)):  # Log significant concentration
                 logger.debug(
-                    f"InjectionManager: {vessel_id} (edge) concentrated {conc_mult:.3f}× "
-                    f"(volume_mult={state.volume_mult:.3f})"
+                    f"InjectionManager: {self._vessel_ids[row]} (edge) concentrated {conc_mult[row]:.3f}× "
+                    f"(volume_mult={volume_mult[row]:.3f})"
                 )
 
     # ========== Internal sync hook ==========
@@ -287,8 +456,9 @@ class InjectionManager:
             nutrients_mM: Updated nutrient concentrations
             now_h: Current simulated time
         """
-        state = self.get_state(vessel_id)
-        state.nutrients_mM.update(nutrients_mM)
+        row = self._row(vessel_id)
+        for nutrient, conc in nutrients_mM.items():
+            self._nutrients.set(row, nutrient, conc)
         logger.debug(f"InjectionManager: synced nutrients for {vessel_id}: {nutrients_mM}")
 
     # ========== Validation ==========
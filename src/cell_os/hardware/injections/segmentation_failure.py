@@ -50,7 +50,7 @@ Defeat Conditions:
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Sequence
 import numpy as np
 from .base import InjectionState, Injection, InjectionContext
 
@@ -391,6 +391,120 @@ class SegmentationFailureInjection(Injection):
 
         return observed_count, distorted_morphology, qc_metadata
 
+    def hook_cell_painting_assay_batch(
+        self,
+        true_counts: np.ndarray,
+        morphology: np.ndarray,
+        feature_names: Sequence[str],
+        confluence: np.ndarray,
+        debris_level: np.ndarray,
+        focus_offset_um: float,
+        stain_scale: float,
+        rngs: Sequence[np.random.Generator]
+    ) -> Dict[str, Any]:
+        """
+        Columnar hook_cell_painting_assay for a plate of wells.
+
+        Quality scores, distortion rates, size bias and feature distortions are
+        computed as arrays; only the per-well RNG draws (quality jitter, count
+        binomials, intensity noise) loop over wells, in the scalar draw order of
+        each well's own RNG. Row i is bit-identical to the scalar hook called
+        with rngs[i].
+
+        Args:
+            true_counts: (n_wells,) estimated cell counts before segmentation
+            morphology: (n_wells, n_features) feature array (not modified)
+            feature_names: Column names of morphology
+            confluence: (n_wells,) confluence
+            debris_level: (n_wells,) debris level [0, 1]
+            focus_offset_um: Defocus amount (shared by the plate read)
+            stain_scale: Stain intensity scale (shared by the plate read)
+            rngs: One dedicated RNG per well
+
+        Returns:
+            Dict of columns: observed_count, morphology, segmentation_quality,
+            merge_count, split_count, size_bias, qc_passed, qc_warnings, data_quality
+        """
+        true_counts = np.asarray(true_counts)
+        confluence = np.asarray(confluence, dtype=float)
+        debris_level = np.asarray(debris_level, dtype=float)
+        n_wells = len(rngs)
+
+        # Quality score: deterministic penalties, then per-well jitter
+        q = np.ones(n_wells)
+        density_factor = np.where(
+            confluence > 0.7,
+            DENSITY_PENALTY_HIGH - (confluence - 0.7) * 0.5,
+            np.where(confluence < 0.3, DENSITY_PENALTY_LOW + (0.3 - confluence) * 0.2, 1.0),
+        )
+        q *= density_factor
+        q *= np.where(
+            debris_level > 0.1, DEBRIS_PENALTY + (1 - DEBRIS_PENALTY) * (1 - debris_level), 1.0
+        )
+        defocus_severity = abs(focus_offset_um) / 5.0
+        if defocus_severity > 0.5:
+            q *= FOCUS_PENALTY + (1 - FOCUS_PENALTY) * (1 - defocus_severity)
+        if stain_scale > 1.2:
+            q *= SATURATION_PENALTY + (1 - SATURATION_PENALTY) * (1.2 / stain_scale)
+        q *= np.array([rng.uniform(0.95, 1.05) for rng in rngs])
+        q = np.clip(q, 0.0, 1.0)
+
+        # Count distortion (binomial draws on each well's RNG)
+        observed = np.empty(n_wells, dtype=np.int64)
+        merges = np.zeros(n_wells, dtype=np.int64)
+        splits = np.zeros(n_wells, dtype=np.int64)
+        for i, rng in enumerate(rngs):
+            observed[i], merges[i], splits[i] = self.distort_cell_count(
+                true_count=int(true_counts[i]),
+                segmentation_quality=q[i],
+                confluence=confluence[i],
+                rng=rng
+            )
+
+        safe_counts = np.where(true_counts > 0, true_counts, 1)
+        size_bias = np.where(
+            merges > 0,
+            1.0 + (merges / safe_counts) * 0.5,
+            np.where(splits > 0, 1.0 - (splits / safe_counts) * 0.3, 1.0),
+        )
+
+        # Feature distortion
+        distorted = np.array(morphology, dtype=float)
+        if self.enable_feature_distortion:
+            texture_factor = 0.7 + 0.3 * q
+            for j, key in enumerate(feature_names):
+                if 'texture' in key.lower() or 'granularity' in key.lower():
+                    distorted[:, j] *= texture_factor
+            noise_inflation = 1.0 + (1 - q) * 0.3
+            intensity_cols = [j for j, key in enumerate(feature_names) if 'intensity' in key.lower()]
+            for i, rng in enumerate(rngs):
+                for j in intensity_cols:
+                    distorted[i, j] *= rng.normal(1.0, 0.05 * noise_inflation[i])
+            for j, key in enumerate(feature_names):
+                if 'area' in key.lower() or 'size' in key.lower():
+                    distorted[:, j] *= size_bias
+
+        # QC gating
+        gating = [
+            self.apply_qc_gating(
+                segmentation_quality=q[i], confluence=confluence[i], debris_level=debris_level[i]
+            )
+            for i in range(n_wells)
+        ]
+        qc_passed = np.array([passed for passed, _ in gating], dtype=bool)
+
+        return {
+            'observed_count': observed,
+            'morphology': distorted,
+            'segmentation_quality': q,
+            'merge_count': merges,
+            'split_count': splits,
+            'size_bias': size_bias,
+            'qc_passed': qc_passed,
+            'qc_warnings': [warnings for _, warnings in gating],
+            'data_quality': np.where(qc_passed, 'good', 'poor'),
+        }
+
     def get_state_summary(self, state: SegmentationFailureState) -> Dict[str, Any]:
         """Summary for logging/debugging."""
         return {
@@ -154,6 +154,11 @@ class NuisanceModel:
         )
 
 
+# NUISANCE hypothesis (shared by the scalar and batched posteriors)
+_SIGMA2_MEAS_FLOOR = 0.005  # Measurement noise floor (slightly larger than UNKNOWN)
+_PRIOR_NUISANCE = 0.10  # Start with 10% prior on nuisance hypothesis
+
+
 def compute_mechanism_posterior_v2(
     actin_fold: float,
     mito_fold: float,
@@ -201,14 +206,13 @@ def compute_mechanism_posterior_v2(
         likelihoods[mech] = likelihood
 
     # Add NUISANCE hypothesis (competing explanation for measurement drift)
-    sigma2_meas_floor = 0.005  # Measurement noise floor (slightly larger than UNKNOWN)
     mu_nuis = np.array([1.0, 1.0, 1.0]) + nuisance.total_mean_shift
-    cov_nuis = np.eye(3) * (sigma2_meas_floor + nuisance.total_var_inflation)
+    cov_nuis = np.eye(3) * (_SIGMA2_MEAS_FLOOR + nuisance.total_var_inflation)
     mvn_nuis = multivariate_normal(mean=mu_nuis, cov=cov_nuis, allow_singular=True)
     likelihoods["NUISANCE"] = mvn_nuis.pdf(observed)
 
     # Extend prior to include NUISANCE
-    prior_nuis = 0.10  # Start with 10% prior on nuisance hypothesis
+    prior_nuis = _PRIOR_NUISANCE
     mech_mass = 1.0 - prior_nuis
     prior_extended = {m: prior[m] * mech_mass for m in MECHANISM_SIGNATURES_V2}
     prior_extended["NUISANCE"] = prior_nuis
@@ -284,14 +288,13 @@ def compute_mechanism_posterior_v2(
             likelihoods_old_nuisance[mech] = mvn.pdf(observed)
 
         # NUISANCE hypothesis with prior nuisance
-        sigma2_meas_floor = 0.005
         mu_nuis = np.array([1.0, 1.0, 1.0]) + prior_nuisance.total_mean_shift
-        cov_nuis = np.eye(3) * (sigma2_meas_floor + prior_nuisance.total_var_inflation)
+        cov_nuis = np.eye(3) * (_SIGMA2_MEAS_FLOOR + prior_nuisance.total_var_inflation)
         mvn_nuis = multivariate_normal(mean=mu_nuis, cov=cov_nuis, allow_singular=True)
         likelihoods_old_nuisance["NUISANCE"] = mvn_nuis.pdf(observed)
 
         # Recompute posterior with old nuisance
-        prior_nuis = 0.10
+        prior_nuis = _PRIOR_NUISANCE
         mech_mass = 1.0 - prior_nuis
         prior_extended_old = {m: prior[m] * mech_mass for m in MECHANISM_SIGNATURES_V2}
         prior_extended_old["NUISANCE"] = prior_nuis
@@ -473,6 +476,208 @@ class MechanismPosterior:
         return "\n".join(lines)
 
 
+# Batched posterior (N observations in one pass)
+#
+# Signatures are diagonal, so the Cholesky factor of Σ_m + h·I is the elementwise
+# sqrt of (var_m + h). Means and variances are stacked once (K × 3) and each row
+# only adds its own heterogeneity / nuisance terms.
+
+_BATCH_MECHANISMS: List[Mechanism] = list(MECHANISM_SIGNATURES_V2.keys())
+_SIGNATURE_MEANS = np.array([s.to_mean_vector() for s in MECHANISM_SIGNATURES_V2.values()])  # (K, 3)
+_SIGNATURE_VARS = np.array([np.diag(s.to_cov_matrix()) for s in MECHANISM_SIGNATURES_V2.values()])  # (K, 3)
+_LOG_2PI = np.log(2.0 * np.pi)
+
+
+def _diag_gaussian_pdf(observed: np.ndarray, mean: np.ndarray, var: np.ndarray) -> np.ndarray:
+    """
+    Diagonal-covariance normal density, broadcast over leading axes.
+
+    Evaluated as exp(logpdf) like scipy, so far-out rows underflow to 0 exactly
+    as the scalar path does (which then takes the Z == 0 branch).
+    """
+    sd = np.sqrt(var)  # Cholesky factor of a diagonal covariance
+    z = (observed - mean) / sd
+    log_det = 2.0 * np.sum(np.log(sd), axis=-1)
+    return np.exp(-0.5 * (3 * _LOG_2PI + log_det + np.sum(z * z, axis=-1)))
+
+
+@dataclass
+class MechanismPosteriorBatch:
+    """
+    Posteriors for N observations over K mechanisms (columns follow `mechanisms`).
+
+    Row i matches compute_mechanism_posterior_v2 on observation i with its own
+    nuisance (same NUISANCE hypothesis, same ambiguity capping).
+    """
+    mechanisms: List[Mechanism]
+    probabilities: np.ndarray          # (N, K), after ambiguity capping
+    likelihoods: np.ndarray            # (N, K)
+    nuisance_likelihood: np.ndarray    # (N,)
+    nuisance_probability: np.ndarray   # (N,)
+    likelihood_gap: np.ndarray         # (N,)
+    is_ambiguous: np.ndarray           # (N,) bool
+    uncertainty: np.ndarray            # (N,)
+    observed_features: np.ndarray      # (N, 3)
+
+    def __len__(self) -> int:
+        return self.probabilities.shape[0]
+
+    @property
+    def top_index(self) -> np.ndarray:
+        return np.argmax(self.probabilities, axis=1)
+
+    @property
+    def top_mechanisms(self) -> List[Mechanism]:
+        return [self.mechanisms[k] for k in self.top_index]
+
+    @property
+    def top_probability(self) -> np.ndarray:
+        return np.max(self.probabilities, axis=1)
+
+    @property
+    def margin(self) -> np.ndarray:
+        """Separation between top two, per row."""
+        top2 = -np.partition(-self.probabilities, 1, axis=1)[:, :2]
+        return top2[:, 0] - top2[:, 1]
+
+    @property
+    def mechanism_entropy_bits(self) -> np.ndarray:
+        """Per-row mechanism entropy (same units as MechanismPosterior.mechanism_entropy_bits)."""
+        p = self.probabilities
+        with np.errstate(divide='ignore', invalid='ignore'):
+            terms = np.where(p > 0, p * np.log(p), 0.0)
+        return -np.sum(terms, axis=1)
+
+    @property
+    def entropy(self) -> np.ndarray:
+        return self.mechanism_entropy_bits
+
+    def posterior(self, i: int, nuisance: NuisanceModel,
+                  prior: Optional[Dict[Mechanism, float]] = None) -> MechanismPosterior:
+        """Materialize row i as a MechanismPosterior (no split-ledger attribution)."""
+        if prior is None:
+            prior = {mech: 1.0 / len(self.mechanisms) for mech in self.mechanisms}
+        likelihoods = {m: float(self.likelihoods[i, k]) for k, m in enumerate(self.mechanisms)}
+        likelihoods["NUISANCE"] = float(self.nuisance_likelihood[i])
+        return MechanismPosterior(
+            probabilities={m: float(self.probabilities[i, k]) for k, m in enumerate(self.mechanisms)},
+            observed_features=self.observed_features[i].copy(),
+            likelihood_scores=likelihoods,
+            prior=prior,
+            nuisance=nuisance,
+            nuisance_probability=float(self.nuisance_probability[i]),
+            uncertainty=float(self.uncertainty[i]),
+            is_ambiguous=bool(self.is_ambiguous[i]),
+            likelihood_gap=float(self.likelihood_gap[i])
+        )
+
+
+def compute_mechanism_posterior_v2_batch(
+    observed: np.ndarray,
+    nuisance=None,
+    prior: Optional[Dict[Mechanism, float]] = None,
+    heterogeneity_var=0.0,
+    mean_shift=0.0,
+    var_inflation=0.0
+) -> MechanismPosteriorBatch:
+    """
+    Vectorized compute_mechanism_posterior_v2 over N observations.
+
+    Args:
+        observed: (N, 3) fold-changes [actin, mito, er]
+        nuisance: NuisanceModel shared by all rows, or a sequence of N models.
+            When given, overrides the array arguments below.
+        prior: Mechanism prior (uniform if None), shared by all rows
+        heterogeneity_var: scalar or (N,) heterogeneity variance
+        mean_shift: scalar, (3,) or (N, 3) NUISANCE mean shift (total_mean_shift)
+        var_inflation: scalar or (N,) NUISANCE variance inflation (total_var_inflation)
+
+    Split-ledger attribution (prior_posterior) is a per-trajectory comparison and
+    stays on the scalar path.
+    """
+    observed = np.atleast_2d(np.asarray(observed, dtype=float))
+    n = observed.shape[0]
+
+    if nuisance is not None:
+        models = [nuisance] * n if isinstance(nuisance, NuisanceModel) else list(nuisance)
+        if len(models) != n:
+            raise ValueError(f"Got {len(models)} nuisance models for {n} observations")
+        heterogeneity_var = np.array([m.heterogeneity_var for m in models], dtype=float)
+        mean_shift = np.array([m.total_mean_shift for m in models], dtype=float).reshape(n, 3)
+        var_inflation = np.array([m.total_var_inflation for m in models], dtype=float)
+
+    hetero = np.broadcast_to(np.asarray(heterogeneity_var, dtype=float), (n,))
+    shift = np.broadcast_to(np.asarray(mean_shift, dtype=float), (n, 3))
+    inflation = np.broadcast_to(np.asarray(var_inflation, dtype=float), (n,))
+
+    if prior is None:
+        prior = {mech: 1.0 / len(MECHANISM_SIGNATURES_V2) for mech in MECHANISM_SIGNATURES_V2}
+    prior_vec = np.array([prior[m] for m in _BATCH_MECHANISMS]) * (1.0 - _PRIOR_NUISANCE)
+
+    # Mechanism likelihoods (N, K): no mean shift, variance = Σ_m + heterogeneity
+    var_m = _SIGNATURE_VARS[None, :, :] + hetero[:, None, None]
+    likelihoods = _diag_gaussian_pdf(observed[:, None, :], _SIGNATURE_MEANS[None, :, :], var_m)
+
+    # NUISANCE likelihood (N,)
+    mu_nuis = 1.0 + shift
+    var_nuis = np.repeat((_SIGMA2_MEAS_FLOOR + inflation)[:, None], 3, axis=1)
+    nuis_like = _diag_gaussian_pdf(observed, mu_nuis, var_nuis)
+
+    # Bayes rule with NUISANCE in the normalization
+    unnormalized = likelihoods * prior_vec
+    unnormalized_nuis = nuis_like * _PRIOR_NUISANCE
+    Z = unnormalized.sum(axis=1) + unnormalized_nuis
+    degenerate = Z == 0
+    safe_Z = np.where(degenerate, 1.0, Z)
+    n_hyp = len(_BATCH_MECHANISMS) + 1
+    probs = np.where(degenerate[:, None], 1.0 / n_hyp, unnormalized / safe_Z[:, None])
+    nuisance_prob = np.where(degenerate, 1.0 / n_hyp, unnormalized_nuis / safe_Z)
+
+    # Ambiguity: normalized gap between top-2 mechanism likelihoods
+    top2 = -np.partition(-likelihoods, 1, axis=1)[:, :2]
+    valid = top2[:, 0] > 0
+    gap = np.ones(n)
+    gap[valid] = (top2[valid, 0] - top2[valid, 1]) / top2[valid, 0]
+    is_ambiguous = gap < GAP_CLEAR
+
+    # Cap top probability in ambiguous rows and redistribute the excess
+    top_idx = np.argmax(probs, axis=1)
+    rows = np.arange(n)
+    top_prob = probs[rows, top_idx]
+    capped = is_ambiguous & (top_prob > MAX_PROB_AMBIGUOUS)
+    if capped.any():
+        r = rows[capped]
+        t = top_idx[capped]
+        excess = top_prob[capped] - MAX_PROB_AMBIGUOUS
+        others = probs[r].copy()
+        others[np.arange(len(r)), t] = 0.0
+        other_total = others.sum(axis=1)
+        has_mass = other_total > 0
+        share = np.where(
+            has_mass[:, None],
+            others / np.where(has_mass, other_total, 1.0)[:, None],
+            1.0 / (len(_BATCH_MECHANISMS) - 1)
+        )
+        share[np.arange(len(r)), t] = 0.0
+        new = probs[r] + excess[:, None] * share
+        new[np.arange(len(r)), t] = MAX_PROB_AMBIGUOUS
+        probs[r] = new
+
+    uncertainty = np.where(is_ambiguous, 1.0 - gap / GAP_CLEAR, 0.0)
+
+    return MechanismPosteriorBatch(
+        mechanisms=list(_BATCH_MECHANISMS),
+        probabilities=probs,
+        likelihoods=likelihoods,
+        nuisance_likelihood=nuis_like,
+        nuisance_probability=nuisance_prob,
+        likelihood_gap=gap,
+        is_ambiguous=is_ambiguous,
+        uncertainty=uncertainty,
+        observed_features=observed
+    )
+
+
 def calibrate_confidence(
     posteriors: List[MechanismPosterior],
     ground_truth: List[Mechanism],
@@ -0,0 +1,194 @@
+"""
+Shared registry for parsed YAML parameter files.
+
+Every BiologicalVirtualMachine reads data/simulation_parameters.yaml and
+data/cell_thalamus_params.yaml. Episode runners and beam search build VMs in
+tight loops, so each file is parsed at most once per process and the parsed
+result is kept in an on-disk pickle cache for the next process.
+
+Lookup order for a file:
+1. In-process entry, valid while the file's (mtime_ns, size) is unchanged
+2. On-disk pickle beside the file (<file name>.pkl, e.g. simulation_parameters.yaml.pkl),
+   valid while the content sha256 matches (survives checkouts that only touch mtime)
+3. yaml.load with the LibYAML C loader when available, else SafeLoader
+
+Callers get either a shared read-only view (load_yaml_params) or a private
+mutable copy (load_yaml_params_copy) for per-VM overrides.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import pickle
+from collections.abc import Mapping
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+logger = logging.getLogger(__name__)
+
+try:
+    YAML_LOADER = yaml.CSafeLoader
+    LIBYAML_AVAILABLE = True
+except AttributeError:
+    YAML_LOADER = yaml.SafeLoader
+    LIBYAML_AVAILABLE = False
+
+# Bump when the on-disk payload layout changes (old cache files are ignored)
+CACHE_VERSION = 1
+
+
+@dataclass(frozen=True)
+class _ParamEntry:
+    file_key: tuple  # (mtime_ns, size)
+    sha256: str
+    blob: bytes  # pickled plain data, source of private copies
+    view: Any  # frozen view shared by all readers
+
+
+# Module-level registry: resolved path -> parsed entry (one per process)
+_PARAM_REGISTRY: dict[str, _ParamEntry] = {}
+
+
+class FrozenParams(Mapping):
+    """
+    Read-only mapping over parsed parameters.
+
+    Unlike MappingProxyType it survives copy.deepcopy (VM.fork/snapshot),
+    returning itself, and pickles for process pools.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenParams({self._data!r})"
+
+    def __copy__(self) -> "FrozenParams":
+        return self
+
+    def __deepcopy__(self, memo) -> "FrozenParams":
+        return self
+
+    def __reduce__(self):
+        return (FrozenParams, (self._data,))
+
+
+def freeze(obj: Any) -> Any:
+    """Recursively convert dicts to FrozenParams and lists to tuples."""
+    if isinstance(obj, dict):
+        return FrozenParams({k: freeze(v) for k, v in obj.items()})
+    if isinstance(obj, list):
+        return tuple(freeze(v) for v in obj)
+    return obj
+
+
+def _file_key(path: Path) -> tuple:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
+
+
+def cache_path(path: str | Path) -> Path:
+    """On-disk cache file for a YAML parameter file."""
+    path = Path(path)
+    return path.with_name(f"{path.name}.pkl")
+
+
+def _read_disk_cache(path: Path, sha256: str) -> bytes | None:
+    try:
+        with open(cache_path(path), "rb") as f:
+            payload = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError):
+        return None
+    if not isinstance(payload, dict) or payload.get("version") != CACHE_VERSION:
+        return None
+    if payload.get("sha256") != sha256:
+        return None
+    return payload["blob"]
+
+
+def _write_disk_cache(path: Path, sha256: str, blob: bytes) -> None:
+    """Best effort: the data directory may be read-only."""
+    target = cache_path(path)
+    tmp = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            pickle.dump({"version": CACHE_VERSION, "sha256": sha256, "blob": blob}, f,
+                        protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, target)
+    except OSError:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def _load_entry(path: str | Path, use_disk_cache: bool = True) -> _ParamEntry:
+    path = Path(path).resolve()
+    key = str(path)
+    file_key = _file_key(path)
+
+    entry = _PARAM_REGISTRY.get(key)
+    if entry is not None and entry.file_key == file_key:
+        return entry
+
+    raw = path.read_bytes()
+    sha256 = hashlib.sha256(raw).hexdigest()
+
+    blob = _read_disk_cache(path, sha256) if use_disk_cache else None
+    if blob is None:
+        data = yaml.load(raw, Loader=YAML_LOADER)
+        blob = pickle.dumps(data, protocol=pickle.HIGHEST_PROTOCOL)
+        if use_disk_cache:
+            _write_disk_cache(path, sha256, blob)
+        logger.debug(f"Parsed parameter file: {path}")
+    else:
+        data = pickle.loads(blob)
+        logger.debug(f"Loaded parameter cache: {cache_path(path)}")
+
+    entry = _ParamEntry(file_key=file_key, sha256=sha256, blob=blob, view=freeze(data))
+    _PARAM_REGISTRY[key] = entry
+    return entry
+
+
+def load_yaml_params(path: str | Path, use_disk_cache: bool = True) -> Mapping[str, Any]:
+    """
+    Shared read-only view of a parsed YAML parameter file.
+
+    The same object is returned to every caller until the file changes.
+    Mappings are FrozenParams and lists are tuples.
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        yaml.YAMLError: If the file cannot be parsed
+    """
+    return _load_entry(path, use_disk_cache).view
+
+
+def load_yaml_params_copy(path: str | Path, use_disk_cache: bool = True) -> Any:
+    """
+    Private mutable copy (plain dicts/lists) of a parsed YAML parameter file.
+
+    Built from the cached pickle, so no YAML parsing after the first load.
+    """
+    return pickle.loads(_load_entry(path, use_disk_cache).blob)
+
+
+def clear_param_cache() -> None:
+    """Drop all in-process entries (on-disk caches are left in place)."""
+    _PARAM_REGISTRY.clear()
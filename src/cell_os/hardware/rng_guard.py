@@ -9,13 +9,24 @@ Observer independence requires that:
 - Stream order is deterministic and auditable
 
 Any violation of these contracts crashes immediately.
+
+Enforcement modes (GUARD_MODES):
+- "strict": walk the stack and match the caller name on every draw (reference)
+- "cached": verify each call-site (code object) once, then hit a set lookup
+- "off": no caller checks (draws are still counted)
+
+Authorization depends only on the caller's function name, which is fixed per
+code object, so "cached" enforces exactly the same contract as "strict".
 """
 
 import copy
 import inspect
+import sys
 from typing import Set, Optional, Any
 import numpy as np
 
+GUARD_MODES = ("strict", "cached", "off")
+
 
 class RNGStreamViolation(RuntimeError):
     """Raised when RNG stream is used from unauthorized context.
@@ -57,6 +68,7 @@ class ValidatedRNG:
     - Shallow stack inspection (2 levels up)
     - Call counting for diagnostics
     - Zero state mutation (wrapper is pure)
+    - Mode only changes how often the caller is checked, never the draws
 
     Usage:
         rng_growth = ValidatedRNG(
@@ -77,7 +89,8 @@ class ValidatedRNG:
         base_rng: np.random.Generator,
         stream_name: str,
         allowed_patterns: Set[str],
-        enforce: bool = True
+        enforce: bool = True,
+        mode: str = "strict"
     ):
         """Initialize validated RNG wrapper.
 
@@ -86,12 +99,23 @@ class ValidatedRNG:
             stream_name: Human-readable name ("growth", "assay", etc.)
             allowed_patterns: Set of substrings that must appear in caller name
             enforce: If False, logs violations but doesn't crash (for debugging)
+            mode: Enforcement mode, one of GUARD_MODES ("strict", "cached", "off").
+                "cached" remembers authorized call-sites; unauthorized call-sites
+                are never cached and raise on every draw.
+
+        Raises:
+            ValueError: If mode is not one of GUARD_MODES
         """
+        if mode not in GUARD_MODES:
+            raise ValueError(f"Unknown RNG guard mode '{mode}'. Valid modes: {GUARD_MODES}")
         self._rng = base_rng
         self.stream_name = stream_name
         self.allowed_patterns = allowed_patterns
         self.enforce = enforce
+        self.mode = mode
         self.call_count = 0
+        # Code objects already verified against allowed_patterns ("cached" mode)
+        self._authorized_code: Set[Any] = set()
 
     def _check_caller(self) -> None:
         """Verify caller is authorized to use this stream.
@@ -104,7 +128,10 @@ class ValidatedRNG:
         Raises:
             RNGStreamViolation: If caller not in allowed contexts
         """
-        if not self.enforce:
+        if not self.enforce or self.mode == "off":
+            return
+        if self.mode == "cached":
+            self._check_caller_cached()
             return
 
         # Get caller 2 levels up
@@ -136,6 +163,57 @@ class ValidatedRNG:
         finally:
             del frame  # Avoid reference cycles
 
+    def _check_caller_cached(self) -> None:
+        """Verify caller once per call-site, then trust the code object.
+
+        Stack levels are the same as _check_caller, plus this method:
+        _check_caller_cached -> _check_caller -> wrapper method -> actual caller
+
+        Raises:
+            RNGStreamViolation: If caller not in allowed contexts
+        """
+        try:
+            code = sys._getframe(3).f_code
+        except ValueError:
+            return  # Can't validate, allow (edge case, matches strict mode)
+
+        if code in self._authorized_code:
+            return
+        if code.co_name in self.allowed_patterns:
+            self._authorized_code.add(code)
+            return
+
+        raise RNGStreamViolation(
+            stream_name=self.stream_name,
+            caller_function=code.co_name,
+            caller_file=code.co_filename,
+            allowed_contexts=self.allowed_patterns,
+            call_count=self.call_count
+        )
+
+    def __getstate__(self) -> dict:
+        """Pickle support: the call-site cache holds code objects, so drop it.
+
+        The cache is a pure optimization; an unpickled copy re-verifies lazily.
+        """
+        state = self.__dict__.copy()
+        state["_authorized_code"] = set()
+        return state
+
+    def set_mode(self, mode: str) -> None:
+        """Switch enforcement mode (clears the call-site cache).
+
+        Args:
+            mode: One of GUARD_MODES
+
+        Raises:
+            ValueError: If mode is not one of GUARD_MODES
+        """
+        if mode not in GUARD_MODES:
+            raise ValueError(f"Unknown RNG guard mode '{mode}'. Valid modes: {GUARD_MODES}")
+        self.mode = mode
+        self._authorized_code.clear()
+
     # Proxy all common RNG methods with validation
 
     def random(self, size=None):
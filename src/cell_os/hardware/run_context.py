@@ -558,38 +558,29 @@ def sample_plating_context(seed: int, config: dict | None = None) -> dict[str, f
     }
 
 
-def pipeline_transform(
-    morphology: dict[str, float],
+PIPELINE_CHANNELS = ("er", "mito", "nucleus", "actin", "rna")
+
+
+def _pipeline_factors(
     context: RunContext,
     batch_id: str,
-    plate_id: str | None = None,
-) -> dict[str, float]:
+    plate_id: str | None,
+    channels: list[str],
+) -> list[tuple[str, float]]:
     """
-    Phase 5B Injection #3: Pipeline Drift
-
-    Apply batch-dependent feature extraction failures to morphology.
+    Draw the pipeline drift for one (batch_id, plate_id) as ordered multiplications.
 
-    This creates "same biology, different features" outcomes that prevent
-    feature overtrust. Two batches can genuinely disagree on channel intensities,
-    not just due to Gaussian noise.
-
-    Transforms applied:
-    1. Affine transforms per batch (rotation/scaling in feature space)
-    2. Channel-specific segmentation bias (nucleus area shifts)
-    3. Discrete failure modes (focus off, illumination correction wrong)
-
-    Key: Pipeline drift is mildly correlated with reagent_lot_shift so that
-    "cursed days" affect both biology AND feature extraction in the same direction.
-    This creates the most realistic suffering where naive policies get seduced.
+    All RNG draws of pipeline_transform live here, so the scalar and batched
+    transforms apply the same factors in the same order (bit-identical results).
 
     Args:
-        morphology: True morphology dict (er, mito, nucleus, actin, rna)
         context: RunContext with reagent lot effects
         batch_id: Batch identifier for deterministic pipeline effects
         plate_id: Optional plate identifier for per-plate failures
+        channels: Channels present, in order (plate failures apply to each of them)
 
     Returns:
-        Transformed morphology with batch-dependent biases
+        [(channel, factor), ...] to multiply in sequence
     """
     import hashlib
 
@@ -599,13 +590,12 @@ def pipeline_transform(
     )
     rng_batch = np.random.default_rng(batch_seed)
 
-    # Start with copy of true morphology
-    transformed = morphology.copy()
+    factors = []
 
     # 1. Channel-specific segmentation bias (correlated with reagent lot)
     # When reagent lot is bad, segmentation also tends to be off
     # Correlation = 0.3 (mild, not deterministic)
-    for channel in ["er", "mito", "nucleus", "actin", "rna"]:
+    for channel in PIPELINE_CHANNELS:
         reagent_shift = context.reagent_lot_shift.get(channel, 0.0)
 
         # Pipeline bias: 30% correlated with reagent lot + 70% independent
@@ -615,16 +605,13 @@ def pipeline_transform(
         )
 
         # Apply as multiplicative bias (segmentation threshold shifts)
-        transformed[channel] *= float(np.exp(pipeline_bias))
+        factors.append((channel, float(np.exp(pipeline_bias))))
 
     # 2. Affine transform in feature space (batch-specific rotation/scaling)
     # Some batches compress ER-mito separation, others amplify it
     # This creates "same compound, different conclusion" at the feature level
-    affine_scale_er = float(np.exp(rng_batch.normal(0, 0.05)))
-    affine_scale_mito = float(np.exp(rng_batch.normal(0, 0.05)))
-
-    transformed["er"] *= affine_scale_er
-    transformed["mito"] *= affine_scale_mito
+    factors.append(("er", float(np.exp(rng_batch.normal(0, 0.05)))))
+    factors.append(("mito", float(np.exp(rng_batch.normal(0, 0.05)))))
 
     # 3. Discrete failure modes (rare but catastrophic)
     # These are per-plate, not per-batch (plate-level QC failures)
@@ -643,22 +630,94 @@ def pipeline_transform(
             if failure_type == "focus_off":
                 # Out of focus → all channels dimmer and blurrier (reduced dynamic range)
                 focus_penalty = rng_plate.uniform(0.7, 0.9)
-                for channel in transformed:
-                    transformed[channel] *= focus_penalty
+                factors.extend((channel, focus_penalty) for channel in channels)
 
             elif failure_type == "illumination_wrong":
                 # Illumination correction failed → channel-dependent intensity shifts
-                for channel in transformed:
-                    illum_shift = rng_plate.uniform(0.8, 1.3)
-                    transformed[channel] *= illum_shift
+                for channel in channels:
+                    factors.append((channel, rng_plate.uniform(0.8, 1.3)))
 
             elif failure_type == "segmentation_fail":
                 # Segmentation thresholds wrong → nucleus/actin ratio off
-                transformed["nucleus"] *= rng_plate.uniform(0.6, 0.8)
-                transformed["actin"] *= rng_plate.uniform(1.2, 1.5)
+                factors.append(("nucleus", rng_plate.uniform(0.6, 0.8)))
+                factors.append(("actin", rng_plate.uniform(1.2, 1.5)))
+
+    return factors
+
+
+def pipeline_transform(
+    morphology: dict[str, float],
+    context: RunContext,
+    batch_id: str,
+    plate_id: str | None = None,
+) -> dict[str, float]:
+    """
+    Phase 5B Injection #3: Pipeline Drift
+
+    Apply batch-dependent feature extraction failures to morphology.
+
+    This creates "same biology, different features" outcomes that prevent
+    feature overtrust. Two batches can genuinely disagree on channel intensities,
+    not just due to Gaussian noise.
+
+    Transforms applied:
+    1. Affine transforms per batch (rotation/scaling in feature space)
+    2. Channel-specific segmentation bias (nucleus area shifts)
+    3. Discrete failure modes (focus off, illumination correction wrong)
+
+    Key: Pipeline drift is mildly correlated with reagent_lot_shift so that
+    "cursed days" affect both biology AND feature extraction in the same direction.
+    This creates the most realistic suffering where naive policies get seduced.
+
+    Args:
+        morphology: True morphology dict (er, mito, nucleus, actin, rna)
+        context: RunContext with reagent lot effects
+        batch_id: Batch identifier for deterministic pipeline effects
+        plate_id: Optional plate identifier for per-plate failures
+
+    Returns:
+        Transformed morphology with batch-dependent biases
+    """
+    # Start with copy of true morphology
+    transformed = morphology.copy()
+
+    for channel, factor in _pipeline_factors(context, batch_id, plate_id, list(transformed)):
+        transformed[channel] *= factor
 
     # Ensure no negative values
     for channel in transformed:
         transformed[channel] = max(0.0, transformed[channel])
 
     return transformed
+
+
+def pipeline_transform_batch(
+    morphology: np.ndarray,
+    context: RunContext,
+    batch_id: str,
+    plate_id: str | None = None,
+) -> np.ndarray:
+    """
+    Columnar pipeline_transform for wells sharing one (batch_id, plate_id).
+
+    The pipeline factors depend only on the batch and plate, so they are drawn
+    once (_pipeline_factors, shared with the scalar path) and applied to every
+    row in the same order. Each row is bit-identical to pipeline_transform on
+    that well's morphology dict.
+
+    Args:
+        morphology: (n_wells, 5) array in PIPELINE_CHANNELS order
+        context: RunContext with reagent lot effects
+        batch_id: Batch identifier for deterministic pipeline effects
+        plate_id: Optional plate identifier for per-plate failures
+
+    Returns:
+        Transformed (n_wells, 5) array (input is not modified)
+    """
+    col = {ch: i for i, ch in enumerate(PIPELINE_CHANNELS)}
+    transformed = np.array(morphology, dtype=float)
+
+    for channel, factor in _pipeline_factors(context, batch_id, plate_id, list(PIPELINE_CHANNELS)):
+        transformed[:, col[channel]] *= factor
+
+    return np.maximum(0.0, transformed)
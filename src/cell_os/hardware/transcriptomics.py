@@ -77,12 +77,31 @@ def _dropout_prob(expected_umi: np.ndarray, alpha: float, x0: float) -> np.ndarr
     return 1.0 / (1.0 + (expected_umi / x0) ** alpha)
 
 
+def _contact_loadings(gene_names: List[str]) -> np.ndarray:
+    """
+    Per-gene contact program loadings (deterministic per gene set).
+
+    Uses a stable hash (sha256) of the sorted gene set so loadings are
+    reproducible across runs and processes.
+    """
+    import hashlib
+
+    key = ("|".join(sorted(gene_names))).encode("utf-8")
+    seed_for_loadings = int.from_bytes(hashlib.sha256(key).digest()[:4], "little")
+    rng_loadings = np.random.Generator(np.random.PCG64(seed_for_loadings))
+
+    # Low-rank program: single factor with small variance
+    # Most genes: weak response. A few genes: strong response (creates structure)
+    return rng_loadings.normal(loc=0.0, scale=0.15, size=len(gene_names))
+
+
 def _apply_contact_program(
     expected: np.ndarray,
     p: float,
     gene_names: List[str],
     gene_index: Dict[str, int],
     scale: float = 0.35,
+    beta: Optional[np.ndarray] = None,
 ) -> np.ndarray:
     """
     Apply contact inhibition program (YAP/TAZ, Hippo pathway, metabolic shifts).
@@ -100,6 +119,8 @@ def _apply_contact_program(
         gene_names: List of gene symbols
         gene_index: Map {gene: index}
         scale: Program strength (default 0.35 = 35% modulation at full pressure)
+        beta: Precomputed per-gene loadings (from _contact_loadings); derived
+            from gene_names when omitted
 
     Returns:
         Modified expected expression
@@ -109,19 +130,8 @@ def _apply_contact_program(
     - No RNG dependence (uses stable hash, not process hash())
     - Monotonic (higher p → consistent systematic shift)
     """
-    import hashlib
-
-    n_cells, n_genes = expected.shape
-
-    # Synthetic per-gene loading vector (deterministic per gene set)
-    # Use stable hash (sha256) so loadings are reproducible across runs
-    key = ("|".join(sorted(gene_names))).encode("utf-8")
-    seed_for_loadings = int.from_bytes(hashlib.sha256(key).digest()[:4], "little")
-    rng_loadings = np.random.Generator(np.random.PCG64(seed_for_loadings))
-
-    # Low-rank program: single factor with small variance
-    # Most genes: weak response. A few genes: strong response (creates structure)
-    beta = rng_loadings.normal(loc=0.0, scale=0.15, size=n_genes)
+    if beta is None:
+        beta = _contact_loadings(gene_names)
 
     # Apply: log_mu += (scale * p) * beta
     # Equivalent to: expected *= exp((scale * p) * beta)
@@ -176,128 +186,221 @@ def _make_batch_effects(
     return np.exp(shared + gene)
 
 
-def simulate_scrna_counts(
-    *,
-    cell_line: str,
-    vessel_latents: Dict[str, float],
-    viability: float,
-    n_cells: int,
-    rng: np.random.Generator,
-    params_path: str | Path,
-    batch_id: Optional[str] = None,
-    subpop_fractions: Optional[Dict[str, float]] = None,
-    run_context_latent: Optional[float] = None,
-) -> ScRNASeqResult:
-    """
-    Simulate single-cell RNA-seq UMI counts from vessel latent state.
+# ============================================================================
+# Compiled model (parsed + vectorized once per params file)
+# ============================================================================
 
-    Physics → Measurement transformation:
-    1. Baseline expression per cell line
-    2. Stress program activation from vessel latents (er_stress, mito_dysfunction, etc.)
-    3. Subpopulation heterogeneity (program gain + baseline noise)
-    4. Viability effects (apoptosis gene modulation)
-    5. Library size normalization + sampling
-    6. Batch effects (multiplicative per-gene biases)
-    7. Dropout (low-expression genes randomly undetected)
-    8. Ambient RNA contamination
-    9. Poisson sampling (UMI counting noise)
+# Cells per chunk above which counts are generated in memory-bounded chunks
+SCRNA_CHUNK_CELLS = 8192
 
-    Args:
-        cell_line: Cell line name (e.g., "A549")
-        vessel_latents: Latent stress states {axis_name: level}
-        viability: Vessel viability [0, 1]
-        n_cells: Number of cells to profile
-        rng: Random number generator (use assay RNG for observer independence)
-        params_path: Path to scrna_seq_params.yaml
-        batch_id: Optional batch identifier for batch effects
-        subpop_fractions: Optional subpop mixture {subpop_name: fraction}
-        run_context_latent: Optional RunContext coupling for correlated batch drift
 
-    Returns:
-        ScRNASeqResult with counts matrix + metadata
+@dataclass(frozen=True)
+class ScRNACellLineModel:
     """
-    params = _load_yaml(params_path)
-    programs = _load_yaml(params["stress_programs_ref"])
+    Per-cell-line arrays precomputed from the params + program YAMLs.
 
-    baseline_map = params["cell_line_baseline"].get(cell_line)
-    if baseline_map is None:
-        raise ValueError(f"cell line '{cell_line}' not in scrna params")
+    Program fold-changes are stored densely as (n_programs × n_genes) matrices of
+    (fc - 1) with zeros for genes a program does not touch, so program
+    activation is a handful of vector ops instead of dict lookups per gene.
+    """
+    gene_names: List[str]
+    gene_index: Dict[str, int]
+    baseline: np.ndarray                # (n_genes,)
+    program_names: List[str]
+    program_up: np.ndarray              # (n_programs, n_genes), fc - 1
+    program_down: np.ndarray            # (n_programs, n_genes), fc - 1
+    pro_apoptotic_idx: np.ndarray
+    anti_apoptotic_idx: np.ndarray
+    contact_beta: np.ndarray            # (n_genes,)
+    cycling_fraction: float
+    cycling_idx: np.ndarray
+    cycling_fc_minus1: np.ndarray
+    antagonism_idx: np.ndarray
+    antagonism_one_minus: np.ndarray
+
+
+class ScRNAModel:
+    """
+    Compiled scRNA-seq simulation model for one params file.
 
-    # Assemble gene list from baseline keys plus any program genes
-    gene_set = set(baseline_map.keys())
-    for prog in programs.values():
-        for direction in ("up", "down"):
-            for g in prog.get(direction, {}).keys():
-                gene_set.add(g)
+    Built once by load_scrna_model() and cached until the params or program
+    YAML changes on disk. Per-cell-line arrays are compiled lazily.
+    """
 
-    gene_names = sorted(gene_set)
-    n_genes = len(gene_names)
+    def __init__(self, params: Dict[str, Any], programs: Dict[str, Any]):
+        self.params = params
+        self.programs = programs
+        self.program_names = list(programs.keys())
+
+        self.hill = float(params["dose_response"]["hill"])
+        self.latent_sat = float(params["dose_response"]["latent_saturation"])
+        self.apoptosis_genes = set(params["genesets"].get("apoptosis", []))
+        self.subpop_effects = {
+            name: (float(cfg["program_gain"]), float(cfg["baseline_noise_cv"]))
+            for name, cfg in params["subpop_effects"].items()
+        }
+        self.cell_cycle = params.get("cell_cycle", {})
+        self.technical_noise = params["technical_noise"]
+        self._cell_lines: Dict[str, ScRNACellLineModel] = {}
+
+    def cell_line(self, cell_line: str) -> ScRNACellLineModel:
+        """Compiled arrays for a cell line (raises ValueError if unknown)."""
+        compiled = self._cell_lines.get(cell_line)
+        if compiled is None:
+            compiled = self._compile_cell_line(cell_line)
+            self._cell_lines[cell_line] = compiled
+        return compiled
+
+    def _compile_cell_line(self, cell_line: str) -> ScRNACellLineModel:
+        baseline_map = self.params["cell_line_baseline"].get(cell_line)
+        if baseline_map is None:
+            raise ValueError(f"cell line '{cell_line}' not in scrna params")
+
+        # Gene list from baseline keys plus any program genes
+        gene_set = set(baseline_map.keys())
+        for prog in self.programs.values():
+            for direction in ("up", "down"):
+                for g in prog.get(direction, {}).keys():
+                    gene_set.add(g)
+
+        gene_names = sorted(gene_set)
+        gene_index = {g: i for i, g in enumerate(gene_names)}
+        n_genes = len(gene_names)
+
+        baseline = np.array([float(baseline_map.get(g, 0.2)) for g in gene_names], dtype=np.float64)
+        baseline = np.clip(baseline, 1e-6, None)
+
+        program_up = np.zeros((len(self.program_names), n_genes), dtype=np.float64)
+        program_down = np.zeros((len(self.program_names), n_genes), dtype=np.float64)
+        for k, name in enumerate(self.program_names):
+            prog = self.programs[name]
+            for g, fc in prog.get("up", {}).items():
+                program_up[k, gene_index[g]] = float(fc) - 1.0
+            for g, fc in prog.get("down", {}).items():
+                program_down[k, gene_index[g]] = float(fc) - 1.0
+
+        apoptosis = [g for g in self.apoptosis_genes if g in gene_index]
+        pro_apoptotic_idx = np.array([gene_index[g] for g in apoptosis if g in ("BAX", "BBC3")], dtype=np.intp)
+        anti_apoptotic_idx = np.array([gene_index[g] for g in apoptosis if g == "BCL2"], dtype=np.intp)
+
+        cc = self.cell_cycle
+        cycling = {g: float(fc) for g, fc in cc.get("cycling_program", {}).items() if g in gene_index}
+        antagonism = {g: float(m) for g, m in cc.get("stress_antagonism", {}).items() if g in gene_index}
+
+        return ScRNACellLineModel(
+            gene_names=gene_names,
+            gene_index=gene_index,
+            baseline=baseline,
+            program_names=list(self.program_names),
+            program_up=program_up,
+            program_down=program_down,
+            pro_apoptotic_idx=pro_apoptotic_idx,
+            anti_apoptotic_idx=anti_apoptotic_idx,
+            contact_beta=_contact_loadings(gene_names),
+            cycling_fraction=float(cc.get("cycling_fraction_by_cell_line", {}).get(cell_line, 0.3)),
+            cycling_idx=np.array([gene_index[g] for g in cycling], dtype=np.intp),
+            cycling_fc_minus1=np.array([fc - 1.0 for fc in cycling.values()], dtype=np.float64),
+            antagonism_idx=np.array([gene_index[g] for g in antagonism], dtype=np.intp),
+            antagonism_one_minus=np.array([1.0 - m for m in antagonism.values()], dtype=np.float64),
+        )
 
-    baseline = np.array([float(baseline_map.get(g, 0.2)) for g in gene_names], dtype=np.float64)
-    baseline = np.clip(baseline, 1e-6, None)
+    def program_activation(self, vessel_latents: Dict[str, float]) -> Dict[str, float]:
+        """Hill-normalized activation (0..1) per program."""
+        return {
+            k: _sigmoid_hill(np.array([float(vessel_latents.get(k, 0.0)) / max(self.latent_sat, 1e-8)]), hill=self.hill)[0]
+            for k in self.program_names
+        }
+
+    def fold_change(self, cl: ScRNACellLineModel, act: Dict[str, float], viability: float) -> np.ndarray:
+        """
+        Per-gene fold-change from activated programs and viability.
+
+        fold = Π_k (1 + a_k·up_k) (1 + a_k·down_k), applied program by program
+        in file order so the result matches per-gene interpolation exactly.
+        """
+        fold = np.ones(len(cl.gene_names), dtype=np.float64)
+        for k, axis in enumerate(cl.program_names):
+            a = act.get(axis, 0.0)
+            if a <= 0.0:
+                continue
+            # Linear interpolation: fold = 1 + a * (fc - 1)
+            fold *= (1.0 + a * cl.program_up[k])
+            fold *= (1.0 + a * cl.program_down[k])
 
-    # Program activation from vessel latents
-    hill = float(params["dose_response"]["hill"])
-    latent_sat = float(params["dose_response"]["latent_saturation"])
+        # Viability modulates apoptosis genes
+        # Low viability → increase pro-apoptotic (BAX, BBC3), decrease anti-apoptotic (BCL2)
+        fold[cl.pro_apoptotic_idx] *= (1.0 + (1.0 - viability) * 4.0)
+        fold[cl.anti_apoptotic_idx] *= (1.0 - (1.0 - viability) * 0.5)
+        return fold
 
-    # Normalize latents into activation scalars (0..1)
-    latents = {k: float(vessel_latents.get(k, 0.0)) for k in programs.keys()}
-    act = {k: _sigmoid_hill(np.array([latents[k] / max(latent_sat, 1e-8)]), hill=hill)[0] for k in latents}
 
-    # Build per-gene fold-change vector from activated programs
-    fold = np.ones(n_genes, dtype=np.float64)
-    gene_index = {g: i for i, g in enumerate(gene_names)}
+_SCRNA_MODEL_CACHE: Dict[str, tuple] = {}
 
-    for axis, prog in programs.items():
-        a = act.get(axis, 0.0)
-        if a <= 0.0:
-            continue
 
-        for g, fc in prog.get("up", {}).items():
-            if g not in gene_index:
-                continue
-            i = gene_index[g]
-            # Linear interpolation: fold = 1 + a * (fc - 1)
-            fold[i] *= (1.0 + a * (float(fc) - 1.0))
+def _file_key(path: Path) -> tuple:
+    stat = path.stat()
+    return (stat.st_mtime_ns, stat.st_size)
 
-        for g, fc in prog.get("down", {}).items():
-            if g not in gene_index:
-                continue
-            i = gene_index[g]
-            fold[i] *= (1.0 + a * (float(fc) - 1.0))
 
-    # Viability modulates apoptosis genes
-    # Low viability → increase pro-apoptotic (BAX, BBC3), decrease anti-apoptotic (BCL2)
-    viab = float(np.clip(viability, 0.0, 1.0))
-    apoptosis = set(params["genesets"].get("apoptosis", []))
-    for g in apoptosis:
-        if g not in gene_index:
-            continue
-        i = gene_index[g]
-        if g in ("BAX", "BBC3"):  # Pro-apoptotic
-            fold[i] *= (1.0 + (1.0 - viab) * 4.0)
-        if g == "BCL2":  # Anti-apoptotic
-            fold[i] *= (1.0 - (1.0 - viab) * 0.5)
+def load_scrna_model(params_path: str | Path) -> ScRNAModel:
+    """
+    Compiled ScRNAModel for a params file, cached per process.
+
+    The cache entry is rebuilt when the params YAML or the referenced
+    stress-program YAML changes (mtime/size).
+    """
+    params_path = Path(params_path).resolve()
+    cache_key = str(params_path)
+    cached = _SCRNA_MODEL_CACHE.get(cache_key)
+    if cached is not None:
+        file_keys, programs_path, model = cached
+        if file_keys == (_file_key(params_path), _file_key(programs_path)):
+            return model
+
+    params = _load_yaml(params_path)
+    programs_path = Path(params["stress_programs_ref"]).resolve()
+    programs = _load_yaml(programs_path)
+    model = ScRNAModel(params, programs)
+    _SCRNA_MODEL_CACHE[cache_key] = ((_file_key(params_path), _file_key(programs_path)), programs_path, model)
+    return model
 
-    # Subpopulation sampling
-    if subpop_fractions is None:
-        subpop_fractions = {"sensitive": 0.25, "typical": 0.50, "resistant": 0.25}
 
+def _sample_gene_expression(
+    model: ScRNAModel,
+    cl: ScRNACellLineModel,
+    fold: np.ndarray,
+    rng: np.random.Generator,
+    n_cells: int,
+    subpop_fractions: Dict[str, float],
+    contact_pressure: float,
+    batch_mult: np.ndarray,
+):
+    """
+    Expected UMIs per cell after subpops, programs, confounders, depth, batch and dropout.
+
+    Returns (expected, cell_subpop, library_size, cycling_score). Draw order on
+    rng is fixed: subpop, baseline noise, cycling, library size, dropout.
+    """
+    n_genes = len(cl.gene_names)
+
+    # Subpopulation sampling
     subpops = list(subpop_fractions.keys())
     p = np.array([subpop_fractions[s] for s in subpops], dtype=np.float64)
     p = p / p.sum()
 
     cell_subpop = rng.choice(subpops, size=n_cells, p=p)
 
-    subpop_cfg = params["subpop_effects"]
-    program_gain = np.array([float(subpop_cfg[s]["program_gain"]) for s in cell_subpop], dtype=np.float64)
-    baseline_cv = np.array([float(subpop_cfg[s]["baseline_noise_cv"]) for s in cell_subpop], dtype=np.float64)
+    program_gain = np.empty(n_cells, dtype=np.float64)
+    baseline_cv = np.empty(n_cells, dtype=np.float64)
+    for s in subpops:
+        mask = cell_subpop == s
+        program_gain[mask], baseline_cv[mask] = model.subpop_effects[s]
 
     # Per-cell baseline noise (lognormal, captures cell-to-cell variation)
     # mu = -0.5*sigma^2 to preserve mean=1
     mu = -0.5 * (baseline_cv ** 2)
     noise = np.exp(rng.normal(loc=mu[:, None], scale=baseline_cv[:, None], size=(n_cells, n_genes)))
-    expected = baseline[None, :] * noise
+    expected = cl.baseline[None, :] * noise
 
     # Apply stress programs with subpop-specific gain
     # Sensitive cells: program_gain > 1 (stronger response)
@@ -306,45 +409,28 @@ def simulate_scrna_counts(
 
     # Contact inhibition confounder: high confluence shifts expression systematically
     # This is NOT a stress axis - it's a measurement confounder that creates false attribution
-    contact_pressure = float(vessel_latents.get("contact_inhibition", 0.0))
     if contact_pressure > 0.01:
-        expected = _apply_contact_program(expected, contact_pressure, gene_names, gene_index)
+        expected = _apply_contact_program(
+            expected, contact_pressure, cl.gene_names, cl.gene_index, beta=cl.contact_beta
+        )
 
     # Cell cycle confounder: cycling cells show high cycle markers + suppressed stress markers
     # This creates realistic ambiguity: "recovered or just dividing?"
-    cc = params.get("cell_cycle", {})
     cycling_score = None
-    if cc:
-        frac_map = cc.get("cycling_fraction_by_cell_line", {})
-        cycling_frac = float(frac_map.get(cell_line, 0.3))
-
+    if model.cell_cycle:
         # Sample per-cell cycling state (0/1) then convert to continuous score
-        cycling_binary = (rng.random(n_cells) < cycling_frac).astype(np.float64)
+        cycling_binary = (rng.random(n_cells) < cl.cycling_fraction).astype(np.float64)
         cycling_score = cycling_binary * rng.uniform(0.6, 1.0, size=n_cells)
 
-        # Upregulate cell cycle program genes
-        cc_prog = cc.get("cycling_program", {})
-        for g, fc in cc_prog.items():
-            if g in gene_index:
-                i = gene_index[g]
-                # Linear interpolation: 1.0 + cycling_score * (fc - 1.0)
-                expected[:, i] *= (1.0 + cycling_score * (float(fc) - 1.0))
+        # Upregulate cell cycle program genes: 1.0 + cycling_score * (fc - 1.0)
+        expected[:, cl.cycling_idx] *= (1.0 + cycling_score[:, None] * cl.cycling_fc_minus1[None, :])
 
         # CRITICAL: Antagonize stress markers when cycling is high
-        # This creates false "recovery" signal in proliferating cells
-        # Resource competition: dividing cells suppress stress response
-        ant = cc.get("stress_antagonism", {})
-        for g, mult in ant.items():
-            if g in gene_index:
-                i = gene_index[g]
-                # Cycling suppresses stress markers: mult < 1.0
-                # expected[cycling] *= (1.0 - cycling_score * (1.0 - mult))
-                # When cycling_score = 1.0, gene *= mult
-                # When cycling_score = 0.0, gene *= 1.0
-                expected[:, i] *= (1.0 - cycling_score * (1.0 - float(mult)))
+        # Cycling suppresses stress markers (mult < 1.0): gene *= 1 - cycling_score * (1 - mult)
+        expected[:, cl.antagonism_idx] *= (1.0 - cycling_score[:, None] * cl.antagonism_one_minus[None, :])
 
     # Library size scaling: normalize per-cell sum, then scale to sampled library size
-    tech = params["technical_noise"]
+    tech = model.technical_noise
     lib = _sample_library_sizes(
         rng,
         n_cells,
@@ -354,9 +440,81 @@ def simulate_scrna_counts(
     expected_sum = np.clip(expected.sum(axis=1), 1e-8, None)
     expected = expected / expected_sum[:, None] * lib[:, None]
 
+    expected *= batch_mult[None, :]
+
+    # Dropout: low-expression genes randomly undetected
+    p_do = _dropout_prob(expected, alpha=float(tech["dropout_alpha"]), x0=float(tech["dropout_x0"]))
+    dropout_mask = rng.random(size=expected.shape) < p_do
+    expected = np.where(dropout_mask, 0.0, expected)
+
+    return expected, cell_subpop, lib, cycling_score
+
+
+def simulate_scrna_counts(
+    *,
+    cell_line: str,
+    vessel_latents: Dict[str, float],
+    viability: float,
+    n_cells: int,
+    rng: np.random.Generator,
+    params_path: str | Path,
+    batch_id: Optional[str] = None,
+    subpop_fractions: Optional[Dict[str, float]] = None,
+    run_context_latent: Optional[float] = None,
+    chunk_size: Optional[int] = None,
+) -> ScRNASeqResult:
+    """
+    Simulate single-cell RNA-seq UMI counts from vessel latent state.
+
+    Physics → Measurement transformation:
+    1. Baseline expression per cell line
+    2. Stress program activation from vessel latents (er_stress, mito_dysfunction, etc.)
+    3. Subpopulation heterogeneity (program gain + baseline noise)
+    4. Viability effects (apoptosis gene modulation)
+    5. Library size normalization + sampling
+    6. Batch effects (multiplicative per-gene biases)
+    7. Dropout (low-expression genes randomly undetected)
+    8. Ambient RNA contamination
+    9. Poisson sampling (UMI counting noise)
+
+    Args:
+        cell_line: Cell line name (e.g., "A549")
+        vessel_latents: Latent stress states {axis_name: level}
+        viability: Vessel viability [0, 1]
+        n_cells: Number of cells to profile
+        rng: Random number generator (use assay RNG for observer independence)
+        params_path: Path to scrna_seq_params.yaml
+        batch_id: Optional batch identifier for batch effects
+        subpop_fractions: Optional subpop mixture {subpop_name: fraction}
+        run_context_latent: Optional RunContext coupling for correlated batch drift
+        chunk_size: Cells per chunk for large readouts (default SCRNA_CHUNK_CELLS).
+            Up to one chunk the draws on rng are unchanged; larger readouts draw
+            one seed per chunk from rng and simulate chunks from child generators,
+            so peak memory scales with chunk_size instead of n_cells.
+
+    Returns:
+        ScRNASeqResult with counts matrix + metadata
+    """
+    model = load_scrna_model(params_path)
+    cl = model.cell_line(cell_line)
+    n_genes = len(cl.gene_names)
+
+    # Program activation from vessel latents, normalized into (0..1)
+    latents = {k: float(vessel_latents.get(k, 0.0)) for k in model.program_names}
+    act = model.program_activation(latents)
+
+    viab = float(np.clip(viability, 0.0, 1.0))
+    fold = model.fold_change(cl, act, viab)
+
+    if subpop_fractions is None:
+        subpop_fractions = {"sensitive": 0.25, "typical": 0.50, "resistant": 0.25}
+
+    contact_pressure = float(vessel_latents.get("contact_inhibition", 0.0))
+
     # Batch effects (multiplicative per-gene biases)
     # CRITICAL: Batch effects must be deterministic per batch_id, not just RNG state
     # Use stable seeding like cell_painting_assay to ensure same batch_id → same effects
+    tech = model.technical_noise
     batch_mult = np.ones(n_genes, dtype=np.float64)
     if batch_id is not None:
         # Create batch-specific RNG from batch_id hash (deterministic)
@@ -377,21 +535,57 @@ def simulate_scrna_counts(
         if run_context_latent is not None:
             batch_mult *= np.exp(float(run_context_latent) * 0.10)
 
-    expected *= batch_mult[None, :]
-
-    # Dropout: low-expression genes randomly undetected
-    p_do = _dropout_prob(expected, alpha=float(tech["dropout_alpha"]), x0=float(tech["dropout_x0"]))
-    dropout_mask = rng.random(size=expected.shape) < p_do
-    expected = np.where(dropout_mask, 0.0, expected)
-
-    # Ambient RNA: add small fraction of mean profile (cell-free RNA in supernatant)
     ambient_frac = float(tech.get("ambient_fraction", 0.0))
-    if ambient_frac > 0:
-        ambient_profile = expected.mean(axis=0)
-        expected = (1.0 - ambient_frac) * expected + ambient_frac * ambient_profile[None, :]
+    sample_args = (model, cl, fold)
+    sample_kwargs = dict(
+        subpop_fractions=subpop_fractions, contact_pressure=contact_pressure, batch_mult=batch_mult
+    )
+
+    chunk_size = int(chunk_size or SCRNA_CHUNK_CELLS)
+    if n_cells <= chunk_size:
+        expected, cell_subpop, lib, cycling_score = _sample_gene_expression(
+            *sample_args, rng, n_cells, **sample_kwargs
+        )
 
-    # Sample UMI counts: Poisson is the minimal honest model
-    counts = rng.poisson(lam=np.clip(expected, 0.0, None)).astype(np.int32)
+        # Ambient RNA: add small fraction of mean profile (cell-free RNA in supernatant)
+        if ambient_frac > 0:
+            ambient_profile = expected.mean(axis=0)
+            expected = (1.0 - ambient_frac) * expected + ambient_frac * ambient_profile[None, :]
+
+        # Sample UMI counts: Poisson is the minimal honest model
+        counts = rng.poisson(lam=np.clip(expected, 0.0, None)).astype(np.int32)
+    else:
+        # Memory-bounded path: one child generator per chunk. Pass 1 accumulates
+        # the ambient profile; pass 2 regenerates each chunk from the same seed,
+        # mixes in ambient RNA and samples counts into the preallocated matrix.
+        bounds = [(lo, min(lo + chunk_size, n_cells)) for lo in range(0, n_cells, chunk_size)]
+        chunk_seeds = rng.integers(0, 2**63 - 1, size=len(bounds), dtype=np.int64)
+
+        ambient_profile = np.zeros(n_genes, dtype=np.float64)
+        if ambient_frac > 0:
+            for (lo, hi), seed in zip(bounds, chunk_seeds):
+                expected, *_ = _sample_gene_expression(
+                    *sample_args, np.random.default_rng(int(seed)), hi - lo, **sample_kwargs
+                )
+                ambient_profile += expected.sum(axis=0)
+            ambient_profile /= n_cells
+
+        counts = np.empty((n_cells, n_genes), dtype=np.int32)
+        cell_subpop = np.empty(n_cells, dtype=object)
+        lib = np.empty(n_cells, dtype=np.float64)
+        cycling_score = np.empty(n_cells, dtype=np.float64) if model.cell_cycle else None
+        for (lo, hi), seed in zip(bounds, chunk_seeds):
+            rng_chunk = np.random.default_rng(int(seed))
+            expected, subpop_c, lib_c, cycling_c = _sample_gene_expression(
+                *sample_args, rng_chunk, hi - lo, **sample_kwargs
+            )
+            if ambient_frac > 0:
+                expected = (1.0 - ambient_frac) * expected + ambient_frac * ambient_profile[None, :]
+            counts[lo:hi] = rng_chunk.poisson(lam=np.clip(expected, 0.0, None))
+            cell_subpop[lo:hi] = subpop_c
+            lib[lo:hi] = lib_c
+            if cycling_score is not None:
+                cycling_score[lo:hi] = cycling_c
 
     cell_ids = [f"cell_{i:05d}" for i in range(n_cells)]
 
@@ -403,11 +597,11 @@ def simulate_scrna_counts(
         "latents": latents,
         "viability": viab,
         "program_activation": act,
-        "cycling_score": cycling_score.tolist() if cc else None,
+        "cycling_score": cycling_score.tolist() if cycling_score is not None else None,
     }
 
     return ScRNASeqResult(
-        gene_names=gene_names,
+        gene_names=list(cl.gene_names),
         cell_ids=cell_ids,
         counts=counts,
         meta=meta,
@@ -0,0 +1,866 @@
+"""
+Batched (struct-of-arrays) vessel stepping for BiologicalVirtualMachine.
+
+The scalar path (BiologicalVirtualMachine._step_vessel) runs every stress mechanism,
+growth, attrition and death commitment on one VesselState at a time. At 384/1536
+vessels that Python loop dominates plate runs. This module steps every vessel in one
+vectorized pass while keeping VesselState as the authoritative view between steps.
+
+Design:
+    • VesselBatch gathers per-vessel scalars (cell_count, viability, death_* ledgers,
+      stress axes, nutrients, volume) into NumPy columns, and scatters them back.
+    • BatchedVesselEngine.step() mirrors _step_vessel in the same order, operating on
+      columns. Hazard proposals accumulate in an (n_vessels × n_death_fields) matrix.
+    • Logic that is inherently per-vessel and dict-shaped stays scalar and is called
+      as a hook on the VesselState:
+        - compound attrition + mitotic catastrophe (per-exposure biology_core calls)
+        - stochastic commitment sampling (per-lineage event RNG)
+      Both only read fields that are already in sync when the hook runs.
+    • Conservation and non-negativity are checked vectorized. On violation the scalar
+      checker is invoked on the offending vessel so error messages stay identical.
+
+Contract:
+    Batched stepping must match the scalar path to numerical precision (parity suite:
+    tests/unit/hardware/test_vessel_batch_parity.py). Runs with operational
+    contamination enabled fall back to the scalar path (contamination mutates vessel
+    phase in place and is not vectorized).
+"""
+
+import logging
+from typing import TYPE_CHECKING, Any, Iterable
+
+import numpy as np
+
+from .constants import (
+    BASELINE_DEATH_RATE_PER_H,
+    CONTACT_PRESSURE_C0,
+    CONTACT_PRESSURE_TAU_H,
+    CONTACT_PRESSURE_WIDTH,
+    DEATH_EPS,
+    DEFAULT_EVAPORATION_RATE_UL_PER_H,
+    DNA_DAMAGE_BOOST,
+    DNA_DAMAGE_DEATH_THETA,
+    DNA_DAMAGE_DEATH_WIDTH,
+    DNA_DAMAGE_H_MAX,
+    DNA_DAMAGE_K_ACCUM,
+    DNA_DAMAGE_K_OFF,
+    DNA_DAMAGE_K_ON,
+    DNA_DAMAGE_K_REPAIR,
+    DNA_DAMAGE_RECOVERY_SLOW,
+    EDGE_EVAPORATION_MULTIPLIER,
+    ENABLE_CONTINUOUS_SUBTHRESHOLD_COST,
+    ENABLE_DNA_DAMAGE,
+    ENABLE_ER_MITO_COUPLING,
+    ENABLE_ER_STRESS,
+    ENABLE_MITO_DYSFUNCTION,
+    ENABLE_NUTRIENT_DEPLETION,
+    ENABLE_OXIDATIVE_DNA_COUPLING,
+    ENABLE_SYNERGISTIC_COUPLING,
+    ENABLE_TRANSPORT_DYSFUNCTION,
+    ENABLE_TRANSPORT_MITO_COUPLING,
+    ER_DAMAGE_BOOST,
+    ER_DAMAGE_K_ACCUM,
+    ER_DAMAGE_K_REPAIR,
+    ER_DAMAGE_RECOVERY_SLOW,
+    ER_MITO_COUPLING_D0,
+    ER_MITO_COUPLING_K,
+    ER_MITO_COUPLING_SLOPE,
+    ER_STRESS_DEATH_THETA,
+    ER_STRESS_DEATH_WIDTH,
+    ER_STRESS_H_MAX,
+    ER_STRESS_K_OFF,
+    ER_STRESS_K_ON,
+    GLUCOSE_STRESS_THRESHOLD_mM,
+    GLUTAMINE_STRESS_THRESHOLD_mM,
+    INTERNAL_STRESS_TIMESTEP_H,
+    MAX_STARVATION_RATE_PER_H,
+    MITO_DAMAGE_BOOST,
+    MITO_DAMAGE_K_ACCUM,
+    MITO_DAMAGE_K_REPAIR,
+    MITO_DAMAGE_RECOVERY_SLOW,
+    MITO_DYSFUNCTION_DEATH_THETA,
+    MITO_DYSFUNCTION_DEATH_WIDTH,
+    MITO_DYSFUNCTION_H_MAX,
+    MITO_DYSFUNCTION_K_OFF,
+    MITO_DYSFUNCTION_K_ON,
+    OXIDATIVE_DNA_COUPLING_RATE,
+    OXIDATIVE_DNA_COUPLING_THRESHOLD,
+    SUBTHRESHOLD_STRESS_GROWTH_PENALTY,
+    SYNERGY_GATE_S0,
+    SYNERGY_K_HAZARD,
+    TRACKED_DEATH_FIELDS,
+    TRANSPORT_DAMAGE_BOOST,
+    TRANSPORT_DAMAGE_K_ACCUM,
+    TRANSPORT_DAMAGE_K_REPAIR,
+    TRANSPORT_DAMAGE_RECOVERY_SLOW,
+    TRANSPORT_DYSFUNCTION_K_OFF,
+    TRANSPORT_DYSFUNCTION_K_ON,
+    TRANSPORT_MITO_COUPLING_DELAY_H,
+    TRANSPORT_MITO_COUPLING_RATE,
+    TRANSPORT_MITO_COUPLING_THRESHOLD,
+    VESSEL_EVAPORATION_RATES_UL_PER_H,
+    DEFAULT_MEDIA_GLUCOSE_mM,
+    DEFAULT_MEDIA_GLUTAMINE_mM,
+)
+
+if TYPE_CHECKING:
+    from .biological_virtual import BiologicalVirtualMachine, VesselState
+
+logger = logging.getLogger(__name__)
+
+# Stable column order for the death ledger matrix (TRACKED_DEATH_FIELDS is a frozenset)
+LEDGER_FIELDS: tuple[str, ...] = tuple(sorted(TRACKED_DEATH_FIELDS))
+_LEDGER_INDEX = {field: i for i, field in enumerate(LEDGER_FIELDS)}
+
+# Scalar VesselState fields mirrored as float columns (None ↔ NaN), with getattr defaults
+STATE_FIELDS: dict[str, float] = {
+    "cell_count": 0.0,
+    "viability": 1.0,
+    "confluence": 0.0,
+    "vessel_capacity": 1e7,
+    "seed_time": 0.0,
+    "current_volume_ml": np.nan,
+    "working_volume_ml": np.nan,
+    "total_evaporated_ml": 0.0,
+    "contact_pressure": 0.0,
+    "er_stress": 0.0,
+    "er_damage": 0.0,
+    "mito_dysfunction": 0.0,
+    "mito_damage": 0.0,
+    "transport_dysfunction": 0.0,
+    "transport_damage": 0.0,
+    "dna_damage": 0.0,
+    "dna_damage_memory": 0.0,
+    "media_glucose_mM": DEFAULT_MEDIA_GLUCOSE_mM,
+    "media_glutamine_mM": DEFAULT_MEDIA_GLUTAMINE_mM,
+    "transport_high_since": np.nan,
+    "cytotox_released_since_feed": 0.0,
+    "death_unattributed": 0.0,
+}
+
+# Fields that may legitimately be None on VesselState (scattered back as None when NaN)
+_OPTIONAL_FIELDS = frozenset({"current_volume_ml", "working_volume_ml", "transport_high_since"})
+
+# Commitment mechanism names → (stress column, enabled attr, threshold attr)
+_COMMITMENT_MECHANISMS = (
+    ("er_stress", "er_stress", "er_commitment_enabled", "er_commitment_threshold"),
+    ("mito", "mito_dysfunction", "mito_commitment_enabled", "mito_commitment_threshold"),
+    ("dna", "dna_damage", "dna_commitment_enabled", "dna_commitment_threshold"),
+)
+
+
+class VesselBatch:
+    """
+    Struct-of-arrays view over a list of VesselState objects.
+
+    Columns are float64 arrays named after the VesselState attribute they mirror
+    (see STATE_FIELDS). Death ledgers live in ``ledger`` (n_vessels × len(LEDGER_FIELDS)).
+    """
+
+    def __init__(self, vessel_ids: list[str], columns: dict[str, np.ndarray], ledger: np.ndarray):
+        self.vessel_ids = vessel_ids
+        self.columns = columns
+        self.ledger = ledger
+
+    def __len__(self) -> int:
+        return len(self.vessel_ids)
+
+    def __getattr__(self, name: str) -> np.ndarray:
+        columns = self.__dict__.get("columns")
+        if columns is not None and name in columns:
+            return columns[name]
+        if name in _LEDGER_INDEX:
+            return self.__dict__["ledger"][:, _LEDGER_INDEX[name]]
+        raise AttributeError(name)
+
+    @classmethod
+    def gather(cls, vessels: Iterable["VesselState"]) -> "VesselBatch":
+        """Copy scalar state from VesselState objects into columns."""
+        vessels = list(vessels)
+        columns = {}
+        for field, default in STATE_FIELDS.items():
+            values = []
+            for v in vessels:
+                x = getattr(v, field, default)
+                values.append(np.nan if x is None else x)
+            columns[field] = np.array(values, dtype=float)
+        ledger = np.array(
+            [[getattr(v, field, 0.0) for field in LEDGER_FIELDS] for v in vessels], dtype=float
+        ).reshape(len(vessels), len(LEDGER_FIELDS))
+        return cls([v.vessel_id for v in vessels], columns, ledger)
+
+    def scatter(self, vessels: Iterable["VesselState"]) -> None:
+        """Write every column back into the VesselState objects (same order as gather)."""
+        for i, vessel in enumerate(vessels):
+            self.scatter_row(vessel, i)
+
+    def scatter_row(self, vessel: "VesselState", i: int) -> None:
+        """Write row i back into a single VesselState."""
+        for field, column in self.columns.items():
+            x = float(column[i])
+            setattr(vessel, field, None if field in _OPTIONAL_FIELDS and np.isnan(x) else x)
+        for j, field in enumerate(LEDGER_FIELDS):
+            setattr(vessel, field, float(self.ledger[i, j]))
+
+
+class BatchedVesselEngine:
+    """
+    Vectorized replacement for the per-vessel loop in advance_time.
+
+    Owns no persistent biology state: VesselState remains authoritative between steps,
+    so seed/feed/treat/washout and every assay keep working unchanged. Per-vessel
+    constants that never change (edge status) are cached by vessel_id.
+    """
+
+    def __init__(self, vm: "BiologicalVirtualMachine"):
+        self.vm = vm
+        self._edge_cache: dict[str, bool] = {}
+
+    def can_step(self) -> bool:
+        """Batched stepping is unavailable while operational contamination is enabled."""
+        config = self.vm.contamination_config
+        return not (config and config.get("enabled", False))
+
+    def _is_edge(self, vessel_id: str) -> bool:
+        is_edge = self._edge_cache.get(vessel_id)
+        if is_edge is None:
+            import re
+
+            well_match = re.search(r"([A-P]\d{1,2})$", vessel_id)
+            is_edge = bool(well_match) and self.vm._is_edge_well(well_match.group(1))
+            self._edge_cache[vessel_id] = is_edge
+        return is_edge
+
+    def _mirror_exposures(self, vessels: list["VesselState"]) -> None:
+        """Step 0 of _step_vessel: mirror authoritative concentrations into VesselState."""
+        injection_mgr = self.vm.injection_mgr
+        if injection_mgr is None:
+            return
+        for vessel in vessels:
+            if injection_mgr.has_vessel(vessel.vessel_id):
+                vessel.compounds = injection_mgr.get_all_compounds_uM(vessel.vessel_id)
+                vessel.media_glucose_mM = injection_mgr.get_nutrient_conc_mM(
+                    vessel.vessel_id, "glucose"
+                )
+                vessel.media_glutamine_mM = injection_mgr.get_nutrient_conc_mM(
+                    vessel.vessel_id, "glutamine"
+                )
+
+    def _vessel_parameters(self, vessels: list["VesselState"]) -> dict[str, np.ndarray]:
+        """Per-vessel constants for this step (cell line params, random effects, inductions)."""
+        vm = self.vm
+        n = len(vessels)
+        p = {
+            name: np.zeros(n)
+            for name in (
+                "doubling_time_h",
+                "nutrient_doubling_time_h",
+                "max_confluence",
+                "lag_duration_h",
+                "edge_penalty",
+                "growth_rate_mult",
+                "hazard_scale_mult",
+                "commit_hazard_scale_mult",
+                "stress_sensitivity_mult",
+                "death_threshold_shift_mult",
+                "evap_rate_ul_per_h",
+                "er_induction",
+                "mito_induction",
+                "transport_induction",
+                "dna_induction",
+            )
+        }
+        p["is_edge"] = np.zeros(n, dtype=bool)
+        p["has_exposures"] = np.zeros(n, dtype=bool)
+        p["tracks_volume"] = np.zeros(n, dtype=bool)
+
+        for i, vessel in enumerate(vessels):
+            params = vm.cell_line_params.get(vessel.cell_line, vm.defaults)
+            p["doubling_time_h"][i] = params.get(
+                "doubling_time_h", vm.defaults.get("doubling_time_h", 24.0)
+            )
+            p["nutrient_doubling_time_h"][i] = params.get("doubling_time_h", 24.0)
+            p["max_confluence"][i] = params.get(
+                "max_confluence", vm.defaults.get("max_confluence", 0.9)
+            )
+            p["lag_duration_h"][i] = params.get(
+                "lag_duration_h", vm.defaults.get("lag_duration_h", 12.0)
+            )
+            p["edge_penalty"][i] = params.get("edge_penalty", vm.defaults.get("edge_penalty", 0.15))
+            p["is_edge"][i] = self._is_edge(vessel.vessel_id)
+
+            bio_re = getattr(vessel, "bio_random_effects", None) or {}
+            p["growth_rate_mult"][i] = float(bio_re.get("growth_rate_mult", 1.0))
+            p["hazard_scale_mult"][i] = float(bio_re.get("hazard_scale_mult", 1.0))
+            p["commit_hazard_scale_mult"][i] = float(bio_re.get("hazard_scale_mult", 1.0))
+            p["stress_sensitivity_mult"][i] = float(bio_re.get("stress_sensitivity_mult", 1.0))
+            p["death_threshold_shift_mult"][i] = float(
+                bio_re.get("death_threshold_shift_mult", 1.0)
+            )
+            ic50_shift_mult = float(bio_re.get("ic50_shift_mult", 1.0))
+
+            p["tracks_volume"][i] = (
+                vessel.current_volume_ml is not None and vessel.vessel_type is not None
+            )
+            p["evap_rate_ul_per_h"][i] = VESSEL_EVAPORATION_RATES_UL_PER_H.get(
+                vessel.vessel_type, DEFAULT_EVAPORATION_RATE_UL_PER_H
+            )
+            p["has_exposures"][i] = bool((vessel.compound_meta or {}).get("exposures"))
+
+            # Induction terms (same accumulation order as the stress mechanisms)
+            er = mito = transport = dna_direct = dna_oxidative = 0.0
+            for compound, dose_uM in (vessel.compounds or {}).items():
+                if dose_uM <= 0:
+                    continue
+                meta = vessel.compound_meta.get(compound)
+                if not meta:
+                    continue
+                stress_axis = meta["stress_axis"]
+                ic50_shifted = max(1e-12, float(meta["ic50_uM"]) * ic50_shift_mult)
+                f_axis = float(dose_uM / (dose_uM + ic50_shifted)) * meta.get("potency_scalar", 1.0)
+                if stress_axis in ("er_stress", "proteostasis"):
+                    er += f_axis
+                if stress_axis == "mitochondrial":
+                    mito += f_axis
+                if stress_axis == "microtubule":
+                    transport += f_axis
+                if stress_axis == "dna_damage":
+                    dna_direct += f_axis
+                if stress_axis == "oxidative":
+                    coupling_factor = meta.get("dna_damage_coupling", 0.0)
+                    if coupling_factor > 0:
+                        dna_oxidative += f_axis * coupling_factor
+            p["er_induction"][i] = min(1.0, er)
+            p["mito_induction"][i] = mito
+            p["transport_induction"][i] = min(1.0, transport)
+            p["dna_induction"][i] = dna_direct + dna_oxidative
+
+        return p
+
+    @staticmethod
+    def _integrate_stress(S, D, dt, n_substeps, k_on, induction, k_off, k_accum, k_repair,
+                          boost, recovery_slow, contact_rate):
+        """Forward-Euler substeps of the coupled damage/stress ODE (damage first)."""
+        for _ in range(n_substeps):
+            dD_dt = k_accum * S - k_repair * D
+            D = np.clip(D + dD_dt * dt, 0.0, 1.0)
+            k_on_boosted = k_on * (1.0 + boost * D * D)
+            k_off_effective = k_off / (1.0 + recovery_slow * D)
+            dS_dt = k_on_boosted * induction * (1.0 - S) - k_off_effective * S
+            if contact_rate is not None:
+                dS_dt = dS_dt + contact_rate * (1.0 - S)
+            S = np.clip(S + dS_dt * dt, 0.0, 1.0)
+        return S, D
+
+    @staticmethod
+    def _death_sigmoid(S, theta, width, h_max):
+        """Vessel-level death hazard: h_max * sigmoid((S - theta)/width) above theta, else 0."""
+        x = (S - theta) / width
+        with np.errstate(over="ignore"):
+            hazard = h_max * (1.0 / (1.0 + np.exp(-x)))
+        return np.where(S > theta, hazard, 0.0)
+
+    @staticmethod
+    def _mean_lag_factor(a, dt_h, lag):
+        """Vectorized biology_core.mean_lag_factor_over_interval."""
+        b = a + dt_h
+        safe_lag = np.where(lag > 0, lag, 1.0)
+        x0 = np.maximum(0.0, np.minimum(a, lag))
+        x1 = np.maximum(0.0, np.minimum(b, lag))
+        ramp_area = np.where(x1 > x0, (x1 * x1 - x0 * x0) / (2.0 * safe_lag), 0.0)
+        plateau_start = np.maximum(a, lag)
+        plateau_area = np.where(b > plateau_start, b - plateau_start, 0.0)
+        mean_factor = (ramp_area + plateau_area) / dt_h
+        return np.where(lag <= 0, 1.0, np.minimum(1.0, np.maximum(0.0, mean_factor)))
+
+    def _propose(self, hazards: np.ndarray, mask: Any, values: Any, death_field: str) -> None:
+        """Accumulate hazard proposals (already >= 0) into the ledger column for death_field."""
+        j = _LEDGER_INDEX[death_field]
+        hazards[:, j] += np.where(mask, np.maximum(0.0, values), 0.0)
+
+    def step(self, hours: float) -> None:
+        """
+        Advance every vessel over [t0, t0 + hours) in one vectorized pass.
+
+        Mirrors BiologicalVirtualMachine._step_vessel step for step. The caller
+        (advance_time) owns event flushing, InjectionManager evaporation and the clock.
+        """
+        vm = self.vm
+        hours = float(hours)
+        vessels = list(vm.vessel_states.values())
+        if not vessels or hours <= 0:
+            return
+
+        t0 = float(vm.simulated_time)
+        n = len(vessels)
+        bio_mods = vm.run_context.get_biology_modifiers()
+        stress_sensitivity = bio_mods["stress_sensitivity"]
+        growth_rate_multiplier = bio_mods["growth_rate_multiplier"]
+
+        # 0) Mirror concentrations, then gather
+        self._mirror_exposures(vessels)
+        b = VesselBatch.gather(vessels)
+        p = self._vessel_parameters(vessels)
+        c = b.columns
+        hazards = np.zeros((n, len(LEDGER_FIELDS)))
+
+        # 1a) Stress at start of interval
+        stress_t0 = np.maximum(np.maximum(c["er_stress"], c["mito_dysfunction"]),
+                               c["transport_dysfunction"])
+
+        # 1b) Volume (evaporation)
+        tracks = p["tracks_volume"]
+        edge_mult = np.where(p["is_edge"], EDGE_EVAPORATION_MULTIPLIER, 1.0)
+        evap_ml = ((p["evap_rate_ul_per_h"] * edge_mult) / 1000.0) * hours
+        min_volume = c["working_volume_ml"] * 0.10
+        c["current_volume_ml"] = np.where(
+            tracks, np.maximum(min_volume, c["current_volume_ml"] - evap_ml), c["current_volume_ml"]
+        )
+        c["total_evaporated_ml"] = np.where(
+            tracks, c["total_evaporated_ml"] + evap_ml, c["total_evaporated_ml"]
+        )
+        self._warn_evaporation(vessels, b, tracks)
+
+        # 1c) Contact pressure
+        cap_floor = np.maximum(c["vessel_capacity"], 1.0)
+        confluence = c["cell_count"] / cap_floor
+        c["confluence"] = confluence
+        x = (confluence - CONTACT_PRESSURE_C0) / max(CONTACT_PRESSURE_WIDTH, 1e-6)
+        with np.errstate(over="ignore"):
+            p_inst = 1.0 / (1.0 + np.exp(-x))
+        alpha = 1.0 - np.exp(-hours / max(CONTACT_PRESSURE_TAU_H, 1e-6))
+        p_current = c["contact_pressure"]
+        c["contact_pressure"] = np.clip(p_current + alpha * (p_inst - p_current), 0.0, 1.0)
+        contact = np.clip(c["contact_pressure"], 0.0, 1.0)
+
+        # Step bookkeeping (start-of-step snapshot)
+        viability_start = np.clip(c["viability"], 0.0, 1.0)
+        cell_count_start = np.maximum(0.0, c["cell_count"])
+
+        # 1e) Stress mechanisms
+        if ENABLE_NUTRIENT_DEPLETION:
+            self._step_nutrients(b, p, hazards, hours)
+
+        n_substeps = max(1, int(np.ceil(hours / INTERNAL_STRESS_TIMESTEP_H)))
+        dt = hours / n_substeps
+
+        if ENABLE_ER_STRESS:
+            k_on = ER_STRESS_K_ON * stress_sensitivity * p["stress_sensitivity_mult"]
+            c["er_stress"], c["er_damage"] = self._integrate_stress(
+                c["er_stress"], c["er_damage"], dt, n_substeps, k_on, p["er_induction"],
+                ER_STRESS_K_OFF, ER_DAMAGE_K_ACCUM, ER_DAMAGE_K_REPAIR, ER_DAMAGE_BOOST,
+                ER_DAMAGE_RECOVERY_SLOW, 0.02 * contact,
+            )
+
+        if ENABLE_TRANSPORT_DYSFUNCTION:
+            k_on = TRANSPORT_DYSFUNCTION_K_ON * stress_sensitivity * p["stress_sensitivity_mult"]
+            c["transport_dysfunction"], c["transport_damage"] = self._integrate_stress(
+                c["transport_dysfunction"], c["transport_damage"], dt, n_substeps, k_on,
+                p["transport_induction"], TRANSPORT_DYSFUNCTION_K_OFF, TRANSPORT_DAMAGE_K_ACCUM,
+                TRANSPORT_DAMAGE_K_REPAIR, TRANSPORT_DAMAGE_BOOST, TRANSPORT_DAMAGE_RECOVERY_SLOW,
+                0.01 * contact,
+            )
+
+        if ENABLE_MITO_DYSFUNCTION:
+            coupling = np.zeros(n)
+            if ENABLE_TRANSPORT_MITO_COUPLING:
+                high = c["transport_dysfunction"] > TRANSPORT_MITO_COUPLING_THRESHOLD
+                since = np.where(
+                    high & np.isnan(c["transport_high_since"]), t0, c["transport_high_since"]
+                )
+                c["transport_high_since"] = np.where(high, since, np.nan)
+                coupling = np.where(
+                    high & ((t0 - since) >= TRANSPORT_MITO_COUPLING_DELAY_H),
+                    TRANSPORT_MITO_COUPLING_RATE,
+                    0.0,
+                )
+            induction = np.minimum(1.0, p["mito_induction"] + coupling)
+            k_on = MITO_DYSFUNCTION_K_ON * stress_sensitivity * p["stress_sensitivity_mult"]
+            if ENABLE_ER_MITO_COUPLING:
+                sigmoid = 1.0 / (
+                    1.0 + np.exp(-ER_MITO_COUPLING_SLOPE * (c["er_damage"] - ER_MITO_COUPLING_D0))
+                )
+                k_on = k_on * np.minimum(
+                    1.0 + ER_MITO_COUPLING_K * sigmoid, 1.0 + ER_MITO_COUPLING_K
+                )
+            c["mito_dysfunction"], c["mito_damage"] = self._integrate_stress(
+                c["mito_dysfunction"], c["mito_damage"], dt, n_substeps, k_on, induction,
+                MITO_DYSFUNCTION_K_OFF, MITO_DAMAGE_K_ACCUM, MITO_DAMAGE_K_REPAIR,
+                MITO_DAMAGE_BOOST, MITO_DAMAGE_RECOVERY_SLOW, 0.015 * contact,
+            )
+
+        if ENABLE_DNA_DAMAGE:
+            mito_coupling = np.zeros(n)
+            if ENABLE_OXIDATIVE_DNA_COUPLING:
+                excess = c["mito_dysfunction"] - OXIDATIVE_DNA_COUPLING_THRESHOLD
+                mito_coupling = np.where(
+                    c["mito_dysfunction"] > OXIDATIVE_DNA_COUPLING_THRESHOLD,
+                    OXIDATIVE_DNA_COUPLING_RATE * excess,
+                    0.0,
+                )
+            induction = np.minimum(1.0, p["dna_induction"] + mito_coupling)
+            k_on = DNA_DAMAGE_K_ON * stress_sensitivity * p["stress_sensitivity_mult"]
+            c["dna_damage"], c["dna_damage_memory"] = self._integrate_stress(
+                c["dna_damage"], c["dna_damage_memory"], dt, n_substeps, k_on, induction,
+                DNA_DAMAGE_K_OFF, DNA_DAMAGE_K_ACCUM, DNA_DAMAGE_K_REPAIR, DNA_DAMAGE_BOOST,
+                DNA_DAMAGE_RECOVERY_SLOW, None,
+            )
+
+        # Stochastic commitment (per-lineage event RNG → order-independent scalar hook)
+        committed_mechanism = self._sample_commitment(vessels, b, hours)
+
+        theta_mult = p["death_threshold_shift_mult"]
+        stochastic = vm.stochastic_biology
+        if ENABLE_ER_STRESS:
+            self._propose(hazards, True, self._death_sigmoid(
+                c["er_stress"], ER_STRESS_DEATH_THETA * theta_mult, ER_STRESS_DEATH_WIDTH,
+                ER_STRESS_H_MAX), "death_er_stress")
+            self._propose(hazards, committed_mechanism == "er_stress",
+                          stochastic.er_committed_death_hazard_per_h, "death_committed_er")
+        if ENABLE_MITO_DYSFUNCTION:
+            self._propose(hazards, True, self._death_sigmoid(
+                c["mito_dysfunction"], MITO_DYSFUNCTION_DEATH_THETA * theta_mult,
+                MITO_DYSFUNCTION_DEATH_WIDTH, MITO_DYSFUNCTION_H_MAX), "death_mito_dysfunction")
+            self._propose(hazards, committed_mechanism == "mito",
+                          stochastic.mito_committed_death_hazard_per_h, "death_committed_mito")
+        if ENABLE_DNA_DAMAGE:
+            self._propose(hazards, True, self._death_sigmoid(
+                c["dna_damage"], DNA_DAMAGE_DEATH_THETA * theta_mult, DNA_DAMAGE_DEATH_WIDTH,
+                DNA_DAMAGE_H_MAX), "death_dna_damage")
+            self._propose(hazards, committed_mechanism == "dna",
+                          stochastic.dna_committed_death_hazard_per_h, "death_committed_dna")
+
+        # 1f-1h) Interval-average stress → growth
+        stress_t1 = np.maximum(np.maximum(c["er_stress"], c["mito_dysfunction"]),
+                               c["transport_dysfunction"])
+        stress_mean = 0.5 * (stress_t0 + stress_t1)
+        self._step_growth(b, p, stress_mean, contact, growth_rate_multiplier, t0, hours)
+
+        # 2) Compound attrition (scalar hook, only vessels with exposures)
+        self._apply_attrition_hooks(vessels, b, p, hazards, hours)
+
+        if ENABLE_SYNERGISTIC_COUPLING:
+            def gate(s):
+                return np.maximum(0.0, (s - SYNERGY_GATE_S0) / (1.0 - SYNERGY_GATE_S0))
+
+            syn = gate(np.clip(c["er_stress"], 0.0, 1.0)) * gate(
+                np.clip(c["mito_dysfunction"], 0.0, 1.0)
+            )
+            self._propose(hazards, syn > 0.0, SYNERGY_K_HAZARD * syn, "death_compound")
+
+        # 2b) Chronic damage hazard (worst scar dominates)
+        er_dmg, mito_dmg, transport_dmg = c["er_damage"], c["mito_damage"], c["transport_damage"]
+        max_damage = np.clip(np.maximum(np.maximum(er_dmg, mito_dmg), transport_dmg), 0.0, 1.0)
+        chronic = 0.01 * (max_damage**2.0)
+        scarred = max_damage > 0.01
+        er_wins = (er_dmg >= mito_dmg) & (er_dmg >= transport_dmg)
+        mito_wins = ~er_wins & (mito_dmg >= transport_dmg)
+        self._propose(hazards, scarred & er_wins, chronic, "death_er_stress")
+        self._propose(hazards, scarred & mito_wins, chronic, "death_mito_dysfunction")
+        self._propose(hazards, scarred & ~er_wins & ~mito_wins, chronic, "death_compound")
+
+        # 2c) Baseline turnover
+        if BASELINE_DEATH_RATE_PER_H > 0.0:
+            self._propose(hazards, True, BASELINE_DEATH_RATE_PER_H, "death_unknown")
+
+        # 3) Commit death
+        total_hazard, total_kill = self._commit_death(vessels, b, p, hazards, hours)
+
+        # 3b) Post-washout stress recovery
+        self._apply_stress_recovery(vessels, b, p, t0, hours)
+
+        # 4) Confluence cap (no killing)
+        over = c["confluence"] > p["max_confluence"]
+        c["cell_count"] = np.where(over, p["max_confluence"] * c["vessel_capacity"], c["cell_count"])
+        c["confluence"] = np.where(over, p["max_confluence"], c["confluence"])
+
+        # 5) Death mode + conservation
+        death_modes = self._update_death_mode(vessels, b)
+
+        # Scatter back into the authoritative VesselState view
+        b.scatter(vessels)
+        t1 = float(t0 + hours)
+        for i, vessel in enumerate(vessels):
+            vessel.death_mode = death_modes[i]
+            vessel._step_viability_start = float(viability_start[i])
+            vessel._step_cell_count_start = float(cell_count_start[i])
+            vessel._step_total_hazard = float(total_hazard[i])
+            vessel._step_total_kill = float(total_kill[i])
+            vessel._step_ledger_scale = 1.0
+            vessel.last_update_time = t1
+            vessel._step_hazard_proposals = None
+
+        if ENABLE_NUTRIENT_DEPLETION and vm.injection_mgr is not None:
+            for i, vessel in enumerate(vessels):
+                if vm.injection_mgr.has_vessel(vessel.vessel_id):
+                    vm.injection_mgr.set_nutrients_mM(
+                        vessel.vessel_id,
+                        {
+                            "glucose": float(c["media_glucose_mM"][i]),
+                            "glutamine": float(c["media_glutamine_mM"][i]),
+                        },
+                        now_h=t1,
+                    )
+
+    def _warn_evaporation(self, vessels, b: VesselBatch, tracks: np.ndarray) -> None:
+        c = b.columns
+        working = c["working_volume_ml"]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            loss = 1.0 - (c["current_volume_ml"] / working)
+        for i in np.flatnonzero(tracks & ~np.isnan(working) & (loss > 0.20)):
+            vessel = vessels[i]
+            if getattr(vessel, "_evaporation_warning_emitted", False):
+                continue
+            logger.warning(
+                f"Vessel {vessel.vessel_id} has lost {loss[i] * 100:.1f}% volume to evaporation. "
+                f"Current: {c['current_volume_ml'][i] * 1000:.1f}µL, "
+                f"Working: {working[i] * 1000:.1f}µL"
+            )
+            vessel._evaporation_warning_emitted = True
+
+    def _step_nutrients(self, b: VesselBatch, p, hazards: np.ndarray, hours: float) -> None:
+        """Vectorized NutrientDepletionMechanism.update."""
+        c = b.columns
+        media_buffer = np.maximum(1.0, c["vessel_capacity"] / 1e7)
+        viable_cells_t1 = c["cell_count"] * c["viability"]
+        growth_rate = np.log(2.0) / p["nutrient_doubling_time_h"]
+        viable_cells_t0 = viable_cells_t1 / np.exp(growth_rate * hours)
+        viable_cells_mean = np.maximum(0.0, 0.5 * (viable_cells_t0 + viable_cells_t1))
+
+        glucose_drop = (viable_cells_mean / 1e7) * (0.8 / media_buffer) * hours
+        glutamine_drop = (viable_cells_mean / 1e7) * (0.12 / media_buffer) * hours
+        c["media_glucose_mM"] = np.maximum(0.0, c["media_glucose_mM"] - glucose_drop)
+        c["media_glutamine_mM"] = np.maximum(0.0, c["media_glutamine_mM"] - glutamine_drop)
+
+        glucose_stress = np.maximum(
+            0.0,
+            (GLUCOSE_STRESS_THRESHOLD_mM - c["media_glucose_mM"]) / GLUCOSE_STRESS_THRESHOLD_mM,
+        )
+        glutamine_stress = np.maximum(
+            0.0,
+            (GLUTAMINE_STRESS_THRESHOLD_mM - c["media_glutamine_mM"])
+            / GLUTAMINE_STRESS_THRESHOLD_mM,
+        )
+        nutrient_stress = np.maximum(glucose_stress, glutamine_stress)
+        starvation_rate = MAX_STARVATION_RATE_PER_H * nutrient_stress * p["hazard_scale_mult"]
+        self._propose(hazards, nutrient_stress > 0.0, starvation_rate, "death_starvation")
+
+    def _sample_commitment(self, vessels, b: VesselBatch, hours: float) -> np.ndarray:
+        """Run maybe_trigger_commitment on candidate vessels; return committed mechanism per vessel."""
+        stochastic = self.vm.stochastic_biology
+        c = b.columns
+        for mechanism, column, enabled_attr, threshold_attr in _COMMITMENT_MECHANISMS:
+            if not getattr(stochastic, enabled_attr, False):
+                continue
+            # compute_commitment_hazard is zero at or below threshold → no event possible
+            candidates = np.flatnonzero(c[column] > getattr(stochastic, threshold_attr))
+            for i in candidates:
+                stochastic.maybe_trigger_commitment(
+                    vessel=vessels[i],
+                    mechanism=mechanism,
+                    stress_S=float(c[column][i]),
+                    sim_time_h=self.vm.simulated_time,
+                    dt_h=hours,
+                )
+        return np.array(
+            [v.death_commitment_mechanism if v.death_committed else None for v in vessels],
+            dtype=object,
+        )
+
+    def _step_growth(self, b: VesselBatch, p, stress_mean, contact, growth_rate_multiplier,
+                     t0: float, hours: float) -> None:
+        """Vectorized _update_vessel_growth (predictor-corrector saturation)."""
+        c = b.columns
+        grows = (c["cell_count"] != 0) & (c["viability"] > 0.01)
+
+        effective_doubling_time = p["doubling_time_h"] / growth_rate_multiplier
+        effective_doubling_time = effective_doubling_time / p["growth_rate_mult"]
+        growth_rate = np.log(2) / effective_doubling_time
+
+        lag_factor = self._mean_lag_factor(t0 - c["seed_time"], hours, p["lag_duration_h"])
+        edge_penalty = np.where(p["is_edge"], p["edge_penalty"], 0.0)
+        contact_inhibition_factor = 1.0 - (0.20 * contact)
+
+        stress_penalty_factor = 1.0
+        if ENABLE_CONTINUOUS_SUBTHRESHOLD_COST:
+            max_stress = np.clip(stress_mean, 0.0, 1.0)
+            stress_penalty_factor = np.maximum(
+                0.0, 1.0 - (SUBTHRESHOLD_STRESS_GROWTH_PENALTY * max_stress)
+            )
+
+        effective_growth_rate = (
+            growth_rate
+            * lag_factor
+            * (1.0 - edge_penalty)
+            * growth_rate_multiplier
+            * contact_inhibition_factor
+            * stress_penalty_factor
+        )
+
+        cap = np.maximum(c["vessel_capacity"], 1.0)
+        n0 = c["cell_count"]
+        max_confluence = p["max_confluence"]
+
+        def sat_factor(confluence):
+            return np.maximum(0.0, np.minimum(1.0, 1.0 - (confluence / max_confluence) ** 2))
+
+        gf0 = sat_factor(n0 / cap)
+        with np.errstate(over="ignore"):
+            n1_pred = n0 * np.exp(effective_growth_rate * hours * gf0)
+        gf1 = sat_factor(n1_pred / cap)
+        gf_mean = 0.5 * (gf0 + gf1)
+        with np.errstate(over="ignore"):
+            grown = n0 * np.exp(effective_growth_rate * hours * gf_mean)
+
+        c["cell_count"] = np.where(grows, grown, n0)
+        c["confluence"] = np.where(grows, c["cell_count"] / cap, c["confluence"])
+
+        if np.any(c["cell_count"] < 0.0):
+            i = int(np.flatnonzero(c["cell_count"] < 0.0)[0])
+            raise AssertionError(
+                f"NON-NEGATIVE INVARIANT VIOLATION: negative cell count after growth!\n"
+                f"  vessel_id: {b.vessel_ids[i]}\n"
+                f"  cell_count: {c['cell_count'][i]:.2f}\n"
+                f"Growth should never produce negative counts."
+            )
+
+    def _apply_attrition_hooks(self, vessels, b: VesselBatch, p, hazards, hours: float) -> None:
+        """
+        Call the scalar _apply_compound_attrition on vessels with exposures.
+
+        Attrition reads post-growth cell_count (mitotic catastrophe) and start-of-step
+        viability; only cell_count has moved, so only it is synced before the hook.
+        """
+        vm = self.vm
+        for i in np.flatnonzero(p["has_exposures"]):
+            vessel = vessels[i]
+            vessel.cell_count = float(b.columns["cell_count"][i])
+            vessel._step_hazard_proposals = {}
+            vm._apply_compound_attrition(vessel, hours)
+            for death_field, hazard in vessel._step_hazard_proposals.items():
+                hazards[i, _LEDGER_INDEX[death_field]] += hazard
+            vessel._step_hazard_proposals = None
+
+    def _commit_death(self, vessels, b: VesselBatch, p, hazards: np.ndarray, hours: float):
+        """Vectorized _commit_step_death (combined survival, proportional allocation)."""
+        c = b.columns
+        v_before = np.clip(c["viability"], 0.0, 1.0)
+        c0 = np.maximum(0.0, c["cell_count"])
+        alive = v_before > DEATH_EPS
+
+        hazards = np.maximum(0.0, hazards)
+        total_hazard_raw = hazards.sum(axis=1)
+        total_hazard = total_hazard_raw * p["commit_hazard_scale_mult"]
+        survival = np.where(total_hazard > 0.0, np.exp(-total_hazard * hours), 1.0)
+        v_after = np.clip(v_before * survival, 0.0, 1.0)
+        safe_v_before = np.where(alive, v_before, 1.0)
+
+        c["viability"] = np.where(alive, v_after, c["viability"])
+        c["cell_count"] = np.where(
+            alive, np.maximum(0.0, c0 * (v_after / safe_v_before)), c["cell_count"]
+        )
+        kill_total = np.where(alive, np.maximum(0.0, v_before - v_after), 0.0)
+        total_hazard = np.where(alive, total_hazard, 0.0)
+
+        killed = kill_total > DEATH_EPS
+        c["cytotox_released_since_feed"] = np.where(
+            killed, c["cytotox_released_since_feed"] + kill_total, c["cytotox_released_since_feed"]
+        )
+
+        allocate = killed & (total_hazard_raw > DEATH_EPS)
+        safe_raw = np.where(allocate, total_hazard_raw, 1.0)
+        allocated = (hazards / safe_raw[:, None]) * kill_total[:, None]
+        update = allocate[:, None] & (hazards > 0.0)
+        b.ledger = np.where(update, np.clip(b.ledger + allocated, 0.0, 1.0), b.ledger)
+
+        has_capacity = alive & (c["vessel_capacity"] > 0)
+        safe_capacity = np.where(has_capacity, c["vessel_capacity"], 1.0)
+        c["confluence"] = np.where(has_capacity, c["cell_count"] / safe_capacity, c["confluence"])
+
+        bad = alive & ((c["viability"] < 0.0) | (c["viability"] > 1.0) | (c["cell_count"] < 0.0))
+        if np.any(bad):
+            i = int(np.flatnonzero(bad)[0])
+            raise AssertionError(
+                f"viability={c['viability'][i]} / cell_count={c['cell_count'][i]} out of bounds "
+                f"(vessel_id={b.vessel_ids[i]})"
+            )
+
+        total_dead = 1.0 - np.clip(c["viability"], 0.0, 1.0)
+        credited = np.maximum(0.0, b.ledger).sum(axis=1)
+        self._raise_on_violation(
+            vessels, b, alive & (credited > total_dead + DEATH_EPS),
+            lambda vessel: self.vm._assert_conservation(vessel, gate="_commit_step_death"),
+        )
+        return total_hazard, kill_total
+
+    def _apply_stress_recovery(self, vessels, b: VesselBatch, p, t0: float, hours: float) -> None:
+        """Vectorized _apply_stress_recovery (only vessels whose exposures are all cleared)."""
+        recovering = np.zeros(len(vessels), dtype=bool)
+        for i in np.flatnonzero(p["has_exposures"]):
+            vessel = vessels[i]
+            exposures = vessel.compound_meta.get("exposures", {})
+            if any(not exp.get("is_washed_out", False) for exp in exposures.values()):
+                continue
+            max_effective_dose = 0.0
+            for compound in exposures.keys():
+                max_effective_dose = max(
+                    max_effective_dose, self.vm._get_effective_dose_uM(vessel, compound, t0)
+                )
+            recovering[i] = max_effective_dose <= 0.001
+        if not np.any(recovering):
+            return
+        decay_factor = float(np.exp(-hours / 6.0))
+        c = b.columns
+        for axis in ("er_stress", "mito_dysfunction", "transport_dysfunction"):
+            c[axis] = np.where(recovering & (c[axis] > 0.0), c[axis] * decay_factor, c[axis])
+
+    def _update_death_mode(self, vessels, b: VesselBatch) -> np.ndarray:
+        """Vectorized _update_death_mode (conservation enforcement + labels)."""
+        c = b.columns
+        self._raise_on_violation(vessels, b, c["viability"] < -DEATH_EPS,
+                                 self.vm._update_death_mode)
+        c["viability"] = np.clip(c["viability"], 0.0, 1.0)
+        total_dead = 1.0 - c["viability"]
+        tracked_known = b.ledger.sum(axis=1)
+        self._raise_on_violation(vessels, b, tracked_known > total_dead + DEATH_EPS,
+                                 self.vm._update_death_mode)
+        c["death_unattributed"] = np.maximum(0.0, total_dead - tracked_known)
+        b.ledger = np.clip(b.ledger, 0.0, 1.0)
+        tracked_total = b.ledger.sum(axis=1) + c["death_unattributed"]
+        self._raise_on_violation(vessels, b, tracked_total > total_dead + DEATH_EPS,
+                                 self.vm._update_death_mode)
+
+        threshold = 0.05
+        unknown_threshold = np.where(
+            (b.death_compound == 0) & (b.death_confluence == 0), 0.01, threshold
+        )
+        causes = [
+            ("compound", b.death_compound > threshold),
+            ("starvation", b.death_starvation > threshold),
+            ("mitotic", b.death_mitotic_catastrophe > threshold),
+            ("er_stress", b.death_er_stress > threshold),
+            ("mito_dysfunction", b.death_mito_dysfunction > threshold),
+            ("confluence", b.death_confluence > threshold),
+            ("contamination", b.death_contamination > threshold),
+        ]
+        active_causes = np.sum([flag for _, flag in causes], axis=0)
+        unknown = (b.death_unknown > unknown_threshold) | (c["viability"] < 0.5)
+
+        # Priority: mixed > known causes (in order) > unknown > None (healthy)
+        conditions = [active_causes > 1] + [flag for _, flag in causes] + [unknown]
+        labels = ["mixed"] + [label for label, _ in causes] + ["unknown"]
+        death_modes = np.full(len(vessels), None, dtype=object)
+        for flag, label in reversed(list(zip(conditions, labels))):
+            death_modes[flag] = label
+        return death_modes
+
+    def _raise_on_violation(self, vessels, b: VesselBatch, mask: np.ndarray, scalar_check) -> None:
+        """Delegate the first violating vessel to the scalar checker (identical error text)."""
+        if not np.any(mask):
+            return
+        i = int(np.flatnonzero(mask)[0])
+        b.scatter_row(vessels[i], i)
+        scalar_check(vessels[i])
+        raise AssertionError(
+            f"Batched conservation check flagged {b.vessel_ids[i]} but scalar check passed"
+        )
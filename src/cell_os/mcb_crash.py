@@ -5,6 +5,7 @@ Reusable library for running Master Cell Bank (MCB) crash test simulations.
 Supports configurable parameters, deterministic testing, and dashboard asset generation.
 """
 
+import csv
 import json
 import base64
 import numpy as np
@@ -16,6 +17,7 @@ matplotlib.use("Agg")
 import matplotlib.pyplot as plt
 import io
 from dataclasses import dataclass, field
+from functools import partial
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 
@@ -24,6 +26,7 @@ from cell_os.workflow_executor import WorkflowExecutor
 from cell_os.unit_ops.parametric import ParametricOps
 from cell_os.unit_ops.base import VesselLibrary
 from cell_os.simulation.failure_modes import FailureModeSimulator
+from cell_os.simulation.monte_carlo import StreamingHistogram, StreamingQuantiles, run_monte_carlo
 # Import Workflow type for type hinting (using string to avoid circular imports if any)
 from typing import TYPE_CHECKING
 if TYPE_CHECKING:
@@ -42,6 +45,10 @@ class MCBTestConfig:
     cell_line: str = "U2OS"
     starting_vials: int = 3
     workflow: Optional['Workflow'] = None
+    workers: int = 1  # Process pool size for independent runs (1 = in-process)
+    # False keeps only streaming summaries in memory (run rows and daily metrics
+    # still go to output_dir); use for 10k-run crash tests
+    keep_run_details: bool = True
 
 
 @dataclass
@@ -105,73 +112,151 @@ class MCBSimulation:
         }
 
 
+# Runs whose daily metrics are always kept for growth-curve plots
+_PLOT_RUNS = 50
+
+_QUANTILE_METRICS = (
+    "final_vials", "waste_vials", "waste_cells",
+    "waste_vials_equivalent", "waste_fraction", "duration_days",
+)
+
+
+def _run_mcb_simulation(config: MCBTestConfig, run_id: int, rng: np.random.Generator) -> Dict[str, Any]:
+    return MCBSimulation(run_id, config, rng).run()
+
+
+class _MCBRunAccumulator:
+    """Streaming per-run statistics for the crash test summary."""
+
+    def __init__(self, config: MCBTestConfig):
+        self.config = config
+        self.n_runs = 0
+        self.successful_runs = 0
+        self.contaminated_runs = 0
+        self.failed_runs = 0
+        self.waste_total = 0.0
+        self.failures: List[str] = []
+        self.violations: List[str] = []
+        self.quantiles = {metric: StreamingQuantiles() for metric in _QUANTILE_METRICS}
+        self.vials_hist = StreamingHistogram(0, config.target_mcb_vials)
+        self.waste_hist = StreamingHistogram(0.0, 1.0)
+
+    def add(self, res: Dict[str, Any]):
+        self.n_runs += 1
+        self.successful_runs += res["final_vials"] > 0
+        self.contaminated_runs += res["had_contamination"] == True
+        self.failed_runs += res["terminal_failure"] == True
+        self.waste_total += res["waste_vials"]
+        self.failures.extend(res["failures"])
+        self.violations.extend(res["violations"])
+        for metric, quantiles in self.quantiles.items():
+            quantiles.add(res[metric])
+        self.vials_hist.add(res["final_vials"])
+        self.waste_hist.add(res["waste_fraction"])
+
+    def summary(self) -> Dict[str, Any]:
+        q = self.quantiles
+        return {
+            "total_runs": self.config.num_simulations,
+            "successful_runs": int(self.successful_runs),
+            "success_rate": self.successful_runs / self.config.num_simulations,
+            "contaminated_runs": int(self.contaminated_runs),
+            "failed_runs": int(self.failed_runs),
+            "vials_p5": q["final_vials"].quantile(0.05),
+            "vials_p50": q["final_vials"].median(),
+            "vials_p95": q["final_vials"].quantile(0.95),
+            "waste_p50": q["waste_vials"].median(),
+            "waste_total": float(self.waste_total),
+            "waste_cells_p50": q["waste_cells"].median(),
+            "waste_vials_eq_p50": q["waste_vials_equivalent"].median(),
+            "waste_fraction_p50": q["waste_fraction"].median(),
+            "duration_p50": q["duration_days"].median(),
+            "failures": self.failures,
+            "violations": self.violations,
+        }
+
+
+class _CSVStream:
+    """Append rows to a CSV as they arrive; header taken from the first row."""
+
+    def __init__(self, path: Path, empty_header: List[str]):
+        self.path = path
+        self.empty_header = empty_header
+        self._file = open(path, "w", newline="")
+        self._writer = None
+
+    def write(self, row: Dict[str, Any]):
+        if self._writer is None:
+            self._writer = csv.DictWriter(self._file, fieldnames=list(row))
+            self._writer.writeheader()
+        self._writer.writerow(row)
+
+    def close(self):
+        if self._writer is None:
+            self._file.write(",".join(self.empty_header) + "\n")
+        self._file.close()
+
+
 def run_mcb_crash_test(config: MCBTestConfig) -> MCBTestResult:
     """
     Run a pilot scale U2OS MCB crash test and return a summary dict.
     If output_dir is provided, also write CSV and JSON assets there.
+
+    Each run draws from its own SeedSequence child of random_seed, so results
+    do not depend on config.workers. Per-run results are folded into
+    streaming summaries and written to the CSV assets as they complete.
     """
-    # Set up RNG
-    if config.random_seed is not None:
-        rng = np.random.default_rng(config.random_seed)
-    else:
-        rng = np.random.default_rng()
-    
-    # Run simulations
+    output_path = Path(config.output_dir) if config.output_dir else None
+    run_stream = daily_stream = None
+    if output_path:
+        output_path.mkdir(parents=True, exist_ok=True)
+        run_stream = _CSVStream(output_path / "mcb_run_results.csv", ["run_id"])
+        daily_stream = _CSVStream(output_path / "mcb_daily_metrics.csv", ["run_id", "day", "total_cells"])
+
+    accumulator = _MCBRunAccumulator(config)
     results = []
     all_daily = []
-    
-    for i in range(config.num_simulations):
-        sim = MCBSimulation(i, config, rng)
-        res = sim.run()
-        results.append(res)
-        
-        for d in res["daily_metrics"]:
-            d["run_id"] = i
-            all_daily.append(d)
-    
+
+    runs = run_monte_carlo(
+        partial(_run_mcb_simulation, config),
+        config.num_simulations,
+        seed=config.random_seed,
+        workers=config.workers,
+    )
+    try:
+        for i, res in enumerate(runs):
+            for d in res["daily_metrics"]:
+                d["run_id"] = i
+                if daily_stream:
+                    daily_stream.write(d)
+            if run_stream:
+                run_stream.write(res)
+
+            accumulator.add(res)
+            if config.keep_run_details:
+                results.append(res)
+                all_daily.extend(res["daily_metrics"])
+            elif i < _PLOT_RUNS:
+                all_daily.extend(res["daily_metrics"])
+    finally:
+        for stream in (run_stream, daily_stream):
+            if stream:
+                stream.close()
+
     # Create DataFrames
     df_results = pd.DataFrame(results)
     df_daily = pd.DataFrame(all_daily) if all_daily else pd.DataFrame(columns=["run_id", "day", "total_cells"])
-    
-    # Calculate summary
-    contaminated_runs = len(df_results[df_results["had_contamination"] == True])
-    failed_runs = len(df_results[df_results["terminal_failure"] == True])
-    success_runs = len(df_results[df_results["final_vials"] > 0])
-    
-    summary = {
-        "total_runs": config.num_simulations,
-        "successful_runs": success_runs,
-        "success_rate": success_runs / config.num_simulations,
-        "contaminated_runs": contaminated_runs,
-        "failed_runs": failed_runs,
-        "vials_p5": float(df_results["final_vials"].quantile(0.05)),
-        "vials_p50": float(df_results["final_vials"].median()),
-        "vials_p95": float(df_results["final_vials"].quantile(0.95)),
-        "waste_p50": float(df_results["waste_vials"].median()),
-        "waste_total": float(df_results["waste_vials"].sum()),
-        "waste_cells_p50": float(df_results["waste_cells"].median()),
-        "waste_vials_eq_p50": float(df_results["waste_vials_equivalent"].median()),
-        "waste_fraction_p50": float(df_results["waste_fraction"].median()),
-        "duration_p50": float(df_results["duration_days"].median()),
-        "failures": [f for sublist in df_results["failures"] for f in sublist],
-        "violations": [v for sublist in df_results["violations"] for v in sublist]
-    }
-    
-    # Write assets if output_dir specified
-    if config.output_dir:
-        output_path = Path(config.output_dir)
-        output_path.mkdir(parents=True, exist_ok=True)
-        
+
+    summary = accumulator.summary()
+
+    # Write remaining assets if output_dir specified (CSVs were streamed above)
+    if output_path:
         # Write summary JSON
         with open(output_path / "mcb_summary.json", "w") as f:
             json.dump(summary, f, indent=2)
         
-        # Write CSVs
-        df_results.to_csv(output_path / "mcb_run_results.csv", index=False)
-        df_daily.to_csv(output_path / "mcb_daily_metrics.csv", index=False)
-        
         # Generate plots
-        plots = _generate_plots(df_results, df_daily, config)
+        plots = _generate_plots(accumulator, df_daily, config)
         with open(output_path / "plots_manifest.json", "w") as f:
             json.dump(plots, f)
         
@@ -197,13 +282,18 @@ def run_mcb_crash_test(config: MCBTestConfig) -> MCBTestResult:
     return MCBTestResult(summary=summary, run_results=df_results, daily_metrics=df_daily)
 
 
-def _generate_plots(df_results: pd.DataFrame, df_daily: pd.DataFrame, config: MCBTestConfig) -> Dict[str, str]:
+def _plot_histogram(hist: StreamingHistogram, color: str):
+    plt.bar(hist.edges[:-1], hist.counts, width=np.diff(hist.edges), align='edge',
+            color=color, edgecolor='black')
+
+
+def _generate_plots(accumulator: _MCBRunAccumulator, df_daily: pd.DataFrame, config: MCBTestConfig) -> Dict[str, str]:
     """Generate base64-encoded plots."""
     plots = {}
     
     # Distribution of Vials
     plt.figure(figsize=(10, 6))
-    plt.hist(df_results["final_vials"], bins=30, color='skyblue', edgecolor='black')
+    _plot_histogram(accumulator.vials_hist, 'skyblue')
     plt.title("Distribution of MCB Vials Generated")
     plt.xlabel("Number of Vials")
     plt.ylabel("Frequency")
@@ -230,7 +320,7 @@ def _generate_plots(df_results: pd.DataFrame, df_daily: pd.DataFrame, config: MC
     
     # Waste Distribution
     plt.figure(figsize=(10, 6))
-    plt.hist(df_results["waste_fraction"], bins=30, color='coral', edgecolor='black')
+    _plot_histogram(accumulator.waste_hist, 'coral')
     plt.title("Distribution of Waste Fraction")
     plt.xlabel("Waste Fraction (waste_cells / total_cells_produced)")
     plt.ylabel("Frequency")
@@ -27,6 +27,7 @@ from src.cell_os.epistemic_agent.schemas import WellSpec
 from src.cell_os.hardware.biological_virtual import BiologicalVirtualMachine
 from src.cell_os.core.assay import AssayType
 from src.cell_os.hardware.run_context import RunContext
+from src.cell_os.plate_results_store import write_plate_results, default_format
 
 
 # ============================================================================
@@ -930,7 +931,8 @@ def execute_plate_design(
     json_path: Path,
     seed: int = 42,
     output_dir: Optional[Path] = None,
-    verbose: bool = True
+    verbose: bool = True,
+    output_format: str = "json"
 ) -> Dict[str, Any]:
     """
     Execute full 384-well plate simulation with corrected time semantics.
@@ -940,6 +942,9 @@ def execute_plate_design(
         seed: Random seed for reproducibility
         output_dir: Optional directory to save results
         verbose: Print progress messages
+        output_format: On-disk format when output_dir is set: "json" (default),
+            "parquet", "arrow", "npy", or "columnar" (best columnar format
+            available). See plate_results_store for the columnar layout.
 
     Returns:
         Dictionary with results and metadata
@@ -1049,9 +1054,13 @@ def execute_plate_design(
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        output_file = output_dir / f"{plate_id}_results_seed{seed}.json"
-        with open(output_file, 'w') as f:
-            json.dump(output, f, indent=2)
+        if output_format == "json":
+            output_file = output_dir / f"{plate_id}_results_seed{seed}.json"
+            with open(output_file, 'w') as f:
+                json.dump(output, f, indent=2)
+        else:
+            fmt = default_format() if output_format == "columnar" else output_format
+            output_file = write_plate_results(output, output_dir, fmt=fmt)
 
         if verbose:
             print(f"\n✓ Results saved: {output_file}")
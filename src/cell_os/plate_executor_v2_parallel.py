@@ -19,6 +19,7 @@ from src.cell_os.plate_executor_v2 import (
     ParsedWell
 )
 from src.cell_os.plate_executor import parse_plate_design_v3
+from src.cell_os.hardware.biological_virtual import load_simulation_params
 from src.cell_os.hardware.run_context import RunContext
 
 
@@ -172,6 +173,9 @@ def execute_plate_design_parallel(
     # Prepare arguments for workers
     worker_args = [(pw, seed, run_context, plate_id) for pw in parsed_wells]
 
+    # Warm the parameter cache before forking so workers start without DB queries
+    load_simulation_params()
+
     # Execute in parallel with progress tracking
     with Pool(processes=workers) as pool:
         if verbose:
@@ -0,0 +1,455 @@
+"""
+Plate Results Store: columnar on-disk format for plate executor outputs
+
+The JSON output of execute_plate_design() stores every well as a nested dict
+(morphology sub-dicts, detector metadata, parsed well) and then repeats all of
+it in flat_results. This module stores the same run as one row per well:
+
+- morphology / morphology_struct channels -> float64 columns (morph_<ch>, struct_<ch>)
+- detector_metadata / parsed_well          -> struct columns
+- remaining per-well scalars               -> plain columns
+- plate-level fields (plate_id, seed, ...) -> file metadata
+
+flat_results is not stored; it is rebuilt on read from the columns.
+
+Formats:
+- "parquet": Parquet file (requires pyarrow)
+- "arrow":   Arrow IPC file, memory-mapped on read (requires pyarrow)
+- "npy":     directory bundle of .npy columns + manifest.json (numpy only),
+             numeric columns are memory-mapped on read
+
+Usage:
+    path = write_plate_results(output, Path("results/calibration_plates"))
+    reader = PlateResultsReader(path)
+    cols = reader.read(["well_id", "morph_er", "morph_mito"])
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, Any, List, Optional, Sequence, Union
+
+import numpy as np
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+METADATA_KEY = "cell_os.plate_results"
+FORMAT_VERSION = 1
+
+# Per-well nested fields and the flat column prefix they expand to
+_CHANNEL_FIELDS = {"morphology": "morph_", "morphology_struct": "struct_"}
+# Per-well nested dicts kept as struct columns (JSON in the npy bundle)
+_STRUCT_FIELDS = ("detector_metadata", "parsed_well")
+# Top-level list fields that live in columns rather than in file metadata
+_ROW_FIELDS = ("raw_results", "flat_results", "parsed_wells")
+
+_SUFFIXES = {"parquet": ".parquet", "arrow": ".arrow", "npy": ".columns"}
+
+
+def default_format() -> str:
+    """Best columnar format available in this environment."""
+    return "parquet" if PYARROW_AVAILABLE else "npy"
+
+
+def _json_default(obj):
+    if isinstance(obj, set):
+        return sorted(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _to_jsonable(value):
+    """Round-trip through JSON so numpy scalars / sets become plain Python."""
+    return json.loads(json.dumps(value, default=_json_default))
+
+
+# ============================================================================
+# Row -> column conversion
+# ============================================================================
+
+def _build_columns(output: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Split an execute_plate_design() output into per-well columns and plate info.
+
+    Returns dict with:
+        columns: {name: list of per-well values} in stable order
+        kinds:   {name: "channel" | "struct" | "scalar"}
+        channels: {"morphology": [...], "morphology_struct": [...]}
+        plate:   plate-level fields (everything except per-well lists)
+    """
+    raw_results = output["raw_results"]
+    parsed_wells = output.get("parsed_wells") or []
+    if parsed_wells and len(parsed_wells) != len(raw_results):
+        raise ValueError(
+            f"parsed_wells ({len(parsed_wells)}) and raw_results ({len(raw_results)}) "
+            f"must be aligned one-to-one"
+        )
+
+    n = len(raw_results)
+    channels = {field: [] for field in _CHANNEL_FIELDS}
+    scalar_keys: List[str] = []
+    struct_keys: List[str] = []
+
+    for r in raw_results:
+        for key, value in r.items():
+            if key in _CHANNEL_FIELDS:
+                for ch in value:
+                    if ch not in channels[key]:
+                        channels[key].append(ch)
+            elif key in _STRUCT_FIELDS:
+                if key not in struct_keys:
+                    struct_keys.append(key)
+            elif key not in scalar_keys:
+                scalar_keys.append(key)
+
+    columns: Dict[str, List[Any]] = {}
+    kinds: Dict[str, str] = {}
+
+    for key in scalar_keys:
+        columns[key] = [r.get(key) for r in raw_results]
+        kinds[key] = "scalar"
+
+    for field, prefix in _CHANNEL_FIELDS.items():
+        for ch in channels[field]:
+            name = f"{prefix}{ch}"
+            values = [r.get(field, {}).get(ch) for r in raw_results]
+            columns[name] = [np.nan if v is None else float(v) for v in values]
+            kinds[name] = "channel"
+
+    for key in struct_keys:
+        columns[key] = [_to_jsonable(r.get(key)) for r in raw_results]
+        kinds[key] = "struct"
+
+    if parsed_wells:
+        columns["parsed_well"] = [_to_jsonable(pw) for pw in parsed_wells]
+        kinds["parsed_well"] = "struct"
+
+    # Rows lacking a key (error wells) must not gain it back on read
+    if any(r.keys() != raw_results[0].keys() for r in raw_results):
+        columns["_present_keys"] = [sorted(r.keys()) for r in raw_results]
+        kinds["_present_keys"] = "struct"
+
+    plate = _to_jsonable({k: v for k, v in output.items() if k not in _ROW_FIELDS})
+    plate.setdefault("n_wells", n)
+
+    return {"columns": columns, "kinds": kinds, "channels": channels, "plate": plate}
+
+
+def _file_metadata(built: Dict[str, Any], fmt: str, json_columns: List[str]) -> Dict[str, Any]:
+    return {
+        "format_version": FORMAT_VERSION,
+        "format": fmt,
+        "plate": built["plate"],
+        "channels": built["channels"],
+        "kinds": built["kinds"],
+        "json_columns": json_columns,
+    }
+
+
+# ============================================================================
+# Writers
+# ============================================================================
+
+def _has_empty_struct(arrow_type) -> bool:
+    """Parquet cannot store struct types without child fields (e.g. all-{} dicts)."""
+    if pa.types.is_struct(arrow_type):
+        if arrow_type.num_fields == 0:
+            return True
+        return any(_has_empty_struct(arrow_type.field(i).type) for i in range(arrow_type.num_fields))
+    if pa.types.is_list(arrow_type) or pa.types.is_large_list(arrow_type):
+        return _has_empty_struct(arrow_type.value_type)
+    return False
+
+
+def _to_arrow_table(built: Dict[str, Any], fmt: str):
+    arrays = []
+    names = []
+    json_columns = []
+
+    for name, values in built["columns"].items():
+        kind = built["kinds"][name]
+        if kind == "channel":
+            arr = pa.array(values, type=pa.float64())
+        else:
+            try:
+                arr = pa.array(values)
+                if _has_empty_struct(arr.type):
+                    raise pa.ArrowInvalid("empty struct")
+            except (pa.ArrowInvalid, pa.ArrowTypeError, pa.ArrowNotImplementedError):
+                # Heterogeneous values (mixed types, empty dicts): keep as JSON text
+                arr = pa.array([json.dumps(v) for v in values], type=pa.string())
+                json_columns.append(name)
+        arrays.append(arr)
+        names.append(name)
+
+    meta = _file_metadata(built, fmt, json_columns)
+    schema_metadata = {METADATA_KEY: json.dumps(meta)}
+    return pa.Table.from_arrays(arrays, names=names, metadata=schema_metadata)
+
+
+def _write_npy_bundle(built: Dict[str, Any], path: Path) -> None:
+    path.mkdir(parents=True, exist_ok=True)
+    json_columns = []
+    files = {}
+
+    for i, (name, values) in enumerate(built["columns"].items()):
+        kind = built["kinds"][name]
+        array = None
+        if kind == "channel":
+            array = np.asarray(values, dtype=np.float64)
+        elif kind == "scalar" and values and all(
+            isinstance(v, (int, float, bool)) and not isinstance(v, bool) for v in values
+        ):
+            array = np.asarray(values)
+
+        if array is not None:
+            fname = f"{i:04d}.npy"
+            np.save(path / fname, array, allow_pickle=False)
+        else:
+            fname = f"{i:04d}.json"
+            with open(path / fname, "w") as f:
+                json.dump(values, f, default=_json_default)
+            json_columns.append(name)
+        files[name] = fname
+
+    manifest = _file_metadata(built, "npy", json_columns)
+    manifest["n_rows"] = len(next(iter(built["columns"].values()), []))
+    manifest["files"] = files
+    with open(path / "manifest.json", "w") as f:
+        json.dump(manifest, f, indent=2)
+
+
+def results_path(output_dir: Path, plate_id: str, seed: int, fmt: str) -> Path:
+    """Standard location of a columnar run, mirroring the JSON naming."""
+    return Path(output_dir) / f"{plate_id}_results_seed{seed}{_SUFFIXES[fmt]}"
+
+
+def write_plate_results(
+    output: Dict[str, Any],
+    path: Path,
+    fmt: Optional[str] = None,
+) -> Path:
+    """
+    Write an execute_plate_design() output dict in columnar form.
+
+    Args:
+        output: Plate output (needs raw_results; parsed_wells optional)
+        path: Target file (or bundle directory for "npy"). If an existing
+            directory is given (and fmt is not "npy" or the directory has no
+            manifest), the standard {plate_id}_results_seed{seed} name is used.
+        fmt: "parquet", "arrow" or "npy" (default: best available)
+
+    Returns:
+        Path that was written
+    """
+    fmt = fmt or default_format()
+    if fmt not in _SUFFIXES:
+        raise ValueError(f"Unknown results format '{fmt}'. Expected one of {sorted(_SUFFIXES)}")
+    if fmt in ("parquet", "arrow") and not PYARROW_AVAILABLE:
+        raise ImportError(f"pyarrow is required for '{fmt}' output (use fmt='npy' instead)")
+
+    path = Path(path)
+    if path.is_dir() and not (path / "manifest.json").exists():
+        path = results_path(path, output["plate_id"], output["seed"], fmt)
+
+    built = _build_columns(output)
+
+    if fmt == "npy":
+        _write_npy_bundle(built, path)
+    else:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        table = _to_arrow_table(built, fmt)
+        if fmt == "parquet":
+            pq.write_table(table, path, compression="zstd")
+        else:
+            with pa.OSFile(str(path), "wb") as sink:
+                with pa.ipc.new_file(sink, table.schema) as writer:
+                    writer.write_table(table)
+
+    return path
+
+
+# ============================================================================
+# Reader
+# ============================================================================
+
+class PlateResultsReader:
+    """
+    Lazy reader for columnar plate results.
+
+    Opening a store only reads its schema/manifest. Column data is loaded on
+    demand by read(), and only for the requested columns.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        if self.path.is_dir():
+            self.format = "npy"
+            with open(self.path / "manifest.json") as f:
+                self._meta = json.load(f)
+            self._column_names = list(self._meta["files"])
+        else:
+            if not PYARROW_AVAILABLE:
+                raise ImportError(f"pyarrow is required to read {self.path.name}")
+            if self.path.suffix == ".arrow":
+                self.format = "arrow"
+                self._source = pa.memory_map(str(self.path), "r")
+                self._ipc = pa.ipc.open_file(self._source)
+                schema = self._ipc.schema
+            else:
+                self.format = "parquet"
+                self._parquet = pq.ParquetFile(self.path)
+                schema = self._parquet.schema_arrow
+            self._meta = json.loads(schema.metadata[METADATA_KEY.encode()])
+            self._column_names = list(schema.names)
+
+        self._json_columns = set(self._meta.get("json_columns", []))
+
+    @property
+    def plate(self) -> Dict[str, Any]:
+        """Plate-level fields (plate_id, seed, n_wells, metadata, ...)."""
+        return self._meta["plate"]
+
+    @property
+    def channels(self) -> List[str]:
+        """Morphology channel names in stored order."""
+        return list(self._meta["channels"]["morphology"])
+
+    @property
+    def columns(self) -> List[str]:
+        """Public column names (internal bookkeeping columns excluded)."""
+        return [c for c in self._column_names if not c.startswith("_")]
+
+    def __len__(self) -> int:
+        return int(self.plate["n_wells"])
+
+    def _select(self, columns: Optional[Sequence[str]]) -> List[str]:
+        if columns is None:
+            return self.columns
+        unknown = [c for c in columns if c not in self._column_names]
+        if unknown:
+            raise KeyError(f"Unknown columns: {unknown}")
+        return list(columns)
+
+    def _read_arrow(self, names: List[str]) -> Dict[str, Any]:
+        if self.format == "parquet":
+            table = self._parquet.read(columns=names)
+        else:
+            table = self._ipc.read_all().select(names)
+
+        out = {}
+        for name in names:
+            col = table.column(name)
+            if name in self._json_columns:
+                out[name] = [json.loads(v) for v in col.to_pylist()]
+            elif pa.types.is_floating(col.type) or pa.types.is_integer(col.type):
+                out[name] = col.to_numpy()
+            else:
+                out[name] = col.to_pylist()
+        return out
+
+    def _read_npy(self, names: List[str]) -> Dict[str, Any]:
+        out = {}
+        for name in names:
+            fpath = self.path / self._meta["files"][name]
+            if name in self._json_columns:
+                with open(fpath) as f:
+                    out[name] = json.load(f)
+            else:
+                out[name] = np.load(fpath, mmap_mode="r", allow_pickle=False)
+        return out
+
+    def read(self, columns: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+        """
+        Load columns.
+
+        Numeric columns come back as numpy arrays (memory-mapped for "npy"),
+        struct and string columns as Python lists.
+
+        Args:
+            columns: Column names to load (default: all public columns)
+        """
+        names = self._select(columns)
+        if self.format == "npy":
+            return self._read_npy(names)
+        return self._read_arrow(names)
+
+    def morphology_matrix(self, struct: bool = False) -> np.ndarray:
+        """(n_wells, n_channels) float64 matrix of morphology (or morphology_struct)."""
+        field = "morphology_struct" if struct else "morphology"
+        prefix = _CHANNEL_FIELDS[field]
+        names = [f"{prefix}{ch}" for ch in self._meta["channels"][field]]
+        cols = self.read(names)
+        return np.column_stack([np.asarray(cols[n], dtype=np.float64) for n in names])
+
+    def to_pandas(self, columns: Optional[Sequence[str]] = None):
+        """Load columns into a pandas DataFrame (struct columns hold dicts)."""
+        import pandas as pd
+        return pd.DataFrame(self.read(columns))
+
+    def to_raw_results(self) -> List[Dict[str, Any]]:
+        """Rebuild the per-well raw_results dicts written by execute_plate_design()."""
+        names = [c for c in self._column_names if c != "parsed_well"]
+        cols = self.read(names)
+        kinds = self._meta["kinds"]
+        present = cols.pop("_present_keys", None)
+
+        rows = []
+        for i in range(len(self)):
+            keys = set(present[i]) if present is not None else None
+            row: Dict[str, Any] = {}
+            for name, values in cols.items():
+                kind = kinds[name]
+                value = values[i]
+                if isinstance(value, np.generic):
+                    value = value.item()
+                if kind == "channel":
+                    field = "morphology_struct" if name.startswith("struct_") else "morphology"
+                    if keys is not None and field not in keys:
+                        continue
+                    ch = name[len(_CHANNEL_FIELDS[field]):]
+                    if value == value:  # NaN marks a channel this well did not report
+                        row.setdefault(field, {})[ch] = value
+                else:
+                    if keys is not None and name not in keys:
+                        continue
+                    row[name] = value
+            for field in _CHANNEL_FIELDS:
+                if (keys is None or field in keys) and self._meta["channels"][field]:
+                    row.setdefault(field, {})
+            rows.append(row)
+        return rows
+
+    def to_output(self) -> Dict[str, Any]:
+        """Rebuild the full execute_plate_design() output dict (JSON layout)."""
+        from src.cell_os.plate_executor_v2 import flatten_result
+
+        raw_results = self.to_raw_results()
+        output = dict(self.plate)
+        if "parsed_well" in self._column_names:
+            output["parsed_wells"] = self.read(["parsed_well"])["parsed_well"]
+        output["raw_results"] = raw_results
+        output["flat_results"] = [flatten_result(r) for r in raw_results]
+        return output
+
+
+def load_plate_results(path: Union[str, Path]) -> Dict[str, Any]:
+    """
+    Load a plate run in the JSON output layout, whatever its storage format.
+
+    Accepts legacy .json files as well as columnar stores, so analysis scripts
+    can switch formats without code changes.
+    """
+    path = Path(path)
+    if path.suffix == ".json":
+        with open(path) as f:
+            return json.load(f)
+    return PlateResultsReader(path).to_output()
@@ -8,10 +8,28 @@ from .spatial_diagnostics import (
     compute_morans_i,
     check_spatial_autocorrelation,
     extract_channel_values,
+    extract_channel_matrix,
+    spatial_qc_batch,
+)
+from .spatial_statistics import (
+    PLATE_FORMATS,
+    gearys_c,
+    morans_i,
+    permutation_test,
+    plate_weights,
+    rook_weights,
 )
 
 __all__ = [
     "compute_morans_i",
     "check_spatial_autocorrelation",
     "extract_channel_values",
+    "extract_channel_matrix",
+    "spatial_qc_batch",
+    "PLATE_FORMATS",
+    "gearys_c",
+    "morans_i",
+    "permutation_test",
+    "plate_weights",
+    "rook_weights",
 ]
@@ -8,10 +8,11 @@ Extracted from scripts/analyze_spatial_autocorrelation.py and made
 production-ready with channel-agnostic interface.
 """
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Mapping, Sequence, Tuple
 import numpy as np
 
 from ..core.observation import RawWellResult
+from .spatial_statistics import morans_i, morans_i_moments, permutation_test, rook_weights
 
 
 def parse_well_id(well_id: str) -> Tuple[int, int]:
@@ -92,6 +93,34 @@ def extract_channel_values(
     return np.array(values), np.array(positions)
 
 
+def extract_channel_matrix(
+    wells: List[RawWellResult],
+    channel_keys: Sequence[str]
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Extract several channels at once.
+
+    Args:
+        wells: List of raw well results
+        channel_keys: Dot-notation channel keys
+
+    Returns:
+        Tuple of (values, positions) where:
+        - values: np.ndarray of shape (C, N), one row per channel key
+        - positions: np.ndarray of shape (N, 2) with (row, col) indices
+
+    Raises:
+        ValueError: If a channel key is invalid or wells empty
+    """
+    rows = []
+    positions = None
+    for channel_key in channel_keys:
+        values, positions = extract_channel_values(wells, channel_key)
+        rows.append(values)
+    if positions is None:
+        raise ValueError("No channel keys given")
+    return np.vstack(rows).astype(float), positions
+
+
 def compute_morans_i(
     wells: List[RawWellResult],
     channel_key: str
@@ -142,21 +171,11 @@ def compute_morans_i(
 
     # Extract values and positions
     values, positions = extract_channel_values(wells, channel_key)
-
     N = len(values)
-    mean_val = np.mean(values)
 
-    # Build spatial weight matrix (rook contiguity: adjacent wells only, no diagonals)
-    W_matrix = np.zeros((N, N))
-    for i in range(N):
-        for j in range(N):
-            if i != j:
-                # Manhattan distance (row diff + col diff)
-                dist = abs(positions[i][0] - positions[j][0]) + abs(positions[i][1] - positions[j][1])
-                if dist == 1:  # Adjacent (not diagonal)
-                    W_matrix[i, j] = 1.0
-
-    W = np.sum(W_matrix)
+    # Spatial weights (rook contiguity: adjacent wells only, no diagonals)
+    W_matrix = rook_weights(positions)
+    W = W_matrix.sum()
 
     if W == 0:
         # No adjacencies (single well or disconnected)
@@ -169,47 +188,19 @@ def compute_morans_i(
             'total_weight': 0.0
         }
 
-    # Compute Moran's I
-    numerator = 0.0
-    for i in range(N):
-        for j in range(N):
-            numerator += W_matrix[i, j] * (values[i] - mean_val) * (values[j] - mean_val)
-
-    denominator = np.sum((values - mean_val) ** 2)
-
-    if denominator == 0:
-        # No variance (all values identical)
-        morans_i = 0.0
-    else:
-        morans_i = (N / W) * (numerator / denominator)
-
-    # Expected value and variance under null hypothesis (random spatial pattern)
-    expected = -1 / (N - 1)
-
-    # Compute variance (simplified formula)
-    S1 = 0.0
-    for i in range(N):
-        for j in range(N):
-            S1 += (W_matrix[i, j] + W_matrix[j, i]) ** 2
-    S1 /= 2
-
-    S2 = 0.0
-    for i in range(N):
-        row_sum = np.sum(W_matrix[i, :])
-        col_sum = np.sum(W_matrix[:, i])
-        S2 += (row_sum + col_sum) ** 2
-
-    # Variance formula (under normality assumption)
-    variance = ((N * S1 - N * S2 + 3 * W**2) / ((N**2 - 1) * W**2)) - expected**2
+    # Moran's I (0 if all values identical), expected value and variance
+    # under null hypothesis (random spatial pattern)
+    statistic = float(morans_i(values, W_matrix))
+    expected, variance = morans_i_moments(W_matrix)
 
     # Z-score for significance testing
     if variance > 0:
-        z_score = (morans_i - expected) / np.sqrt(variance)
+        z_score = (statistic - expected) / np.sqrt(variance)
     else:
         z_score = 0.0
 
     return {
-        'morans_i': float(morans_i),
+        'morans_i': float(statistic),
         'expected': float(expected),
         'variance': float(variance),
         'z_score': float(z_score),
@@ -221,7 +212,9 @@ def compute_morans_i(
 def check_spatial_autocorrelation(
     wells: List[RawWellResult],
     channel_key: str = "morphology.nucleus",
-    significance_threshold: float = 1.96
+    significance_threshold: float = 1.96,
+    n_permutations: int = 0,
+    seed: int = 0
 ) -> Tuple[bool, Dict[str, float]]:
     """Check if spatial autocorrelation is significant.
 
@@ -231,11 +224,14 @@ def check_spatial_autocorrelation(
         wells: List of raw well results
         channel_key: Dot-notation channel key (default: morphology.nucleus)
         significance_threshold: Z-score threshold for flagging (default: 1.96 = p<0.05)
+        n_permutations: If > 0, also compute a permutation p-value for I
+        seed: Seed for the permutations
 
     Returns:
         Tuple of (flagged, diagnostics) where:
         - flagged: True if |Z-score| > threshold
-        - diagnostics: Dict with Moran's I statistics
+        - diagnostics: Dict with Moran's I statistics (plus 'p_value' when
+          n_permutations > 0)
 
     Example:
         >>> flagged, diag = check_spatial_autocorrelation(wells)
@@ -244,4 +240,58 @@ def check_spatial_autocorrelation(
     """
     diagnostics = compute_morans_i(wells, channel_key)
     flagged = abs(diagnostics['z_score']) > significance_threshold
+    if n_permutations > 0 and diagnostics['n_wells'] > 0:
+        values, positions = extract_channel_values(wells, channel_key)
+        tested = permutation_test(values, rook_weights(positions), n_permutations=n_permutations, seed=seed)
+        diagnostics['p_value'] = float(tested['morans_i_p'])
     return flagged, diagnostics
+
+
+def spatial_qc_batch(
+    plates: Mapping[str, Sequence[RawWellResult]],
+    channel_keys: Sequence[str],
+    n_permutations: int = 999,
+    seed: int = 0
+) -> Dict[str, Dict[str, Dict[str, float]]]:
+    """Moran's I / Geary's C with permutation p-values for every plate and channel.
+
+    Plates with an identical well layout are stacked and share one set of
+    permutations, so a whole batch costs a few sparse products.
+
+    Args:
+        plates: plate_id -> wells on that plate
+        channel_keys: Dot-notation channel keys (e.g. "morphology.nucleus")
+        n_permutations: Number of random relabelings per test
+        seed: Seed for the permutations
+
+    Returns:
+        plate_id -> channel_key -> dict with keys:
+        - morans_i, morans_i_p, morans_i_null_mean, morans_i_null_sd
+        - gearys_c, gearys_c_p
+        - n_wells
+
+    Example:
+        >>> qc = spatial_qc_batch({"P1": wells}, ["morphology.nucleus", "morphology.er"])
+        >>> qc["P1"]["morphology.er"]["morans_i_p"]
+    """
+    layouts: Dict[bytes, List[Tuple[str, np.ndarray, np.ndarray]]] = {}
+    for plate_id, wells in plates.items():
+        if not wells:
+            continue
+        values, positions = extract_channel_matrix(list(wells), channel_keys)
+        layouts.setdefault(positions.tobytes(), []).append((plate_id, values, positions))
+
+    results: Dict[str, Dict[str, Dict[str, float]]] = {}
+    for group in layouts.values():
+        weights = rook_weights(group[0][2])
+        stacked = np.stack([values for _, values, _ in group])  # (plates, channels, N)
+        tested = permutation_test(stacked, weights, n_permutations=n_permutations, seed=seed)
+        for p, (plate_id, values, _) in enumerate(group):
+            results[plate_id] = {
+                channel_key: {
+                    **{stat: float(arr[p, c]) for stat, arr in tested.items()},
+                    'n_wells': int(values.shape[1]),
+                }
+                for c, channel_key in enumerate(channel_keys)
+            }
+    return results
@@ -0,0 +1,206 @@
+"""
+Vectorized spatial statistics for plate QC.
+
+Rook-contiguity weights (adjacent wells, no diagonals) are precomputed once
+per plate geometry as sparse matrices, so Moran's I and Geary's C reduce to
+a sparse mat-vec per channel. Permutation tests share one set of shuffles
+across every channel (and every plate with the same layout), which makes
+the null distribution for a whole batch a handful of sparse products.
+
+Usage:
+    weights = rook_weights(positions)                  # (N, N) sparse
+    I = morans_i(values, weights)                      # values: (..., N)
+    result = permutation_test(values, weights, n_permutations=999, seed=0)
+
+spatial_diagnostics.spatial_qc_batch() applies these to RawWellResults
+grouped by plate.
+"""
+
+from functools import lru_cache
+from typing import Dict, Tuple
+
+import numpy as np
+from scipy import sparse
+
+# Plate format (well count) -> (n_rows, n_cols)
+PLATE_FORMATS: Dict[int, Tuple[int, int]] = {
+    96: (8, 12),
+    384: (16, 24),
+    1536: (32, 48),
+}
+
+# Permutations evaluated per block (bounds peak memory for large batches)
+PERMUTATION_CHUNK = 128
+
+
+@lru_cache(maxsize=None)
+def grid_weights(n_rows: int, n_cols: int) -> sparse.csr_matrix:
+    """Rook adjacency for a full n_rows × n_cols grid (row-major well index)."""
+    index = np.arange(n_rows * n_cols).reshape(n_rows, n_cols)
+    src = np.concatenate([index[:, :-1].ravel(), index[:-1, :].ravel()])
+    dst = np.concatenate([index[:, 1:].ravel(), index[1:, :].ravel()])
+    data = np.ones(2 * len(src))
+    n = n_rows * n_cols
+    weights = sparse.csr_matrix(
+        (data, (np.concatenate([src, dst]), np.concatenate([dst, src]))), shape=(n, n)
+    )
+    weights.data.setflags(write=False)
+    return weights
+
+
+def plate_weights(plate_format: int) -> sparse.csr_matrix:
+    """Precomputed rook adjacency for a standard plate (96, 384 or 1536 wells)."""
+    if plate_format not in PLATE_FORMATS:
+        raise ValueError(f"Unknown plate format: {plate_format}. Expected one of {sorted(PLATE_FORMATS)}")
+    return grid_weights(*PLATE_FORMATS[plate_format])
+
+
+def rook_weights(positions: np.ndarray) -> sparse.csr_matrix:
+    """
+    Rook adjacency between wells at the given (row, col) positions.
+
+    Uses the smallest standard plate that contains every position (falls back
+    to the positions' bounding grid). Wells sharing a position are not
+    adjacent to each other but each is adjacent to the other's neighbours.
+
+    Args:
+        positions: (N, 2) integer (row, col) indices
+
+    Returns:
+        (N, N) sparse binary weight matrix
+    """
+    positions = np.asarray(positions, dtype=int).reshape(-1, 2)
+    if len(positions) == 0:
+        return sparse.csr_matrix((0, 0))
+
+    offset = np.minimum(positions.min(axis=0), 0)
+    positions = positions - offset
+    extent = positions.max(axis=0) + 1
+    for n_rows, n_cols in sorted(PLATE_FORMATS.values()):
+        if extent[0] <= n_rows and extent[1] <= n_cols:
+            break
+    else:
+        n_rows, n_cols = (int(x) for x in extent)
+
+    index = positions[:, 0] * n_cols + positions[:, 1]
+    return grid_weights(n_rows, n_cols)[index][:, index].tocsr()
+
+
+def _quadratic_form(z: np.ndarray, weights: sparse.spmatrix) -> np.ndarray:
+    """zᵀ W z along the last axis of z."""
+    flat = z.reshape(-1, z.shape[-1])
+    wz = (weights @ flat.T).T
+    return np.einsum('ij,ij->i', flat, wz).reshape(z.shape[:-1])
+
+
+def morans_i(values: np.ndarray, weights: sparse.spmatrix) -> np.ndarray:
+    """
+    Moran's I along the last axis: I = (N/W) * zᵀ W z / Σ z².
+
+    Returns 0 where the values have no variance or W has no edges.
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.shape[-1]
+    total_weight = weights.sum()
+    z = values - values.mean(axis=-1, keepdims=True)
+    denominator = np.sum(z ** 2, axis=-1)
+    numerator = _quadratic_form(z, weights)
+    ok = (denominator != 0) & (total_weight != 0)
+    scale = n / total_weight if total_weight else 0.0
+    return np.where(ok, scale * numerator / np.where(ok, denominator, 1.0), 0.0)
+
+
+def gearys_c(values: np.ndarray, weights: sparse.spmatrix) -> np.ndarray:
+    """
+    Geary's C along the last axis: C = (N-1) Σ w_ij (x_i - x_j)² / (2 W Σ z²).
+
+    Returns 1 (no autocorrelation) where the values have no variance or W
+    has no edges.
+    """
+    values = np.asarray(values, dtype=float)
+    n = values.shape[-1]
+    total_weight = weights.sum()
+    z = values - values.mean(axis=-1, keepdims=True)
+    denominator = np.sum(z ** 2, axis=-1)
+    # Σ w_ij (z_i - z_j)² = Σ_i z_i² (row_i + col_i) - 2 zᵀ W z
+    degree = np.asarray(weights.sum(axis=1)).ravel() + np.asarray(weights.sum(axis=0)).ravel()
+    numerator = (z ** 2) @ degree - 2.0 * _quadratic_form(z, weights)
+    ok = (denominator != 0) & (total_weight != 0)
+    scale = (n - 1) / (2.0 * total_weight) if total_weight else 0.0
+    return np.where(ok, scale * numerator / np.where(ok, denominator, 1.0), 1.0)
+
+
+def morans_i_moments(weights: sparse.spmatrix) -> Tuple[float, float]:
+    """
+    Expected value and variance of Moran's I under the null (normality).
+
+    Same simplified formula as spatial_diagnostics.compute_morans_i.
+    """
+    n = weights.shape[0]
+    expected = -1 / (n - 1) if n > 1 else 0.0
+    total_weight = weights.sum()
+    if total_weight == 0:
+        return expected, 0.0
+    s1 = (weights + weights.T).power(2).sum() / 2
+    s2 = np.sum((np.asarray(weights.sum(axis=1)).ravel() + np.asarray(weights.sum(axis=0)).ravel()) ** 2)
+    variance = ((n * s1 - n * s2 + 3 * total_weight ** 2) / ((n ** 2 - 1) * total_weight ** 2)) - expected ** 2
+    return expected, float(variance)
+
+
+def _pseudo_p(null: np.ndarray, observed: np.ndarray) -> np.ndarray:
+    """Folded one-sided permutation p-value (tail the observed value lies in)."""
+    n_permutations = null.shape[-1]
+    larger = np.sum(null >= observed[..., None], axis=-1)
+    extreme = np.minimum(larger, n_permutations - larger)
+    return (extreme + 1.0) / (n_permutations + 1.0)
+
+
+def permutation_test(
+    values: np.ndarray,
+    weights: sparse.spmatrix,
+    n_permutations: int = 999,
+    seed: int = 0
+) -> Dict[str, np.ndarray]:
+    """
+    Permutation p-values for Moran's I and Geary's C, batched over channels.
+
+    All rows of `values` share one set of well shuffles, so a batch of
+    channels (or of plates with the same layout) costs one pass.
+
+    Args:
+        values: (..., N) values; leading axes are batch dimensions
+        weights: (N, N) spatial weights
+        n_permutations: Number of random relabelings
+        seed: Seed for the shuffles
+
+    Returns:
+        Dict of arrays shaped like the batch dimensions:
+            morans_i, morans_i_p, morans_i_null_mean, morans_i_null_sd,
+            gearys_c, gearys_c_p
+    """
+    values = np.asarray(values, dtype=float)
+    batch_shape, n = values.shape[:-1], values.shape[-1]
+    flat = values.reshape(-1, n)
+
+    observed_i = morans_i(flat, weights)
+    observed_c = gearys_c(flat, weights)
+
+    rng = np.random.default_rng(seed)
+    null_i = np.empty((len(flat), n_permutations))
+    null_c = np.empty((len(flat), n_permutations))
+    for start in range(0, n_permutations, PERMUTATION_CHUNK):
+        stop = min(start + PERMUTATION_CHUNK, n_permutations)
+        shuffles = np.argsort(rng.random((stop - start, n)), axis=1)
+        permuted = flat[:, shuffles]  # (batch, chunk, N)
+        null_i[:, start:stop] = morans_i(permuted, weights)
+        null_c[:, start:stop] = gearys_c(permuted, weights)
+
+    result = {
+        'morans_i': observed_i,
+        'morans_i_p': _pseudo_p(null_i, observed_i),
+        'morans_i_null_mean': null_i.mean(axis=-1),
+        'morans_i_null_sd': null_i.std(axis=-1),
+        'gearys_c': observed_c,
+        'gearys_c_p': _pseudo_p(null_c, observed_c),
+    }
+    return {k: v.reshape(batch_shape) for k, v in result.items()}
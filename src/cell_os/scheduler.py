@@ -3,13 +3,43 @@ Scheduler for Cell OS.
 
 Uses Constraint Programming (CP-SAT) to optimize workflow scheduling
 under resource constraints.
+
+Three entry points share one model builder:
+- schedule(): solve a whole workflow at once
+- reschedule(): freeze everything that started before `now_min` and
+  re-optimize the rest, warm-started from the previous schedule
+- schedule_rolling(): rolling-horizon decomposition for large campaigns;
+  tasks are solved in windows of `window_size` (in list-schedule order)
+  with earlier windows frozen
+
+Resource units (e.g. incubator_3 of a capacity-8 incubator) are assigned
+inside the model with one optional interval per unit, so assignments are
+always consistent with the solved start times. Every solve is bounded by
+`time_limit_s`, runs `num_workers` parallel search workers and starts from
+a complete hint: a serial list schedule, or the caller's hint repaired
+into a feasible schedule. If the time limit expires before the solver
+reports a solution, that list schedule is returned (status "HEURISTIC").
 """
 
-from typing import List, Dict, Any, Tuple, Optional
-from dataclasses import dataclass
-from datetime import datetime, timedelta
-from ortools.sat.python import cp_model
+import bisect
 import collections
+import heapq
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from ortools.sat.python import cp_model
+
+logger = logging.getLogger(__name__)
+
+# Solver defaults
+DEFAULT_TIME_LIMIT_S = 60.0
+DEFAULT_NUM_WORKERS = 8
+
+# Tasks per rolling-horizon window
+DEFAULT_WINDOW_SIZE = 100
+
 
 @dataclass
 class Resource:
@@ -24,7 +54,7 @@ class Task:
     duration_min: int
     resources_required: List[str]  # List of Resource IDs
     predecessors: List[str] = None # List of Task IDs
-    
+
     def __post_init__(self):
         if self.predecessors is None:
             self.predecessors = []
@@ -36,114 +66,596 @@ class ScheduleResult:
     end_time: int
     resource_assignments: Dict[str, str] # resource_id -> specific_unit (if applicable)
 
+@dataclass
+class SolveInfo:
+    """Summary of the last solve (all windows, for rolling schedules).
+
+    status is a CP-SAT status name, or "HEURISTIC" when the list schedule
+    was returned.
+    """
+    status: str
+    makespan: Optional[int]
+    wall_time_s: float
+    n_windows: int = 1
+    window_status: List[str] = field(default_factory=list)
+
+
+@dataclass
+class _WindowModel:
+    """CP-SAT model for the free tasks of one solve."""
+    model: cp_model.CpModel
+    starts: Dict[str, cp_model.IntVar]
+    ends: Dict[str, cp_model.IntVar]
+    units: Dict[Tuple[str, str], Dict[str, cp_model.IntVar]]  # (task, resource) -> unit -> presence
+    makespan: cp_model.IntVar
+    frozen_end: int
+
+
 class Scheduler:
     """
     Optimizes task scheduling using Google OR-Tools CP-SAT solver.
     """
-    
+
     def __init__(self, resources: List[Resource]):
         self.resources = {r.id: r for r in resources}
-        
-    def schedule(self, tasks: List[Task], horizon_min: int = 10080) -> List[ScheduleResult]:
+        self.last_solve: Optional[SolveInfo] = None
+
+    def unit_names(self, res_id: str) -> List[str]:
+        """Concrete unit identifiers of a resource (the resource id itself if capacity is 1)."""
+        capacity = self.resources[res_id].capacity
+        if capacity == 1:
+            return [res_id]
+        return [f"{res_id}_{unit}" for unit in range(capacity)]
+
+    def schedule(
+        self,
+        tasks: List[Task],
+        horizon_min: int = 10080,
+        time_limit_s: Optional[float] = DEFAULT_TIME_LIMIT_S,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+        hint: Optional[List[ScheduleResult]] = None,
+    ) -> List[ScheduleResult]:
         """
         Schedule tasks to minimize makespan (total duration).
-        
+
         Args:
             tasks: List of tasks to schedule
             horizon_min: Max scheduling horizon in minutes (default 7 days)
-            
+            time_limit_s: Solver time limit (None for no limit); the best
+                schedule found so far is returned when it expires
+            num_workers: Parallel CP-SAT search workers
+            hint: Previous schedule used as a solution hint
+
+        Returns:
+            List of ScheduleResult objects (empty if no schedule was found)
+        """
+        started = time.perf_counter()
+        results, status, makespan = self._solve_window(
+            tasks, {}, horizon_min, 0, time_limit_s, num_workers, hint, compact=False
+        )
+        self.last_solve = SolveInfo(status, makespan, time.perf_counter() - started, 1, [status])
+        return self._in_task_order(tasks, results)
+
+    def reschedule(
+        self,
+        tasks: List[Task],
+        previous: List[ScheduleResult],
+        now_min: int,
+        horizon_min: int = 10080,
+        time_limit_s: Optional[float] = DEFAULT_TIME_LIMIT_S,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+        window_size: Optional[int] = None,
+    ) -> List[ScheduleResult]:
+        """
+        Re-optimize a schedule from `now_min` on, keeping the past fixed.
+
+        Tasks of the previous schedule that started before now_min keep
+        their times and units; all other tasks (including new ones) start
+        no earlier than now_min. The previous schedule is the solution hint.
+
+        Args:
+            tasks: Current task list (may add or drop tasks)
+            previous: Schedule being revised
+            now_min: Freeze time in minutes
+            window_size: Re-optimize in rolling windows of this many tasks
+                (default: one solve over all unfrozen tasks)
+
+        Returns:
+            List of ScheduleResult objects (empty if no schedule was found)
+        """
+        started = time.perf_counter()
+        task_ids = {task.id for task in tasks}
+        frozen = {
+            r.task_id: r for r in previous
+            if r.task_id in task_ids and r.start_time < now_min
+        }
+        free = [task for task in tasks if task.id not in frozen]
+
+        if window_size is None:
+            results, status, makespan = self._solve_window(
+                free, frozen, horizon_min, now_min, time_limit_s, num_workers, previous, compact=False
+            )
+            window_status = [status]
+        else:
+            results, status, makespan, window_status = self._solve_rolling(
+                free, frozen, now_min, window_size, horizon_min, time_limit_s, num_workers, previous
+            )
+        self.last_solve = SolveInfo(
+            status, makespan, time.perf_counter() - started, len(window_status), window_status
+        )
+        if not results and free:
+            return []
+        return self._in_task_order(tasks, {**frozen, **results})
+
+    def schedule_rolling(
+        self,
+        tasks: List[Task],
+        window_size: int = DEFAULT_WINDOW_SIZE,
+        horizon_min: int = 10080,
+        time_limit_s: Optional[float] = DEFAULT_TIME_LIMIT_S,
+        num_workers: int = DEFAULT_NUM_WORKERS,
+        hint: Optional[List[ScheduleResult]] = None,
+    ) -> List[ScheduleResult]:
+        """
+        Rolling-horizon schedule for workflows too large to solve at once.
+
+        Tasks are ordered by their start in a greedy list schedule and
+        solved window_size at a time; each window is optimized with every
+        earlier window frozen, minimizing its makespan and then its total
+        completion time so later windows inherit a compact plan.
+
+        Args:
+            tasks: List of tasks to schedule
+            window_size: Tasks per window
+            horizon_min: Max scheduling horizon in minutes
+            time_limit_s: Solver time limit per window
+            num_workers: Parallel CP-SAT search workers
+            hint: Previous schedule used as a solution hint
+
+        Returns:
+            List of ScheduleResult objects (empty if a window is infeasible)
+        """
+        started = time.perf_counter()
+        results, status, makespan, window_status = self._solve_rolling(
+            tasks, {}, 0, window_size, horizon_min, time_limit_s, num_workers, hint
+        )
+        self.last_solve = SolveInfo(
+            status, makespan, time.perf_counter() - started, len(window_status), window_status
+        )
+        return self._in_task_order(tasks, results)
+
+    def check_schedule(self, tasks: List[Task], results: List[ScheduleResult]) -> List[str]:
+        """
+        Verify durations, precedences and per-unit exclusivity of a schedule.
+
         Returns:
-            List of ScheduleResult objects
+            Human-readable violations (empty if the schedule is valid)
         """
+        violations = []
+        sched = {r.task_id: r for r in results}
+        task_ids = {task.id for task in tasks}
+
+        for task in tasks:
+            r = sched.get(task.id)
+            if r is None:
+                violations.append(f"{task.id}: not scheduled")
+                continue
+            if r.end_time - r.start_time != task.duration_min:
+                violations.append(f"{task.id}: duration {r.end_time - r.start_time} != {task.duration_min}")
+            for pred_id in task.predecessors:
+                if pred_id in sched and pred_id in task_ids and r.start_time < sched[pred_id].end_time:
+                    violations.append(f"{task.id}: starts before predecessor {pred_id} ends")
+            for res_id in task.resources_required:
+                if res_id in self.resources and r.resource_assignments.get(res_id) not in self.unit_names(res_id):
+                    violations.append(f"{task.id}: no valid unit of {res_id}")
+
+        busy = collections.defaultdict(list)
+        for task in tasks:
+            r = sched.get(task.id)
+            if r is None:
+                continue
+            for res_id in task.resources_required:
+                if res_id in self.resources:
+                    busy[r.resource_assignments.get(res_id)].append((r.start_time, r.end_time, task.id))
+        for unit, intervals in busy.items():
+            intervals.sort()
+            for (_, end_a, id_a), (start_b, _, id_b) in zip(intervals, intervals[1:]):
+                if start_b < end_a:
+                    violations.append(f"{unit}: {id_a} and {id_b} overlap")
+
+        return violations
+
+    def _solve_window(
+        self,
+        tasks: List[Task],
+        frozen: Dict[str, ScheduleResult],
+        horizon_min: int,
+        earliest_start: int,
+        time_limit_s: Optional[float],
+        num_workers: int,
+        hint: Optional[List[ScheduleResult]],
+        compact: bool,
+    ) -> Tuple[Dict[str, ScheduleResult], str, Optional[int]]:
+        """Build and solve the model for `tasks` around fixed `frozen` ones."""
+        if not tasks:
+            ends = [r.end_time for r in frozen.values()]
+            return {}, "OPTIMAL", max(ends) if ends else 0
+
+        window = self._build_model(tasks, frozen, horizon_min, earliest_start, compact)
+
+        # Warm start: the hint (if any) repaired into a complete feasible schedule
+        greedy = self._greedy_schedule(tasks, frozen, earliest_start, hint)
+        greedy_makespan = max([window.frozen_end] + [r.end_time for r in greedy.values()])
+        if greedy_makespan <= horizon_min:
+            self._add_hint(window, list(greedy.values()))
+
+        solver = cp_model.CpSolver()
+        if time_limit_s is not None:
+            solver.parameters.max_time_in_seconds = time_limit_s
+        solver.parameters.num_workers = num_workers
+        status = solver.Solve(window.model)
+        status_name = solver.StatusName(status)
+
+        if status == cp_model.UNKNOWN and greedy_makespan <= horizon_min:
+            # Time limit hit before the solver reported the warm start
+            logger.warning(f"No solution within the time limit for {len(tasks)} tasks; using the list schedule")
+            return greedy, "HEURISTIC", greedy_makespan
+
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            logger.warning(f"No schedule found for {len(tasks)} tasks ({status_name})")
+            return {}, status_name, None
+
+        makespan = solver.Value(window.makespan)
+        logger.info(
+            f"Schedule found ({status_name}): {len(tasks)} tasks, makespan {makespan} min, "
+            f"{solver.WallTime():.2f}s"
+        )
+
+        results = {}
+        for task in tasks:
+            assignments = {}
+            for res_id in task.resources_required:
+                presences = window.units.get((task.id, res_id))
+                if presences is not None:
+                    assignments[res_id] = next(
+                        unit for unit, literal in presences.items() if solver.Value(literal)
+                    )
+            results[task.id] = ScheduleResult(
+                task_id=task.id,
+                start_time=solver.Value(window.starts[task.id]),
+                end_time=solver.Value(window.ends[task.id]),
+                resource_assignments=assignments,
+            )
+        return results, status_name, makespan
+
+    def _solve_rolling(
+        self,
+        tasks: List[Task],
+        frozen: Dict[str, ScheduleResult],
+        earliest_start: int,
+        window_size: int,
+        horizon_min: int,
+        time_limit_s: Optional[float],
+        num_workers: int,
+        hint: Optional[List[ScheduleResult]],
+    ) -> Tuple[Dict[str, ScheduleResult], str, Optional[int], List[str]]:
+        """Solve `tasks` window by window, freezing each window once solved."""
+        greedy = self._greedy_schedule(tasks, frozen, earliest_start, hint)
+        position = {task_id: i for i, task_id in enumerate(greedy)}  # Placement (topological) order
+        order = sorted(tasks, key=lambda task: (greedy[task.id].start_time, position[task.id]))
+
+        frozen = dict(frozen)
+        results = {}
+        window_status = []
+        frozen_end = max((r.end_time for r in frozen.values()), default=0)
+        makespan = frozen_end
+
+        for offset in range(0, len(order), window_size):
+            window = order[offset:offset + window_size]
+            solved, status, makespan = self._solve_window(
+                window, frozen, horizon_min, earliest_start, time_limit_s, num_workers, hint, compact=True
+            )
+            window_status.append(status)
+            if not solved:
+                logger.warning(f"Rolling window {len(window_status)} ({len(window)} tasks): {status}")
+                return {}, status, None, window_status
+            frozen.update(solved)
+            results.update(solved)
+
+        # Windows are myopic; never return worse than the list schedule they started from
+        greedy_makespan = max([frozen_end] + [r.end_time for r in greedy.values()])
+        if greedy_makespan < makespan:
+            logger.info(f"Rolling makespan {makespan} > list schedule {greedy_makespan}; using the list schedule")
+            return greedy, "HEURISTIC", greedy_makespan, window_status
+
+        # Per-window optimality does not make the whole schedule optimal
+        status = "HEURISTIC" if "HEURISTIC" in window_status else "FEASIBLE"
+        return results, status, makespan, window_status
+
+    def _build_model(
+        self,
+        tasks: List[Task],
+        frozen: Dict[str, ScheduleResult],
+        horizon_min: int,
+        earliest_start: int,
+        compact: bool,
+    ) -> _WindowModel:
         model = cp_model.CpModel()
-        
+        task_ids = {task.id for task in tasks}
+
         # --- Variables ---
-        
-        # Task intervals
+
+        # Task intervals (starts bounded below by frozen predecessors)
         task_starts = {}
         task_ends = {}
         task_intervals = {}
-        
+
         for task in tasks:
-            start_var = model.NewIntVar(0, horizon_min, f'start_{task.id}')
-            end_var = model.NewIntVar(0, horizon_min, f'end_{task.id}')
+            lower = earliest_start
+            for pred_id in task.predecessors:
+                if pred_id in frozen and pred_id not in task_ids:
+                    lower = max(lower, frozen[pred_id].end_time)
+            start_var = model.NewIntVar(lower, horizon_min, f'start_{task.id}')
+            end_var = model.NewIntVar(lower, horizon_min, f'end_{task.id}')
             interval_var = model.NewIntervalVar(
                 start_var, task.duration_min, end_var, f'interval_{task.id}'
             )
-            
+
             task_starts[task.id] = start_var
             task_ends[task.id] = end_var
             task_intervals[task.id] = interval_var
-            
+
         # --- Constraints ---
-        
+
         # 1. Precedence constraints
         for task in tasks:
             for pred_id in task.predecessors:
                 if pred_id in task_ends:
                     # Start >= Predecessor End
                     model.Add(task_starts[task.id] >= task_ends[pred_id])
-                    
-        # 2. Resource constraints (Cumulative)
-        # Group tasks by resource requirement
-        resource_usage = collections.defaultdict(list)
+
+        # 2. Resource constraints, with the unit chosen inside the model
+        unit_intervals = collections.defaultdict(list)
+        resource_intervals = collections.defaultdict(list)
+        unit_presences = {}
+
+        for res_id, blocks in self._frozen_blocks(frozen).items():
+            for unit, (start, end) in blocks:
+                interval = model.NewFixedSizeIntervalVar(start, end - start, f'frozen_{unit}_{start}')
+                unit_intervals[unit].append(interval)
+                resource_intervals[res_id].append(interval)
+
         for task in tasks:
             for res_id in task.resources_required:
-                resource_usage[res_id].append(task_intervals[task.id])
-                
-        for res_id, intervals in resource_usage.items():
-            if res_id in self.resources:
-                capacity = self.resources[res_id].capacity
-                # If capacity is 1, use NoOverlap
-                if capacity == 1:
-                    model.AddNoOverlap(intervals)
-                else:
-                    # For capacity > 1, we need Cumulative constraint
-                    # OR-Tools Cumulative requires demands. Assuming demand=1 for now.
-                    demands = [1] * len(intervals)
-                    model.AddCumulative(intervals, demands, capacity)
-                    
+                if res_id not in self.resources:
+                    continue
+                resource_intervals[res_id].append(task_intervals[task.id])
+                units = self.unit_names(res_id)
+                if len(units) == 1:
+                    unit_intervals[units[0]].append(task_intervals[task.id])
+                    unit_presences[(task.id, res_id)] = {units[0]: model.NewConstant(1)}
+                    continue
+
+                # One optional interval per unit; exactly one is present
+                presences = {}
+                for unit in units:
+                    literal = model.NewBoolVar(f'on_{task.id}_{unit}')
+                    unit_intervals[unit].append(model.NewOptionalIntervalVar(
+                        task_starts[task.id], task.duration_min, task_ends[task.id],
+                        literal, f'interval_{task.id}_{unit}'
+                    ))
+                    presences[unit] = literal
+                model.AddExactlyOne(presences.values())
+                unit_presences[(task.id, res_id)] = presences
+
+        for intervals in unit_intervals.values():
+            model.AddNoOverlap(intervals)
+
+        # Redundant cumulative per pooled resource (stronger propagation)
+        for res_id, intervals in resource_intervals.items():
+            capacity = self.resources[res_id].capacity
+            if capacity > 1:
+                model.AddCumulative(intervals, [1] * len(intervals), capacity)
+
         # --- Objective ---
-        
+
         # Minimize makespan (end time of the last task)
-        makespan = model.NewIntVar(0, horizon_min, 'makespan')
-        model.AddMaxEquality(makespan, [task_ends[t.id] for t in tasks])
-        model.Minimize(makespan)
-        
-        # --- Solve ---
-        
-        solver = cp_model.CpSolver()
-        status = solver.Solve(model)
-        
-        results = []
-        task_lookup = {task.id: task for task in tasks}
-        if status == cp_model.OPTIMAL or status == cp_model.FEASIBLE:
-            print(f"Schedule found! Makespan: {solver.Value(makespan)} min")
-            for task in tasks:
-                start = solver.Value(task_starts[task.id])
-                end = solver.Value(task_ends[task.id])
-                results.append(ScheduleResult(
-                    task_id=task.id,
-                    start_time=start,
-                    end_time=end,
-                    resource_assignments={}
-                ))
-
-            self._assign_resource_units(results, task_lookup)
+        frozen_end = max((r.end_time for r in frozen.values()), default=0)
+        makespan = model.NewIntVar(0, max(horizon_min, frozen_end), 'makespan')
+        model.AddMaxEquality(makespan, [task_ends[t.id] for t in tasks] + [frozen_end])
+        if compact:
+            # Then total completion time, so no task floats later than needed
+            model.Minimize(makespan * (len(tasks) + 1) + sum(task_ends.values()))
         else:
-            print("No solution found.")
-            
+            model.Minimize(makespan)
+
+        return _WindowModel(model, task_starts, task_ends, unit_presences, makespan, frozen_end)
+
+    def _frozen_blocks(self, frozen: Dict[str, ScheduleResult]) -> Dict[str, List[Tuple[str, Tuple[int, int]]]]:
+        """Busy periods of each unit in the frozen schedule, with touching intervals merged."""
+        by_unit = collections.defaultdict(list)
+        for r in frozen.values():
+            for res_id, unit in r.resource_assignments.items():
+                if res_id in self.resources:
+                    by_unit[(res_id, unit)].append((r.start_time, r.end_time))
+
+        blocks = collections.defaultdict(list)
+        for (res_id, unit), intervals in by_unit.items():
+            intervals.sort()
+            current_start, current_end = intervals[0]
+            for start, end in intervals[1:]:
+                if start <= current_end:
+                    current_end = max(current_end, end)
+                else:
+                    blocks[res_id].append((unit, (current_start, current_end)))
+                    current_start, current_end = start, end
+            blocks[res_id].append((unit, (current_start, current_end)))
+        return blocks
+
+    def _greedy_schedule(
+        self,
+        tasks: List[Task],
+        frozen: Dict[str, ScheduleResult],
+        earliest_start: int,
+        hint: Optional[List[ScheduleResult]] = None,
+    ) -> Dict[str, ScheduleResult]:
+        """
+        Serial list schedule around the frozen tasks (feasible warm start).
+
+        Tasks are placed in priority order at the earliest time every
+        required resource has a free unit, filling gaps between busy periods.
+        With a hint, tasks are placed in order of their hinted start and keep
+        their hinted unit when it is free as early as any other, which
+        repairs a stale schedule into a feasible one close to it.
+
+        Returns:
+            Task ID -> ScheduleResult, in placement order
+        """
+        preferred_start = None
+        preferred_unit = {}
+        if hint:
+            hinted = {r.task_id: r for r in hint}
+            unhinted = self._greedy_schedule(tasks, frozen, earliest_start)
+            preferred_start = {
+                task.id: (hinted.get(task.id) or unhinted[task.id]).start_time for task in tasks
+            }
+            preferred_unit = {
+                (r.task_id, res_id): unit
+                for r in hint for res_id, unit in r.resource_assignments.items()
+            }
+
+        busy_starts = collections.defaultdict(list)  # unit -> sorted starts
+        busy_ends = collections.defaultdict(list)    # unit -> matching ends
+        for blocks in self._frozen_blocks(frozen).values():
+            for unit, (start, end) in blocks:
+                index = bisect.bisect(busy_starts[unit], start)
+                busy_starts[unit].insert(index, start)
+                busy_ends[unit].insert(index, end)
+
+        def earliest_fit(unit: str, t: int, duration: int) -> int:
+            starts, ends = busy_starts[unit], busy_ends[unit]
+            index = bisect.bisect_right(ends, t)
+            while index < len(starts) and starts[index] < t + duration:
+                t = max(t, ends[index])
+                index += 1
+            return t
+
+        ends_by_id = {task_id: r.end_time for task_id, r in frozen.items()}
+        order = self._priority_order(tasks, preferred_start)
+        results = {}
+        for task in order:
+            t = max([earliest_start] + [ends_by_id[p] for p in task.predecessors if p in ends_by_id])
+            required = [res_id for res_id in task.resources_required if res_id in self.resources]
+            while True:
+                chosen = {}
+                for res_id in required:
+                    fit, _, unit = min(
+                        (earliest_fit(unit, t, task.duration_min), unit != preferred_unit.get((task.id, res_id)), unit)
+                        for unit in self.unit_names(res_id)
+                    )
+                    chosen[res_id] = (fit, unit)
+                latest = max((fit for fit, _ in chosen.values()), default=t)
+                if latest == t:
+                    break
+                t = latest
+
+            for res_id, (_, unit) in chosen.items():
+                index = bisect.bisect(busy_starts[unit], t)
+                busy_starts[unit].insert(index, t)
+                busy_ends[unit].insert(index, t + task.duration_min)
+            ends_by_id[task.id] = t + task.duration_min
+            results[task.id] = ScheduleResult(
+                task_id=task.id,
+                start_time=t,
+                end_time=t + task.duration_min,
+                resource_assignments={res_id: unit for res_id, (_, unit) in chosen.items()},
+            )
         return results
 
+    def _add_hint(self, window: _WindowModel, hint: List[ScheduleResult]):
+        """Warm-start from a schedule of the window's tasks (tasks it does not cover are left free)."""
+        hinted_end = window.frozen_end
+        for r in hint:
+            if r.task_id not in window.starts:
+                continue
+            hinted_end = max(hinted_end, r.end_time)
+            window.model.AddHint(window.starts[r.task_id], r.start_time)
+            window.model.AddHint(window.ends[r.task_id], r.end_time)
+            for res_id, unit in r.resource_assignments.items():
+                presences = window.units.get((r.task_id, res_id))
+                if presences is None or len(presences) == 1 or unit not in presences:
+                    continue
+                for name, literal in presences.items():
+                    window.model.AddHint(literal, name == unit)
+        # A complete, feasible hint is accepted as the first solution
+        window.model.AddHint(window.makespan, hinted_end)
+
+    def _priority_order(self, tasks: List[Task], preferred_start: Optional[Dict[str, int]] = None) -> List[Task]:
+        """
+        Topological order, longest remaining (critical) path first, then input order.
+
+        With preferred_start, ready tasks are taken by preferred start first.
+        """
+        by_id = {task.id: task for task in tasks}
+        successors = collections.defaultdict(list)
+        indegree = {task.id: 0 for task in tasks}
+        for task in tasks:
+            for pred_id in task.predecessors:
+                if pred_id in by_id:
+                    successors[pred_id].append(task.id)
+                    indegree[task.id] += 1
+
+        # Remaining path length via reverse topological sweep
+        topo = []
+        ready = collections.deque(task_id for task_id, deg in indegree.items() if deg == 0)
+        remaining = dict(indegree)
+        while ready:
+            task_id = ready.popleft()
+            topo.append(task_id)
+            for succ in successors[task_id]:
+                remaining[succ] -= 1
+                if remaining[succ] == 0:
+                    ready.append(succ)
+        if len(topo) != len(tasks):
+            raise ValueError("Task predecessors contain a cycle")
+
+        tail = {}
+        for task_id in reversed(topo):
+            tail[task_id] = by_id[task_id].duration_min + max(
+                (tail[succ] for succ in successors[task_id]), default=0
+            )
+
+        position = {task.id: i for i, task in enumerate(tasks)}
+        preferred_start = preferred_start or {}
+
+        def key(task_id):
+            return (preferred_start.get(task_id, 0), -tail[task_id], position[task_id], task_id)
+
+        heap = [key(t) for t, deg in indegree.items() if deg == 0]
+        heapq.heapify(heap)
+        order = []
+        while heap:
+            task_id = heapq.heappop(heap)[-1]
+            order.append(by_id[task_id])
+            for succ in successors[task_id]:
+                indegree[succ] -= 1
+                if indegree[succ] == 0:
+                    heapq.heappush(heap, key(succ))
+        return order
+
+    @staticmethod
+    def _in_task_order(tasks: List[Task], results: Dict[str, ScheduleResult]) -> List[ScheduleResult]:
+        return [results[task.id] for task in tasks if task.id in results]
+
     def visualize_schedule(self, results: List[ScheduleResult]):
         """Print a simple Gantt chart."""
         if not results:
             print("No schedule to visualize.")
             return
-            
+
         # Sort by start time
         sorted_results = sorted(results, key=lambda x: x.start_time)
-        
+
         print("\n--- Schedule Gantt ---")
         for r in sorted_results:
             assignment_str = ""
@@ -153,38 +665,3 @@ class Scheduler:
                 )
                 assignment_str = f" [{formatted}]"
             print(f"[{r.start_time:4d} - {r.end_time:4d}] {r.task_id}{assignment_str}")
-
-    def _assign_resource_units(self, results: List[ScheduleResult], tasks: Dict[str, Task]):
-        """Assign specific resource units post-solve."""
-        result_lookup = {r.task_id: r for r in results}
-
-        for res_id, resource in self.resources.items():
-            relevant = [
-                result_lookup[task_id]
-                for task_id, task in tasks.items()
-                if res_id in task.resources_required and task_id in result_lookup
-            ]
-            if not relevant:
-                continue
-
-            capacity = resource.capacity
-            if capacity == 1:
-                for r in relevant:
-                    r.resource_assignments[res_id] = res_id
-                continue
-
-            relevant.sort(key=lambda x: x.start_time)
-            unit_available = [0] * capacity
-
-            for sched in relevant:
-                assigned_unit = None
-                for idx in range(capacity):
-                    if unit_available[idx] <= sched.start_time:
-                        assigned_unit = idx
-                        break
-
-                if assigned_unit is None:
-                    assigned_unit = min(range(capacity), key=lambda i: unit_available[i])
-
-                unit_available[assigned_unit] = max(unit_available[assigned_unit], sched.end_time)
-                sched.resource_assignments[res_id] = f"{res_id}_{assigned_unit}"
@@ -47,6 +47,9 @@ from .simulated_executor import SimulatedImagingExecutor
 from .simulated_perturbation_executor import SimulatedPerturbationExecutor
 from .legacy import simulate_plate_data, SimulationEngine
 
+# Monte Carlo crash-test engine
+from .monte_carlo import run_monte_carlo, StreamingQuantiles, StreamingHistogram
+
 __all__ = [
     # Spatial effects
     'SpatialEffectsSimulator',
@@ -83,4 +86,9 @@ __all__ = [
     'SimulatedPerturbationExecutor',
     'simulate_plate_data',
     'SimulationEngine',
+
+    # Monte Carlo
+    'run_monte_carlo',
+    'StreamingQuantiles',
+    'StreamingHistogram',
 ]
@@ -0,0 +1,159 @@
+"""
+Monte Carlo Engine
+
+Runs many independent simulation replicates (crash tests) with per-run
+reproducible randomness and bounded-memory summaries.
+
+- Each run gets its own generator from SeedSequence(seed).spawn(...), so run i
+  is identical whether it executes serially, in a pool, or on its own.
+- Runs fan out over a process pool and are yielded back in run order.
+- StreamingQuantiles / StreamingHistogram summarize per-run metrics without
+  keeping every run in memory.
+"""
+
+from multiprocessing import Pool
+from typing import Any, Callable, Dict, Iterator, Optional
+
+import numpy as np
+
+# Run function: (run_id, rng) -> per-run result
+RunFn = Callable[[int, np.random.Generator], Any]
+
+# Set in pool workers by _init_worker (avoids pickling the run function per task)
+_WORKER_RUN_FN: Optional[RunFn] = None
+
+
+def run_rng(entropy: int, run_id: int) -> np.random.Generator:
+    """Generator for one run: child `run_id` of SeedSequence(entropy).spawn(...)."""
+    return np.random.default_rng(np.random.SeedSequence(entropy, spawn_key=(run_id,)))
+
+
+def _init_worker(run_fn: RunFn):
+    global _WORKER_RUN_FN
+    _WORKER_RUN_FN = run_fn
+
+
+def _run_in_worker(task: tuple) -> Any:
+    entropy, run_id = task
+    return _WORKER_RUN_FN(run_id, run_rng(entropy, run_id))
+
+
+def run_monte_carlo(
+    run_fn: RunFn,
+    num_runs: int,
+    seed: Optional[int] = None,
+    workers: int = 1,
+    chunksize: Optional[int] = None,
+) -> Iterator[Any]:
+    """
+    Execute num_runs independent runs and yield their results in run order.
+
+    Args:
+        run_fn: Top-level callable (run_id, rng) -> result (picklable result)
+        num_runs: Number of runs
+        seed: Root seed (None draws fresh OS entropy)
+        workers: Process count; 1 runs in-process
+        chunksize: Runs per pool task (default: ~8 tasks per worker)
+
+    Yields:
+        run_fn results for run_id = 0..num_runs-1
+    """
+    entropy = np.random.SeedSequence(seed).entropy
+
+    if workers <= 1 or num_runs <= 1:
+        for run_id in range(num_runs):
+            yield run_fn(run_id, run_rng(entropy, run_id))
+        return
+
+    if chunksize is None:
+        chunksize = max(1, num_runs // (workers * 8))
+    tasks = ((entropy, run_id) for run_id in range(num_runs))
+    with Pool(processes=workers, initializer=_init_worker, initargs=(run_fn,)) as pool:
+        yield from pool.imap(_run_in_worker, tasks, chunksize=chunksize)
+
+
+class StreamingQuantiles:
+    """
+    Quantiles of a stream of scalars.
+
+    Exact (pandas' default linear interpolation) while the stream has at most
+    max_bins distinct values, which covers counts such as vials and days.
+    Beyond that, neighbouring values are merged into weighted centroids so
+    memory stays O(max_bins) and quantiles become approximate (tightest in
+    the tails, where crash-test p5/p95 live).
+    """
+
+    def __init__(self, max_bins: int = 4096):
+        self.max_bins = max_bins
+        self.count = 0
+        self.total = 0.0
+        self.exact = True
+        self._weights: Dict[float, float] = {}
+
+    def add(self, value: float):
+        value = float(value)
+        self.count += 1
+        self.total += value
+        self._weights[value] = self._weights.get(value, 0.0) + 1.0
+        if len(self._weights) > self.max_bins:
+            self._compress()
+
+    def _compress(self):
+        """
+        Merge neighbouring values into weighted centroids (t-digest style).
+
+        Centroids may grow to ~4 N q(1 - q) / max_bins, so the tails keep
+        near-exact resolution while the middle is coarsened.
+        """
+        values = sorted(self._weights)
+        scale = 4.0 * self.count / (self.max_bins / 8)
+        merged: Dict[float, float] = {}
+        cumulative = 0.0
+        centroid, weight = values[0], self._weights[values[0]]
+        for v in values[1:]:
+            w = self._weights[v]
+            q = (cumulative + (weight + w) / 2) / self.count
+            if weight + w <= max(1.0, scale * q * (1 - q)):
+                centroid = (centroid * weight + v * w) / (weight + w)
+                weight += w
+            else:
+                merged[centroid] = merged.get(centroid, 0.0) + weight
+                cumulative += weight
+                centroid, weight = v, w
+        merged[centroid] = merged.get(centroid, 0.0) + weight
+        self._weights = merged
+        self.exact = False
+
+    def quantile(self, q: float) -> float:
+        if self.count == 0:
+            return float("nan")
+        values = np.array(sorted(self._weights))
+        cumulative = np.cumsum([self._weights[v] for v in values])
+
+        position = (self.count - 1) * q
+        lower = int(np.floor(position))
+        upper = min(lower + 1, self.count - 1)
+        v_lower = values[np.searchsorted(cumulative, lower, side="right")]
+        v_upper = values[np.searchsorted(cumulative, upper, side="right")]
+        return float(v_lower + (position - lower) * (v_upper - v_lower))
+
+    def median(self) -> float:
+        return self.quantile(0.5)
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else float("nan")
+
+
+class StreamingHistogram:
+    """Fixed-bin histogram over [lo, hi]; out-of-range values land in the edge bins."""
+
+    def __init__(self, lo: float, hi: float, bins: int = 30):
+        if hi <= lo:
+            hi = lo + 1.0
+        self.edges = np.linspace(lo, hi, bins + 1)
+        self.counts = np.zeros(bins, dtype=np.int64)
+
+    def add(self, value: float):
+        index = np.searchsorted(self.edges, value, side="right") - 1
+        self.counts[min(max(index, 0), len(self.counts) - 1)] += 1
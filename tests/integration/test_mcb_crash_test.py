@@ -131,3 +131,16 @@ def test_mcb_crash_test_dataframes():
         ]
         for col in expected_daily_columns:
             assert col in result.daily_metrics.columns, f"Missing daily column: {col}"
+
+
+def test_mcb_crash_test_parallel_matches_serial(tmp_path):
+    """Test per-run seeding gives identical summaries for serial and pooled runs."""
+    serial = run_mcb_crash_test(MCBTestConfig(num_simulations=6, random_seed=321))
+    pooled = run_mcb_crash_test(MCBTestConfig(
+        num_simulations=6, random_seed=321, workers=2,
+        keep_run_details=False, output_dir=str(tmp_path),
+    ))
+
+    assert pooled.summary == serial.summary
+    assert pooled.run_results.empty
+    assert (tmp_path / "mcb_daily_metrics.csv").read_text().count("\n") == len(serial.daily_metrics) + 1
@@ -9,7 +9,9 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 import numpy as np
-from src.cell_os.hardware.rng_guard import ValidatedRNG, RNGStreamViolation
+import pytest
+
+from src.cell_os.hardware.rng_guard import GUARD_MODES, ValidatedRNG, RNGStreamViolation
 
 
 def test_rng_guard_allows_authorized():
@@ -86,6 +88,72 @@ def test_rng_guard_non_enforcing():
     print("✓ Non-enforcing mode allows all calls")
 
 
+def test_rng_guard_cached_mode_matches_strict():
+    """Test that cached mode authorizes and blocks exactly like strict mode."""
+    allowed = ValidatedRNG(
+        np.random.default_rng(42),
+        stream_name="test",
+        allowed_patterns={"test_rng_guard_cached_mode_matches_strict"},
+        mode="cached"
+    )
+    for _ in range(3):
+        allowed.random()
+    assert allowed.call_count == 3
+    assert len(allowed._authorized_code) == 1
+
+    blocked = ValidatedRNG(
+        np.random.default_rng(42),
+        stream_name="test",
+        allowed_patterns={"_never_matches_"},
+        mode="cached"
+    )
+    # Unauthorized call-sites are never cached: every draw raises
+    for _ in range(2):
+        with pytest.raises(RNGStreamViolation) as excinfo:
+            blocked.normal()
+        assert excinfo.value.caller_function == "test_rng_guard_cached_mode_matches_strict"
+    assert not blocked._authorized_code
+
+    print("✓ Cached mode enforces the strict contract")
+
+
+def test_rng_guard_modes_produce_identical_streams():
+    """Test that enforcement mode never changes the draws."""
+    streams = []
+    for mode in GUARD_MODES:
+        rng = ValidatedRNG(
+            np.random.default_rng(7),
+            stream_name="test",
+            allowed_patterns={"test_rng_guard_modes_produce_identical_streams"},
+            mode=mode
+        )
+        streams.append([rng.random(), rng.normal(0, 2), rng.integers(0, 100), rng.lognormal(0, 0.3)])
+    assert streams[0] == streams[1] == streams[2]
+
+    print("✓ Draws are identical across strict/cached/off")
+
+
+def test_rng_guard_off_mode_and_invalid_mode():
+    """Test that off mode skips checks and unknown modes are rejected."""
+    rng = ValidatedRNG(
+        np.random.default_rng(42),
+        stream_name="test",
+        allowed_patterns={"_never_matches_"},
+        mode="off"
+    )
+    rng.random()
+    assert rng.call_count == 1
+
+    rng.set_mode("cached")
+    with pytest.raises(RNGStreamViolation):
+        rng.random()
+
+    with pytest.raises(ValueError):
+        ValidatedRNG(np.random.default_rng(42), "test", {"x"}, mode="sampled")
+
+    print("✓ Off mode skips checks, invalid modes rejected")
+
+
 if __name__ == "__main__":
     print("="*60)
     print("Agent 1: RNG Guard Unit Tests")
@@ -96,6 +164,9 @@ if __name__ == "__main__":
     test_rng_guard_blocks_unauthorized()
     test_rng_call_counting()
     test_rng_guard_non_enforcing()
+    test_rng_guard_cached_mode_matches_strict()
+    test_rng_guard_modes_produce_identical_streams()
+    test_rng_guard_off_mode_and_invalid_mode()
 
     print()
     print("="*60)
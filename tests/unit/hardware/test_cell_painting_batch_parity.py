@@ -0,0 +1,184 @@
+"""
+Parity tests: batched cell_painting_assay_batch vs per-well cell_painting_assay.
+
+The columnar plate read is an optimization only. Every row must be bit-identical
+to the scalar assay called well by well in the same order, and the shared
+rng_assay stream must end in the same state (downstream draws unchanged).
+"""
+
+import copy
+
+import numpy as np
+
+from cell_os.hardware.biological_virtual import BiologicalVirtualMachine
+
+CHANNELS = ["er", "mito", "nucleus", "actin", "rna"]
+CONTEXT = {"plate_id": "P7", "batch_id": "batch_B", "day": 2, "operator": "OP2"}
+
+# Detector layers that are dormant in the default params
+ACTIVE_DETECTOR = {
+    "additive_floor_sigma_er": 2.0,
+    "additive_floor_sigma_mito": 3.0,
+    "additive_floor_sigma_nucleus": 1.5,
+    "additive_floor_sigma_actin": 2.0,
+    "additive_floor_sigma_rna": 2.5,
+    "saturation_ceiling_er": 120.0,
+    "saturation_ceiling_mito": 180.0,
+    "saturation_ceiling_nucleus": 220.0,
+    "saturation_ceiling_actin": 130.0,
+    "saturation_ceiling_rna": 170.0,
+    "saturation_knee_start_fraction": 0.6,
+    "adc_quant_bits_default": 10,
+    "well_failure_rate": 0.2,
+}
+
+HOSTILE_REALISM = {
+    "position_row_bias_pct": 3.0,
+    "position_col_bias_pct": 3.0,
+    "edge_mean_shift_pct": -7.0,
+    "edge_noise_multiplier": 2.5,
+    "outlier_rate": 0.3,
+    "batch_effect_strength": 1.5,
+}
+
+
+def _plate(rows="ABCDEFGH", n_cols=12):
+    positions = [f"{r}{c:02d}" for r in rows for c in range(1, n_cols + 1)]
+    return [f"Plate1_{wp}" for wp in positions], positions
+
+
+def _make_vm(seed=7, tech_noise_overrides=None):
+    vm = BiologicalVirtualMachine(simulation_speed=0.0, seed=seed)
+    vessel_ids, _ = _plate()
+    for i, vessel_id in enumerate(vessel_ids):
+        vm.seed_vessel(vessel_id, ["A549", "HepG2"][i % 2], initial_count=2e5 + i * 5e3)
+    for i, vessel_id in enumerate(vessel_ids):
+        if i % 4:
+            compound = ["tunicamycin", "cccp", "nocodazole"][i % 3]
+            vm.treat_with_compound(vessel_id, compound, [0.1, 1.0, 10.0, 50.0][i % 4])
+    vm.advance_time(24.0)
+    if tech_noise_overrides:
+        vm._load_cell_thalamus_params()
+        vm.thalamus_params = copy.deepcopy(vm.thalamus_params)
+        vm.thalamus_params["technical_noise"].update(tech_noise_overrides)
+    return vm
+
+
+def _assert_rows_match(scalar_results, batch):
+    assert batch["status"] == "success"
+    assert batch["channels"] == CHANNELS
+    for i, r in enumerate(scalar_results):
+        for col, key in (("morphology", "morphology"), ("morphology_struct", "morphology_struct")):
+            row = [r[key][ch] for ch in CHANNELS]
+            assert batch[col][i].tolist() == row, f"{batch['vessel_ids'][i]}.{col}"
+        for key in (
+            "signal_intensity",
+            "transport_dysfunction_score",
+            "cell_count_estimated",
+            "cell_count_observed",
+            "segmentation_quality",
+            "segmentation_quality_pre_debris",
+            "merge_count",
+            "split_count",
+            "size_bias",
+            "segmentation_qc_passed",
+            "cp_quality",
+            "n_segmented",
+        ):
+            assert batch[key][i] == r[key], f"{batch['vessel_ids'][i]}.{key}"
+        assert batch["qc_flag"][i] == r.get("qc_flag")
+        assert batch["well_failure"][i] == r.get("well_failure")
+        assert batch["segmentation_warnings"][i] == r["segmentation_warnings"]
+
+        meta = r["detector_metadata"]
+        assert batch["detector_metadata"]["edge_distance"][i] == meta["edge_distance"]
+        assert batch["detector_metadata"]["qc_flags"][i] == meta["qc_flags"]
+        for c, ch in enumerate(CHANNELS):
+            assert batch["detector_metadata"]["is_saturated"][i, c] == meta["is_saturated"][ch]
+            assert batch["detector_metadata"]["quant_step"][i, c] == meta["quant_step"][ch]
+        assert batch["detector_metadata"]["realism_config_hash"] == meta["realism_config_hash"]
+
+        regime = batch["morph_regime"]
+        assert regime["stress_weight"][i] == r["morph_regime"]["stress_weight"]
+        assert regime["death_weight"][i] == r["morph_regime"]["death_weight"]
+
+
+def _run_both(vessel_ids, well_positions, tech_noise_overrides=None, **kwargs):
+    vm_scalar = _make_vm(tech_noise_overrides=tech_noise_overrides)
+    if well_positions is None:
+        scalar = [vm_scalar.cell_painting_assay(v, **kwargs) for v in vessel_ids]
+    else:
+        scalar = [
+            vm_scalar.cell_painting_assay(v, well_position=wp, **kwargs)
+            for v, wp in zip(vessel_ids, well_positions)
+        ]
+
+    vm_batch = _make_vm(tech_noise_overrides=tech_noise_overrides)
+    batch = vm_batch.cell_painting_assay_batch(vessel_ids, well_positions=well_positions, **kwargs)
+
+    # Shared assay stream consumed identically (later measurements unaffected)
+    assert vm_scalar.rng_assay.call_count == vm_batch.rng_assay.call_count
+    assert vm_scalar.rng_assay._rng.random() == vm_batch.rng_assay._rng.random()
+    return scalar, batch
+
+
+def test_default_plate_read_parity():
+    """Treated two-cell-line plate under the default (clean) profile."""
+    vessel_ids, positions = _plate()
+    scalar, batch = _run_both(vessel_ids, positions, **CONTEXT)
+
+    _assert_rows_match(scalar, batch)
+    assert batch["vessel_ids"] == vessel_ids
+    assert batch["morphology"].shape == (len(vessel_ids), 5)
+
+
+def test_active_detector_and_realism_parity():
+    """Additive floor, soft-knee saturation, ADC bits, QC pathologies, well failures."""
+    vessel_ids, positions = _plate()
+    scalar, batch = _run_both(
+        vessel_ids,
+        positions,
+        tech_noise_overrides=ACTIVE_DETECTOR,
+        realism_config_override=HOSTILE_REALISM,
+        enable_structured_artifacts=True,
+        exposure_multiplier=1.3,
+        focus_offset_um=3.0,
+        stain_scale=1.4,
+        **CONTEXT,
+    )
+
+    _assert_rows_match(scalar, batch)
+
+    # Sanity: the scenario exercised the vectorized regimes
+    assert batch["detector_metadata"]["is_saturated"].any()
+    assert batch["detector_metadata"]["is_quantized"].all()
+    assert any(flags["is_outlier"] for flags in batch["detector_metadata"]["qc_flags"])
+    assert any(mode is not None for mode in batch["well_failure"])
+
+
+def test_default_well_positions_match_scalar_defaults():
+    """Without well_positions, rows match measure(vessel, **kwargs) per well."""
+    vessel_ids, _ = _plate(rows="AB", n_cols=6)
+    scalar, batch = _run_both(vessel_ids, None, **CONTEXT)
+
+    _assert_rows_match(scalar, batch)
+
+
+def test_missing_vessel_returns_error():
+    vm = _make_vm()
+    result = vm.cell_painting_assay_batch(["Plate1_A01", "nope"])
+    assert result["status"] == "error"
+    assert "nope" in result["message"]
+
+
+def test_batch_is_read_only():
+    """A plate read does not mutate vessel state (measurement purity)."""
+    vm = _make_vm()
+    vessel_ids, positions = _plate(rows="CD", n_cols=4)
+    before = {v: (vm.vessel_states[v].viability, vm.vessel_states[v].confluence) for v in vessel_ids}
+
+    result = vm.cell_painting_assay_batch(vessel_ids, well_positions=positions, **CONTEXT)
+
+    after = {v: (vm.vessel_states[v].viability, vm.vessel_states[v].confluence) for v in vessel_ids}
+    assert after == before
+    assert np.all(result["morphology"] >= 0.0)
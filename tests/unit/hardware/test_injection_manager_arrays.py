@@ -0,0 +1,101 @@
+"""
+Tests for the array-backed InjectionManager.
+
+Concentrations live in vessel × species arrays; these tests pin the dict
+semantics the rest of the simulator relies on (absent != 0.0, insertion
+order, copies from get_all_*) and the read-only state view.
+"""
+
+import pytest
+
+from cell_os.hardware.injection_manager import InjectionManager
+
+
+def _is_edge(well):
+    return well[0] in "AH" or well[1:] in ("01", "12")
+
+
+def _seed(mgr, vessel_id, t=0.0):
+    mgr.add_event({
+        "event_type": "SEED_VESSEL", "time_h": t, "vessel_id": vessel_id,
+        "payload": {"initial_nutrients_mM": {"glucose": 25.0, "glutamine": 4.0}},
+    })
+
+
+def _treat(mgr, vessel_id, compound, dose_uM, t=1.0):
+    mgr.add_event({
+        "event_type": "TREAT_COMPOUND", "time_h": t, "vessel_id": vessel_id,
+        "payload": {"compound": compound, "dose_uM": dose_uM},
+    })
+
+
+def test_step_matches_scalar_evaporation():
+    mgr = InjectionManager(is_edge_well_fn=_is_edge)
+    for well in ("P_A01", "P_D06"):
+        _seed(mgr, well)
+        _treat(mgr, well, "tBHQ", 10.0)
+
+    vm = {"P_A01": 1.0, "P_D06": 1.0}
+    conc = {"P_A01": 10.0, "P_D06": 10.0}
+    for i in range(200):
+        mgr.step(dt_h=1.0, now_h=float(i + 1))
+        for well, rate in (("P_A01", 0.0020), ("P_D06", 0.0005)):
+            new_vm = max(0.70, vm[well] * (1.0 - rate * 1.0))
+            conc[well] *= vm[well] / new_vm
+            vm[well] = new_vm
+
+    for well in vm:
+        assert mgr.get_volume_mult(well) == vm[well]
+        assert mgr.get_compound_concentration_uM(well, "tBHQ") == conc[well]
+    assert mgr.get_volume_mult("P_A01") == 0.70  # Edge well hits the cap
+    assert mgr.get_state("P_D06").last_step_time == 200.0
+
+
+def test_absent_compounds_and_insertion_order():
+    mgr = InjectionManager(is_edge_well_fn=_is_edge)
+    _seed(mgr, "P_B02")
+    _seed(mgr, "P_B03")
+    _treat(mgr, "P_B02", "X", 1.0)
+    _treat(mgr, "P_B02", "Y", 0.0)  # Zero dose is still present
+    _treat(mgr, "P_B03", "Y", 2.0)
+    _treat(mgr, "P_B03", "X", 3.0)
+
+    assert list(mgr.get_all_compounds_uM("P_B02")) == ["X", "Y"]
+    assert list(mgr.get_all_compounds_uM("P_B03")) == ["Y", "X"]
+
+    mgr.add_event({
+        "event_type": "WASHOUT_COMPOUND", "time_h": 2.0, "vessel_id": "P_B02",
+        "payload": {"compound": "X"},
+    })
+    assert mgr.get_all_compounds_uM("P_B02") == {"Y": 0.0}
+    assert mgr.get_compound_concentration_uM("P_B02", "X") == 0.0
+    assert mgr.get_state("P_B02").last_washout_time == 2.0
+    assert mgr.get_state("P_B03").last_washout_time is None
+
+    # Re-seeding resets the vessel
+    _seed(mgr, "P_B03", t=3.0)
+    assert mgr.get_all_compounds_uM("P_B03") == {}
+    assert mgr.get_volume_mult("P_B03") == 1.0
+
+
+def test_state_is_read_only_and_getters_return_copies():
+    mgr = InjectionManager(is_edge_well_fn=_is_edge)
+    _seed(mgr, "P_C04")
+    _treat(mgr, "P_C04", "X", 5.0)
+
+    state = mgr.get_state("P_C04")
+    with pytest.raises(TypeError):
+        state.compounds_uM["X"] = 100.0
+    with pytest.raises(AttributeError):
+        state.volume_mult = 0.5
+
+    compounds = mgr.get_all_compounds_uM("P_C04")
+    compounds["X"] = 100.0
+    assert mgr.get_compound_concentration_uM("P_C04", "X") == 5.0
+
+    # The view is live
+    _treat(mgr, "P_C04", "X", 7.0)
+    assert state.compounds_uM["X"] == 7.0
+
+    with pytest.raises(KeyError):
+        mgr.get_state("P_missing")
@@ -8,9 +8,15 @@ Tests:
 4. Same compound measured in two batches gives different conclusions
 """
 
+import numpy as np
 import pytest
 from cell_os.hardware.biological_virtual import BiologicalVirtualMachine
-from cell_os.hardware.run_context import RunContext, pipeline_transform
+from cell_os.hardware.run_context import (
+    PIPELINE_CHANNELS,
+    RunContext,
+    pipeline_transform,
+    pipeline_transform_batch,
+)
 
 
 def test_pipeline_transform_deterministic():
@@ -217,6 +223,25 @@ def test_pipeline_integration_with_assay():
     print("✓ Pipeline integration: PASS\n")
 
 
+def test_batch_transform_matches_scalar_including_plate_failures():
+    """Columnar transform is bit-identical to the scalar one, failure plates included."""
+    ctx = RunContext.sample(seed=3)
+    rows = np.random.default_rng(0).uniform(50.0, 150.0, size=(4, len(PIPELINE_CHANNELS)))
+
+    n_failures = 0
+    for i in range(200):
+        for plate_id in (None, "P1", "P2"):
+            batch = pipeline_transform_batch(rows, ctx, batch_id=f"batch_{i}", plate_id=plate_id)
+            for row, out in zip(rows, batch):
+                scalar = pipeline_transform(dict(zip(PIPELINE_CHANNELS, row)), ctx, f"batch_{i}", plate_id)
+                assert [scalar[ch] for ch in PIPELINE_CHANNELS] == out.tolist()
+
+            clean = pipeline_transform_batch(rows, ctx, batch_id=f"batch_{i}")
+            n_failures += plate_id is not None and not np.allclose(batch, clean)
+
+    assert n_failures > 0  # Plate failure branches were exercised
+
+
 if __name__ == "__main__":
     test_pipeline_transform_deterministic()
     test_batch_dependent_features()
@@ -0,0 +1,119 @@
+"""
+Persistent prefix-rollout cache and process-pool prefetch for beam search.
+
+Both are pure accelerations: a cached or worker-computed PrefixRolloutResult
+must equal the one the sequential runner computes in-process.
+"""
+
+import subprocess
+import sys
+from dataclasses import asdict
+from multiprocessing import Pool
+
+from cell_os.hardware.beam_search import PrefixRolloutCache, Phase5EpisodeRunner
+from cell_os.hardware.beam_search import prefix_cache
+from cell_os.hardware.beam_search.parallel import init_rollout_worker, prefetch_rollouts
+from cell_os.hardware.beam_search.types import PrefixRolloutResult
+from cell_os.hardware.episode import Action
+from cell_os.hardware.masked_compound_phase5 import PHASE5_LIBRARY
+
+COMPOUND_ID = "test_A_clean"
+DOSE = Action(dose_fraction=1.0, washout=False, feed=False)
+HOLD = Action(dose_fraction=0.0, washout=False, feed=False)
+WASH = Action(dose_fraction=0.0, washout=True, feed=False)
+
+
+def _runner(**kwargs):
+    return Phase5EpisodeRunner(PHASE5_LIBRARY[COMPOUND_ID], seed=42, **kwargs)
+
+
+def _comparable(result: PrefixRolloutResult) -> dict:
+    record = asdict(result)
+    record.pop("posterior")  # Object identity differs; its summaries are compared via fields
+    return record
+
+
+def test_cache_key_is_content_addressed(tmp_path):
+    """Same inputs → same key; any input that changes the rollout → new key."""
+    cache = PrefixRolloutCache(str(tmp_path), version="v1")
+    context = {"compound": "x", "seed": 1}
+    schedule = [(1.0, False, False), (0.0, True, False)]
+
+    key = cache.make_key(context, schedule, with_prior=True)
+    assert key == cache.make_key(dict(context), list(schedule), with_prior=True)
+
+    assert key != cache.make_key({"compound": "x", "seed": 2}, schedule, with_prior=True)
+    assert key != cache.make_key(context, schedule[:1], with_prior=True)
+    assert key != cache.make_key(context, schedule, with_prior=False)
+    assert key != PrefixRolloutCache(str(tmp_path), version="v2").make_key(context, schedule, True)
+
+
+def test_code_version_covers_rollout_imports():
+    """Every cell_os subpackage a prefix rollout imports is fingerprinted."""
+    # Fresh interpreter: other tests import unrelated subpackages into this one
+    script = (
+        "import sys\n"
+        "from cell_os.hardware.beam_search import Phase5EpisodeRunner\n"
+        "from cell_os.hardware.episode import Action\n"
+        "from cell_os.hardware.masked_compound_phase5 import PHASE5_LIBRARY\n"
+        f"runner = Phase5EpisodeRunner(PHASE5_LIBRARY[{COMPOUND_ID!r}], seed=42)\n"
+        "runner.rollout_prefix([Action(1.0, False, False), Action(0.0, False, False)])\n"
+        "print(' '.join(sorted({m.split('.')[1] for m in sys.modules if m.startswith('cell_os.')})))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", script], capture_output=True, text=True, check=True).stdout
+    imported = set(output.split())
+
+    assert "hardware" in imported
+    assert imported <= set(prefix_cache._FINGERPRINT_PACKAGES)
+
+
+def test_cache_roundtrip_and_corrupt_record(tmp_path):
+    cache = PrefixRolloutCache(str(tmp_path), version="v1")
+    record = PrefixRolloutResult(
+        viability=0.9, actin_fold=1.2, classifier_margin=0.3, predicted_axis="microtubule",
+        washout_count=0, feed_count=0, actin_struct=1.1, baseline_actin=0.9,
+    )
+    key = cache.make_key({"compound": "x"}, [(1.0, False, False)], with_prior=False)
+
+    assert cache.get(key) is None
+    cache.put(key, record)
+    assert cache.get(key) == record
+    assert len(cache) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # Truncated write from a crashed process reads as a miss, never as garbage
+    (tmp_path / key[:2] / f"{key}.pkl").write_bytes(b"\x80\x05")
+    assert cache.get(key) is None
+
+
+def test_runner_disk_cache_hit_matches_computed(tmp_path):
+    """A second runner (fresh process state) reads identical records from disk."""
+    schedules = [[DOSE], [DOSE, HOLD], [DOSE, WASH]]
+
+    cold = _runner(prefix_cache_dir=str(tmp_path))
+    expected = [_comparable(cold.rollout_prefix(s)) for s in schedules]
+    assert cold._disk_cache.misses == len(schedules)
+
+    warm = _runner(prefix_cache_dir=str(tmp_path))
+    assert [_comparable(warm.rollout_prefix(s)) for s in schedules] == expected
+    assert warm._disk_cache.hits == len(schedules)
+
+
+def test_pool_prefetch_matches_sequential():
+    """Worker rollouts (extending shipped parent snapshots) equal in-process rollouts."""
+    parent = [DOSE]
+    children = [parent + [HOLD], parent + [WASH], parent + [DOSE]]
+
+    sequential = _runner()
+    sequential.rollout_prefix(parent)
+    expected = [_comparable(sequential.rollout_prefix(s)) for s in children]
+
+    parallel = _runner()
+    parallel.rollout_prefix(parent)
+    with Pool(2, initializer=init_rollout_worker, initargs=(parallel.worker_config(),)) as pool:
+        computed = prefetch_rollouts(pool, parallel, children)
+
+    assert computed == len(children)
+    key = parallel._actions_key(children[0])
+    assert key in parallel._prefix_snapshots  # Child snapshots returned for the next level
+    assert [_comparable(parallel.rollout_prefix(s)) for s in children] == expected
@@ -0,0 +1,72 @@
+"""
+VM reset contract: a reset VM is indistinguishable from a freshly constructed one.
+
+Worker pools reuse one VM per process and reset() it between wells, so any
+state that survives reset() would leak between wells and change results.
+"""
+
+from cell_os.cell_thalamus.design_generator import WellAssignment
+from cell_os.cell_thalamus import parallel_runner
+from cell_os.hardware.biological_virtual import BiologicalVirtualMachine
+
+
+def _drive(vm):
+    vm.seed_vessel("Plate1_B02", "A549", vessel_type="96-well", density_level="NOMINAL")
+    vm.advance_time(4.0)
+    vm.treat_with_compound("Plate1_B02", "tunicamycin", 1.0)
+    vm.advance_time(20.0)
+    morph = vm.cell_painting_assay("Plate1_B02")["morphology"]
+    atp = vm.atp_viability_assay("Plate1_B02")["atp_signal"]
+    return morph, atp, vm.vessel_states["Plate1_B02"].viability
+
+
+def test_reset_matches_fresh_vm():
+    """Dirty a VM with a different seed and vessels, reset, and compare to a fresh VM."""
+    vm = BiologicalVirtualMachine(seed=11, simulation_speed=0.0)
+    vm.seed_vessel("Plate9_H12", "HepG2", initial_count=3e5)
+    vm.treat_with_compound("Plate9_H12", "cccp", 10.0)
+    vm.advance_time(30.0)
+    vm.cell_painting_assay("Plate9_H12")
+
+    vm.reset(seed=5)
+    assert vm.vessel_states == {}
+    assert vm.simulated_time == 0.0
+    assert not vm.injection_mgr.has_vessel("Plate9_H12")
+
+    fresh = BiologicalVirtualMachine(seed=5, simulation_speed=0.0)
+    assert _drive(vm) == _drive(fresh)
+    assert vm.rng_assay.get_state() == fresh.rng_assay.get_state()
+    assert vm.run_context.to_dict() == fresh.run_context.to_dict()
+
+
+def test_reset_defaults_to_construction_seed():
+    vm = BiologicalVirtualMachine(seed=3, simulation_speed=0.0)
+    first = _drive(vm)
+    vm.reset()
+    assert _drive(vm) == first
+
+
+def test_plate_worker_matches_fresh_vm_per_well():
+    """Plate tasks on a reused worker VM return the same records as one VM per well."""
+    wells = [
+        WellAssignment(
+            well_id=well_id, cell_line="A549", compound=compound, dose_uM=dose,
+            timepoint_h=12.0, plate_id="P1", day=1, operator="Op1",
+        )
+        for well_id, compound, dose in [
+            ("A01", "tunicamycin", 10.0),
+            ("A02", "DMSO", 0.0),
+            ("B03", "etoposide", 1.0),
+        ]
+    ]
+
+    parallel_runner.init_worker()
+    reused = parallel_runner.execute_plate_worker((wells, "design"))
+
+    expected = []
+    for well in wells:
+        parallel_runner.init_worker()  # Brand-new VM for every well
+        expected.append(parallel_runner.execute_well_worker((well, "design")))
+
+    assert all(record is not None for record in reused)
+    assert reused == expected
@@ -0,0 +1,158 @@
+"""
+VM snapshot/fork contract: a restored VM continues bit-identically.
+
+Beam search relies on this to extend a parent node's snapshot by one step
+instead of replaying the prefix from t=0.
+"""
+
+from dataclasses import asdict
+
+import pytest
+
+from cell_os.hardware.biological_virtual import BiologicalVirtualMachine
+from cell_os.hardware.episode import Action, EpisodeRunner, Policy
+
+
+def _drive(vm):
+    """Treat, advance, measure: touches growth, treatment, assay and operations streams."""
+    vm.treat_with_compound("Plate1_B02", "tunicamycin", 1.0)
+    vm.advance_time(12.0)
+    vm.washout_compound("Plate1_B02")
+    vm.advance_time(12.0)
+    morph = vm.cell_painting_assay("Plate1_B02")["morphology"]
+    return morph, vm.vessel_states["Plate1_B02"]
+
+
+def _make_vm():
+    vm = BiologicalVirtualMachine(seed=7, simulation_speed=0.0)
+    vm.seed_vessel("Plate1_B02", "A549", initial_count=5e5)
+    vm.advance_time(6.0)
+    vm.cell_painting_assay("Plate1_B02")
+    return vm
+
+
+def test_fork_continues_bit_identically():
+    """Parent and fork driven through the same operations agree exactly."""
+    parent = _make_vm()
+    child = parent.fork()
+
+    morph_p, vessel_p = _drive(parent)
+    morph_c, vessel_c = _drive(child)
+
+    assert morph_p == morph_c
+    assert vessel_p.viability == vessel_c.viability
+    assert vessel_p.cell_count == vessel_c.cell_count
+    assert vessel_p.er_stress == vessel_c.er_stress
+    assert parent.rng_assay.get_state() == child.rng_assay.get_state()
+    assert parent.rng_operations.get_state() == child.rng_operations.get_state()
+
+
+def test_snapshot_is_isolated_and_reusable():
+    """Mutating the source or a restored VM never leaks into the snapshot."""
+    vm = _make_vm()
+    snapshot = vm.snapshot()
+    assert snapshot.simulated_time == vm.simulated_time
+    assert snapshot.vessel_ids == ("Plate1_B02",)
+
+    # Perturb the source after snapshotting
+    vm.treat_with_compound("Plate1_B02", "cccp", 10.0)
+    vm.advance_time(24.0)
+
+    first = BiologicalVirtualMachine.from_snapshot(snapshot)
+    second = BiologicalVirtualMachine.from_snapshot(snapshot)
+    assert first is not second
+    assert first.vessel_states["Plate1_B02"] is not second.vessel_states["Plate1_B02"]
+    assert first.vessel_states["Plate1_B02"].compounds == {}
+
+    morph_1, vessel_1 = _drive(first)
+    morph_2, vessel_2 = _drive(second)
+    assert morph_1 == morph_2
+    assert vessel_1.viability == vessel_2.viability
+
+
+def test_forked_vm_owns_its_subsystems():
+    """Assays, mechanisms and InjectionManager must point at the fork, not the parent."""
+    parent = _make_vm()
+    child = parent.fork()
+
+    assert child._cell_painting_assay.vm is child
+    assert child._er_stress.vm is child
+    assert child.injection_mgr is not parent.injection_mgr
+    assert child.scheduler is not parent.scheduler
+    assert child.run_context is not parent.run_context
+
+
+def test_episode_runner_snapshots_match_replay():
+    """Policies sharing a prefix give identical receipts with and without snapshots."""
+    dose = Action(dose_fraction=1.0, washout=False, feed=False)
+    hold = Action(dose_fraction=0.0, washout=False, feed=False)
+    wash = Action(dose_fraction=0.0, washout=True, feed=False)
+    policies = [
+        Policy(actions=[dose, hold, hold, hold]),
+        Policy(actions=[dose, hold, wash, hold]),
+        Policy(actions=[dose, wash, hold, hold]),
+    ]
+
+    outcomes = {}
+    for use_snapshots in (False, True):
+        runner = EpisodeRunner(
+            compound="nocodazole",
+            reference_dose_uM=0.5,
+            horizon_h=48.0,
+            step_h=12.0,
+            seed=3,
+            use_snapshots=use_snapshots,
+        )
+        outcomes[use_snapshots] = [
+            (asdict(receipt), [asdict(s) for s in trajectory])
+            for receipt, trajectory in (runner.run(p) for p in policies)
+        ]
+        if use_snapshots:
+            # Later policies resumed from shared prefixes
+            assert runner._run_checkpoints
+
+    assert outcomes[True] == outcomes[False]
+
+
+def test_episode_runner_snapshot_cache_is_capped():
+    """Run checkpoints stay within max_snapshots and evicted prefixes simply replay."""
+    dose = Action(dose_fraction=1.0, washout=False, feed=False)
+    hold = Action(dose_fraction=0.0, washout=False, feed=False)
+    wash = Action(dose_fraction=0.0, washout=True, feed=False)
+    policies = [
+        Policy(actions=[first, second, hold, hold])
+        for first in (dose, hold, wash)
+        for second in (dose, hold, wash)
+    ]
+
+    def run_all(**kwargs):
+        runner = EpisodeRunner(
+            compound="nocodazole", reference_dose_uM=0.5, horizon_h=48.0, step_h=12.0, seed=3, **kwargs
+        )
+        receipts = []
+        for policy in policies:
+            receipts.append(asdict(runner.run(policy)[0]))
+            assert len(runner._run_checkpoints) <= runner.max_snapshots
+        return runner, receipts
+
+    capped, capped_receipts = run_all(max_snapshots=2)
+    _, replayed_receipts = run_all(use_snapshots=False)
+
+    assert len(capped._run_checkpoints) == 2
+    # Most recently run policy's prefixes survive
+    assert list(capped._run_checkpoints) == [
+        capped._actions_key(policies[-1].actions[:2]),
+        capped._actions_key(policies[-1].actions[:3]),
+    ]
+    assert capped_receipts == replayed_receipts
+
+
+def test_from_snapshot_rejects_foreign_type():
+    vm = _make_vm()
+    snapshot = vm.snapshot()
+
+    class OtherVM(BiologicalVirtualMachine):
+        pass
+
+    with pytest.raises(TypeError):
+        OtherVM.from_snapshot(snapshot)
@@ -0,0 +1,92 @@
+"""
+Tests for the design-level response cache behind the Thalamus results endpoints.
+"""
+
+import asyncio
+import json
+import sqlite3
+
+import numpy as np
+import pytest
+
+from cell_os.api.routes import results
+from cell_os.api.services.analysis_cache import ANALYSIS_CACHE, AnalysisCache
+from cell_os.database.cell_thalamus_db import CellThalamusDB
+
+
+def _rows(design_id, n, start=0, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "design_id": design_id, "well_id": f"W{start + i:04d}", "cell_line": "A549",
+            "compound": "tBHQ", "dose_uM": float(i % 4), "timepoint_h": 24.0,
+            "plate_id": "P1", "day": 1, "operator": "op", "is_sentinel": False,
+            "morphology": {ch: float(v) for ch, v in zip(["er", "mito", "nucleus", "actin", "rna"], rng.normal(100, 10, 5))},
+            "atp_signal": 1.0,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "thalamus.db")
+    with CellThalamusDB(db_path=path) as db:
+        db.insert_results_batch(_rows("d1", 40))
+        db.insert_results_batch(_rows("d2", 10, seed=1))
+    results.init_globals(path)
+    ANALYSIS_CACHE.clear()
+    yield path
+    ANALYSIS_CACHE.clear()
+
+
+def _call(handler, *args, **kwargs):
+    return json.loads(asyncio.run(handler(*args, **kwargs)).body)
+
+
+def test_repeat_requests_hit_cache(db_path):
+    first = _call(results.get_pca_data, "d1")
+    assert _call(results.get_pca_data, "d1") == first
+    assert _call(results.get_pca_data, "d1", channels="er,mito")["channels"] == ["er", "mito"]
+
+    stats = ANALYSIS_CACHE.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 2, 2)
+
+
+def test_writes_invalidate_only_that_design(db_path):
+    assert _call(results.get_pca_data, "d1")["n_wells"] == 40
+    _call(results.get_morphology_matrix, "d2")
+
+    with CellThalamusDB(db_path=db_path) as db:
+        db.insert_results_batch(_rows("d1", 5, start=40))
+    assert ANALYSIS_CACHE.stats()["invalidations"] == 1
+    assert _call(results.get_pca_data, "d1")["n_wells"] == 45
+
+    # Writes from another process bypass the listener but change the version
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "INSERT INTO thalamus_results (design_id, well_id, cell_line, compound, dose_uM, timepoint_h, "
+        "plate_id, day, operator, morph_er, morph_mito, morph_nucleus, morph_actin, morph_rna) "
+        "VALUES ('d2', 'X', 'A549', 'DMSO', 0, 24, 'P1', 1, 'op', 1, 2, 3, 4, 5)"
+    )
+    conn.commit()
+    conn.close()
+    assert len(_call(results.get_morphology_matrix, "d2")["well_ids"]) == 11
+
+
+def test_columnar_layout_matches_rows(db_path):
+    rows = _call(results.get_results, "d2")
+    columns = _call(results.get_results, "d2", layout="columns")
+    assert set(columns) == set(rows[0])
+    assert columns["well_id"] == [r["well_id"] for r in rows]
+
+
+def test_lru_bounds():
+    cache = AnalysisCache(max_entries=2)
+    cache.put(("db", "d", "a", (), (1, 1)), b"a")
+    cache.put(("db", "d", "b", (), (1, 1)), b"b")
+    cache.get(("db", "d", "a", (), (1, 1)))
+    cache.put(("db", "d", "c", (), (1, 1)), b"c")
+
+    assert cache.get(("db", "d", "b", (), (1, 1))) is None
+    assert cache.stats()["evictions"] == 1 and cache.stats()["size_bytes"] == 2
@@ -12,6 +12,8 @@ from cell_os.biology.cell_cycle import (
     DRUG_CYCLE_EFFECTS,
     simulate_drug_treatment_cycle,
     compare_cell_lines_response,
+    phase_propagator,
+    simulate_batch,
 )
 
 
@@ -107,6 +109,71 @@ class TestCellCycleModel:
         assert np.std(g1_late) < 0.05  # Low variance = stable
 
 
+class TestExactStepper:
+    """Tests for matrix-exponential stepping and batched simulation."""
+
+    def test_simulate_matches_repeated_steps(self):
+        """Test vectorized simulate equals stepping one dt at a time."""
+        grid = CellCycleModel(cell_line='HeLa')
+        stepped = CellCycleModel(cell_line='HeLa')
+        for model in (grid, stepped):
+            model.add_drug('hydroxyurea', 1000.0)
+            model.add_drug('etoposide', 2.0)
+
+        result = grid.simulate(duration_h=60.0, dt_h=0.1)
+        deaths = [stepped.step(0.1)['deaths_from_arrest'] for _ in range(600)]
+
+        np.testing.assert_allclose(result['deaths'], deaths, atol=1e-15)
+        np.testing.assert_allclose(grid.distribution.to_array(), stepped.distribution.to_array(), atol=1e-14)
+        assert grid.total_deaths == pytest.approx(stepped.total_deaths, abs=1e-12)
+        assert grid.time_h == stepped.time_h
+
+    def test_single_step_jumps_whole_interval(self):
+        """Test one 48h step lands on the same state as a 0.1h grid."""
+        jump = CellCycleModel(cell_line='A549')
+        grid = CellCycleModel(cell_line='A549')
+        jump.add_drug('palbociclib', 1.0)
+        grid.add_drug('palbociclib', 1.0)
+
+        jump.step(48.0)
+        grid.simulate(duration_h=48.0, dt_h=0.1)
+
+        np.testing.assert_allclose(jump.distribution.to_array(), grid.distribution.to_array(), atol=1e-12)
+
+    def test_propagator_cached_per_rate_set(self):
+        """Test the matrix exponential is reused while rates are unchanged."""
+        model = CellCycleModel()
+        rates = model._compute_effective_rates()
+        P = phase_propagator(rates, 0.1)
+
+        assert phase_propagator(dict(rates), 0.1) is P
+        assert not P.flags.writeable
+        assert P.sum(axis=0) @ model.distribution.to_array() > 1.0  # division grows the population
+
+    def test_batch_matches_individual_simulation(self):
+        """Test simulate_batch equals simulating each model alone."""
+        lines = ['A549', 'HeLa', 'iPSC_NGN2']
+        batched = [CellCycleModel(cell_line=cl) for cl in lines]
+        single = [CellCycleModel(cell_line=cl) for cl in lines]
+        for i, model in enumerate(batched + single):
+            model.add_drug(['paclitaxel', 'palbociclib', 'hydroxyurea'][i % 3], 1.0)
+
+        results = simulate_batch(batched, duration_h=30.0, dt_h=0.25)
+        for b, s, result in zip(batched, single, results):
+            expected = s.simulate(duration_h=30.0, dt_h=0.25)
+            for key in ('time_h', 'G0', 'G1', 'S', 'G2', 'M', 'cumulative_deaths'):
+                np.testing.assert_allclose(result[key], expected[key], atol=1e-13)
+            assert b.total_deaths == pytest.approx(s.total_deaths, abs=1e-13)
+
+    def test_compare_cell_lines_matches_single_line(self):
+        """Test batched comparison equals per-line simulate_drug_treatment_cycle."""
+        result = compare_cell_lines_response('paclitaxel', 0.1, duration_h=24.0, cell_lines=['A549', 'HeLa'])
+        for cl in ('A549', 'HeLa'):
+            single = simulate_drug_treatment_cycle(cl, 'paclitaxel', 0.1, duration_h=24.0)
+            np.testing.assert_allclose(result[cl]['treatment']['M'], single['treatment']['M'], atol=1e-13)
+            assert result[cl]['total_deaths'] == pytest.approx(single['total_deaths'], abs=1e-13)
+
+
 class TestDrugEffects:
     """Tests for drug effects on cell cycle."""
 
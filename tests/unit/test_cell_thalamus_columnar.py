@@ -0,0 +1,112 @@
+"""
+Tests for the columnar (NumPy/DataFrame) result fetches on CellThalamusDB.
+"""
+
+import sqlite3
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cell_os.cell_thalamus.morphology_variance_analysis import MorphologyVarianceAnalyzer
+from cell_os.database.cell_thalamus_db import SCHEMA_VERSION, CellThalamusDB
+
+
+def _rows(design_id, n, seed=0):
+    rng = np.random.default_rng(seed)
+    return [
+        {
+            "design_id": design_id, "well_id": f"W{i:04d}", "cell_line": ["A549", "HepG2"][i % 2],
+            "compound": ["DMSO", "tBHQ", "MG132"][i % 3], "dose_uM": float(i % 4), "timepoint_h": 24.0,
+            "plate_id": f"P{i % 3}", "day": 1 + i % 2, "operator": "op", "is_sentinel": i % 5 == 0,
+            "morphology": {ch: float(v) for ch, v in zip(["er", "mito", "nucleus", "actin", "rna"], rng.normal(100, 10, 5))},
+            "atp_signal": float(rng.normal(1, 0.1)) if i % 7 else None,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture
+def db(tmp_path):
+    with CellThalamusDB(db_path=str(tmp_path / "thalamus.db")) as db:
+        db.insert_results_batch(_rows("d1", 60))
+        db.insert_results_batch(_rows("d2", 5, seed=1))
+        yield db
+
+
+def test_columns_match_row_dicts(db):
+    rows = db.get_results("d1")
+    columns = db.get_results_columns("d1")
+
+    assert list(columns) == list(rows[0])
+    for name, values in columns.items():
+        expected = [row[name] for row in rows]
+        if values.dtype == float:
+            np.testing.assert_array_equal(values, np.array(expected, dtype=float))  # NULL -> NaN
+        else:
+            assert values.tolist() == expected
+    assert columns["is_sentinel"].dtype == np.int64
+    assert columns["atp_signal"].dtype == float and np.isnan(columns["atp_signal"][0])
+    assert columns["ldh_signal"].dtype == float  # All NULL
+
+
+def test_projection_filters_and_frame(db):
+    frame = db.get_results_frame("d1", columns=["well_id", "morph_er"], filters={"is_sentinel": True})
+    assert list(frame.columns) == ["well_id", "morph_er"]
+    assert frame["well_id"].tolist() == [r["well_id"] for r in db.get_sentinel_data("d1")]
+
+    empty = db.get_results_columns("missing", columns=["well_id", "dose_uM"])
+    assert len(empty["well_id"]) == 0 and empty["dose_uM"].dtype == float
+
+    with pytest.raises(ValueError, match="Unknown thalamus_results column"):
+        db.get_results_columns("d1", columns=["well_id; DROP TABLE thalamus_results"])
+
+
+def test_chunked_iterator_concatenates_to_full_fetch(db):
+    chunks = list(db.iter_results_columns("d1", columns=["well_id", "morph_mito"], chunk_size=25))
+    assert [len(c["well_id"]) for c in chunks] == [25, 25, 10]
+
+    full = db.get_results_columns("d1", columns=["well_id", "morph_mito"])
+    np.testing.assert_array_equal(np.concatenate([c["morph_mito"] for c in chunks]), full["morph_mito"])
+
+
+def test_morphology_array_matches_matrix(db):
+    matrix, well_ids = db.get_morphology_matrix("d1")
+    array, array_ids = db.get_morphology_array("d1")
+
+    np.testing.assert_array_equal(array, np.array(matrix))
+    assert array_ids.tolist() == well_ids
+    assert db.get_morphology_array("missing")[0].shape == (0, 5)
+
+
+def test_condition_index_covers_unordered_projection(db):
+    query, params = db._results_query("d1", ["is_sentinel", "compound", "cell_line"], None, ordered=False)
+    plan = " ".join(row[3] for row in db.conn.execute(f"EXPLAIN QUERY PLAN {query}", params))
+    assert "COVERING INDEX idx_results_design_condition" in plan
+
+
+def test_existing_database_is_migrated(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE thalamus_results (result_id INTEGER PRIMARY KEY, design_id TEXT, "
+                 "is_sentinel BOOLEAN, compound TEXT, cell_line TEXT)")
+    conn.commit()
+    conn.close()
+
+    CellThalamusDB(db_path=path).close()
+
+    conn = sqlite3.connect(path)
+    indexes = {row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+    assert "idx_results_design_condition" in indexes
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == SCHEMA_VERSION
+    conn.close()
+
+
+def test_morphology_variance_accepts_frame(db):
+    analyzer = MorphologyVarianceAnalyzer()
+    X_rows, meta_rows = analyzer._extract_morphology_features(db.get_results("d1"))
+    X_frame, meta_frame = analyzer._extract_morphology_features(db.get_results_frame("d1"))
+
+    np.testing.assert_array_equal(X_rows, X_frame)
+    pd.testing.assert_frame_equal(meta_rows, meta_frame)
+    assert (meta_frame["viability_pct"] == 100.0).all()
@@ -14,6 +14,7 @@ Goal: Prove the system knows WHY it refused, not just THAT it refused.
 """
 
 import pytest
+from cell_os.epistemic_agent.beliefs import state as beliefs_state_module
 from cell_os.epistemic_agent.beliefs.state import BeliefState
 from cell_os.epistemic_agent.acquisition.chooser import TemplateChooser
 from cell_os.epistemic_agent.exceptions import (
@@ -445,5 +446,85 @@ def test_covenant7_refuses_to_update_beliefs_without_evidence():
         "Invariant must detect direct mutation and explain violation"
 
 
+
+def _documented_update(beliefs):
+    beliefs._set(
+        "dose_curvature_seen",
+        True,
+        evidence={"n_curves": 1},
+        supporting_conditions=["A549/CCCP@1.0uM/12.0h/cell_painting/center"],
+        evidence_time_h=12.0,
+    )
+
+
+def _direct_mutation(beliefs):
+    beliefs.dose_curvature_seen = True
+
+
+def _mutation_beside_unrelated_event(beliefs):
+    _documented_update(beliefs)
+    beliefs.edge_tests_run = 3
+
+
+def _gate_without_gate_event(beliefs):
+    beliefs._set(
+        "ldh_sigma_stable",
+        True,
+        evidence={"rel_width": 0.1},
+        supporting_conditions=["A549/DMSO@0.0uM/12.0h/ldh/center"],
+        evidence_time_h=12.0,
+    )
+    beliefs._events[:] = [e for e in beliefs._events if not e.belief.startswith("gate_")]
+    beliefs._gate_event_cycles.clear()
+
+
+def _set_and_revert(beliefs):
+    beliefs.total_observations = 5
+    beliefs.total_observations = 0
+
+
+@pytest.mark.parametrize("mutate, violation", [
+    (_documented_update, None),
+    (_direct_mutation, "without any evidence events"),
+    (_mutation_beside_unrelated_event, "Unaccounted fields: ['edge_tests_run']"),
+    (_gate_without_gate_event, "without gate_* event"),
+    (_set_and_revert, None),
+])
+def test_covenant7_incremental_check_matches_full_snapshot(mutate, violation):
+    """Dirty-field tracking gives the same Covenant 7 verdict as full snapshot diffs."""
+    beliefs = BeliefState()
+    beliefs.begin_cycle(1)
+    before = beliefs.snapshot()
+    mutate(beliefs)
+    after = beliefs.snapshot()
+
+    if violation is None:
+        beliefs.assert_no_undocumented_mutation(before, after, cycle=1)
+        beliefs.assert_cycle_mutations_documented(cycle=1)
+        return
+
+    with pytest.raises(BeliefLedgerInvariantError) as full:
+        beliefs.assert_no_undocumented_mutation(before, after, cycle=1)
+    with pytest.raises(BeliefLedgerInvariantError) as incremental:
+        beliefs.assert_cycle_mutations_documented(cycle=1)
+    assert violation in str(full.value)
+    assert str(incremental.value) == str(full.value)
+
+
+def test_covenant7_tracking_resets_each_cycle():
+    beliefs = BeliefState()
+    assert set(beliefs.to_dict()) == beliefs_state_module._SNAPSHOT_FIELDS
+
+    beliefs.begin_cycle(1)
+    _documented_update(beliefs)
+    assert beliefs.changed_fields() == {"dose_curvature_seen"}
+    assert beliefs.value_at_cycle_start("dose_curvature_seen") is False
+
+    beliefs.begin_cycle(2)
+    assert beliefs.changed_fields() == set()
+    assert beliefs.value_at_cycle_start("dose_curvature_seen") is True
+    beliefs.assert_cycle_mutations_documented(cycle=2)
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
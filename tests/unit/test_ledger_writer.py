@@ -0,0 +1,90 @@
+"""
+Tests for the buffered run ledger writer.
+
+Records are validated when appended, held in memory until a cycle-boundary
+flush, and written through handles that stay open for the whole run.
+"""
+
+import json
+
+import pytest
+
+from cell_os.epistemic_agent.beliefs.ledger import (
+    EvidenceEvent,
+    LedgerWriter,
+    append_events_jsonl,
+    ledger_path,
+    open_ledger,
+)
+from cell_os.epistemic_agent.exceptions import TemporalProvenanceError
+
+
+def _event(belief="noise_sigma_stable", evidence_time_h=24.0, cycle=1):
+    return EvidenceEvent(
+        cycle=cycle,
+        belief=belief,
+        prev=False,
+        new=True,
+        evidence={"df": 12},
+        supporting_conditions=["A549/DMSO/0.0/24.0"],
+        evidence_time_h=evidence_time_h,
+    )
+
+
+def _read_lines(path):
+    with open_ledger(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def test_buffers_until_flush_and_matches_append_functions(tmp_path):
+    legacy = tmp_path / "legacy.jsonl"
+    buffered = tmp_path / "buffered.jsonl"
+    events = [_event(cycle=1), _event("gate_event:noise_sigma", None, cycle=1)]
+    debt_diagnostic = {"event_type": "epistemic_debt_status", "cycle": 1, "debt_bits": 0.5}
+
+    append_events_jsonl(legacy, events)
+    with open(legacy, "a", encoding="utf-8") as f:
+        f.write(json.dumps(debt_diagnostic) + "\n")
+
+    with LedgerWriter() as ledger:
+        ledger.append_events(buffered, events)
+        ledger.append(buffered, [debt_diagnostic])
+        assert not buffered.exists()
+
+        ledger.flush()
+        assert buffered.read_text() == legacy.read_text()
+
+        # Handles stay open across flushes; later cycles append
+        ledger.append_events(buffered, [_event(cycle=2)])
+    assert [r["cycle"] for r in _read_lines(buffered)] == [1, 1, 1, 2]
+
+
+def test_provenance_refused_before_buffering(tmp_path):
+    path = tmp_path / "evidence.jsonl"
+    ledger = LedgerWriter()
+
+    with pytest.raises(TemporalProvenanceError) as exc_info:
+        ledger.append_events(path, [_event(cycle=3), _event("dose_curvature_seen", None, cycle=3)])
+    assert exc_info.value.missing_field == "evidence_time_h"
+
+    ledger.close()
+    # Events before the refused one are kept, the refused one never reaches disk
+    assert [r["belief"] for r in _read_lines(path)] == ["noise_sigma_stable"]
+
+
+def test_gzip_ledger_round_trip(tmp_path):
+    ledger = LedgerWriter(compression="gzip")
+    path = ledger.path_for(tmp_path / "evidence.jsonl")
+    assert path.name == "evidence.jsonl.gz"
+
+    for cycle in (1, 2, 3):
+        ledger.append_events(path, [_event(cycle=cycle)])
+        ledger.flush()  # One gzip member per flush
+    ledger.close()
+
+    assert [r["cycle"] for r in _read_lines(path)] == [1, 2, 3]
+
+
+def test_unknown_compression_rejected():
+    with pytest.raises(ValueError):
+        ledger_path("evidence.jsonl", "lz4")
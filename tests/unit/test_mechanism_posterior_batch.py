@@ -0,0 +1,86 @@
+"""
+Tests for compute_mechanism_posterior_v2_batch.
+
+The batched posterior must reproduce the scalar compute_mechanism_posterior_v2
+row by row, including NUISANCE probability, ambiguity capping and the Z == 0
+degenerate branch.
+"""
+
+import numpy as np
+import pytest
+
+from cell_os.hardware.mechanism_posterior_v2 import (
+    compute_mechanism_posterior_v2,
+    compute_mechanism_posterior_v2_batch,
+    NuisanceModel,
+    Mechanism,
+    MAX_PROB_AMBIGUOUS,
+)
+
+
+def _nuisance(rng):
+    return NuisanceModel(
+        context_shift=rng.normal(0.0, 0.05, 3),
+        pipeline_shift=np.array([0.01, -0.01, 0.01]),
+        contact_shift=np.zeros(3),
+        artifact_var=rng.uniform(0.0, 0.02),
+        heterogeneity_var=rng.uniform(0.0, 0.05),
+        context_var=0.001,
+        pipeline_var=0.0005,
+        contact_var=0.0,
+    )
+
+
+def test_batch_matches_scalar_rows():
+    rng = np.random.default_rng(3)
+    n = 400
+    observed = np.column_stack([
+        rng.uniform(0.4, 2.0, n), rng.uniform(0.3, 1.6, n), rng.uniform(0.5, 2.0, n)
+    ])
+    observed[:40] = 1.0 + rng.normal(0.0, 0.02, (40, 3))  # ambiguous near-baseline rows
+    observed[40:45] = 25.0  # all likelihoods underflow → uniform posterior
+    nuisances = [_nuisance(rng) for _ in range(n)]
+
+    batch = compute_mechanism_posterior_v2_batch(observed, nuisances)
+
+    assert batch.probabilities.shape == (n, len(batch.mechanisms))
+    assert batch.is_ambiguous.any()
+    for i in range(n):
+        scalar = compute_mechanism_posterior_v2(*observed[i], nuisance=nuisances[i])
+        expected = [scalar.probabilities[m] for m in batch.mechanisms]
+        np.testing.assert_allclose(batch.probabilities[i], expected, rtol=1e-9, atol=1e-12)
+        assert batch.nuisance_probability[i] == pytest.approx(scalar.nuisance_probability, abs=1e-12)
+        assert bool(batch.is_ambiguous[i]) == scalar.is_ambiguous
+        assert batch.uncertainty[i] == pytest.approx(scalar.uncertainty, abs=1e-9)
+        assert batch.top_mechanisms[i] == scalar.top_mechanism
+        assert batch.margin[i] == pytest.approx(scalar.margin, abs=1e-12)
+        assert batch.entropy[i] == pytest.approx(scalar.entropy, abs=1e-12)
+
+    assert np.all(batch.top_probability[batch.is_ambiguous] <= MAX_PROB_AMBIGUOUS + 1e-9)
+
+
+def test_array_nuisance_arguments_and_row_posterior():
+    rng = np.random.default_rng(11)
+    nuisance = _nuisance(rng)
+    observed = np.array([[1.6, 1.0, 1.0], [1.0, 0.6, 1.0], [1.0, 1.0, 1.5]])
+
+    from_model = compute_mechanism_posterior_v2_batch(observed, nuisance)
+    from_arrays = compute_mechanism_posterior_v2_batch(
+        observed,
+        heterogeneity_var=nuisance.heterogeneity_var,
+        mean_shift=nuisance.total_mean_shift,
+        var_inflation=nuisance.total_var_inflation,
+    )
+    np.testing.assert_array_equal(from_model.probabilities, from_arrays.probabilities)
+    assert from_model.top_mechanisms == [Mechanism.MICROTUBULE, Mechanism.MITOCHONDRIAL, Mechanism.ER_STRESS]
+
+    row = from_model.posterior(1, nuisance)
+    scalar = compute_mechanism_posterior_v2(1.0, 0.6, 1.0, nuisance=nuisance)
+    assert row.top_mechanism == scalar.top_mechanism
+    assert row.top_probability == pytest.approx(scalar.top_probability, abs=1e-12)
+
+
+def test_nuisance_count_must_match_rows():
+    rng = np.random.default_rng(0)
+    with pytest.raises(ValueError):
+        compute_mechanism_posterior_v2_batch(np.ones((3, 3)), [_nuisance(rng)] * 2)
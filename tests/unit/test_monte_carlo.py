@@ -0,0 +1,75 @@
+"""
+Tests for the Monte Carlo engine (per-run seeding, pooled execution, streaming summaries).
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from cell_os.simulation.monte_carlo import (
+    StreamingHistogram,
+    StreamingQuantiles,
+    run_monte_carlo,
+    run_rng,
+)
+
+
+def _draw(run_id, rng):
+    return run_id, rng.normal(size=3).tolist()
+
+
+def test_runs_use_spawned_children_regardless_of_workers():
+    serial = list(run_monte_carlo(_draw, 12, seed=7))
+    pooled = list(run_monte_carlo(_draw, 12, seed=7, workers=2, chunksize=5))
+
+    assert serial == pooled
+    assert [run_id for run_id, _ in serial] == list(range(12))
+
+    children = np.random.SeedSequence(7).spawn(12)
+    expected = np.random.default_rng(children[9]).normal(size=3).tolist()
+    assert serial[9][1] == expected
+    assert run_rng(7, 9).normal(size=3).tolist() == expected
+
+
+def test_unseeded_runs_are_independent():
+    (_, a), (_, b) = run_monte_carlo(_draw, 2, seed=None)
+    assert a != b
+
+
+@pytest.mark.parametrize("q", [0.0, 0.05, 0.5, 0.95, 1.0])
+def test_quantiles_exact_for_discrete_streams(q):
+    rng = np.random.default_rng(0)
+    values = rng.integers(0, 31, size=500)
+    sketch = StreamingQuantiles()
+    for v in values:
+        sketch.add(v)
+
+    assert sketch.exact
+    assert sketch.quantile(q) == pytest.approx(pd.Series(values).quantile(q), abs=1e-12)
+    assert sketch.mean == pytest.approx(values.mean())
+
+
+def test_quantiles_bounded_memory_for_continuous_streams():
+    rng = np.random.default_rng(1)
+    values = rng.normal(size=20_000)
+    sketch = StreamingQuantiles(max_bins=512)
+    for v in values:
+        sketch.add(v)
+
+    assert not sketch.exact
+    assert len(sketch._weights) <= 512
+    for q in (0.05, 0.5, 0.95):
+        assert sketch.quantile(q) == pytest.approx(np.quantile(values, q), abs=0.02)
+
+
+def test_histogram_matches_numpy():
+    rng = np.random.default_rng(2)
+    values = rng.uniform(0.0, 1.0, size=1000)
+    hist = StreamingHistogram(0.0, 1.0, bins=30)
+    for v in values:
+        hist.add(v)
+    hist.add(1.0)
+    hist.add(-0.5)
+
+    expected, _ = np.histogram(np.append(values, [1.0, 0.0]), bins=30, range=(0.0, 1.0))
+    np.testing.assert_array_equal(hist.counts, expected)
@@ -0,0 +1,107 @@
+"""
+Tests for the shared parsed-YAML parameter registry.
+
+Each file is parsed once per process, restored from the on-disk pickle while
+its content hash matches, and handed out as a shared read-only view or a
+private mutable copy.
+"""
+
+import copy
+import os
+import pickle
+
+import pytest
+import yaml
+
+from cell_os.hardware import param_registry
+from cell_os.hardware.param_registry import (
+    FrozenParams,
+    cache_path,
+    clear_param_cache,
+    load_yaml_params,
+    load_yaml_params_copy,
+)
+
+
+@pytest.fixture(autouse=True)
+def _isolated_registry():
+    clear_param_cache()
+    yield
+    clear_param_cache()
+
+
+@pytest.fixture
+def params_file(tmp_path):
+    path = tmp_path / "params.yaml"
+    path.write_text("technical_noise:\n  well_cv: 0.02\n  channels: [er, mito]\ndose_grid: {low: 0.1}\n")
+    return path
+
+
+@pytest.fixture
+def count_parses(monkeypatch):
+    calls = []
+    real_load = yaml.load
+
+    def _counting_load(stream, Loader):
+        calls.append(Loader)
+        return real_load(stream, Loader=Loader)
+
+    monkeypatch.setattr(param_registry.yaml, "load", _counting_load)
+    return calls
+
+
+def test_parsed_once_and_shared_read_only(params_file, count_parses):
+    view = load_yaml_params(params_file)
+
+    assert load_yaml_params(params_file) is view
+    assert len(count_parses) == 1
+    assert isinstance(view, FrozenParams)
+    assert view["technical_noise"]["channels"] == ("er", "mito")
+    with pytest.raises(TypeError):
+        view["technical_noise"]["well_cv"] = 1.0
+
+    # Survives VM.fork (deepcopy) and process pools (pickle)
+    assert copy.deepcopy(view) is view
+    assert pickle.loads(pickle.dumps(view)) == view
+
+
+def test_private_copies_are_independent(params_file, count_parses):
+    first = load_yaml_params_copy(params_file)
+    first["technical_noise"]["well_cv"] = 0.5
+
+    second = load_yaml_params_copy(params_file)
+    assert second["technical_noise"]["well_cv"] == 0.02
+    assert load_yaml_params(params_file)["technical_noise"]["well_cv"] == 0.02
+    assert len(count_parses) == 1
+
+
+def test_disk_cache_keyed_on_content(params_file, count_parses):
+    load_yaml_params(params_file)
+    assert cache_path(params_file).exists()
+
+    # New process (empty registry), same content with a touched mtime: no parse
+    clear_param_cache()
+    stat = os.stat(params_file)
+    os.utime(params_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert load_yaml_params(params_file)["dose_grid"]["low"] == 0.1
+    assert len(count_parses) == 1
+
+    # Edited content invalidates both the in-process entry and the disk cache
+    params_file.write_text("dose_grid: {low: 0.2}\n")
+    assert load_yaml_params(params_file)["dose_grid"]["low"] == 0.2
+    assert len(count_parses) == 2
+
+
+def test_vm_thalamus_overrides_do_not_leak():
+    from cell_os.hardware.biological_virtual import BiologicalVirtualMachine
+
+    vm1 = BiologicalVirtualMachine(seed=0)
+    vm2 = BiologicalVirtualMachine(seed=1)
+    vm1._load_cell_thalamus_params()
+    vm2._load_cell_thalamus_params()
+
+    original = vm2.thalamus_params["technical_noise"]["well_cv"]
+    vm1.thalamus_params["technical_noise"]["well_cv"] = original + 1.0
+
+    assert vm2.thalamus_params["technical_noise"]["well_cv"] == original
+    assert vm1.raw_yaml_data is vm2.raw_yaml_data
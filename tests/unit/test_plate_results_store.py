@@ -0,0 +1,108 @@
+"""
+Tests for plate_results_store (columnar plate executor output).
+
+Every format must round-trip raw_results / parsed_wells / flat_results exactly,
+including failed wells that carry a reduced set of keys.
+"""
+
+import json
+
+import numpy as np
+import pytest
+
+from src.cell_os.plate_executor_v2 import flatten_result
+from src.cell_os.plate_results_store import (
+    PYARROW_AVAILABLE,
+    PlateResultsReader,
+    load_plate_results,
+    write_plate_results,
+)
+
+CHANNELS = ["er", "mito", "nucleus", "actin", "rna"]
+
+FORMATS = ["npy"] + (["parquet", "arrow"] if PYARROW_AVAILABLE else [])
+
+
+def _make_output(n_wells=12):
+    raw_results = []
+    parsed_wells = []
+    for i in range(n_wells):
+        well_id = f"A{i + 1}"
+        parsed_wells.append({
+            "well_id": well_id, "row": "A", "col": i + 1, "cell_line": "A549",
+            "treatment": "VEHICLE", "reagent": "DMSO", "dose_uM": 0.0,
+            "material_assignment": None,
+        })
+        if i == 3:
+            raw_results.append({
+                "well_id": well_id, "row": "A", "col": i + 1, "error": "boom",
+                "cell_line": "A549", "compound": "DMSO", "dose_uM": 0.0, "treatment": "VEHICLE",
+            })
+            continue
+        raw_results.append({
+            "well_id": well_id, "row": "A", "col": i + 1, "cell_line": "A549",
+            "compound": "DMSO", "dose_uM": 0.0, "time_h": 48.0,
+            "morphology": {ch: np.float64(100.0 + i + c) for c, ch in enumerate(CHANNELS)},
+            "morphology_struct": {ch: 1.0 + 0.01 * i for ch in CHANNELS},
+            "viability": 0.97, "n_cells": 5000 + i, "treatment": "VEHICLE",
+            "detector_metadata": {
+                "is_saturated": {ch: i % 2 == 0 for ch in CHANNELS},
+                "quant_step": {ch: 0.0 for ch in CHANNELS},
+                "exposure_multiplier": 1.0,
+                "qc_flags": {"is_outlier": False, "pathology_type": None},
+            },
+        })
+
+    return {
+        "plate_id": "TEST_PLATE",
+        "seed": 7,
+        "n_wells": n_wells,
+        "n_success": n_wells - 1,
+        "n_failed": 1,
+        "parsed_wells": parsed_wells,
+        "raw_results": raw_results,
+        "flat_results": [flatten_result(r) for r in raw_results],
+        "metadata": {"cell_lines": ["A549"], "background_wells": {"P24"}},
+    }
+
+
+def _plain(obj):
+    return json.loads(json.dumps(obj, default=lambda o: sorted(o) if isinstance(o, set) else o.item()))
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_round_trip_matches_json_layout(tmp_path, fmt):
+    output = _make_output()
+    path = write_plate_results(output, tmp_path, fmt=fmt)
+
+    assert path.name.startswith("TEST_PLATE_results_seed7")
+    assert load_plate_results(path) == _plain(output)
+
+
+@pytest.mark.parametrize("fmt", FORMATS)
+def test_lazy_column_selection(tmp_path, fmt):
+    output = _make_output()
+    reader = PlateResultsReader(write_plate_results(output, tmp_path, fmt=fmt))
+
+    assert len(reader) == 12
+    assert reader.channels == CHANNELS
+    assert reader.plate["plate_id"] == "TEST_PLATE"
+    assert "morph_er" in reader.columns and "detector_metadata" in reader.columns
+
+    cols = reader.read(["well_id", "morph_er"])
+    assert set(cols) == {"well_id", "morph_er"}
+    assert isinstance(cols["morph_er"], np.ndarray)
+    assert np.isnan(cols["morph_er"][3])  # failed well
+    assert cols["morph_er"][0] == 100.0
+
+    matrix = reader.morphology_matrix()
+    assert matrix.shape == (12, 5)
+    assert matrix[5, 2] == 107.0
+
+    with pytest.raises(KeyError):
+        reader.read(["not_a_column"])
+
+
+def test_unknown_format_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        write_plate_results(_make_output(), tmp_path, fmt="csv")
@@ -3,7 +3,7 @@ Tests for Scheduler
 """
 
 import pytest
-from cell_os.scheduler import Scheduler, Resource, Task
+from cell_os.scheduler import Scheduler, Resource, ScheduleResult, Task
 
 class TestScheduler:
     
@@ -99,3 +99,80 @@ class TestScheduler:
 
         # First two tasks should run concurrently on different units
         assert sched["t1"].resource_assignments["incubator"] != sched["t2"].resource_assignments["incubator"]
+
+    def _campaign(self, n_plates):
+        """Independent seed -> incubate -> image workflows sharing three resources."""
+        resources = [
+            Resource(id="robot", name="Liquid Handler", capacity=1),
+            Resource(id="incubator", name="Incubator", capacity=3),
+            Resource(id="imager", name="Imager", capacity=1),
+        ]
+        tasks = []
+        for p in range(n_plates):
+            tasks += [
+                Task(id=f"p{p}_seed", name="Seed", duration_min=10 + p % 3, resources_required=["robot"]),
+                Task(id=f"p{p}_inc", name="Incubate", duration_min=60 + 7 * (p % 4),
+                     resources_required=["incubator"], predecessors=[f"p{p}_seed"]),
+                Task(id=f"p{p}_img", name="Image", duration_min=15, resources_required=["imager", "robot"],
+                     predecessors=[f"p{p}_inc"]),
+            ]
+        return resources, tasks
+
+    def test_units_assigned_in_model(self):
+        """Every task gets a concrete unit and no unit is double-booked."""
+        resources, tasks = self._campaign(8)
+        scheduler = Scheduler(resources)
+        results = scheduler.schedule(tasks, time_limit_s=10, num_workers=1)
+
+        assert len(results) == len(tasks)
+        assert scheduler.check_schedule(tasks, results) == []
+        units = {r.resource_assignments["incubator"] for r in results if r.task_id.endswith("_inc")}
+        assert units <= {"incubator_0", "incubator_1", "incubator_2"} and len(units) > 1
+        assert scheduler.last_solve.status in ("OPTIMAL", "FEASIBLE")
+
+    def test_rolling_horizon_windows(self):
+        """Rolling windows produce a valid schedule no worse than the list schedule."""
+        resources, tasks = self._campaign(12)
+        scheduler = Scheduler(resources)
+        results = scheduler.schedule_rolling(tasks, window_size=10, time_limit_s=5, num_workers=1)
+
+        assert [r.task_id for r in results] == [t.id for t in tasks]
+        assert scheduler.check_schedule(tasks, results) == []
+        assert scheduler.last_solve.n_windows == 4
+        greedy = scheduler._greedy_schedule(tasks, {}, 0)
+        assert scheduler.last_solve.makespan <= max(r.end_time for r in greedy.values())
+
+    def test_reschedule_freezes_past(self):
+        """Tasks started before now keep their slot; new and later tasks start at or after now."""
+        resources, tasks = self._campaign(6)
+        scheduler = Scheduler(resources)
+        previous = scheduler.schedule(tasks, time_limit_s=10, num_workers=1)
+        now = 50
+
+        _, rush = self._campaign(1)
+        for task in rush:
+            task.id = task.id.replace("p0", "rush")
+            task.predecessors = [p.replace("p0", "rush") for p in task.predecessors]
+        replanned = scheduler.reschedule(tasks + rush, previous, now_min=now, time_limit_s=10, num_workers=1)
+
+        assert scheduler.check_schedule(tasks + rush, replanned) == []
+        before = {r.task_id: r for r in previous}
+        for r in replanned:
+            if r.task_id in before and before[r.task_id].start_time < now:
+                assert r == before[r.task_id]
+            else:
+                assert r.start_time >= now
+
+    def test_stale_hint_is_repaired(self):
+        """A hint that double-books the robot is repaired into a feasible warm start."""
+        resources, tasks = self._campaign(3)
+        scheduler = Scheduler(resources)
+        stale = [
+            ScheduleResult(task_id=t.id, start_time=0, end_time=t.duration_min, resource_assignments={})
+            for t in tasks
+        ]
+        repaired = scheduler._greedy_schedule(tasks, {}, 0, hint=stale)
+        assert scheduler.check_schedule(tasks, list(repaired.values())) == []
+
+        results = scheduler.schedule(tasks, time_limit_s=10, num_workers=1, hint=stale)
+        assert scheduler.check_schedule(tasks, results) == []
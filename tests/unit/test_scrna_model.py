@@ -0,0 +1,96 @@
+"""
+Unit tests for the compiled scRNA-seq model (load_scrna_model / ScRNAModel).
+
+Tests validate:
+1. Params are parsed once and reused until the YAML changes on disk
+2. Dense program matrices reproduce the per-gene fold-change interpolation
+3. Large readouts are chunked deterministically with the right shape/metadata
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import numpy as np
+import pytest
+import yaml
+
+from cell_os.hardware.transcriptomics import (
+    load_scrna_model,
+    simulate_scrna_counts,
+)
+
+REPO_ROOT = Path(__file__).parent.parent.parent
+PARAMS = REPO_ROOT / "data" / "scrna_seq_params.yaml"
+
+
+@pytest.fixture
+def params_copy(tmp_path, monkeypatch):
+    """Writable copy of the params; stress_programs_ref resolves from the repo root."""
+    monkeypatch.chdir(REPO_ROOT)
+    dst = tmp_path / "scrna_seq_params.yaml"
+    shutil.copy(PARAMS, dst)
+    return dst
+
+
+def test_model_cached_until_file_changes(params_copy):
+    model = load_scrna_model(params_copy)
+    assert load_scrna_model(params_copy) is model
+
+    params = yaml.safe_load(params_copy.read_text())
+    params["technical_noise"]["umi_depth_mean"] = 1234.0
+    params_copy.write_text(yaml.safe_dump(params))
+    stat = params_copy.stat()
+    os.utime(params_copy, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = load_scrna_model(params_copy)
+    assert reloaded is not model
+    assert reloaded.technical_noise["umi_depth_mean"] == 1234.0
+
+
+def test_dense_fold_change_matches_program_interpolation(params_copy):
+    model = load_scrna_model(params_copy)
+    cl = model.cell_line("A549")
+    act = model.program_activation({"er_stress": 0.8, "mito_dysfunction": 0.4})
+
+    fold = model.fold_change(cl, act, viability=1.0)
+
+    expected = np.ones(len(cl.gene_names))
+    for axis, prog in model.programs.items():
+        a = act[axis]
+        if a <= 0.0:
+            continue
+        for direction in ("up", "down"):
+            for g, fc in prog.get(direction, {}).items():
+                expected[cl.gene_index[g]] *= (1.0 + a * (float(fc) - 1.0))
+    np.testing.assert_array_equal(fold, expected)
+
+    with pytest.raises(ValueError):
+        model.cell_line("NOT_A_CELL_LINE")
+
+
+def test_large_readout_chunked_and_deterministic(params_copy):
+    kwargs = dict(
+        cell_line="A549",
+        vessel_latents={"er_stress": 0.5, "contact_inhibition": 0.3},
+        viability=0.9,
+        n_cells=5000,
+        params_path=params_copy,
+        batch_id="batch_1",
+        chunk_size=1024,
+    )
+    a = simulate_scrna_counts(rng=np.random.default_rng(3), **kwargs)
+    b = simulate_scrna_counts(rng=np.random.default_rng(3), **kwargs)
+
+    assert a.counts.shape == (5000, len(a.gene_names))
+    assert a.counts.dtype == np.int32
+    assert np.array_equal(a.counts, b.counts)
+    assert len(a.meta["cell_subpop"]) == len(a.meta["library_size"]) == 5000
+    assert len(a.meta["cycling_score"]) == 5000
+
+    # Up to one chunk, the caller's stream is consumed exactly as before
+    small = dict(kwargs, n_cells=800)
+    rng_a, rng_b = np.random.default_rng(4), np.random.default_rng(4)
+    simulate_scrna_counts(rng=rng_a, **small)
+    simulate_scrna_counts(rng=rng_b, **dict(small, chunk_size=None))
+    assert rng_a.random() == rng_b.random()
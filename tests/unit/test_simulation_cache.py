@@ -0,0 +1,104 @@
+"""
+Tests for the content-addressed standalone simulation result cache.
+"""
+
+import json
+import sqlite3
+import zlib
+from pathlib import Path
+
+from cell_os.biology import standalone_cell_thalamus as sim
+from cell_os.biology.simulation_cache import SimulationResultCache, cache_key
+
+
+def _results(n, tag):
+    return [{"well_id": f"W{i:03d}", "tag": tag, "morphology": {"er": 100.0 + i / 3}} for i in range(n)]
+
+
+def test_round_trip_and_counters(tmp_path):
+    with SimulationResultCache(str(tmp_path / "cache.db")) as cache:
+        key = cache_key(design_id="d1", sim_version="v1", code_hash="abc")
+        assert key != cache_key(design_id="d1", sim_version="v2", code_hash="abc")
+
+        assert cache.get(key) is None
+        results = _results(20, "a")
+        assert cache.put(key, results, design_id="d1")
+        assert cache.get(key) == results
+
+        stats = cache.stats()
+        assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+        assert stats["hit_rate"] == 0.5
+
+    # Counters persist across instances (CLI runs vs API process)
+    with SimulationResultCache(str(tmp_path / "cache.db")) as cache:
+        assert cache.stats()["hits"] == 1
+
+
+def test_lru_eviction_by_size(tmp_path):
+    cache = SimulationResultCache(str(tmp_path / "cache.db"))
+    entry_size = len(zlib.compress(json.dumps(_results(200, "a"), separators=(",", ":")).encode()))
+    cache.max_bytes = int(entry_size * 2.5)
+
+    cache.put("a", _results(200, "a"))
+    cache.put("b", _results(200, "b"))
+    cache.get("a")  # "b" is now least recently used
+    cache.put("c", _results(200, "c"))
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["size_bytes"] <= cache.max_bytes
+    cache.close()
+
+
+def _db_rows(path):
+    conn = sqlite3.connect(path)
+    rows = conn.execute(
+        "SELECT well_id, cell_line, morph_er, morph_rna, atp_signal, viability, death_mode "
+        "FROM thalamus_results ORDER BY plate_id, cell_line, well_id"
+    ).fetchall()
+    conn.close()
+    return rows
+
+
+def test_run_parallel_simulation_hit_and_bypass(tmp_path):
+    cache_path = str(tmp_path / "cache.db")
+    kwargs = dict(mode="demo", workers=1, cache_path=cache_path)
+
+    d1 = sim.run_parallel_simulation(db_path=str(tmp_path / "a.db"), **kwargs)
+    d2 = sim.run_parallel_simulation(db_path=str(tmp_path / "b.db"), **kwargs)
+    d3 = sim.run_parallel_simulation(db_path=str(tmp_path / "c.db"), use_cache=False, **kwargs)
+
+    assert d1 == d2 == d3
+    assert _db_rows(tmp_path / "a.db") == _db_rows(tmp_path / "b.db") == _db_rows(tmp_path / "c.db")
+    with SimulationResultCache(cache_path) as cache:
+        stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["entries"]) == (1, 1, 1)
+
+
+def test_run_key_covers_dependencies_and_flags(tmp_path, monkeypatch):
+    def copy_sources(dest):
+        dest.mkdir()
+        paths = []
+        for source in sim.SIMULATOR_SOURCES:
+            path = dest / Path(source).name
+            path.write_bytes(Path(source).read_bytes())
+            paths.append(str(path))
+        return tuple(paths)
+
+    original = copy_sources(tmp_path / "original")
+    edited = copy_sources(tmp_path / "edited")
+    cell_cycle = next(p for p in edited if p.endswith("cell_cycle.py"))
+    with open(cell_cycle, "a") as f:
+        f.write("\n# tweak\n")
+
+    monkeypatch.setattr(sim, "SIMULATOR_SOURCES", original)
+    key = sim._run_cache_key("d1", [], seed=0)
+    assert sim._run_cache_key("d1", [], seed=0) == key
+
+    monkeypatch.setattr(sim, "SIMULATOR_SOURCES", edited)
+    assert sim._run_cache_key("d1", [], seed=0) != key
+
+    monkeypatch.setattr(sim, "SIMULATOR_SOURCES", original)
+    monkeypatch.setattr(sim, "USE_CELL_CYCLE_DYNAMICS", not sim.USE_CELL_CYCLE_DYNAMICS)
+    assert sim._run_cache_key("d1", [], seed=0) != key
@@ -0,0 +1,115 @@
+"""
+Tests for bulk simulation parameter loading and the versioned snapshot.
+
+Bulk queries must build exactly the dicts the original per-pair loop built,
+and a fresh snapshot must let workers start without touching SQLite.
+"""
+
+import os
+import shutil
+from pathlib import Path
+
+import pytest
+
+import cell_os.hardware.biological_virtual as bv
+from cell_os.database.repositories import simulation_params_repository
+from cell_os.database.repositories.simulation_params_repository import SimulationParamsRepository
+
+DB_PATH = Path(__file__).resolve().parents[2] / "data" / "cell_lines.db"
+
+pytestmark = pytest.mark.skipif(not DB_PATH.exists(), reason="data/cell_lines.db not available")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    db_path = tmp_path / "cell_lines.db"
+    shutil.copy(DB_PATH, db_path)
+    return SimulationParamsRepository(str(db_path))
+
+
+@pytest.fixture
+def fresh_cache(monkeypatch):
+    monkeypatch.setattr(bv, "_SIMULATION_PARAMS_CACHE", None)
+
+
+def _legacy_load(db):
+    """Per-cell-line / per-pair loading as done before bulk queries."""
+    cell_line_params = {}
+    for cell_line_id in db.get_all_cell_lines():
+        params = db.get_cell_line_params(cell_line_id)
+        if params:
+            cell_line_params[cell_line_id] = {f: getattr(params, f) for f in bv._CELL_LINE_PARAM_FIELDS}
+
+    compound_sensitivity = {}
+    for compound in db.get_all_compounds():
+        data = {}
+        for cell_line_id in db.get_all_cell_lines():
+            sensitivity = db.get_compound_sensitivity(compound, cell_line_id)
+            if sensitivity:
+                data[cell_line_id] = sensitivity.ic50_um
+                if "hill_slope" not in data:
+                    data["hill_slope"] = sensitivity.hill_slope
+        if data:
+            compound_sensitivity[compound] = data
+
+    defaults = {name: db.get_default_param(name) for name in bv._DEFAULT_PARAM_NAMES}
+    return {"cell_line_params": cell_line_params, "compound_sensitivity": compound_sensitivity, "defaults": defaults}
+
+
+def test_bulk_load_matches_per_pair_load(repo):
+    bulk = bv._query_simulation_params(repo)
+    legacy = _legacy_load(repo)
+
+    assert bulk == legacy
+    for compound, data in bulk["compound_sensitivity"].items():
+        assert list(data) == list(legacy["compound_sensitivity"][compound])
+
+
+def test_snapshot_round_trip_and_staleness(repo):
+    params = bv._query_simulation_params(repo)
+    assert repo.load_snapshot() is None
+
+    path = repo.write_snapshot(params)
+    assert path == repo.snapshot_path and path.name == "cell_lines.params.pkl"
+    assert repo.load_snapshot() == params
+
+    # Touching the database invalidates the snapshot
+    stat = os.stat(repo.db_path)
+    os.utime(repo.db_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert repo.load_snapshot() is None
+
+
+def test_snapshot_invalidated_by_code_constants(repo, monkeypatch):
+    params = bv._query_simulation_params(repo)
+    repo.write_snapshot(params, bv._SNAPSHOT_LAYOUT)
+    assert repo.load_snapshot(bv._SNAPSHOT_LAYOUT) == params
+
+    # Copied fields changed in biological_virtual
+    edited_layout = {**bv._SNAPSHOT_LAYOUT, "cell_line_fields": bv._CELL_LINE_PARAM_FIELDS[:-1]}
+    assert repo.load_snapshot(edited_layout) is None
+
+    # DEFAULT_PARAMS changed in the repository module
+    monkeypatch.setitem(simulation_params_repository.DEFAULT_PARAMS, "edge_penalty", 0.2)
+    assert repo.load_snapshot(bv._SNAPSHOT_LAYOUT) is None
+
+
+def test_snapshot_load_makes_zero_queries(repo, fresh_cache, monkeypatch):
+    repo.write_snapshot(bv._query_simulation_params(repo), bv._SNAPSHOT_LAYOUT)
+
+    def _no_queries(self):
+        raise AssertionError("database queried despite fresh snapshot")
+
+    monkeypatch.setattr(SimulationParamsRepository, "_get_connection", _no_queries)
+    monkeypatch.setattr(bv, "SimulationParamsRepository", lambda: SimulationParamsRepository(repo.db_path))
+
+    vm = bv.BiologicalVirtualMachine(seed=0)
+    assert "A549" in vm.cell_line_params
+    assert bv._SIMULATION_PARAMS_CACHE is not None
+
+
+def test_load_writes_snapshot_for_later_processes(repo, fresh_cache, monkeypatch):
+    monkeypatch.setattr(bv, "SimulationParamsRepository", lambda: SimulationParamsRepository(repo.db_path))
+
+    params = bv.load_simulation_params()
+    assert repo.load_snapshot(bv._SNAPSHOT_LAYOUT) == params
+    assert bv.load_simulation_params() is params
@@ -0,0 +1,108 @@
+"""
+Tests for sparse/vectorized spatial statistics used by plate QC.
+"""
+
+import numpy as np
+
+from cell_os.core.assay import AssayType
+from cell_os.core.experiment import SpatialLocation, Treatment
+from cell_os.core.observation import RawWellResult
+from cell_os.qc.spatial_diagnostics import spatial_qc_batch
+from cell_os.qc.spatial_statistics import (
+    gearys_c,
+    morans_i,
+    permutation_test,
+    plate_weights,
+    rook_weights,
+)
+
+
+def _dense_rook(positions):
+    diff = np.abs(positions[:, None, :] - positions[None, :, :]).sum(axis=-1)
+    return (diff == 1).astype(float)
+
+
+def _plate_values(rng, n_rows, n_cols, gradient):
+    rows, cols = np.meshgrid(np.arange(n_rows), np.arange(n_cols), indexing='ij')
+    return 100.0 + gradient * cols.ravel() + rng.normal(0, 5, rows.size)
+
+
+def test_plate_weights_are_rook_adjacency():
+    for fmt, (n_rows, n_cols) in ((96, (8, 12)), (384, (16, 24)), (1536, (32, 48))):
+        weights = plate_weights(fmt)
+        assert weights.nnz == 2 * (n_rows * (n_cols - 1) + (n_rows - 1) * n_cols)
+    assert plate_weights(384) is plate_weights(384)  # Cached
+
+
+def test_subset_weights_match_dense_construction():
+    rng = np.random.default_rng(0)
+    positions = np.column_stack([rng.integers(0, 16, 150), rng.integers(0, 24, 150)])
+    positions[1] = positions[0]  # Shared position: not self-adjacent
+
+    np.testing.assert_array_equal(rook_weights(positions).toarray(), _dense_rook(positions))
+
+
+def test_statistics_match_dense_formulas():
+    rng = np.random.default_rng(1)
+    positions = np.array([(r, c) for r in range(8) for c in range(12)])
+    values = rng.normal(size=(3, 96))
+    values[2] = 7.0  # No variance
+    dense = _dense_rook(positions)
+    z = values - values.mean(axis=1, keepdims=True)
+
+    expected_i = 96 / dense.sum() * np.einsum('bi,ij,bj->b', z, dense, z) / (z ** 2).sum(axis=1).clip(1e-300)
+    sq_diff = (z[:, :, None] - z[:, None, :]) ** 2
+    expected_c = 95 * np.einsum('ij,bij->b', dense, sq_diff) / (2 * dense.sum() * (z ** 2).sum(axis=1).clip(1e-300))
+
+    weights = rook_weights(positions)
+    np.testing.assert_allclose(morans_i(values, weights)[:2], expected_i[:2], rtol=1e-12)
+    np.testing.assert_allclose(gearys_c(values, weights)[:2], expected_c[:2], rtol=1e-12)
+    assert morans_i(values, weights)[2] == 0.0 and gearys_c(values, weights)[2] == 1.0
+
+
+def test_permutation_test_batches_channels():
+    rng = np.random.default_rng(2)
+    weights = plate_weights(384)
+    values = np.stack([_plate_values(rng, 16, 24, gradient) for gradient in (0.0, 2.0)])
+
+    result = permutation_test(values, weights, n_permutations=199, seed=3)
+    assert result['morans_i'].shape == (2,)
+    assert result['morans_i_p'][1] == 1 / 200  # Strong gradient beats every relabeling
+    assert result['gearys_c_p'][1] == 1 / 200
+    assert result['morans_i_p'][0] > 0.01
+    assert abs(result['morans_i_null_mean'][0] + 1 / 383) < 0.01
+
+    again = permutation_test(values, weights, n_permutations=199, seed=3)
+    np.testing.assert_array_equal(result['morans_i_p'], again['morans_i_p'])
+
+
+def _wells(plate_id, values, n_cols):
+    return [
+        RawWellResult(
+            location=SpatialLocation(plate_id=plate_id, well_id=f"{chr(65 + i // n_cols)}{i % n_cols + 1}"),
+            cell_line="A549",
+            treatment=Treatment(compound="DMSO", dose_uM=0.0),
+            assay=AssayType.CELL_PAINTING,
+            observation_time_h=24.0,
+            readouts={'morphology': {'nucleus': float(v), 'er': float(v) * 0.5}},
+        )
+        for i, v in enumerate(values)
+    ]
+
+
+def test_spatial_qc_batch_per_plate_and_channel():
+    rng = np.random.default_rng(4)
+    plates = {
+        "P1": _wells("P1", _plate_values(rng, 8, 12, 0.0), 12),
+        "P2": _wells("P2", _plate_values(rng, 8, 12, 3.0), 12),
+        "P3": _wells("P3", _plate_values(rng, 8, 12, 3.0)[:90], 12),  # Different layout
+    }
+
+    qc = spatial_qc_batch(plates, ["morphology.nucleus", "morphology.er"], n_permutations=99)
+
+    assert set(qc) == {"P1", "P2", "P3"}
+    assert qc["P3"]["morphology.er"]["n_wells"] == 90
+    assert qc["P2"]["morphology.nucleus"]["morans_i_p"] == 0.01
+    # Scaling a channel does not change its spatial statistics
+    for plate in qc.values():
+        assert np.isclose(plate["morphology.er"]["morans_i"], plate["morphology.nucleus"]["morans_i"])
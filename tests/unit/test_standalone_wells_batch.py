@@ -0,0 +1,85 @@
+"""
+Tests for condition-grouped batch simulation in the standalone simulator.
+
+simulate_wells_batch() evaluates the deterministic response surface once per
+(cell_line, compound, dose, timepoint) and applies per-well noise afterwards;
+it must reproduce simulate_well() exactly, in input order.
+"""
+
+import time
+from multiprocessing import Pool
+
+import pytest
+
+from cell_os.biology import standalone_cell_thalamus as sim
+
+
+def _design():
+    return sim.generate_design(["A549", "iPSC_NGN2"], ["tBHQ", "nocodazole", "tunicamycin"], "benchmark")
+
+
+@pytest.mark.parametrize("flag", [None, "USE_ADVANCED_BIOLOGY", "USE_REALISTIC_NOISE"])
+def test_batch_matches_per_well(monkeypatch, flag):
+    if flag:
+        monkeypatch.setattr(sim, flag, True)
+    wells = _design()
+
+    batch = sim.simulate_wells_batch(wells, "batch_test")
+    single = [sim.simulate_well(w, "batch_test") for w in wells]
+
+    assert batch == single
+    assert len({sim.condition_key(w) for w in wells}) < len(wells)
+
+
+def test_replicates_share_condition_but_not_noise():
+    wells = [w for w in _design() if w.compound == "tunicamycin" and w.dose_uM > 0]
+    keys = [sim.condition_key(w) for w in wells]
+    key = max(keys, key=keys.count)
+    replicates = [w for w in wells if sim.condition_key(w) == key]
+    assert len(replicates) > 1
+
+    results = sim.simulate_wells_batch(replicates, "batch_test")
+    response = sim.simulate_condition(*key)
+
+    assert {r["viability"] for r in results} == {0.98 * response.viability_effect}
+    assert len({r["morphology"]["er"] for r in results}) == len(results)
+    # The shared response is never mutated by per-well noise
+    assert response == sim.simulate_condition(*key)
+
+
+def test_condition_chunks_partition_design():
+    wells = _design()
+    chunks = sim.condition_chunks(wells, chunk_size=50)
+
+    indices = sorted(i for chunk, _ in chunks for i in chunk)
+    assert indices == list(range(len(wells)))
+    assert all(len(chunk) <= 50 for chunk, _ in chunks)
+    for chunk, chunk_wells in chunks:
+        assert chunk_wells == [wells[i] for i in chunk]
+    # Replicates of a condition land together (unless a group overflows a chunk)
+    n_conditions = len({sim.condition_key(w) for w in wells})
+    assert len(chunks) < n_conditions
+
+
+@pytest.mark.parametrize("chunk_size", [2, 3, 5, 13])
+def test_condition_chunks_never_exceed_chunk_size(chunk_size):
+    """Chunks are filled to exactly chunk_size (only the last may be short)."""
+    wells = _design()
+    keys = [sim.condition_key(w) for w in wells]
+    assert max(keys.count(k) for k in keys) > 3  # Some groups are larger than small chunks
+
+    chunks = sim.condition_chunks(wells, chunk_size=chunk_size)
+
+    assert sorted(i for chunk, _ in chunks for i in chunk) == list(range(len(wells)))
+    assert [len(chunk) for chunk, _ in chunks[:-1]] == [chunk_size] * (len(chunks) - 1)
+    assert 0 < len(chunks[-1][0]) <= chunk_size
+
+
+def test_pool_chunks_match_per_well_in_design_order():
+    wells = _design()
+    single = [sim.simulate_well(w, "batch_test") for w in wells]
+
+    with Pool(processes=2) as pool:
+        pooled = list(sim._simulate_in_design_order(pool, wells, "batch_test", 2, time.time()))
+
+    assert pooled == single
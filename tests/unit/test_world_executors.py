@@ -0,0 +1,69 @@
+"""
+Unit tests for ExperimentalWorld well execution backends.
+
+Per-well measurement noise is keyed by design/plate/well (assay_rng_for_well),
+so every backend must return exactly the serial results, in the same order,
+with adversarial post-processing applied on top.
+"""
+
+import pytest
+
+from src.cell_os.epistemic_agent.world import ExperimentalWorld, EXECUTORS
+from src.cell_os.epistemic_agent.schemas import Proposal, WellSpec
+from src.cell_os.adversarial import AdversarialPlateConfig, AdversarySpec
+
+
+def _proposal(n_wells: int = 48) -> Proposal:
+    wells = [
+        WellSpec(
+            cell_line=["A549", "HepG2"][i % 2],
+            compound=["DMSO", "tunicamycin", "CCCP", "nocodazole"][i % 4],
+            dose_uM=[0.0, 1.0, 10.0][i % 3],
+            time_h=24.0,
+            assay="cell_painting",
+            position_tag=["edge", "center", "any"][i % 3],
+        )
+        for i in range(n_wells)
+    ]
+    return Proposal(design_id="exec_test_0001", hypothesis="executor parity", wells=wells, budget_limit=96)
+
+
+def _adversarial_config() -> AdversarialPlateConfig:
+    return AdversarialPlateConfig(
+        enabled=True,
+        adversaries=[
+            AdversarySpec("SpatialGradient", {"target_channel": "morphology.nucleus", "strength": 0.1}),
+            AdversarySpec("EdgeEffect", {"edge_shift": -0.05}, seed_offset=1),
+        ],
+        strength=1.0,
+    )
+
+
+@pytest.mark.parametrize("executor", [e for e in EXECUTORS if e != "serial"])
+def test_parallel_backends_match_serial(executor):
+    proposal = _proposal()
+    serial = ExperimentalWorld(budget_wells=96, seed=5).run_experiment(proposal)
+
+    world = ExperimentalWorld(budget_wells=96, seed=5, executor=executor, max_workers=3, chunk_size=7)
+    results = world.run_experiment(proposal)
+
+    assert results == serial
+    assert world.budget_remaining == 96 - len(proposal.wells)
+
+
+def test_adversarial_postprocessing_applied_after_parallel_execution():
+    proposal = _proposal()
+    serial = ExperimentalWorld(
+        budget_wells=96, seed=5, adversarial_plate_config=_adversarial_config()
+    ).run_experiment(proposal)
+    chunked = ExperimentalWorld(
+        budget_wells=96, seed=5, adversarial_plate_config=_adversarial_config(),
+        executor="chunked", max_workers=2
+    ).run_experiment(proposal)
+
+    assert chunked == serial
+
+
+def test_unknown_executor_rejected():
+    with pytest.raises(ValueError):
+        ExperimentalWorld(executor="gpu")